@@ -0,0 +1,516 @@
+# batch_report.py
+# Tab 1 일괄 작업 (매니페스트 → 프로세스 풀)
+# - 매니페스트: (이미지 폴더, Word 템플릿, 작업) 항목 목록 - report_cli 작업 정의와 같은 형식
+# - 같은 폴더를 쓰는 항목은 이미지 색인을 한 번만 만들어 공유 (부모 프로세스에서 검색 후 작업자에 전달)
+# - 작업자 프로세스가 항목을 하나씩 가져가 처리, 문서별 로그/진행률은 큐로 부모에 전달
+# - 작업자가 비정상 종료되면 처리 중이던 항목만 실패 처리하고 새 작업자로 교체
+# - 끝나면 항목별 결과 표와 합계 요약
+#
+# 매니페스트 예 (상대 경로는 매니페스트 파일 위치 기준):
+#   {
+#     "defaults": {"folder": "images", "include_subfolders": true},
+#     "entries": [
+#       {"operation": "images", "word": "n41.docx"},
+#       {"operation": "images", "word": "n77.docx", "folder": "images_n77"},
+#       {"operation": "table", "output_dir": "out"}
+#     ]
+#   }
+#   (항목 목록만 있는 JSON 배열도 가능)
+
+import os
+import time
+import json
+import queue
+import signal
+import logging
+import multiprocessing
+
+from docx import Document
+
+from cancellation import CancellationToken, OperationCancelled
+from tracing import Tracer, current_tracer, set_tracer
+from memory_profiling import MemoryProfiler, current_memory_profiler, set_memory_profiler
+from image_report_engine import ImageReportEngine, ReportJobError, filename_target_cells
+
+
+logger = logging.getLogger(__name__)
+
+BATCH_OPERATIONS = ('filenames', 'images', 'table')
+
+# 작업별로 필요한 이미지 색인 종류
+# (image_report_engine: get_image_files → listing, get_png_files → by_name,
+#  get_first_image_files → first: 템플릿 첫 테이블 셀 수만큼 앞 N개만 정렬)
+INDEX_KIND = {'filenames': 'first', 'table': 'listing', 'images': 'by_name'}
+
+# 경로로 해석할 항목 키
+_PATH_KEYS = ('folder', 'word', 'output_dir')
+
+# 큐 폴링 간격 (초) / 실행 중인 문서 진행률 로그 간격 (초)
+QUEUE_POLL_INTERVAL = 0.2
+PROGRESS_LOG_INTERVAL = 5.0
+
+# 취소 후 작업자가 현재 문서를 정리하고 끝나기를 기다리는 시간 (초) - 넘으면 강제 종료
+CANCEL_GRACE_SECONDS = 15.0
+
+
+class BatchManifestError(ReportJobError):
+    """매니페스트 형식 오류 - 메시지는 사용자에게 그대로 표시"""
+
+
+def default_batch_workers():
+    """기본 작업자 수 (CPU 코어 수)"""
+    return max(1, os.cpu_count() or 1)
+
+
+# ===================================================================
+# MANIFEST
+# ===================================================================
+
+def load_manifest(path):
+    """매니페스트 JSON 읽기 → 항목 목록 (기본값 적용, 상대 경로는 매니페스트 위치 기준)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise BatchManifestError(f"매니페스트를 읽을 수 없습니다: {str(e)}")
+    return normalize_entries(data, base_dir=os.path.dirname(os.path.abspath(path)))
+
+
+def normalize_entries(data, base_dir=None):
+    """
+    매니페스트 내용 → 항목 목록
+
+    Args:
+        data: 항목 목록 또는 {'defaults': {...}, 'entries': [...]}
+        base_dir: 상대 경로 기준 폴더 (None이면 현재 폴더)
+    """
+    if isinstance(data, dict):
+        defaults = data.get('defaults', {})
+        entries = data.get('entries')
+    else:
+        defaults, entries = {}, data
+    if not isinstance(entries, list) or not entries:
+        raise BatchManifestError("매니페스트에 작업 항목(entries)이 없습니다.")
+
+    normalized = []
+    for number, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict):
+            raise BatchManifestError(f"{number}번 항목이 작업 정의(dict)가 아닙니다.")
+        spec = dict(defaults)
+        spec.update(entry)
+        operation = spec.get('operation')
+        if operation not in BATCH_OPERATIONS:
+            raise BatchManifestError(
+                f"{number}번 항목: 일괄 작업에서 쓸 수 없는 작업 {operation!r} (사용 가능: {', '.join(BATCH_OPERATIONS)})"
+            )
+        required = ('folder',) if operation == 'table' else ('folder', 'word')
+        missing = [key for key in required if not spec.get(key)]
+        if missing:
+            raise BatchManifestError(f"{number}번 항목: 필수 항목 없음 ({', '.join(missing)})")
+        for key in _PATH_KEYS:
+            if spec.get(key):
+                spec[key] = os.path.abspath(os.path.join(base_dir or '', spec[key]))
+        spec.setdefault('include_subfolders', True)
+        normalized.append(spec)
+    return normalized
+
+
+def entry_label(spec):
+    """항목 표시 이름 (Word 파일 또는 폴더)"""
+    return os.path.basename(spec.get('word') or spec['folder'].rstrip('\\/'))
+
+
+# ===================================================================
+# WORKER PROCESS
+# ===================================================================
+
+def _run_entries(worker_id, task_queue, message_queue, image_index, cancel_event, trace=False, memory=False):
+    """
+    작업자 프로세스 진입점 - 큐에서 항목을 하나씩 가져와 처리 (None을 받으면 종료)
+
+    image_index: 부모가 만든 폴더별 이미지 색인 (항목끼리 공유)
+    """
+    from report_cli import run_job
+
+    # Ctrl+C는 부모가 받아 취소 Event로 전달 (작업자가 직접 중단되면 복사본 정리를 못 함)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    cancel_token = CancellationToken(cancel_event)
+    tracer = Tracer() if trace else None
+    set_tracer(tracer)
+    profiler = MemoryProfiler() if memory else None
+    set_memory_profiler(profiler)
+    if profiler is not None:
+        profiler.start()
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        index, spec = task
+        message_queue.put(('start', worker_id, index))
+        if cancel_token.cancelled:
+            message_queue.put(('result', worker_id, (index, {
+                'success': False, 'cancelled': True, 'message': "취소됨 (시작 전)", 'seconds': 0.0
+            })))
+            continue
+
+        last_progress = [-1]
+
+        def log(message, index=index):
+            message_queue.put(('log', worker_id, (index, message)))
+
+        def progress(value, index=index):
+            value = int(value)
+            if value != last_progress[0]:  # 같은 값은 보내지 않음 (셀마다 호출됨)
+                last_progress[0] = value
+                message_queue.put(('progress', worker_id, (index, value)))
+
+        started = time.perf_counter()
+        result = run_job(spec, log_callback=log, progress_callback=progress, cancel_token=cancel_token,
+                         image_index=image_index)
+        result['seconds'] = round(time.perf_counter() - started, 3)
+        message_queue.put(('result', worker_id, (index, result)))
+
+    report = {}
+    if tracer is not None:
+        report['trace_events'] = tracer.events
+    if profiler is not None:
+        profiler.stop()
+        report['memory_checkpoints'] = profiler.checkpoints
+    message_queue.put(('done', worker_id, report))
+
+
+# ===================================================================
+# BATCH PROCESSOR
+# ===================================================================
+
+class BatchReportProcessor:
+    """
+    Tab 1 일괄 작업 처리기
+
+    Args:
+        entries: 항목 목록 (normalize_entries/load_manifest 결과)
+        workers: 최대 동시 작업자 프로세스 수 (1이면 현재 스레드에서 차례로 처리)
+        log_callback: 로그 출력 콜백 (부모 프로세스에서 호출, 문서 로그는 [번호] 접두사)
+        progress_callback: 전체 진행률(0~100, 문서별 진행률 평균) 콜백
+        cancel_token: 취소 토큰 (cancellation.py) - 시작 전 항목은 건너뛰고 처리 중인 문서는 정리 후 중단
+    """
+
+    def __init__(self, entries, workers=None, log_callback=None, progress_callback=None, cancel_token=None):
+        self.entries = list(entries)
+        self.workers = workers or default_batch_workers()
+        self.log_callback = log_callback
+        self.progress_callback = progress_callback
+        self.cancel_token = cancel_token
+        self._progress = {}  # 항목 번호 → 진행률
+        self._running = {}   # 항목 번호 → (작업자 번호, 시작 시각)
+
+    def log(self, message):
+        """로그 출력"""
+        logger.info(message)
+        if self.log_callback:
+            self.log_callback(message)
+
+    def update_progress(self, index, value):
+        """문서 진행률 갱신 → 전체 진행률 보고"""
+        self._progress[index] = value
+        if self.progress_callback and self.entries:
+            self.progress_callback(sum(self._progress.values()) / len(self.entries))
+
+    def build_image_index(self):
+        """
+        항목들이 쓰는 폴더를 한 번씩만 검색하여 공유 색인 생성
+
+        Returns:
+            {(종류, 폴더, 하위 폴더 포함): 검색 결과} - ImageReportEngine(image_index=...)에 전달
+        """
+        image_index = {}
+        engine = ImageReportEngine(log_callback=self.log_callback, cancel_token=self.cancel_token,
+                                   image_index=image_index)
+
+        # 색인별 앞 N개 (파일명 기입: 같은 폴더를 쓰는 템플릿 중 가장 큰 셀 수, 나머지 색인은 None)
+        needed = {}
+        for spec in self.entries:
+            kind = INDEX_KIND[spec['operation']]
+            key = (kind, spec['folder'], spec['include_subfolders'])
+            if kind == 'first':
+                engine.check_cancelled()
+                needed[key] = max(needed.get(key, 0), self._filename_cells(spec['word']))
+            else:
+                needed.setdefault(key, None)
+
+        built = 0
+        for (kind, folder, include_subfolders), limit in needed.items():
+            if kind == 'first':
+                if ('listing', folder, include_subfolders) in needed or not limit:
+                    continue  # 전체 목록 색인의 앞부분 사용 / 템플릿 오류는 항목 실행 시 보고
+                self.log(f"이미지 색인 생성: {folder} (앞 {limit}개)")
+                engine.get_first_image_files(folder, limit, include_subfolders)
+            elif kind == 'listing':
+                self.log(f"이미지 색인 생성: {folder}")
+                engine.get_image_files(folder, include_subfolders)
+            else:
+                self.log(f"이미지 색인 생성: {folder}")
+                engine.get_png_files(folder, include_subfolders)
+            built += 1
+        self.log(f"이미지 색인 {built}개를 항목 {len(self.entries)}개가 공유")
+        return image_index
+
+    def _filename_cells(self, word_path):
+        """파일명 기입 템플릿의 기입 칸 수 (열 수 없으면 0 - 오류는 항목 실행 시 보고)"""
+        try:
+            return filename_target_cells(Document(word_path))
+        except Exception as e:
+            self.log(f"⚠️ 템플릿 셀 수 확인 실패 ({os.path.basename(word_path)}): {str(e)}")
+            return 0
+
+    def run(self):
+        """항목 전체 처리 후 결과 병합 (결과 dict 반환)"""
+        start_time = time.time()
+        self.log(f"=== 일괄 작업 시작: 항목 {len(self.entries)}개 ===")
+
+        results = {}
+        try:
+            image_index = self.build_image_index()
+        except OperationCancelled:
+            for index in range(len(self.entries)):
+                results[index] = {'success': False, 'cancelled': True, 'message': "취소됨 (시작 전)"}
+            return self.merge_results(results, time.time() - start_time, 0)
+
+        workers = max(1, min(self.workers, len(self.entries)))
+        if workers == 1:
+            self._run_inline(image_index, results)
+        else:
+            self._run_pool(image_index, workers, results)
+
+        merged = self.merge_results(results, time.time() - start_time, workers)
+        if merged['cancelled'] and self.cancel_token is not None:
+            latency = self.cancel_token.latency()
+            if latency is not None:
+                merged['cancel_latency'] = round(latency, 3)
+                self.log(f"취소 완료 (요청 → 모든 작업자 정리 완료 {latency:.2f}초)")
+        return merged
+
+    def _run_inline(self, image_index, results):
+        """작업자 1개 - 프로세스를 띄우지 않고 현재 스레드에서 차례로 처리"""
+        from report_cli import run_job
+
+        for index, spec in enumerate(self.entries):
+            if self.cancel_token is not None and self.cancel_token.cancelled:
+                results[index] = {'success': False, 'cancelled': True, 'message': "취소됨 (시작 전)"}
+                continue
+            self._on_start(index, 1)
+            started = time.perf_counter()
+            result = run_job(
+                spec,
+                log_callback=lambda message, index=index: self.log(f"[{index + 1}] {message}"),
+                progress_callback=lambda value, index=index: self.update_progress(index, value),
+                cancel_token=self.cancel_token,
+                image_index=image_index,
+            )
+            result['seconds'] = round(time.perf_counter() - started, 3)
+            self._on_result(index, result, results)
+
+    def _run_pool(self, image_index, workers, results):
+        """작업자 프로세스 풀 - 항목 큐에서 하나씩 가져가 처리"""
+        self.log(f"병렬 처리: 작업자 {workers}개")
+
+        # 부모 스레드에서 추적/메모리 측정 중이면 작업자도 기록하여 돌려줌
+        tracer = current_tracer()
+        profiler = current_memory_profiler()
+
+        # spawn: Windows와 동일한 방식 (GUI 상태를 부모에게서 물려받지 않음)
+        ctx = multiprocessing.get_context('spawn')
+        task_queue = ctx.Queue()
+        message_queue = ctx.Queue()
+        cancel_event = ctx.Event()
+        for index, spec in enumerate(self.entries):
+            task_queue.put((index, spec))
+        for _ in range(workers):
+            task_queue.put(None)  # 작업자 종료 신호 (비정상 종료한 작업자 몫은 교체 작업자가 받음)
+
+        processes = {}
+        current = {}  # 작업자 번호 → 처리 중인 항목 번호
+        next_worker_id = 1
+        cancel_deadline = None
+        last_status = time.monotonic()
+
+        def start_worker():
+            nonlocal next_worker_id
+            worker_id = next_worker_id
+            next_worker_id += 1
+            process = ctx.Process(
+                target=_run_entries,
+                args=(worker_id, task_queue, message_queue, image_index, cancel_event,
+                      tracer is not None, profiler is not None),
+                daemon=True,
+            )
+            process.start()
+            processes[worker_id] = process
+            self.log(f"[B{worker_id}] 작업자 시작 (PID {process.pid})")
+
+        def handle(kind, worker_id, payload):
+            if kind == 'start':
+                current[worker_id] = payload
+                self._on_start(payload, worker_id)
+            elif kind == 'log':
+                index, message = payload
+                self.log(f"[{index + 1}] {message}")
+            elif kind == 'progress':
+                self.update_progress(*payload)
+            elif kind == 'result':
+                index, result = payload
+                current.pop(worker_id, None)
+                self._on_result(index, result, results)
+            elif kind == 'done':
+                if tracer is not None:
+                    tracer.merge(payload.get('trace_events'), process_name=f"B{worker_id}")
+                if profiler is not None:
+                    profiler.merge(payload.get('memory_checkpoints'), process_name=f"B{worker_id}")
+
+        def drain():
+            while True:
+                try:
+                    handle(*message_queue.get_nowait())
+                except queue.Empty:
+                    return
+
+        for _ in range(workers):
+            start_worker()
+
+        try:
+            while processes:
+                # 취소 요청: 작업자에 전달 (남은 항목은 작업자가 시작하지 않고 취소 처리)
+                if cancel_deadline is None and self.cancel_token is not None and self.cancel_token.cancelled:
+                    cancel_event.set()
+                    cancel_deadline = time.monotonic() + CANCEL_GRACE_SECONDS
+                    self.log(f"⚠️ 취소 요청 - 처리 중인 문서 {len(current)}개 정리 대기")
+                if cancel_deadline is not None and time.monotonic() > cancel_deadline:
+                    self.log(f"⚠️ 작업자가 {CANCEL_GRACE_SECONDS:.0f}초 안에 정리되지 않아 강제 종료")
+                    break
+
+                try:
+                    handle(*message_queue.get(timeout=QUEUE_POLL_INTERVAL))
+                except queue.Empty:
+                    pass
+
+                if time.monotonic() - last_status >= PROGRESS_LOG_INTERVAL and self._running:
+                    last_status = time.monotonic()
+                    self.log_running_status(results)
+
+                # 종료된 작업자 정리 (종료 코드가 0이 아니면 비정상 종료 - 처리 중이던 항목만 실패)
+                for worker_id, process in list(processes.items()):
+                    if process.is_alive():
+                        continue
+                    drain()  # 종료 직전에 넣은 메시지가 아직 큐에 남아 있을 수 있음
+                    process.join()
+                    del processes[worker_id]
+                    if process.exitcode == 0:
+                        continue
+                    index = current.pop(worker_id, None)
+                    if index is not None:
+                        self._on_result(index, {
+                            'success': False,
+                            'message': f"작업자 비정상 종료 (종료 코드 {process.exitcode})",
+                        }, results)
+                    self.log(f"⚠️ [B{worker_id}] 작업자 비정상 종료 (종료 코드 {process.exitcode})")
+                    if cancel_deadline is None and len(results) + len(current) < len(self.entries):
+                        start_worker()
+
+            drain()
+        finally:
+            for process in processes.values():
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        for index in range(len(self.entries)):
+            if index not in results:
+                self._on_result(index, {
+                    'success': False, 'cancelled': cancel_deadline is not None,
+                    'message': "작업자 강제 종료" if index in current.values() else "실행되지 않음",
+                }, results)
+
+    # ========== PROGRESS / SUMMARY ==========
+
+    def _on_start(self, index, worker_id):
+        self._running[index] = (worker_id, time.perf_counter())
+        spec = self.entries[index]
+        self.log(f"▶ [{index + 1}/{len(self.entries)}] {spec['operation']}: {entry_label(spec)} (B{worker_id})")
+
+    def _on_result(self, index, result, results):
+        """항목 결과 기록 + 완료 로그"""
+        _, started = self._running.pop(index, (None, None))
+        if 'seconds' not in result and started is not None:
+            result['seconds'] = round(time.perf_counter() - started, 3)
+        results[index] = result
+        self.update_progress(index, 100)
+
+        label = f"[{index + 1}/{len(self.entries)}] {entry_label(self.entries[index])}"
+        if result.get('success'):
+            output = os.path.basename(result.get('output_file') or '')
+            self.log(f"✓ {label} 완료 ({result.get('seconds', 0):.1f}초) → {output}")
+        elif result.get('cancelled'):
+            self.log(f"⏹ {label} 취소됨")
+        else:
+            self.log(f"✗ {label} 실패: {result.get('message')}")
+
+    def log_running_status(self, results):
+        """실행 중인 문서별 진행률 로그"""
+        running = ', '.join(
+            f"{entry_label(self.entries[index])} {int(self._progress.get(index, 0))}%"
+            for index in sorted(self._running)
+        )
+        self.log(f"진행: {len(results)}/{len(self.entries)} 완료 / 처리 중: {running}")
+
+    def merge_results(self, results, elapsed_time, workers):
+        """항목별 결과 → 통합 결과 dict + 요약 로그"""
+        entries = []
+        for index, spec in enumerate(self.entries):
+            result = results.get(index, {'success': False, 'message': '결과 없음'})
+            entries.append({
+                'index': index + 1,
+                'operation': spec['operation'],
+                'folder': spec['folder'],
+                'word': spec.get('word'),
+                'success': bool(result.get('success')),
+                'cancelled': bool(result.get('cancelled')),
+                'message': result.get('message', ''),
+                'output_file': result.get('output_file'),
+                'seconds': result.get('seconds', 0.0),
+                'stats': result.get('stats', {}),
+            })
+
+        succeeded = sum(1 for e in entries if e['success'])
+        cancelled = sum(1 for e in entries if e['cancelled'])
+        failed = len(entries) - succeeded - cancelled
+        document_seconds = sum(e['seconds'] for e in entries)
+
+        self.log("\n" + "=" * 60)
+        self.log(f"일괄 작업 완료 ({succeeded}/{len(entries)} 성공, 실패 {failed}개, 취소 {cancelled}개)")
+        self.log("=" * 60)
+        self.log(f"{'#':>3s}  {'작업':9s} {'문서':32s} {'결과':4s} {'시간(s)':>8s}  출력/메시지")
+        for e in entries:
+            status = '✓' if e['success'] else ('⏹' if e['cancelled'] else '✗')
+            detail = os.path.basename(e['output_file'] or '') if e['success'] else e['message'].split('\n')[0]
+            label = entry_label(self.entries[e['index'] - 1])
+            self.log(f"{e['index']:3d}  {e['operation']:9s} {label[:32]:32s} {status:4s} {e['seconds']:8.1f}  {detail}")
+        minutes = int(elapsed_time // 60)
+        seconds = int(elapsed_time % 60)
+        self.log(f"처리 시간: {minutes}분 {seconds}초 (문서별 시간 합계 {document_seconds:.1f}초, 작업자 {workers}개)")
+
+        if cancelled:
+            message = f"일괄 작업이 취소되었습니다 (완료 {succeeded}개 / 전체 {len(entries)}개)"
+        else:
+            message = f"일괄 작업 완료: 성공 {succeeded}개, 실패 {failed}개 (전체 {len(entries)}개)"
+        return {
+            'success': failed == 0 and cancelled == 0,
+            'cancelled': cancelled > 0,
+            'message': message,
+            'entries': entries,
+            'output_files': [e['output_file'] for e in entries if e['success'] and e['output_file']],
+            'elapsed_time': elapsed_time,
+            'document_seconds': round(document_seconds, 3),
+            'workers': workers,
+        }
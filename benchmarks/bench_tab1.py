@@ -0,0 +1,371 @@
+# benchmarks/bench_tab1.py
+# Tab 1 작업 벤치마크 (합성 데이터)
+# - 이미지 폴더 생성: 개수/크기/형식 혼합/하위 폴더 깊이/제외 폴더(old, etc) 파일
+# - Word 템플릿 생성: N개 테이블 x 행 x 열, BE 테스트 셀(OFDM/DFT/CP 줄), 파일명 셀/설명 셀 혼합
+# - 파일명 기입/이미지 삽입/테이블 생성(GUI 워커와 같은 ImageReportEngine 경로)을 작업마다 새 프로세스에서 실행
+# - 경과 시간(중앙값), 최대 메모리(peak RSS), 출력 파일 크기를 JSON으로 저장 → --compare로 버전 간 비교
+#
+# 사용 예:
+#   python benchmarks/bench_tab1.py --profile small
+#   python benchmarks/bench_tab1.py --images 400 --image-size 1600x1200 --formats png,jpg --depth 3 --out after.json
+#   python benchmarks/bench_tab1.py --profile medium --out after.json --compare before.json
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+OPERATIONS = ('filenames', 'images', 'table')
+
+# 기본 데이터 규모 (명령행 인자로 개별 항목 덮어쓰기 가능)
+PROFILES = {
+    'small': {'images': 40, 'image_size': '640x480', 'formats': 'png,jpg', 'depth': 1, 'excluded': 4,
+              'tables': 2, 'rows': 5, 'cols': 4, 'be_ratio': 0.25},
+    'medium': {'images': 200, 'image_size': '1280x960', 'formats': 'png,jpg,bmp', 'depth': 2, 'excluded': 20,
+               'tables': 5, 'rows': 10, 'cols': 4, 'be_ratio': 0.25},
+    'large': {'images': 800, 'image_size': '1920x1440', 'formats': 'png,jpg,bmp,gif', 'depth': 3, 'excluded': 80,
+              'tables': 10, 'rows': 20, 'cols': 4, 'be_ratio': 0.25},
+}
+
+# BE 테스트 파일명 구성 요소 (예: N78_100MHz_QPSK_DFT_low)
+BE_BANDS = ('N1', 'N3', 'N41', 'N77', 'N78')
+BE_BANDWIDTHS = ('20MHz', '40MHz', '100MHz')
+BE_MODULATIONS = ('QPSK', '16QAM', '64QAM')
+BE_TESTMODES = ('DFT', 'CP')
+BE_CHANNELS = ('low', 'mid', 'high')
+
+
+# ===================================================================
+# DATA GENERATION
+# ===================================================================
+
+def parse_size(text):
+    """'640x480' → (640, 480)"""
+    width, height = text.lower().split('x')
+    return int(width), int(height)
+
+
+def be_image_name(rng):
+    return '_'.join((rng.choice(BE_BANDS), rng.choice(BE_BANDWIDTHS), rng.choice(BE_MODULATIONS),
+                     rng.choice(BE_TESTMODES), rng.choice(BE_CHANNELS)))
+
+
+def folder_for(root, index, depth):
+    """이미지 번호 → 하위 폴더 (깊이 depth까지 번갈아 분산)"""
+    parts = [root]
+    for level in range(index % (depth + 1)):
+        parts.append(f"sub{level + 1}_{index % 3}")
+    return os.path.join(*parts)
+
+
+def generate_images(root, count, size, formats, depth, excluded, be_ratio, seed):
+    """
+    합성 이미지 폴더 생성
+
+    Returns:
+        확장자 없는 이미지 이름 목록 (제외 폴더 파일은 포함하지 않음)
+    """
+    from PIL import Image
+
+    rng = random.Random(seed)
+    width, height = size
+    # 잡음 이미지 (단색보다 압축 크기/디코딩 비용이 실제 측정 화면에 가까움)
+    noise = Image.merge('RGB', [Image.effect_noise((width, height), 64 + 32 * i) for i in range(3)])
+
+    names = []
+    used = set()
+    for index in range(count):
+        if rng.random() < be_ratio:
+            name = be_image_name(rng)
+            if name in used:
+                name = f"{name}_{index}"
+        else:
+            name = f"IMG_{index:05d}"
+        used.add(name)
+        names.append(name)
+
+        folder = folder_for(root, index, depth)
+        os.makedirs(folder, exist_ok=True)
+        fmt = formats[index % len(formats)]
+        noise.save(os.path.join(folder, f"{name}.{fmt}"))
+
+    # 제외 대상 폴더 (검색에서 빠져야 하는 파일)
+    for index in range(excluded):
+        folder = os.path.join(root, ('old', 'etc')[index % 2])
+        os.makedirs(folder, exist_ok=True)
+        noise.save(os.path.join(folder, f"IMG_{index:05d}.{formats[0]}"))
+
+    return names
+
+
+def generate_template(path, names, tables, rows, cols, seed):
+    """
+    합성 Word 템플릿 생성 - 셀 종류를 섞어서 배치
+    - 파일명 셀: 이미지 이름 한 줄 (일치/불일치 혼합)
+    - 설명 셀: 이미지 이름 + 설명 줄
+    - BE 테스트 셀: BE 파일명 줄 + OFDM 설명 줄 + 기타 줄
+    - 빈 셀
+    """
+    from docx import Document
+
+    rng = random.Random(seed)
+    be_names = [name for name in names if name.startswith('N')]
+    plain_names = [name for name in names if not name.startswith('N')] or names
+
+    doc = Document()
+    for table_index in range(tables):
+        doc.add_paragraph(f"시험 결과 {table_index + 1}")
+        table = doc.add_table(rows=rows, cols=cols)
+        table.style = 'Table Grid'
+        for row in table.rows:
+            for cell in row.cells:
+                kind = rng.random()
+                if not names:
+                    # 파일명 기입용: 빈 셀과 기존 내용이 있는 셀 (서식 유지 재구성 경로)
+                    if kind < 0.3:
+                        cell.text = f"측정 조건: {rng.choice(BE_CHANNELS)} 채널"
+                elif be_names and kind < 0.25:
+                    testmode = 'DFT-s_OFDM' if rng.random() < 0.5 else 'CP_OFDM'
+                    cell.text = f"{rng.choice(be_names)}\n{testmode} QPSK low chan spurious emission\n비고"
+                elif kind < 0.6:
+                    # 일부는 일치하는 이미지가 없는 이름
+                    cell.text = rng.choice(plain_names) if rng.random() < 0.9 else f"MISSING_{rng.randint(0, 9999)}"
+                elif kind < 0.85:
+                    cell.text = f"{rng.choice(plain_names)}\n측정 조건: {rng.choice(BE_CHANNELS)} 채널"
+    doc.save(path)
+
+
+def generate_dataset(data_dir, params, seed):
+    """벤치마크 데이터 생성 (이미지 폴더 + 템플릿 2종)"""
+    images_dir = os.path.join(data_dir, 'images')
+    names = generate_images(
+        images_dir, params['images'], parse_size(params['image_size']),
+        params['formats'].split(','), params['depth'], params['excluded'], params['be_ratio'], seed
+    )
+
+    # 파일명 기입용: 첫 번째 테이블 하나 (이미지 수만큼 셀)
+    filenames_cols = params['cols']
+    filenames_rows = max(1, (len(names) + filenames_cols - 1) // filenames_cols)
+    generate_template(os.path.join(data_dir, 'filenames_template.docx'), [], 1,
+                      filenames_rows, filenames_cols, seed)
+    generate_template(os.path.join(data_dir, 'images_template.docx'), names,
+                      params['tables'], params['rows'], params['cols'], seed)
+    return images_dir
+
+
+# ===================================================================
+# MEASUREMENT
+# ===================================================================
+
+def run_operation(operation, data_dir):
+    """
+    작업 하나 실행 (작업자 프로세스 안에서 호출)
+
+    GUI 워커와 같이 ImageReportEngine을 LogChannel 버퍼로 연결해 실행합니다.
+    """
+    sys.path.insert(0, REPO_DIR)
+    from image_report_engine import ImageReportEngine
+    from log_channel import LogChannel
+    from memory_profiling import peak_rss_bytes
+
+    channel = LogChannel()  # 파일 기록 없음 (화면 대신 버퍼만)
+    engine = ImageReportEngine(log_callback=channel.put, progress_callback=channel.set_progress)
+    images_dir = os.path.join(data_dir, 'images')
+    output_dir = os.path.join(data_dir, 'output')
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    if operation == 'filenames':
+        result = engine.insert_filenames(images_dir, os.path.join(data_dir, 'filenames_template.docx'))
+    elif operation == 'images':
+        result = engine.insert_images(images_dir, os.path.join(data_dir, 'images_template.docx'))
+    else:
+        result = engine.create_table(images_dir, output_dir=output_dir)
+    wall = time.perf_counter() - start
+
+    output_file = result['output_file']
+    output_bytes = os.path.getsize(output_file)
+    os.remove(output_file)  # 반복 실행 시 같은 조건 유지 (복사본 이름 번호 증가 방지)
+
+    return {
+        'wall_seconds': wall,
+        'peak_rss_bytes': peak_rss_bytes(),
+        'output_bytes': output_bytes,
+        'log_lines': channel.total_lines,
+        'stats': result.get('stats', {}),
+    }
+
+
+def measure(operation, data_dir, repeat):
+    """작업을 repeat회 새 프로세스에서 실행하여 중앙값/최댓값 집계"""
+    runs = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', operation, '--data-dir', data_dir],
+            capture_output=True, text=True, cwd=REPO_DIR,
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else '실행 실패'
+            return {'error': error}
+        runs.append(json.loads(completed.stdout))
+
+    rss_values = [run['peak_rss_bytes'] for run in runs if run['peak_rss_bytes'] is not None]
+    return {
+        'wall_seconds': statistics.median(run['wall_seconds'] for run in runs),
+        'wall_seconds_min': min(run['wall_seconds'] for run in runs),
+        'peak_rss_mb': round(max(rss_values) / (1024 * 1024), 1) if rss_values else None,
+        'output_bytes': runs[-1]['output_bytes'],
+        'log_lines': runs[-1]['log_lines'],
+        'stats': runs[-1]['stats'],
+        'runs': [round(run['wall_seconds'], 4) for run in runs],
+    }
+
+
+def git_revision():
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                   capture_output=True, text=True)
+        return completed.stdout.strip() or None
+    except OSError:
+        return None
+
+
+# ===================================================================
+# REPORT
+# ===================================================================
+
+def print_results(results):
+    print(f"\n{'작업':10s} {'시간(s)':>9s} {'최소(s)':>9s} {'peak RSS(MB)':>13s} {'출력(KB)':>10s}")
+    for operation, item in results.items():
+        if 'error' in item:
+            print(f"{operation:10s} 실패: {item['error']}")
+            continue
+        rss = f"{item['peak_rss_mb']:.1f}" if item['peak_rss_mb'] is not None else '-'
+        print(f"{operation:10s} {item['wall_seconds']:9.3f} {item['wall_seconds_min']:9.3f} "
+              f"{rss:>13s} {item['output_bytes'] / 1024:10.1f}")
+
+
+def print_comparison(baseline, current):
+    """기준 결과 파일과 비교 (시간/메모리/출력 크기 변화율)"""
+    print(f"\n=== 비교: {baseline['meta'].get('revision')} → {current['meta'].get('revision')} ===")
+    if baseline['meta'].get('params') != current['meta'].get('params'):
+        print("⚠️ 데이터 조건이 다름 - 결과를 직접 비교할 수 없을 수 있음")
+
+    def change(before, after):
+        if not before or after is None:
+            return '-'
+        return f"{(after - before) / before * 100:+.1f}%"
+
+    print(f"{'작업':10s} {'시간':>18s} {'변화':>8s} {'peak RSS(MB)':>16s} {'변화':>8s} {'출력':>8s}")
+    for operation, after in current['results'].items():
+        before = baseline['results'].get(operation)
+        if not before or 'error' in before or 'error' in after:
+            print(f"{operation:10s} 비교 불가")
+            continue
+        print(f"{operation:10s} {before['wall_seconds']:8.3f} → {after['wall_seconds']:7.3f} "
+              f"{change(before['wall_seconds'], after['wall_seconds']):>8s} "
+              f"{before['peak_rss_mb'] or 0:7.1f} → {after['peak_rss_mb'] or 0:6.1f} "
+              f"{change(before['peak_rss_mb'], after['peak_rss_mb']):>8s} "
+              f"{change(before['output_bytes'], after['output_bytes']):>8s}")
+
+
+# ===================================================================
+# MAIN
+# ===================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tab 1 작업 벤치마크 (합성 데이터)")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='small', help="기본 데이터 규모")
+    parser.add_argument('--images', type=int, help="이미지 개수")
+    parser.add_argument('--image-size', help="이미지 크기 (예: 1280x960)")
+    parser.add_argument('--formats', help="이미지 형식 혼합 (예: png,jpg,bmp)")
+    parser.add_argument('--depth', type=int, help="하위 폴더 최대 깊이")
+    parser.add_argument('--excluded', type=int, help="제외 폴더(old/etc)에 넣을 이미지 개수")
+    parser.add_argument('--tables', type=int, help="이미지 삽입용 템플릿의 테이블 수")
+    parser.add_argument('--rows', type=int, help="테이블 행 수")
+    parser.add_argument('--cols', type=int, help="테이블 열 수")
+    parser.add_argument('--be-ratio', type=float, help="BE 테스트 이미지 비율 (0~1)")
+    parser.add_argument('--operations', nargs='+', choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument('--repeat', type=int, default=3, help="작업별 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--data-dir', help="데이터 폴더 (기본: 임시 폴더, 이미 있으면 재사용)")
+    parser.add_argument('--keep', action='store_true', help="임시 데이터 폴더 유지")
+    parser.add_argument('--out', help="결과 JSON 경로 (기본: bench_tab1_<시각>.json)")
+    parser.add_argument('--compare', help="비교할 기준 결과 JSON")
+    parser.add_argument('--child', choices=OPERATIONS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    # 작업자 프로세스: 작업 하나 실행 후 결과 JSON 출력
+    if args.child:
+        json.dump(run_operation(args.child, args.data_dir), sys.stdout)
+        return 0
+
+    params = dict(PROFILES[args.profile])
+    for key in params:
+        value = getattr(args, key)
+        if value is not None:
+            params[key] = value
+
+    temporary = args.data_dir is None
+    data_dir = os.path.abspath(args.data_dir or tempfile.mkdtemp(prefix='bench_tab1_'))
+    # 경로 어딘가에 old/etc가 들어가면 엔진이 모든 이미지를 제외 폴더로 판단함
+    if any(keyword in part.lower() for part in data_dir.split(os.sep) for keyword in ('old', 'etc')):
+        print(f"⚠️ 데이터 경로에 'old'/'etc'가 포함되어 모든 이미지가 제외됩니다: {data_dir}")
+    try:
+        if not os.path.exists(os.path.join(data_dir, 'images_template.docx')):
+            print(f"데이터 생성 중: {data_dir}")
+            start = time.perf_counter()
+            generate_dataset(data_dir, params, args.seed)
+            print(f"데이터 생성 완료 ({time.perf_counter() - start:.1f}초)")
+        else:
+            print(f"기존 데이터 사용: {data_dir}")
+
+        results = {}
+        for operation in args.operations:
+            print(f"측정 중: {operation} ({args.repeat}회)")
+            results[operation] = measure(operation, data_dir, args.repeat)
+    finally:
+        if temporary and not args.keep:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    output = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'profile': args.profile,
+            'params': params,
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+
+    print_results(results)
+
+    out_path = args.out or f"bench_tab1_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {out_path}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            print_comparison(json.load(f), output)
+
+    return 0 if all('error' not in item for item in results.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
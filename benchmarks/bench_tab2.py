@@ -0,0 +1,313 @@
+# benchmarks/bench_tab2.py
+# Tab 2 (Excel 범위 → Word 마커) 파이프라인 벤치마크 - Fake Office 백엔드
+# - DEFAULT_RANGE_CONFIG를 따르는 통합문서(시트별 여러 범위) 생성, {marker}_#N 마커가 있는 Word 템플릿 생성
+# - Office 호출마다 실제와 비슷한 지연(LATENCY_PROFILES)과 준비 상태 안정화 시간을 주입 (Linux에서 실행 가능)
+# - Word 수(W) x 엑셀 수(E) x 변환 방식 x 작업자 수 조합마다 총 시간, 단계별 호출 수/시간,
+#   대기(sleep) 시간, 변환 캐시 적중률을 측정 → JSON 저장, --compare로 버전 간 비교
+#
+# 사용 예:
+#   python benchmarks/bench_tab2.py
+#   python benchmarks/bench_tab2.py --words 1 4 8 --excels 1 2 --modes file --workers 1 4 --time-scale 0.2
+#   python benchmarks/bench_tab2.py --out after.json --compare before.json
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import itertools
+import subprocess
+import tempfile
+from collections import Counter
+from datetime import datetime
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+# Office 호출별 지연 시간 (초, time_scale 배율 적용 전) - 사무용 PC에서 관측한 대략적인 값
+LATENCY_PROFILES = {
+    'realistic': {
+        'start': 2.5, 'shutdown': 1.0,
+        'open_workbook': 0.6, 'close_workbook': 0.1,
+        'copy_range_picture': 0.15, 'export_range_image': 0.25,
+        'open_document': 0.8, 'close_document': 0.1, 'find_marker': 0.02,
+        'insert_picture_at_marker': 0.12, 'insert_picture_file_at_marker': 0.15,
+        'save_document': 0.5,
+    },
+    'zero': {},
+}
+
+# 준비 상태 안정화 시간 (초) - 클립보드 그림 형식 등록, 문서 유휴, 애플리케이션 응답
+SETTLE_PROFILES = {
+    'realistic': {'clipboard': 0.05, 'document': 0.03, 'excel_app': 0.2, 'word_app': 0.2},
+    'zero': {},
+}
+
+
+# ===================================================================
+# DATA GENERATION
+# ===================================================================
+
+def generate_workbook(path, entries):
+    """설정 항목의 시트/범위를 채운 통합문서 생성 (범위 양 끝 셀에 값 기록 → 사용 범위에 포함)"""
+    from openpyxl import Workbook
+    from openpyxl.utils.cell import range_boundaries
+
+    wb = Workbook()
+    wb.remove(wb.active)
+    sheets = {}
+    for entry in entries:
+        ws = sheets.get(entry['sheet'])
+        if ws is None:
+            ws = sheets[entry['sheet']] = wb.create_sheet(entry['sheet'])
+        min_col, min_row, max_col, max_row = range_boundaries(entry['range'])
+        ws.cell(row=min_row, column=min_col, value=entry['marker'])
+        ws.cell(row=max_row, column=max_col, value=1.0)
+    wb.save(path)
+
+
+def generate_word_template(path, markers, missing_every):
+    """마커 문단이 있는 Word 템플릿 생성 (missing_every번째 마커마다 생략 → 사전 검사 제외 경로)"""
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading("시험 성적서 (벤치마크)", level=1)
+    for index, marker in enumerate(markers, 1):
+        if missing_every and index % missing_every == 0:
+            continue
+        doc.add_paragraph(f"{marker}")
+    doc.save(path)
+
+
+def generate_dataset(data_dir, range_config, words, excels, missing_every):
+    """
+    엑셀 excels개(접미사 순환)와 Word 템플릿 words개 생성
+
+    Returns:
+        (엑셀 파일 목록, Word 파일 목록)
+    """
+    suffixes = sorted(range_config)
+    excel_files = []
+    for index in range(excels):
+        suffix = suffixes[index % len(suffixes)]
+        path = os.path.join(data_dir, f"측정{index + 1}_{suffix}.xlsx")
+        if not os.path.exists(path):
+            generate_workbook(path, range_config[suffix])
+        excel_files.append(path)
+
+    used_suffixes = sorted({suffixes[index % len(suffixes)] for index in range(excels)})
+    # 설정에 같은 마커가 여러 번 나오면 Fake 백엔드는 첫 항목만 삽입 (마커 1회 소비) - 나머지는 실패로 집계됨
+    markers = list(dict.fromkeys(
+        f"{entry['marker']}_{suffix}" for suffix in used_suffixes for entry in range_config[suffix]
+    ))
+    word_files = []
+    for index in range(words):
+        path = os.path.join(data_dir, f"성적서{index + 1}_E{excels}.docx")
+        if not os.path.exists(path):
+            generate_word_template(path, markers, missing_every)
+        word_files.append(path)
+    return excel_files, word_files
+
+
+# ===================================================================
+# MEASUREMENT
+# ===================================================================
+
+def shard_stats(automation_stats):
+    """작업자 1개(평면 dict)/여러 개({'W1': ...}) 통계를 목록으로"""
+    if 'calls' in automation_stats:
+        return [automation_stats]
+    return list(automation_stats.values())
+
+
+def run_case(excel_files, word_files, range_config, export_mode, workers, latency, settle, time_scale):
+    """조합 하나 실행 후 측정값 dict 반환"""
+    from parallel_range_processor import ParallelRangeProcessor
+    from tracing import Tracer, set_tracer
+
+    log_lines = []
+    processor = ParallelRangeProcessor(
+        excel_files, word_files, [], range_config,
+        workers=workers,
+        backend='fake',
+        backend_options={'latency': latency, 'settle': settle, 'time_scale': time_scale},
+        log_callback=log_lines.append,
+        export_mode=export_mode,
+    )
+
+    tracer = Tracer('bench_tab2')
+    set_tracer(tracer)
+    start = time.perf_counter()
+    try:
+        result = processor.run()
+    finally:
+        set_tracer(None)
+    wall = time.perf_counter() - start
+
+    # 출력 복사본은 다음 조합에 영향이 없도록 삭제
+    for output_file in result.get('output_files', []):
+        if os.path.exists(output_file):
+            os.remove(output_file)
+
+    calls = Counter()
+    simulated = 0.0
+    for stats in shard_stats(result.get('automation_stats', {})):
+        calls.update(stats.get('calls', {}))
+        simulated += sum(stats.get('simulated_seconds', {}).values())
+
+    readiness = result.get('readiness_stats', {})
+    exported = result.get('ranges_exported', 0)
+    hits = result.get('export_cache_hits', 0)
+
+    return {
+        'success': result.get('success', False),
+        'message': result.get('message', ''),
+        'wall_seconds': round(wall, 4),
+        'workers_used': result.get('workers', 1),
+        'images_inserted': result.get('images_inserted', 0),
+        'images_failed': result.get('images_failed', 0),
+        'preflight_skipped': result.get('preflight_skipped', 0),
+        'calls': dict(sorted(calls.items())),
+        'simulated_call_seconds': round(simulated, 4),
+        'readiness_wait_seconds': round(sum(item['total_seconds'] for item in readiness.values()), 4),
+        'readiness_polls': sum(item['polls'] for item in readiness.values()),
+        'readiness_timeouts': sum(item['timeouts'] for item in readiness.values()),
+        'export_cache': {
+            'exported': exported,
+            'hits': hits,
+            'hit_ratio': round(hits / (exported + hits), 3) if exported + hits else None,
+        },
+        'phases': {name: {'count': item['count'], 'total_ms': item['total_ms'], 'p95_ms': item['p95_ms']}
+                   for name, item in tracer.summary().items()},
+        'log_lines': len(log_lines),
+    }
+
+
+def case_key(words, excels, mode, workers):
+    return f"W{words}xE{excels}/{mode}/w{workers}"
+
+
+def git_revision():
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                   capture_output=True, text=True)
+        return completed.stdout.strip() or None
+    except OSError:
+        return None
+
+
+# ===================================================================
+# REPORT
+# ===================================================================
+
+def print_results(results):
+    print(f"\n{'조합':24s} {'시간(s)':>8s} {'삽입':>6s} {'실패':>5s} {'호출':>6s} "
+          f"{'지연(s)':>8s} {'대기(s)':>8s} {'캐시':>6s}")
+    for key, item in results.items():
+        if not item['success']:
+            print(f"{key:24s} 실패: {item['message']}")
+            continue
+        ratio = item['export_cache']['hit_ratio']
+        print(f"{key:24s} {item['wall_seconds']:8.2f} {item['images_inserted']:6d} {item['images_failed']:5d} "
+              f"{sum(item['calls'].values()):6d} {item['simulated_call_seconds']:8.2f} "
+              f"{item['readiness_wait_seconds']:8.2f} {(f'{ratio:.0%}' if ratio is not None else '-'):>6s}")
+
+
+def print_comparison(baseline, current):
+    """기준 결과 파일과 조합별 시간/호출 수 비교"""
+    print(f"\n=== 비교: {baseline['meta'].get('revision')} → {current['meta'].get('revision')} ===")
+    for key in ('latency_profile', 'time_scale', 'missing_every'):
+        if baseline['meta'].get(key) != current['meta'].get(key):
+            print(f"⚠️ 측정 조건이 다름 ({key}) - 결과를 직접 비교할 수 없을 수 있음")
+
+    print(f"{'조합':24s} {'시간(s)':>20s} {'변화':>8s} {'호출':>16s}")
+    for key, after in current['results'].items():
+        before = baseline['results'].get(key)
+        if not before or not before['success'] or not after['success']:
+            print(f"{key:24s} 비교 불가")
+            continue
+        change = (after['wall_seconds'] - before['wall_seconds']) / before['wall_seconds'] * 100
+        print(f"{key:24s} {before['wall_seconds']:8.2f} → {after['wall_seconds']:8.2f} {change:+7.1f}% "
+              f"{sum(before['calls'].values()):7d} → {sum(after['calls'].values()):6d}")
+
+
+# ===================================================================
+# MAIN
+# ===================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tab 2 파이프라인 벤치마크 (Fake Office 백엔드)")
+    parser.add_argument('--words', type=int, nargs='+', default=[1, 2], help="Word 템플릿 수 (W)")
+    parser.add_argument('--excels', type=int, nargs='+', default=[1, 2], help="엑셀 파일 수 (E, 접미사 순환)")
+    parser.add_argument('--modes', nargs='+', choices=('clipboard', 'file'), default=['clipboard', 'file'])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2],
+                        help="작업자 수 (클립보드 방식은 항상 1개로 실행되므로 1만 측정)")
+    parser.add_argument('--latency', choices=sorted(LATENCY_PROFILES), default='realistic')
+    parser.add_argument('--time-scale', type=float, default=0.05,
+                        help="지연/안정화 시간 배율 (1.0 = 실제 Office와 비슷한 시간)")
+    parser.add_argument('--missing-every', type=int, default=25,
+                        help="Word 템플릿에서 N번째 마커마다 생략 (0: 생략 없음)")
+    parser.add_argument('--data-dir', help="데이터 폴더 (기본: 임시 폴더, 이미 있으면 재사용)")
+    parser.add_argument('--keep', action='store_true', help="임시 데이터 폴더 유지")
+    parser.add_argument('--out', help="결과 JSON 경로 (기본: bench_tab2_<시각>.json)")
+    parser.add_argument('--compare', help="비교할 기준 결과 JSON")
+    args = parser.parse_args(argv)
+
+    from default_range_config import DEFAULT_RANGE_CONFIG
+
+    temporary = args.data_dir is None
+    data_dir = os.path.abspath(args.data_dir or tempfile.mkdtemp(prefix='bench_tab2_'))
+    os.makedirs(data_dir, exist_ok=True)
+
+    results = {}
+    try:
+        for words, excels in itertools.product(args.words, args.excels):
+            excel_files, word_files = generate_dataset(
+                data_dir, DEFAULT_RANGE_CONFIG, words, excels, args.missing_every
+            )
+            for mode in args.modes:
+                for workers in (args.workers if mode == 'file' else [1]):
+                    key = case_key(words, excels, mode, workers)
+                    print(f"측정 중: {key}")
+                    results[key] = run_case(
+                        excel_files, word_files, DEFAULT_RANGE_CONFIG, mode, workers,
+                        LATENCY_PROFILES[args.latency], SETTLE_PROFILES[args.latency], args.time_scale
+                    )
+    finally:
+        if temporary and not args.keep:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    output = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'latency_profile': args.latency,
+            'latency': LATENCY_PROFILES[args.latency],
+            'settle': SETTLE_PROFILES[args.latency],
+            'time_scale': args.time_scale,
+            'missing_every': args.missing_every,
+        },
+        'results': results,
+    }
+
+    print_results(results)
+
+    out_path = args.out or f"bench_tab2_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {out_path}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            print_comparison(json.load(f), output)
+
+    return 0 if all(item['success'] for item in results.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
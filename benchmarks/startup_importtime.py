@@ -0,0 +1,119 @@
+# benchmarks/startup_importtime.py
+# 시작 시간(import 비용) 측정 - python -X importtime 결과 요약
+# - 모드별 진입 모듈을 새 프로세스에서 import하고 누적 시간을 측정 (반복 측정 후 중앙값)
+# - 무거운 패키지(PySide6, docx, PIL, openpyxl, lxml, win32com)별 로드 시간 분해
+# - --baseline-dir로 다른 체크아웃(예: git worktree)과 비교
+#
+# 사용 예:
+#   python benchmarks/startup_importtime.py
+#   python benchmarks/startup_importtime.py --repeat 9 --top 15
+#   git worktree add ../baseline <rev> && python benchmarks/startup_importtime.py --baseline-dir ../baseline
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+from collections import defaultdict
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 모드 → 진입 모듈
+MODES = {
+    'gui': 'integrated_word_excel_manager',     # GUI 시작 (PySide6 필요)
+    'headless': 'report_cli',                   # 명령행 시작
+    'tab2-engine': 'parallel_range_processor',  # Tab 2 처리 엔진
+    'config': 'range_config_cache',             # 범위 설정 로드
+}
+
+HEAVY_PACKAGES = ('PySide6', 'shiboken6', 'docx', 'PIL', 'openpyxl', 'lxml', 'win32com', 'pythoncom', 'pywintypes')
+
+
+def measure(module, repo_dir):
+    """
+    새 프로세스에서 module을 import하고 -X importtime 출력 파싱
+
+    Returns:
+        (누적 시간 us, {최상위 패키지: self 시간 합계 us}) - import 실패 시 (None, 오류 메시지)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=repo_dir, capture_output=True, text=True,
+        env=dict(os.environ, PYTHONPATH=repo_dir, PYTHONDONTWRITEBYTECODE='1'),
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'import 실패'
+        return None, error
+
+    total = None
+    packages = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        except ValueError:
+            continue
+        name = name.strip()
+        packages[name.split('.')[0]] += int(self_us)
+        if name == module:
+            total = int(cumulative_us)
+    return total, dict(packages)
+
+
+def measure_mode(module, repo_dir, repeat):
+    """repeat회 측정 후 누적 시간 중앙값과 마지막 패키지 분해 반환"""
+    totals = []
+    packages = {}
+    for _ in range(repeat):
+        total, packages = measure(module, repo_dir)
+        if total is None:
+            return None, packages
+        totals.append(total)
+    return statistics.median(totals), packages
+
+
+def print_report(label, results, top):
+    print(f"\n=== {label} ===")
+    for mode, (total, packages) in results.items():
+        if total is None:
+            print(f"{mode:12s} 측정 불가: {packages}")
+            continue
+        heavy = {name: us for name, us in packages.items() if name in HEAVY_PACKAGES}
+        heavy_text = ', '.join(f"{name} {us / 1000:.1f}ms" for name, us in
+                               sorted(heavy.items(), key=lambda item: -item[1])) or '없음'
+        print(f"{mode:12s} {total / 1000:8.1f}ms  (무거운 패키지: {heavy_text})")
+        if top:
+            for name, us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+                print(f"    {name:30s} {us / 1000:8.1f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시작 시간(import 비용) 측정")
+    parser.add_argument('--modes', nargs='+', choices=sorted(MODES), default=list(MODES))
+    parser.add_argument('--repeat', type=int, default=5, help="모드별 반복 측정 횟수 (중앙값 사용)")
+    parser.add_argument('--top', type=int, default=0, help="모드별 self 시간 상위 패키지 N개 출력")
+    parser.add_argument('--baseline-dir', help="비교할 다른 체크아웃 경로")
+    args = parser.parse_args(argv)
+
+    current = {mode: measure_mode(MODES[mode], REPO_DIR, args.repeat) for mode in args.modes}
+    print_report(f"현재 ({REPO_DIR})", current, args.top)
+
+    if args.baseline_dir:
+        baseline_dir = os.path.abspath(args.baseline_dir)
+        baseline = {mode: measure_mode(MODES[mode], baseline_dir, args.repeat) for mode in args.modes}
+        print_report(f"기준 ({baseline_dir})", baseline, args.top)
+
+        print("\n=== 비교 (기준 → 현재) ===")
+        for mode in args.modes:
+            before, after = baseline[mode][0], current[mode][0]
+            if before is None or after is None:
+                print(f"{mode:12s} 비교 불가")
+                continue
+            print(f"{mode:12s} {before / 1000:8.1f}ms → {after / 1000:8.1f}ms "
+                  f"({(before - after) / before * 100:.0f}% 단축)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# cancellation.py
+# 작업 취소 토큰 (협력적 취소)
+# - GUI/API 스레드가 cancel()을 호출하면 작업 스레드가 셀/범위/파일 경계에서 check()로 확인 후 중단
+# - 중단은 OperationCancelled 예외로 전달 → 각 처리기의 finally에서 Office 종료/임시 파일 정리
+# - 취소 요청 시각을 기록하여 취소 → 정리 완료까지 걸린 시간(취소 지연)을 보고
+# - 작업자 프로세스에는 multiprocessing Event를 감싼 토큰을 전달
+#
+# 사용 예:
+#   token = CancellationToken()
+#   ... 작업 스레드: token.check()   # 취소되었으면 OperationCancelled
+#   ... GUI 스레드: token.cancel()
+
+import time
+import threading
+
+
+class OperationCancelled(Exception):
+    """사용자가 작업을 취소함 - 정상 종료 경로로 처리 (오류 아님)"""
+
+
+class CancellationToken:
+    """
+    취소 토큰
+
+    Args:
+        event: 공유할 Event (None이면 새 threading.Event) - 작업자 프로세스에는 multiprocessing Event 사용
+    """
+
+    def __init__(self, event=None):
+        self._event = event if event is not None else threading.Event()
+        self.requested_at = None
+        self.reason = None
+
+    @property
+    def event(self):
+        """내부 Event (작업자 프로세스로 전달할 때 사용)"""
+        return self._event
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self, reason="사용자 취소"):
+        """취소 요청 (어느 스레드에서나 호출 가능, 여러 번 호출해도 처음 시각 유지)"""
+        if not self._event.is_set():
+            self.requested_at = time.perf_counter()
+            self.reason = reason
+        self._event.set()
+
+    def check(self):
+        """취소되었으면 OperationCancelled 발생 (셀/범위/파일 경계에서 호출)"""
+        if self._event.is_set():
+            raise OperationCancelled(self.reason or "취소됨")
+
+    def wait(self, timeout):
+        """최대 timeout초 대기 (취소되면 즉시 반환) - time.sleep 대신 사용, 취소 여부 반환"""
+        return self._event.wait(timeout)
+
+    def latency(self):
+        """취소 요청 후 지금까지 걸린 시간 (초, 이 프로세스에서 요청하지 않았으면 None)"""
+        if self.requested_at is None:
+            return None
+        return time.perf_counter() - self.requested_at
+
+
+def check_cancelled(token):
+    """토큰이 있으면 취소 여부 확인 (None이면 아무것도 하지 않음)"""
+    if token is not None:
+        token.check()
@@ -0,0 +1,259 @@
+# default_range_config.py
+# Tab 2 기본 범위 설정 (from excel_to_word_gui.py)
+# - range_config.xlsx가 없거나 읽을 수 없을 때만 불러옴 (시작 시 로드하지 않음)
+
+DEFAULT_RANGE_CONFIG = {
+    "#1": [
+        # Below Worst Case Test Ranges
+        {"sheet": "GSM 850", "range": "B27:I31", "marker": "GSM 850", "category": "Below Worst Case Test"},
+        {"sheet": "W B5", "range": "B27:I31", "marker": "W B5", "category": "Below Worst Case Test"},
+        {"sheet": "5B", "range": "B27:J35", "marker": "5B", "category": "Below Worst Case Test"},
+        {"sheet": "B5", "range": "B52:J70", "marker": "B5", "category": "Below Worst Case Test"},
+        {"sheet": "B12", "range": "B52:J70", "marker": "B12", "category": "Below Worst Case Test"},
+        {"sheet": "B13", "range": "B32:J42", "marker": "B13", "category": "Below Worst Case Test"},
+        {"sheet": "B14", "range": "B32:J42", "marker": "B14", "category": "Below Worst Case Test"},
+        {"sheet": "B26", "range": "B101:J123", "marker": "B26_Part90", "category": "Below Worst Case Test"},
+        {"sheet": "B26", "range": "B125:J147", "marker": "B26_Strd", "category": "Below Worst Case Test"},
+        {"sheet": "B26", "range": "B149:J171", "marker": "B26_Part22", "category": "Below Worst Case Test"},
+        {"sheet": "B71", "range": "B52:J70", "marker": "B71", "category": "Below Worst Case Test"},
+
+        {"sheet": "n5", "range": "B52:K81", "marker": "n5", "category": "Below Worst Case Test"},
+        {"sheet": "n12", "range": "B46:K69", "marker": "n12", "category": "Below Worst Case Test"},
+        {"sheet": "n14", "range": "B32:K49", "marker": "n14", "category": "Below Worst Case Test"},
+        {"sheet": "n26", "range": "B70:K90", "marker": "N26_Part90", "category": "Below Worst Case Test"},
+        {"sheet": "n26", "range": "B92:K121", "marker": "N26_Strd", "category": "Below Worst Case Test"},
+        {"sheet": "n26", "range": "B123:K152", "marker": "N26_Part22", "category": "Below Worst Case Test"},
+        {"sheet": "n71", "range": "B66:K95", "marker": "n71", "category": "Below Worst Case Test"},
+
+        #Below Power Test Ranges
+        {"sheet": "GSM 850", "range": "B33:F60", "marker": "GSM 850_Pwr", "category": "Below Power Test"},
+        {"sheet": "W B5", "range": "B33:F75", "marker": "W B5_Pwr", "category": "Below Power Test"},
+        {"sheet": "5B", "range": "B37:J71", "marker": "5B_Pwr", "category": "Below Power Test"},
+        {"sheet": "B5", "range": "B72:H107", "marker": "B5_Pwr1", "category": "Below Power Test"},
+        {"sheet": "B5", "range": "B108:H143", "marker": "B5_Pwr2", "category": "Below Power Test"},
+        {"sheet": "B12", "range": "B72:H107", "marker": "B12_Pwr1", "category": "Below Power Test"},
+        {"sheet": "B12", "range": "B108:H143", "marker": "B12_Pwr2", "category": "Below Power Test"},
+        {"sheet": "B13", "range": "B44:H79", "marker": "B13_Pwr", "category": "Below Power Test"},
+        {"sheet": "B14", "range": "B44:H79", "marker": "B14_Pwr", "category": "Below Power Test"},
+        {"sheet": "B26", "range": "B173:K226", "marker": "B26_Part90_Pwr1", "category": "Below Power Test"},
+        {"sheet": "B26", "range": "B227:K262", "marker": "B26_Part90_Pwr2", "category": "Below Power Test"},
+        {"sheet": "B71", "range": "B72:H107", "marker": "B71_Pwr", "category": "Below Power Test"},
+
+        {"sheet": "n5", "range": "B83:I138", "marker": "n5_Pwr1", "category": "Below Power Test"},
+        {"sheet": "n5", "range": "B139:I178", "marker": "n5_Pwr2", "category": "Below Power Test"},
+        {"sheet": "n12", "range": "B71:I126", "marker": "n12_Pwr1", "category": "Below Power Test"},
+        {"sheet": "n12", "range": "B127:I146", "marker": "n12_Pwr2", "category": "Below Power Test"},
+        {"sheet": "n14", "range": "B51:I106", "marker": "n14_Pwr", "category": "Below Power Test"},
+        {"sheet": "n26", "range": "B154:L210", "marker": "N26_Pwr1", "category": "Below Power Test"},
+        {"sheet": "n26", "range": "B211:L252", "marker": "N26_Pwr2", "category": "Below Power Test"},
+        {"sheet": "n71", "range": "B97:I152", "marker": "n71_Pwr1", "category": "Below Power Test"},
+        {"sheet": "n71", "range": "B153:I192", "marker": "n71_Pwr2", "category": "Below Power Test"},
+
+        #Above Worst Case Test Ranges
+        {"sheet": "GSM 1900", "range": "B27:I31", "marker": "GSM 1900", "category": "Above Worst Case Test"},
+        {"sheet": "W B2", "range": "B27:I31", "marker": "W B2", "category": "Above Worst Case Test"},
+        {"sheet": "W B4", "range": "B27:I31", "marker": "W B4", "category": "Above Worst Case Test"},
+        {"sheet": "B2", "range": "B64:J90", "marker": "B2", "category": "Above Worst Case Test"},
+        {"sheet": "B4", "range": "B64:J90", "marker": "B4", "category": "Above Worst Case Test"},
+        {"sheet": "B7", "range": "B52:J70", "marker": "B7", "category": "Above Worst Case Test"},
+        {"sheet": "7C", "range": "B27:J35", "marker": "7C", "category": "Above Worst Case Test"},
+        {"sheet": "B25", "range": "B64:J90", "marker": "B25", "category": "Above Worst Case Test"},
+        {"sheet": "B30", "range": "B34:J44", "marker": "B30", "category": "Above Worst Case Test"},
+        {"sheet": "B41", "range": "B52:J70", "marker": "B41", "category": "Above Worst Case Test"},
+        {"sheet": "41C", "range": "B27:J37", "marker": "41C", "category": "Above Worst Case Test"},
+        {"sheet": "B48", "range": "B52:J70", "marker": "B48", "category": "Above Worst Case Test"},
+        {"sheet": "48C", "range": "B27:J37", "marker": "48C", "category": "Above Worst Case Test"},
+        {"sheet": "B66", "range": "B64:J90", "marker": "B66", "category": "Above Worst Case Test"},
+        {"sheet": "66B", "range": "B52:J70", "marker": "66B", "category": "Above Worst Case Test"},
+        {"sheet": "66C", "range": "B27:J37", "marker": "66C", "category": "Above Worst Case Test"},
+
+        {"sheet": "n7", "range": "B82:K141", "marker": "n7", "category": "Above Worst Case Test"},
+        {"sheet": "n12", "range": "B46:K69", "marker": "n12", "category": "Above Worst Case Test"},
+        {"sheet": "n14", "range": "B38:K55", "marker": "n14", "category": "Above Worst Case Test"},
+        {"sheet": "n25", "range": "B76:K129", "marker": "n25", "category": "Above Worst Case Test"},
+        {"sheet": "n30", "range": "B36:K53", "marker": "n30", "category": "Above Worst Case Test"},
+        {"sheet": "n41", "range": "B112:K201", "marker": "n41", "category": "Above Worst Case Test"},
+        {"sheet": "n41_SRS", "range": "B24:I38", "marker": "n41_SRS2", "category": "Above Worst Case Test"},
+        {"sheet": "n41_SRS", "range": "M24:T38", "marker": "n41_SRS3", "category": "Above Worst Case Test"},
+        {"sheet": "n41_SRS", "range": "X24:AE38", "marker": "n41_SRS4", "category": "Above Worst Case Test"},
+        {"sheet": "n48", "range": "B58:K93", "marker": "n48", "category": "Above Worst Case Test"},
+        {"sheet": "n48_SRS", "range": "B24:I31", "marker": "n48_SRS2", "category": "Above Worst Case Test"},
+        {"sheet": "n48_SRS", "range": "M24:T31", "marker": "n48_SRS3", "category": "Above Worst Case Test"},
+        {"sheet": "n48_SRS", "range": "X24:AE31", "marker": "n48_SRS4", "category": "Above Worst Case Test"},
+        {"sheet": "n66", "range": "B82:K144", "marker": "n66", "category": "Above Worst Case Test"},
+        {"sheet": "n70", "range": "B42:K65", "marker": "n70", "category": "Above Worst Case Test"},
+        {"sheet": "n71", "range": "B66:K95", "marker": "n71", "category": "Above Worst Case Test"},
+        {"sheet": "n77 DoD", "range": "B92:K169", "marker": "n77 DoD", "category": "Above Worst Case Test"},
+        {"sheet": "n77 DoD SRS", "range": "B22:I36", "marker": "n77 DoD SRS2", "category": "Above Worst Case Test"},
+        {"sheet": "n77 DoD SRS", "range": "M22:T36", "marker": "n77 DoD SRS3", "category": "Above Worst Case Test"},
+        {"sheet": "n77 DoD SRS", "range": "X22:AE36", "marker": "n77 DoD SRS4", "category": "Above Worst Case Test"},
+        {"sheet": "n77 Upper", "range": "B100:K177", "marker": "n77 Upper", "category": "Above Worst Case Test"},
+        {"sheet": "n77 Upper SRS", "range": "B24:I38", "marker": "n77 Upper SRS2", "category": "Above Worst Case Test"},
+        {"sheet": "n77 Upper SRS", "range": "M24:T38", "marker": "n77 Upper SRS3", "category": "Above Worst Case Test"},
+        {"sheet": "n77 Upper SRS", "range": "X24:AE38", "marker": "n77 Upper SRS4", "category": "Above Worst Case Test"},
+
+        #Above Power Test Ranges
+        {"sheet": "GSM 1900", "range": "B33:F60", "marker": "GSM 1900_Pwr", "category": "Above Power Test"},
+        {"sheet": "W B2", "range": "B33:F75", "marker": "W B2_Pwr", "category": "Above Power Test"},
+        {"sheet": "W B4", "range": "B33:F75", "marker": "W B4_Pwr", "category": "Above Power Test"},
+        {"sheet": "B2", "range": "B92:H145", "marker": "B2_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B2", "range": "B146:H199", "marker": "B2_Pwr2", "category": "Above Power Test"},
+        {"sheet": "B4", "range": "B92:H145", "marker": "B4_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B4", "range": "B146:H199", "marker": "B4_Pwr2", "category": "Above Power Test"},
+        {"sheet": "B7", "range": "B72:H107", "marker": "B7_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B7", "range": "B108:H143", "marker": "B7_Pwr2", "category": "Above Power Test"},
+        {"sheet": "7C", "range": "B37:J71", "marker": "7C_Pwr", "category": "Above Power Test"},
+        {"sheet": "B25", "range": "B92:H145", "marker": "B25_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B25", "range": "B146:H199", "marker": "B25_Pwr2", "category": "Above Power Test"},
+        {"sheet": "B30", "range": "B46:H81", "marker": "B30_Pwr", "category": "Above Power Test"},
+        {"sheet": "B41", "range": "B72:H107", "marker": "B41_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B41", "range": "B108:H143", "marker": "B41_Pwr2", "category": "Above Power Test"},
+        {"sheet": "41C", "range": "B39:J85", "marker": "41C_Pwr", "category": "Above Power Test"},
+        {"sheet": "B48", "range": "B72:H107", "marker": "B48_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B48", "range": "B108:H143", "marker": "B48_Pwr2", "category": "Above Power Test"},
+        {"sheet": "48C", "range": "B39:J85", "marker": "48C_Pwr", "category": "Above Power Test"},
+        {"sheet": "B66", "range": "B92:H145", "marker": "B66_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B66", "range": "B146:H199", "marker": "B66_Pwr2", "category": "Above Power Test"},
+        {"sheet": "66B", "range": "B37:J71", "marker": "66B_Pwr", "category": "Above Power Test"},
+        {"sheet": "66C", "range": "B39:J85", "marker": "66C_Pwr", "category": "Above Power Test"},
+
+        {"sheet": "n7", "range": "B82:K141", "marker": "n7", "category": "Above Power Test"},
+        {"sheet": "n12", "range": "B46:K69", "marker": "n12", "category": "Above Power Test"},
+        {"sheet": "n14", "range": "B38:K55", "marker": "n14", "category": "Above Power Test"},
+        {"sheet": "n25", "range": "B76:K129", "marker": "n25", "category": "Above Power Test"},
+        {"sheet": "n26", "range": "B70:K90", "marker": "N26_Part90", "category": "Above Power Test"},
+        {"sheet": "n26", "range": "B92:K121", "marker": "N26_Strd", "category": "Above Power Test"},
+        {"sheet": "n26", "range": "B123:K152", "marker": "N26_Part22", "category": "Above Power Test"},
+        {"sheet": "n30", "range": "B36:K53", "marker": "n30", "category": "Above Power Test"},
+        {"sheet": "n41", "range": "B112:K201", "marker": "n41", "category": "Above Power Test"},
+        {"sheet": "n41_SRS", "range": "B24:I38", "marker": "n41_SRS2", "category": "Above Power Test"},
+        {"sheet": "n41_SRS", "range": "M24:T38", "marker": "n41_SRS3", "category": "Above Power Test"},
+        {"sheet": "n41_SRS", "range": "X24:AE38", "marker": "n41_SRS4", "category": "Above Power Test"},
+        {"sheet": "n48", "range": "B58:K93", "marker": "n48", "category": "Above Power Test"},
+        {"sheet": "n48_SRS", "range": "B24:I31", "marker": "n48_SRS2", "category": "Above Power Test"},
+        {"sheet": "n48_SRS", "range": "M24:T31", "marker": "n48_SRS3", "category": "Above Power Test"},
+        {"sheet": "n48_SRS", "range": "X24:AE31", "marker": "n48_SRS4", "category": "Above Power Test"},
+        {"sheet": "n66", "range": "B82:K144", "marker": "n66", "category": "Above Power Test"},
+        {"sheet": "n70", "range": "B42:K65", "marker": "n70", "category": "Above Power Test"},
+        {"sheet": "n71", "range": "B66:K95", "marker": "n71", "category": "Above Power Test"},
+        {"sheet": "n77 DoD", "range": "B92:K169", "marker": "n77 DoD", "category": "Above Power Test"},
+        {"sheet": "n77 DoD SRS", "range": "B22:I36", "marker": "n77 DoD SRS2", "category": "Above Power Test"},
+        {"sheet": "n77 DoD SRS", "range": "M22:T36", "marker": "n77 DoD SRS3", "category": "Above Power Test"},
+        {"sheet": "n77 DoD SRS", "range": "X22:AE36", "marker": "n77 DoD SRS4", "category": "Above Power Test"},
+        {"sheet": "n77 Upper", "range": "B100:K177", "marker": "n77 Upper", "category": "Above Power Test"},
+        {"sheet": "n77 Upper SRS", "range": "B24:I38", "marker": "n77 Upper SRS2", "category": "Above Power Test"},
+        {"sheet": "n77 Upper SRS", "range": "M24:T38", "marker": "n77 Upper SRS3", "category": "Above Power Test"},
+        {"sheet": "n77 Upper SRS", "range": "X24:AE38", "marker": "n77 Upper SRS4", "category": "Above Power Test"},
+    ],
+    "#2": [
+        #Below Worst Case Test Ranges
+        {"sheet": "GSM 850", "range": "B30:I31", "marker": "GSM 850", "category": "Below Worst Case Test"},
+        {"sheet": "W B5", "range": "B33:F75", "marker": "W B5", "category": "Below Worst Case Test"},
+        {"sheet": "5B", "range": "B30:J35", "marker": "5B", "category": "Below Worst Case Test"},
+        {"sheet": "B5", "range": "B55:J70", "marker": "B5", "category": "Below Worst Case Test"},
+        {"sheet": "B12", "range": "B55:J70", "marker": "B12", "category": "Below Worst Case Test"},
+        {"sheet": "B13", "range": "B41:J48", "marker": "B13", "category": "Below Worst Case Test"},
+        {"sheet": "B14", "range": "B41:J48", "marker": "B14", "category": "Below Worst Case Test"},
+        {"sheet": "B26", "range": "B104:J123", "marker": "B26_Part90", "category": "Below Worst Case Test"},
+        {"sheet": "B26", "range": "B128:J147", "marker": "B26_Strd", "category": "Below Worst Case Test"},
+        {"sheet": "B26", "range": "B152:J171", "marker": "B26_Part22", "category": "Below Worst Case Test"},
+        {"sheet": "B71", "range": "B55:J70", "marker": "B71", "category": "Below Worst Case Test"},
+        {"sheet": "n5", "range": "B55:K81", "marker": "n5", "category": "Below Worst Case Test"},
+        {"sheet": "n12", "range": "B49:K69", "marker": "n12", "category": "Below Worst Case Test"},
+        {"sheet": "n14", "range": "B41:K55", "marker": "n14", "category": "Below Worst Case Test"},
+        {"sheet": "n26", "range": "B73:K90", "marker": "N26_Part90", "category": "Below Worst Case Test"},
+        {"sheet": "n26", "range": "B95:K121", "marker": "N26_Strd", "category": "Below Worst Case Test"},
+        {"sheet": "n26", "range": "B126:K152", "marker": "N26_Part22", "category": "Below Worst Case Test"},
+        {"sheet": "n71", "range": "B69:K95", "marker": "n71", "category": "Below Worst Case Test"},
+
+        #Below Power Test Ranges
+        {"sheet": "GSM 850", "range": "B33:F60", "marker": "GSM 850_Pwr", "category": "Below Power Test"},
+        {"sheet": "W B5", "range": "B33:F75", "marker": "W B5_Pwr", "category": "Below Power Test"},
+        {"sheet": "5B", "range": "B37:J71", "marker": "5B_Pwr", "category": "Below Power Test"},
+        {"sheet": "B5", "range": "B72:H107", "marker": "B5_Pwr1", "category": "Below Power Test"},
+        {"sheet": "B5", "range": "B108:H143", "marker": "B5_Pwr2", "category": "Below Power Test"},
+        {"sheet": "B12", "range": "B72:H107", "marker": "B12_Pwr1", "category": "Below Power Test"},
+        {"sheet": "B12", "range": "B108:H143", "marker": "B12_Pwr2", "category": "Below Power Test"},
+        {"sheet": "B13", "range": "B50:H85", "marker": "B13_Pwr", "category": "Below Power Test"},
+        {"sheet": "B14", "range": "B50:H85", "marker": "B14_Pwr", "category": "Below Power Test"},
+        {"sheet": "B26", "range": "B173:K226", "marker": "B26_Pwr1", "category": "Below Power Test"},
+        {"sheet": "B26", "range": "B227:K262", "marker": "B26_Pwr2", "category": "Below Power Test"},
+        {"sheet": "B71", "range": "B72:H107", "marker": "B71_Pwr", "category": "Below Power Test"},
+
+        {"sheet": "n5", "range": "B83:I138", "marker": "n5_Pwr1", "category": "Below Power Test"},
+        {"sheet": "n5", "range": "B139:I178", "marker": "n5_Pwr2", "category": "Below Power Test"},
+        {"sheet": "n12", "range": "B71:I126", "marker": "n12_Pwr1", "category": "Below Power Test"},
+        {"sheet": "n12", "range": "B127:I146", "marker": "n12_Pwr2", "category": "Below Power Test"},
+        {"sheet": "n14", "range": "B57:I112", "marker": "n14_Pwr", "category": "Below Power Test"},
+        {"sheet": "n26", "range": "B154:L210", "marker": "N26_Pwr1", "category": "Below Power Test"},
+        {"sheet": "n26", "range": "B211:L252", "marker": "N26_Pwr2", "category": "Below Power Test"},
+        {"sheet": "n71", "range": "B97:I152", "marker": "n71_Pwr1", "category": "Below Power Test"},
+        {"sheet": "n71", "range": "B153:I192", "marker": "n71_Pwr2", "category": "Below Power Test"},
+
+        #Above Worst Case Test Ranges
+        {"sheet": "GSM 1900", "range": "B30:I31", "marker": "GSM 1900", "category": "Above Worst Case Test"},
+        {"sheet": "W B2", "range": "B30:I31", "marker": "W B2", "category": "Above Worst Case Test"},
+        {"sheet": "W B4", "range": "B30:I31", "marker": "W B4", "category": "Above Worst Case Test"},
+        {"sheet": "B2", "range": "B67:J90", "marker": "B2", "category": "Above Worst Case Test"},
+        {"sheet": "B4", "range": "B67:J90", "marker": "B4", "category": "Above Worst Case Test"},
+        {"sheet": "B7", "range": "B55:J70", "marker": "B7", "category": "Above Worst Case Test"},
+        {"sheet": "7C", "range": "B27:J35", "marker": "7C", "category": "Above Worst Case Test"},
+        {"sheet": "B25", "range": "B67:J90", "marker": "B25", "category": "Above Worst Case Test"},
+        {"sheet": "B30", "range": "B37:J44", "marker": "B30", "category": "Above Worst Case Test"},
+        {"sheet": "B41", "range": "B55:J70", "marker": "B41", "category": "Above Worst Case Test"},
+        {"sheet": "41C", "range": "B27:J37", "marker": "41C", "category": "Above Worst Case Test"},
+        {"sheet": "B48", "range": "B55:J70", "marker": "B48", "category": "Above Worst Case Test"},
+        {"sheet": "48C", "range": "B27:J37", "marker": "48C", "category": "Above Worst Case Test"},
+        {"sheet": "B66", "range": "B67:J90", "marker": "B66", "category": "Above Worst Case Test"},
+        {"sheet": "66B", "range": "B52:J70", "marker": "66B", "category": "Above Worst Case Test"},
+        {"sheet": "66C", "range": "B27:J37", "marker": "66C", "category": "Above Worst Case Test"},
+
+        {"sheet": "n7", "range": "B82:K141", "marker": "n7", "category": "Above Worst Case Test"},
+        {"sheet": "n12", "range": "B49:K69", "marker": "n12", "category": "Above Worst Case Test"},
+        {"sheet": "n14", "range": "B41:K55", "marker": "n14", "category": "Above Worst Case Test"},
+        {"sheet": "n25", "range": "B76:K129", "marker": "n25", "category": "Above Worst Case Test"},
+        {"sheet": "n30", "range": "B39:K53", "marker": "n30", "category": "Above Worst Case Test"},
+        {"sheet": "n41", "range": "B112:K201", "marker": "n41", "category": "Above Worst Case Test"},
+        {"sheet": "n41_SRS", "range": "B24:I38", "marker": "n41_SRS2", "category": "Above Worst Case Test"},
+        {"sheet": "n41_SRS", "range": "M24:T38", "marker": "n41_SRS3", "category": "Above Worst Case Test"},
+        {"sheet": "n41_SRS", "range": "X24:AE38", "marker": "n41_SRS4", "category": "Above Worst Case Test"},
+        {"sheet": "n48", "range": "B58:K93", "marker": "n48", "category": "Above Worst Case Test"},
+        {"sheet": "n48_SRS", "range": "B24:I31", "marker": "n48_SRS2", "category": "Above Worst Case Test"},
+        {"sheet": "n48_SRS", "range": "M24:T31", "marker": "n48_SRS3", "category": "Above Worst Case Test"},
+        {"sheet": "n48_SRS", "range": "X24:AE31", "marker": "n48_SRS4", "category": "Above Worst Case Test"},
+        {"sheet": "n66", "range": "B82:K144", "marker": "n66", "category": "Above Worst Case Test"},
+        {"sheet": "n70", "range": "B45:K65", "marker": "n70", "category": "Above Worst Case Test"},
+        {"sheet": "n77 DoD", "range": "B92:K169", "marker": "n77 DoD", "category": "Above Worst Case Test"},
+        {"sheet": "n77 DoD SRS", "range": "B22:I36", "marker": "n77 DoD SRS2", "category": "Above Worst Case Test"},
+        {"sheet": "n77 DoD SRS", "range": "M22:T36", "marker": "n77 DoD SRS3", "category": "Above Worst Case Test"},
+        {"sheet": "n77 DoD SRS", "range": "X22:AE36", "marker": "n77 DoD SRS4", "category": "Above Worst Case Test"},
+        {"sheet": "n77 Upper", "range": "B100:K177", "marker": "n77 Upper", "category": "Above Worst Case Test"},
+        {"sheet": "n77 Upper SRS", "range": "B24:I38", "marker": "n77 Upper SRS2", "category": "Above Worst Case Test"},
+        {"sheet": "n77 Upper SRS", "range": "M24:T38", "marker": "n77 Upper SRS3", "category": "Above Worst Case Test"},
+        {"sheet": "n77 Upper SRS", "range": "X24:AE38", "marker": "n77 Upper SRS4", "category": "Above Worst Case Test"},
+
+        #Above Power Test Ranges
+        {"sheet": "GSM 850", "range": "B33:F60", "marker": "GSM 850_Pwr", "category": "Above Power Test"},
+        {"sheet": "W B5", "range": "B33:F75", "marker": "W B5_Pwr", "category": "Above Power Test"},
+        {"sheet": "5B", "range": "B37:J71", "marker": "5B_Pwr", "category": "Above Power Test"},
+        {"sheet": "B5", "range": "B72:H107", "marker": "B5_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B5", "range": "B108:H143", "marker": "B5_Pwr2", "category": "Above Power Test"},
+        {"sheet": "B12", "range": "B72:H107", "marker": "B12_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B12", "range": "B108:H143", "marker": "B12_Pwr2", "category": "Above Power Test"},
+        {"sheet": "B13", "range": "B50:H85", "marker": "B13_Pwr", "category": "Above Power Test"},
+        {"sheet": "B14", "range": "B50:H85", "marker": "B14_Pwr", "category": "Above Power Test"},
+        {"sheet": "B26", "range": "B173:K226", "marker": "B26_Part90_Pwr1", "category": "Above Power Test"},
+        {"sheet": "B26", "range": "B227:K262", "marker": "B26_Part90_Pwr2", "category": "Above Power Test"},
+        {"sheet": "B71", "range": "B72:H107", "marker": "B71_Pwr", "category": "Above Power Test"},
+
+        {"sheet": "n5", "range": "B83:I138", "marker": "n5_Pwr1", "category": "Above Power Test"},
+        {"sheet": "n5", "range": "B139:I178", "marker": "n5_Pwr2", "category": "Above Power Test"},
+        {"sheet": "n12", "range": "B71:I126", "marker": "n12_Pwr1", "category": "Above Power Test"},
+        {"sheet": "n12", "range": "B127:I146", "marker": "n12_Pwr2", "category": "Above Power Test"},
+        {"sheet": "n14", "range": "B57:I112", "marker": "n14_Pwr", "category": "Above Power Test"},
+        {"sheet": "n26", "range": "B154:L210", "marker": "N26_Pwr1", "category": "Above Power Test"},
+        {"sheet": "n26", "range": "B211:L252", "marker": "N26_Pwr2", "category": "Above Power Test"},
+        {"sheet": "n71", "range": "B97:I152", "marker": "n71_Pwr1", "category": "Above Power Test"},
+        {"sheet": "n71", "range": "B153:I192", "marker": "n71_Pwr2", "category": "Above Power Test"},
+    ]
+}
@@ -0,0 +1,266 @@
+# excel_range_preflight.py
+# Tab 2 사전 검사 (Office 실행 전)
+# - 엑셀: openpyxl 읽기 전용 모드로 시트 이름/표시 상태/사용 범위 확인
+# - 워드: docx의 word/document.xml을 lxml로 읽어 {marker}_{suffix} 문자열 확인
+# - 파일별 검사는 스레드로 병렬 실행
+# - 결과는 실행 계획(PreflightPlan): 실패가 확실한 항목은 자동화 전에 제외
+
+import os
+import re
+import zipfile
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+# lxml/openpyxl은 로드 비용이 크므로 검사 함수에서 처음 사용할 때 불러옴
+
+
+logger = logging.getLogger(__name__)
+
+WORD_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W_P = f'{{{WORD_NS}}}p'
+W_T = f'{{{WORD_NS}}}t'
+
+# 사전 검사 스레드 수 상한 (파일 I/O 위주)
+DEFAULT_PREFLIGHT_THREADS = 8
+
+
+# ===================================================================
+# FILE INSPECTION
+# ===================================================================
+
+def inspect_workbook(path):
+    """
+    통합문서 시트 정보 읽기 (읽기 전용)
+
+    Returns:
+        {'sheets': {시트명: {'visible': bool, 'used_range': 'A1:D20' 또는 None}}, 'error': None}
+        .xls 등 openpyxl이 읽을 수 없는 형식은 {'sheets': None, 'error': None} (검사 생략)
+    """
+    if not path.lower().endswith(('.xlsx', '.xlsm')):
+        return {'sheets': None, 'error': None}
+
+    from openpyxl import load_workbook
+
+    try:
+        wb = load_workbook(path, read_only=True)
+    except Exception as e:
+        return {'sheets': None, 'error': f"엑셀 파일을 읽을 수 없음 ({str(e)})"}
+
+    try:
+        sheets = {}
+        for ws in wb.worksheets:
+            try:
+                used_range = ws.calculate_dimension()
+            except Exception:
+                used_range = None
+            sheets[ws.title] = {
+                'visible': ws.sheet_state == 'visible',
+                'used_range': used_range,
+            }
+        return {'sheets': sheets, 'error': None}
+    finally:
+        wb.close()
+
+
+def read_document_paragraphs(path):
+    """
+    docx 본문 단락 텍스트 목록 (런으로 나뉜 텍스트는 단락 단위로 합침)
+
+    Word의 찾기(HomeKey wdStory 기준)와 같이 본문(document.xml)만 검사합니다.
+    .doc 등 읽을 수 없는 형식은 None 반환 (검사 생략)
+    """
+    if not path.lower().endswith(('.docx', '.docm')):
+        return None
+
+    from lxml import etree
+
+    try:
+        with zipfile.ZipFile(path) as zf:
+            with zf.open('word/document.xml') as f:
+                root = etree.parse(f).getroot()
+    except Exception:
+        return None
+
+    paragraphs = []
+    for p in root.iter(W_P):
+        text = ''.join(t.text or '' for t in p.iter(W_T))
+        if text:
+            paragraphs.append(text)
+    return paragraphs
+
+
+def find_markers(paragraphs, markers):
+    """단락 텍스트에 포함된 마커 집합"""
+    text = '\n'.join(paragraphs)
+    return {marker for marker in markers if marker in text}
+
+
+def validate_range_address(range_address):
+    """범위 주소 확인 - 올바르지 않으면 실패 이유 반환"""
+    from openpyxl.utils.cell import range_boundaries
+    try:
+        min_col, min_row, max_col, max_row = range_boundaries(range_address)
+    except Exception:
+        return f"잘못된 범위 주소: {range_address}"
+    if None in (min_col, min_row, max_col, max_row):
+        return f"잘못된 범위 주소 (행/열 전체 범위는 지원 안 함): {range_address}"
+    return None
+
+
+def is_outside_used_range(range_address, used_range):
+    """범위가 시트 사용 범위와 겹치지 않으면 True (빈 그림이 될 가능성)"""
+    if not used_range:
+        return False
+    from openpyxl.utils.cell import range_boundaries
+    try:
+        r_min_col, r_min_row, r_max_col, r_max_row = range_boundaries(range_address)
+        u_min_col, u_min_row, u_max_col, u_max_row = range_boundaries(used_range)
+    except Exception:
+        return False
+    return (r_max_col < u_min_col or r_min_col > u_max_col
+            or r_max_row < u_min_row or r_min_row > u_max_row)
+
+
+# ===================================================================
+# PLAN
+# ===================================================================
+
+class PreflightPlan:
+    """
+    사전 검사 결과 (실행 계획)
+
+    - entries_for(word_file, excel_file): 실행할 (접미사, 항목 리스트, GUI 테이블 사용 여부), 없으면 None
+    - skipped_for(word_file, excel_file): 제외된 항목 (failed_markers 형식, word_file 제외)
+    """
+
+    def __init__(self):
+        self._entries = {}   # (word_file, excel_file) → (suffix, entries, from_gui)
+        self._skipped = {}   # (word_file, excel_file) → [dict]
+        self.warnings = []
+        self.checked = 0
+
+    def add_entries(self, word_file, excel_file, suffix, entries, from_gui):
+        self._entries[(word_file, excel_file)] = (suffix, entries, from_gui)
+
+    def add_skipped(self, word_file, excel_file, item):
+        self._skipped.setdefault((word_file, excel_file), []).append(item)
+
+    def entries_for(self, word_file, excel_file):
+        return self._entries.get((word_file, excel_file))
+
+    def skipped_for(self, word_file, excel_file):
+        return self._skipped.get((word_file, excel_file), [])
+
+    @property
+    def runnable_count(self):
+        return sum(len(entries) for _, entries, _ in self._entries.values())
+
+    @property
+    def skipped_count(self):
+        return sum(len(items) for items in self._skipped.values())
+
+
+def extract_suffix(filename):
+    """파일명에서 접미사 추출 (#1, #2 등)"""
+    match = re.search(r'_#(\d+)\.xlsx?$', filename, re.IGNORECASE)
+    if match:
+        return f"#{match.group(1)}"
+    return None
+
+
+def build_preflight_plan(excel_files, word_files, mappings, range_config,
+                         max_workers=DEFAULT_PREFLIGHT_THREADS, log_callback=None):
+    """
+    사전 검사 실행 후 PreflightPlan 반환
+
+    제외 기준 (Office에서도 반드시 실패하는 항목):
+        엑셀 파일 읽기 실패, 시트 없음, 숨김 시트, 잘못된 범위 주소, 워드 문서에 마커 없음
+    경고만 (실행은 함): 범위가 사용 범위 밖 (빈 그림)
+    """
+    def log(message):
+        if log_callback:
+            log_callback(message)
+        else:
+            logger.info(message)
+
+    # 파일별 검사를 스레드로 병렬 실행
+    threads = max(1, min(max_workers, len(excel_files) + len(word_files)))
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        workbook_futures = {f: executor.submit(inspect_workbook, f) for f in excel_files}
+        document_futures = {f: executor.submit(read_document_paragraphs, f) for f in word_files}
+        workbooks = {f: future.result() for f, future in workbook_futures.items()}
+        documents = {f: future.result() for f, future in document_futures.items()}
+
+    plan = PreflightPlan()
+
+    for excel_file in excel_files:
+        suffix = extract_suffix(os.path.basename(excel_file))
+        if not suffix:
+            continue  # 처리 단계에서 '접미사 없음'으로 건너뜀
+
+        if suffix in range_config:
+            entries, from_gui = range_config[suffix], False
+        else:
+            entries, from_gui = mappings, True
+
+        info = workbooks[excel_file]
+
+        # 통합문서 기준 검사 (모든 Word 파일에 공통)
+        workbook_ok = []
+        workbook_skipped = []
+        for entry in entries:
+            reason = info['error'] or validate_range_address(entry['range'])
+            if reason is None and info['sheets'] is not None:
+                sheet = info['sheets'].get(entry['sheet'])
+                if sheet is None:
+                    reason = f"시트 없음: {entry['sheet']}"
+                elif not sheet['visible']:
+                    reason = f"숨김 시트: {entry['sheet']}"
+                elif is_outside_used_range(entry['range'], sheet['used_range']):
+                    plan.warnings.append(
+                        f"{os.path.basename(excel_file)} [{entry['sheet']}] {entry['range']}: "
+                        f"사용 범위({sheet['used_range']}) 밖 - 빈 그림이 삽입될 수 있음"
+                    )
+            if reason:
+                workbook_skipped.append((entry, reason))
+            else:
+                workbook_ok.append(entry)
+
+        # 문서 기준 검사 (마커 존재 여부)
+        for word_file in word_files:
+            paragraphs = documents[word_file]
+            runnable = []
+            if paragraphs is None:
+                runnable = list(workbook_ok)
+            else:
+                found = find_markers(paragraphs, {f"{e['marker']}_{suffix}" for e in workbook_ok})
+                for entry in workbook_ok:
+                    if f"{entry['marker']}_{suffix}" in found:
+                        runnable.append(entry)
+                    else:
+                        plan.add_skipped(word_file, excel_file, _skipped_item(
+                            excel_file, suffix, entry, "마커를 Word 문서에서 찾을 수 없음 (사전 검사)"
+                        ))
+
+            for entry, reason in workbook_skipped:
+                plan.add_skipped(word_file, excel_file, _skipped_item(excel_file, suffix, entry, f"{reason} (사전 검사)"))
+
+            plan.add_entries(word_file, excel_file, suffix, runnable, from_gui)
+            plan.checked += len(entries)
+
+    log(f"✓ 사전 검사 완료: 실행 {plan.runnable_count}개, 제외 {plan.skipped_count}개")
+    for warning in plan.warnings:
+        log(f"  ⚠️ {warning}")
+
+    return plan
+
+
+def _skipped_item(excel_file, suffix, entry, reason):
+    """failed_markers 형식의 제외 항목 (word_file은 처리기가 채움)"""
+    return {
+        'excel_file': os.path.basename(excel_file),
+        'marker': f"{entry['marker']}_{suffix}",
+        'sheet': entry['sheet'],
+        'range': entry['range'],
+        'reason': reason,
+    }
@@ -0,0 +1,479 @@
+# excel_range_processor.py
+# Tab 2 처리 엔진 (Qt/win32com 비의존)
+# - Excel 범위를 그림으로 변환하여 Word 문서의 마커 위치에 삽입
+# - Office 접근은 OfficeAutomation 인터페이스를 통해서만 수행 (COM/Fake 교체 가능)
+
+import os
+import time
+import shutil
+import logging
+import tempfile
+import traceback
+
+from office_automation import (
+    create_office_automation, EXPORT_MODE_CLIPBOARD, EXPORT_MODE_FILE, EXPORT_MODES
+)
+from excel_range_preflight import build_preflight_plan, extract_suffix
+from tracing import span
+from memory_profiling import memory_checkpoint
+from cancellation import OperationCancelled, check_cancelled
+
+
+logger = logging.getLogger(__name__)
+
+
+class ExcelRangeProcessor:
+    """
+    Excel 범위 → Word 마커 삽입 처리기
+
+    Args:
+        excel_files: 엑셀 파일 리스트 (파일명_#N.xlsx)
+        word_files: 워드 템플릿 파일 리스트
+        mappings: GUI 테이블 매핑 (range_config에 접미사가 없을 때 사용)
+        range_config: 접미사별 범위 설정 dict ({'#1': [{'sheet', 'range', 'marker', 'category'}, ...]})
+        automation: OfficeAutomation 인스턴스 (None이면 backend로 생성)
+        backend: automation이 None일 때 사용할 백엔드 이름 ('com' 또는 'fake')
+        backend_options: 백엔드 생성자 인자 (예: {'recycle_after': 20})
+        log_callback: 로그 출력 콜백
+        export_mode: 'clipboard'(CopyPicture → Paste) 또는
+                     'file'(범위를 temp_dir에 PNG로 저장 → 파일에서 삽입, 클립보드 미사용)
+        preflight: True이면 Office 실행 전에 사전 검사(excel_range_preflight)를 수행하여
+                   시트 없음/숨김 시트/잘못된 범위/마커 없음 항목을 미리 제외
+        cancel_token: 취소 토큰 (cancellation.py) - Word 파일/엑셀 파일/범위 단위로 확인하고,
+                      취소되면 Office 종료와 임시 파일/미완성 복사본 정리 후 result['cancelled']=True
+    """
+
+    def __init__(self, excel_files, word_files, mappings, range_config,
+                 automation=None, backend='com', backend_options=None, log_callback=None,
+                 export_mode=EXPORT_MODE_CLIPBOARD, preflight=True, cancel_token=None):
+        if export_mode not in EXPORT_MODES:
+            raise ValueError(f"알 수 없는 범위 변환 방식: {export_mode} (사용 가능: {', '.join(EXPORT_MODES)})")
+
+        self.excel_files = excel_files  # 엑셀 파일 리스트
+        self.word_files = word_files    # 워드 파일 리스트
+        self.mappings = mappings
+        self.range_config = range_config
+        self.log_callback = log_callback
+        self.export_mode = export_mode
+        self.preflight = preflight
+        self.cancel_token = cancel_token
+        self.temp_dir = None  # run() 안에서 만들고 같은 finally에서 삭제 (생성자 실패 시 남지 않게)
+
+        # 파일 변환 캐시: (엑셀 경로, 시트, 범위) → (이미지 경로, 실패 이유)
+        # 같은 범위를 여러 Word 파일에 삽입할 때 한 번만 렌더링
+        self._export_cache = {}
+
+        if automation is None:
+            automation = create_office_automation(
+                backend, log_callback=self.log, **(backend_options or {})
+            )
+        self.automation = automation
+        automation.readiness.cancel_token = cancel_token  # 준비 대기 중에도 취소 즉시 반영
+
+    def log(self, message):
+        """로그 출력"""
+        logger.info(message)
+        if self.log_callback:
+            self.log_callback(message)
+
+    def create_word_copy(self, word_file):
+        """Word 파일 복사본 생성"""
+        try:
+            # 원본 파일명에서 확장자 분리
+            base_name = os.path.splitext(word_file)[0]
+            ext = os.path.splitext(word_file)[1]
+
+            # 복사본 파일명 생성
+            copy_file = f"{base_name}_copy{ext}"
+
+            # 이미 존재하면 번호 추가 (빈 파일로 예약 - 동시에 실행 중인 다른 작업과 이름이 겹치지 않게)
+            counter = 1
+            while True:
+                try:
+                    with open(copy_file, 'xb'):
+                        break
+                except FileExistsError:
+                    copy_file = f"{base_name}_copy{counter}{ext}"
+                    counter += 1
+
+            # 파일 복사 (실패하면 예약한 빈 파일 삭제)
+            try:
+                shutil.copy2(word_file, copy_file)
+            except BaseException:
+                os.remove(copy_file)
+                raise
+            self.log(f"✓ Word 복사본 생성: {os.path.basename(copy_file)}")
+
+            return copy_file
+
+        except Exception as e:
+            self.log(f"✗ Word 파일 복사 실패: {str(e)}")
+            return None
+
+    def extract_suffix(self, filename):
+        """파일명에서 접미사 추출 (#1, #2 등)"""
+        return extract_suffix(filename)
+
+    def get_entries_for_suffix(self, suffix):
+        """
+        접미사에 해당하는 범위 항목 반환
+
+        Returns:
+            (항목 리스트, GUI 테이블 사용 여부)
+        """
+        if suffix in self.range_config:
+            return self.range_config[suffix], False
+        return self.mappings, True
+
+    def export_range(self, excel_file, sheet_name, range_address, result):
+        """
+        범위를 temp_dir의 PNG 파일로 변환 (캐시 사용)
+
+        Returns:
+            (이미지 경로 또는 None, 실패 이유)
+        """
+        key = (os.path.abspath(excel_file), sheet_name, range_address)
+        if key in self._export_cache:
+            result['export_cache_hits'] += 1
+            return self._export_cache[key]
+
+        image_path = os.path.join(self.temp_dir, f"range_{len(self._export_cache) + 1:05d}.png")
+        with span('range_copy', sheet=sheet_name, range=range_address, mode='file'):
+            ok, reason = self.automation.export_range_image(excel_file, sheet_name, range_address, image_path)
+        cached = (image_path, None) if ok else (None, reason)
+        self._export_cache[key] = cached
+        if ok:
+            result['ranges_exported'] += 1
+            self.log(f"  ✓ 범위 변환 완료 (파일)")
+        return cached
+
+    def check_cancelled(self):
+        """취소 요청 확인 (취소되었으면 OperationCancelled)"""
+        check_cancelled(self.cancel_token)
+
+    def discard_unsaved_copies(self, word_copy_files, saved_files, result):
+        """취소 시 저장까지 끝나지 않은 Word 복사본 삭제 (결과 목록에서도 제외)"""
+        for _, copy_file in word_copy_files:
+            if copy_file in saved_files:
+                continue
+            try:
+                os.remove(copy_file)
+                self.log(f"  미완성 복사본 삭제: {os.path.basename(copy_file)}")
+            except OSError:
+                pass
+            if copy_file in result['output_files']:
+                result['output_files'].remove(copy_file)
+
+    def process_range_entry(self, wb, doc, entry, suffix, excel_file, word_copy_file, from_gui, result):
+        """범위 항목 하나 처리 (범위 복사/변환 → 마커 위치에 삽입)"""
+        sheet_name = entry['sheet']
+        range_address = entry['range']
+        marker = f"{entry['marker']}_{suffix}"
+
+        source_label = " (GUI)" if from_gui else ""
+        self.log(f"    처리 중: [{sheet_name}] {range_address} → {marker}{source_label}")
+
+        if self.export_mode == EXPORT_MODE_FILE:
+            # 범위를 파일로 변환 → 파일에서 삽입 (클립보드 미사용)
+            image_path, export_error = self.export_range(excel_file, sheet_name, range_address, result)
+            if image_path:
+                with span('marker_paste', marker=marker):
+                    success, error_msg = self.automation.insert_picture_file_at_marker(doc, marker, image_path)
+                reason = None if success else (error_msg or '알 수 없는 오류')
+            else:
+                success = False
+                reason = f"엑셀 범위 변환 실패 ({export_error})"
+        else:
+            # 엑셀 범위를 그림으로 복사 (클립보드) → Word에 붙여넣기
+            # 클립보드는 시스템에 하나뿐이므로 복사~붙여넣기 구간을 잠금
+            with self.automation.clipboard_session():
+                with span('range_copy', sheet=sheet_name, range=range_address, mode='clipboard'):
+                    copied = self.automation.copy_range_picture(wb, sheet_name, range_address)
+                if copied:
+                    with span('marker_paste', marker=marker):
+                        success, error_msg = self.automation.insert_picture_at_marker(doc, marker)
+            if copied:
+                reason = None if success else (error_msg or '알 수 없는 오류')
+            else:
+                success = False
+                reason = '엑셀 범위 복사 실패' if from_gui else '엑셀 범위 복사 실패 (숨김 시트 또는 오류)'
+
+        if success:
+            result['images_inserted'] += 1
+            # 고정 대기 대신 Word가 다시 응답할 때까지만 대기
+            self.automation.wait_document_ready(doc)
+            return
+
+        result['images_failed'] += 1
+        result['failed_markers'].append({
+            'excel_file': os.path.basename(excel_file),
+            'word_file': os.path.basename(word_copy_file),
+            'marker': marker,
+            'sheet': sheet_name,
+            'range': range_address,
+            'reason': reason
+        })
+
+    def record_preflight_skipped(self, plan, word_file, excel_file, word_copy_file, result):
+        """사전 검사에서 제외된 항목을 실패 목록에 기록"""
+        for skipped in plan.skipped_for(word_file, excel_file):
+            self.log(f"    ✗ 제외: [{skipped['sheet']}] {skipped['range']} → {skipped['marker']} - {skipped['reason']}")
+            result['images_failed'] += 1
+            result['preflight_skipped'] += 1
+            result['failed_markers'].append(dict(skipped, word_file=os.path.basename(word_copy_file)))
+
+    def run(self):
+        """메인 처리 - 엑셀-워드 다중 파일 처리 (결과 dict 반환)"""
+        result = {
+            'success': False,
+            'message': '',
+            'images_inserted': 0,
+            'images_failed': 0,
+            'failed_markers': [],
+            'output_files': [],
+            'elapsed_time': 0,
+            'export_mode': self.export_mode,
+            'ranges_exported': 0,
+            'export_cache_hits': 0,
+            'preflight_skipped': 0,
+            'cancelled': False
+        }
+
+        # 시작 시간 기록
+        start_time = time.time()
+
+        automation = self.automation
+        word_copy_files = []  # (원본, 복사본)
+        saved_files = set()
+
+        try:
+            self.temp_dir = tempfile.mkdtemp()
+            self._export_cache = {}  # 캐시된 이미지는 이번 임시 폴더에만 있음
+
+            self.log("=" * 60)
+            self.log("엑셀-워드 다중 파일 처리 시작")
+            self.log("=" * 60)
+            self.log(f"엑셀 파일: {len(self.excel_files)}개")
+            self.log(f"워드 파일: {len(self.word_files)}개\n")
+
+            # 사전 검사 (Office 실행 전 - 실패가 확실한 항목 제외)
+            plan = None
+            if self.preflight:
+                with span('preflight'):
+                    plan = build_preflight_plan(
+                        self.excel_files, self.word_files, self.mappings, self.range_config,
+                        log_callback=self.log
+                    )
+
+            memory_checkpoint('preflight_done')
+            self.check_cancelled()
+
+            with span('com_startup', backend=automation.name):
+                automation.start()
+            memory_checkpoint('office_started')
+
+            # 워드 파일별로 복사본 생성
+            for word_file in self.word_files:
+                copy_file = self.create_word_copy(word_file)
+                if copy_file:
+                    word_copy_files.append((word_file, copy_file))
+                    result['output_files'].append(copy_file)
+                else:
+                    self.log(f"✗ 워드 복사 실패: {os.path.basename(word_file)}")
+
+            if not word_copy_files:
+                raise Exception("워드 복사본 생성 실패")
+
+            self.log(f"\n✓ {len(word_copy_files)}개 워드 복사본 생성 완료\n")
+
+            # 워드 파일별로 처리 (Word 기준 방식)
+            for word_copy_index, (word_file, word_copy_file) in enumerate(word_copy_files, 1):
+                self.check_cancelled()
+                self.log("\n" + "=" * 60)
+                self.log(f"[{word_copy_index}/{len(word_copy_files)}] 워드 파일 처리")
+                self.log("=" * 60)
+                self.log(f"파일: {os.path.basename(word_copy_file)}")
+
+                doc = None
+
+                try:
+                    with span('open_document', file=os.path.basename(word_copy_file)):
+                        doc = automation.open_document(word_copy_file)
+                    self.log(f"✓ 워드 파일 열기 완료")
+
+                    # 모든 엑셀 파일 처리
+                    for excel_index, excel_file in enumerate(self.excel_files, 1):
+                        self.check_cancelled()
+                        self.log(f"\n  [{excel_index}/{len(self.excel_files)}] 엑셀 파일: {os.path.basename(excel_file)}")
+
+                        # 엑셀 파일명에서 접미사 추출
+                        suffix = self.extract_suffix(os.path.basename(excel_file))
+
+                        if not suffix:
+                            self.log(f"  ⚠️ 접미사를 찾을 수 없음 - 건너뜀")
+                            continue
+
+                        self.log(f"  ✓ 접미사: {suffix}")
+
+                        # RANGE_CONFIG에서 설정 가져오기 (없으면 GUI 테이블 사용)
+                        entries, from_gui = self.get_entries_for_suffix(suffix)
+                        if from_gui:
+                            self.log(f"  ⚠️ {suffix} 설정이 없음 - GUI 테이블 사용")
+                        else:
+                            self.log(f"  ✓ {suffix} 설정 사용 ({len(entries)}개 항목)")
+
+                        # 사전 검사에서 제외된 항목은 실패로 기록하고 실행 대상에서 뺌
+                        if plan is not None:
+                            _, entries, from_gui = plan.entries_for(word_file, excel_file)
+                            self.record_preflight_skipped(plan, word_file, excel_file, word_copy_file, result)
+                            if not entries:
+                                self.log(f"  ⚠️ 실행할 항목 없음 (사전 검사) - 엑셀 열지 않음")
+                                continue
+
+                        # Excel 열기
+                        wb = None
+
+                        try:
+                            # 파일 변환 방식은 렌더러가 파일을 직접 읽으므로 Excel을 열지 않음
+                            if self.export_mode == EXPORT_MODE_CLIPBOARD:
+                                with span('open_workbook', file=os.path.basename(excel_file)):
+                                    wb = automation.open_workbook(excel_file)
+                                self.log(f"  ✓ 엑셀 파일 열기 완료")
+
+                            for entry in entries:
+                                self.check_cancelled()
+                                self.process_range_entry(
+                                    wb, doc, entry, suffix, excel_file, word_copy_file, from_gui, result
+                                )
+
+                        except OperationCancelled:
+                            raise
+
+                        except Exception:
+                            # 오류 시 Excel 상태 확인 (응답 없으면 다음 사용 시 재생성)
+                            automation.report_error('excel')
+                            raise
+
+                        finally:
+                            # 통합문서만 닫음 (Excel 애플리케이션은 재사용)
+                            if wb is not None:
+                                automation.close_workbook(wb)
+
+                            # 참조 제거
+                            wb = None
+
+                    # 모든 엑셀 파일 처리 완료 - 워드 저장
+                    if doc is not None:
+                        try:
+                            # 저장 전후 준비 상태 확인은 save_document가 수행
+                            with span('save', file=os.path.basename(word_copy_file)):
+                                automation.save_document(doc)
+                            memory_checkpoint('document_saved', file=os.path.basename(word_copy_file))
+                            saved_files.add(word_copy_file)
+                            self.log(f"\n✓ 워드 저장 완료: {os.path.basename(word_copy_file)}")
+                        except Exception as e:
+                            self.log(f"\n✗ 워드 저장 오류: {str(e)}")
+                            # 저장 실패해도 계속 진행 (파일은 이미 수정됨)
+
+                except OperationCancelled:
+                    raise
+
+                except Exception:
+                    # 오류 시 Word 상태 확인 (응답 없으면 다음 사용 시 재생성)
+                    automation.report_error('word')
+                    raise
+
+                finally:
+                    # 문서만 닫음 (Word 애플리케이션은 재사용)
+                    if doc is not None:
+                        automation.close_document(doc)  # 이미 저장했으므로 저장 없이 닫음
+
+                    # 참조 제거
+                    doc = None
+
+            # 종료 시간 기록 및 경과 시간 계산
+            end_time = time.time()
+            elapsed_time = end_time - start_time
+            result['elapsed_time'] = elapsed_time
+
+            minutes = int(elapsed_time // 60)
+            seconds = int(elapsed_time % 60)
+
+            # 최종 결과 출력
+            self.log("\n" + "=" * 60)
+            self.log("전체 처리 완료")
+            self.log("=" * 60)
+            self.log(f"처리 시간: {minutes}분 {seconds}초")
+            self.log(f"생성된 워드 파일: {len(result['output_files'])}개")
+            self.log(f"삽입 성공: {result['images_inserted']}개")
+            self.log(f"삽입 실패: {result['images_failed']}개")
+            if result['preflight_skipped']:
+                self.log(f"  (사전 검사 제외: {result['preflight_skipped']}개)")
+
+            # 준비 상태 대기에 실제로 쓴 시간 (고정 sleep 대비 안정화 비용)
+            readiness_lines = automation.readiness.summary_lines()
+            if readiness_lines:
+                self.log("준비 상태 대기:")
+                for line in readiness_lines:
+                    self.log(f"  {line}")
+
+            # 생성된 파일 목록
+            if result['output_files']:
+                self.log("\n생성된 파일 목록:")
+                for idx, file in enumerate(result['output_files'], 1):
+                    self.log(f"  {idx}. {os.path.basename(file)}")
+
+            # 실패한 마커 상세 정보
+            if result['failed_markers']:
+                self.log("\n" + "-" * 60)
+                self.log("실패한 마커 목록:")
+                self.log("-" * 60)
+                for idx, failed in enumerate(result['failed_markers'], 1):
+                    self.log(f"{idx}. 엑셀: {failed['excel_file']} → 워드: {failed['word_file']}")
+                    self.log(f"   마커: {failed['marker']}, 시트: {failed['sheet']}, 범위: {failed['range']}")
+                    self.log(f"   실패 이유: {failed['reason']}")
+
+            result['success'] = True
+            result['message'] = "처리 완료"
+
+        except OperationCancelled:
+            self.log(f"\n⚠️ 작업 취소됨 - 저장 완료 {len(saved_files)}개 파일은 유지")
+            result['cancelled'] = True
+            result['message'] = "작업이 취소되었습니다"
+            result['elapsed_time'] = time.time() - start_time
+
+        except Exception as e:
+            self.log(f"\n✗ 치명적 오류 발생: {str(e)}")
+            self.log(f"상세 오류:\n{traceback.format_exc()}")
+            result['message'] = f"오류: {str(e)}"
+
+        finally:
+            # 최종 안전 정리
+            self.log("\n최종 정리 작업 중...")
+
+            # Office 종료 (Excel/Word 종료 및 COM 해제)
+            try:
+                with span('com_teardown', backend=automation.name):
+                    automation.shutdown()
+                memory_checkpoint('office_shutdown')
+            except Exception as e:
+                self.log(f"⚠️ Office 정리 중 오류 (무시됨): {str(e)}")
+
+            result['automation_backend'] = automation.name
+            result['automation_stats'] = automation.get_stats()
+            result['readiness_stats'] = automation.readiness.get_stats()
+
+            # 변환된 범위 이미지 포함 임시 폴더 삭제
+            if self.temp_dir is not None:
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
+                self.temp_dir = None
+
+            # 취소: 문서가 모두 닫힌 뒤 미완성 복사본 삭제
+            if result['cancelled']:
+                self.discard_unsaved_copies(word_copy_files, saved_files, result)
+                latency = self.cancel_token.latency()
+                if latency is not None:
+                    result['cancel_latency'] = round(latency, 3)
+                    self.log(f"취소 완료 (요청 → 정리 완료 {latency:.2f}초)")
+
+        return result
@@ -0,0 +1,620 @@
+# hot_folder_daemon.py
+# 핫 폴더 감시 데몬 (GUI 없이 상시 실행)
+# - 설정된 폴더를 감시 (watchdog이 있으면 파일 이벤트, 없으면 주기적 폴링)
+# - 복사가 끝난 작업 묶음(bundle)을 감지하여 큐에 넣고 작업자 스레드 풀로 실행
+#   · Tab 1: 이미지 폴더 (+ Word 템플릿) → 파일명 기입/이미지 삽입/테이블 생성
+#   · Tab 2: 파일명_#N.xlsx (+ Word 템플릿) → Excel 범위 삽입
+# - 작업 상태는 JSON 파일에 저장 (재시작 시 이어서 처리), 실패 시 지연 후 재시도
+#
+# 폴더 구조 (감시 폴더마다):
+#   <감시 폴더>/<묶음>/             ← 여기에 넣은 하위 폴더 하나가 작업 하나
+#   <감시 폴더>/측정A_#1.xlsx ...    ← Tab 2 폴더는 낱개 파일도 가능 (접두사별로 묶음, 설정의 template 사용)
+#   <감시 폴더>/processing/         ← 처리 중 (입력 파일 + 결과 파일)
+#   <감시 폴더>/done/, failed/      ← 완료/최종 실패
+#
+# 사용 예:
+#   python hot_folder_daemon.py --config hot_folders.json
+#   python hot_folder_daemon.py --config hot_folders.json --once   (현재 있는 작업만 처리 후 종료)
+#
+# 설정 파일 (hot_folders.json):
+#   {
+#     "state_file": "hot_folder_state.json",
+#     "workers": 2, "poll_interval": 2.0, "settle_seconds": 5.0,
+#     "max_retries": 3, "retry_delay": 30.0,
+#     "folders": [
+#       {"path": "D:/drop/screenshots", "kind": "report", "operations": ["filenames", "images"],
+#        "template": "D:/templates/report.docx"},
+#       {"path": "D:/drop/excel", "kind": "excel-range", "template": "D:/templates/result.docx",
+#        "export_mode": "file", "config": "range_config.xlsx"}
+#     ]
+#   }
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import threading
+import traceback
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from report_cli import run_job
+
+
+logger = logging.getLogger(__name__)
+
+# 감시 폴더 안의 예약 폴더 (묶음으로 취급하지 않음)
+PROCESSING_DIR = 'processing'
+DONE_DIR = 'done'
+FAILED_DIR = 'failed'
+RESERVED_DIRS = (PROCESSING_DIR, DONE_DIR, FAILED_DIR)
+
+# 이 파일이 있으면 안정화 대기 없이 바로 처리
+READY_MARKER_FILES = ('READY', '.ready')
+
+WORD_EXTENSIONS = ('.docx', '.docm')
+EXCEL_FILE_PATTERN = re.compile(r'^(.+)_#\d+\.xlsx?$', re.IGNORECASE)
+
+# 작업 종류
+KIND_REPORT = 'report'            # Tab 1
+KIND_EXCEL_RANGE = 'excel-range'  # Tab 2
+
+# 작업 상태
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+DEFAULT_SETTINGS = {
+    'state_file': 'hot_folder_state.json',
+    'workers': 2,
+    'poll_interval': 2.0,
+    'settle_seconds': 5.0,
+    'max_retries': 3,
+    'retry_delay': 30.0,
+}
+
+
+def is_temporary_file(name):
+    """Office 잠금 파일/복사 중 임시 파일 (묶음이 아직 완성되지 않음)"""
+    lower = name.lower()
+    return name.startswith('~$') or lower.endswith(('.tmp', '.part', '.crdownload'))
+
+
+def snapshot(paths):
+    """파일 목록의 (상대 경로, 크기, 수정 시각) 스냅샷 - 임시 파일이 있으면 None"""
+    entries = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in files:
+                    if is_temporary_file(name):
+                        return None
+                    full = os.path.join(root, name)
+                    try:
+                        stat = os.stat(full)
+                    except OSError:
+                        return None
+                    entries.append((os.path.relpath(full, path), stat.st_size, stat.st_mtime_ns))
+        else:
+            if is_temporary_file(os.path.basename(path)):
+                return None
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            entries.append((os.path.basename(path), stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(entries))
+
+
+def unique_path(path):
+    """이미 있으면 _1, _2 ... 를 붙인 경로"""
+    candidate = path
+    counter = 1
+    while os.path.exists(candidate):
+        candidate = f"{path}_{counter}"
+        counter += 1
+    return candidate
+
+
+def relocate_outputs(summary, old_dir, new_dir):
+    """결과 요약의 출력 파일 경로를 묶음 이동 후 경로로 변경"""
+    def move(path):
+        if path and os.path.commonpath([os.path.abspath(path), old_dir]) == old_dir:
+            return os.path.join(new_dir, os.path.relpath(path, old_dir))
+        return path
+
+    for item in summary:
+        if 'output_file' in item:
+            item['output_file'] = move(item['output_file'])
+        if 'output_files' in item:
+            item['output_files'] = [move(path) for path in item['output_files']]
+    return summary
+
+
+# ===================================================================
+# JOB STATE
+# ===================================================================
+
+class JobStateStore:
+    """
+    작업 상태 저장소 (JSON 파일, 원자적 교체)
+
+    작업 id → {'id', 'folder', 'kind', 'bundle', 'inputs', 'status', 'attempts',
+               'next_attempt_at', 'last_error', 'results', 'created', 'updated'}
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.jobs = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.jobs = json.load(f).get('jobs', {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ 작업 상태 파일을 읽을 수 없음 (새로 시작): {e}")
+
+    def save(self):
+        with self._lock:
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'jobs': self.jobs}, f, ensure_ascii=False, indent=2, default=str)
+            os.replace(temp_path, self.path)
+
+    def add(self, job):
+        with self._lock:
+            self.jobs[job['id']] = job
+        self.save()
+
+    def update(self, job_id, **fields):
+        with self._lock:
+            job = self.jobs[job_id]
+            job.update(fields)
+            job['updated'] = datetime.now().isoformat(timespec='seconds')
+        self.save()
+
+    def due_jobs(self, now):
+        """실행할 차례가 된 대기 작업 (생성 순서)"""
+        with self._lock:
+            jobs = [job for job in self.jobs.values()
+                    if job['status'] == STATUS_QUEUED and job.get('next_attempt_at', 0) <= now]
+        return sorted(jobs, key=lambda job: job['created'])
+
+
+# ===================================================================
+# DAEMON
+# ===================================================================
+
+class HotFolderDaemon:
+    """
+    핫 폴더 감시 데몬
+
+    Args:
+        settings: 설정 dict (DEFAULT_SETTINGS + 'folders')
+        log_callback: 로그 출력 콜백 (None이면 logger 사용)
+    """
+
+    def __init__(self, settings, log_callback=None):
+        self.settings = dict(DEFAULT_SETTINGS, **settings)
+        self.folders = [dict(folder, path=os.path.abspath(folder['path']))
+                        for folder in self.settings.get('folders', [])]
+        self.log_callback = log_callback
+        self.state = JobStateStore(self.settings['state_file'])
+
+        self._pending = {}            # 묶음 키 → (스냅샷, 처음 관찰 시각)
+        self._running = {}            # 작업 id → Future
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._clipboard_lock = threading.Lock()  # 클립보드 방식 Tab 2 작업은 한 번에 하나만
+        self._observer = None
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            logger.info(message)
+
+    # ========== WATCHING ==========
+
+    def _start_observer(self):
+        """watchdog이 있으면 파일 이벤트로 검사를 앞당김 (없으면 폴링만 사용)"""
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            self.log(f"⚠️ watchdog 미설치 - {self.settings['poll_interval']}초 간격 폴링으로 감시")
+            return
+
+        wake = self._wake
+
+        class WakeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wake.set()
+
+        observer = Observer()
+        for folder in self.folders:
+            observer.schedule(WakeHandler(), folder['path'], recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+        self.log("✓ 파일 이벤트 감시 시작 (watchdog)")
+
+    def stop(self):
+        """메인 루프 종료 요청"""
+        self._stop.set()
+        self._wake.set()
+
+    # ========== BUNDLE DETECTION ==========
+
+    def find_candidates(self, folder):
+        """
+        감시 폴더의 작업 묶음 후보
+
+        Returns:
+            [(묶음 키, 이름, 경로 리스트)] - 하위 폴더 하나, 또는 Tab 2 낱개 엑셀 파일의 접두사 묶음
+        """
+        candidates = []
+        loose_groups = {}
+        try:
+            names = sorted(os.listdir(folder['path']))
+        except OSError as e:
+            self.log(f"✗ 감시 폴더를 읽을 수 없음: {folder['path']} ({e})")
+            return candidates
+
+        for name in names:
+            path = os.path.join(folder['path'], name)
+            if name.startswith('.') or name in RESERVED_DIRS:
+                continue
+            if os.path.isdir(path):
+                candidates.append((path, name, [path]))
+            elif folder.get('kind') == KIND_EXCEL_RANGE:
+                match = EXCEL_FILE_PATTERN.match(name)
+                if match:
+                    loose_groups.setdefault(match.group(1), []).append(path)
+
+        for prefix, paths in loose_groups.items():
+            candidates.append((os.path.join(folder['path'], prefix + '*'), prefix, paths))
+        return candidates
+
+    def scan(self):
+        """모든 감시 폴더 검사 - 안정화된 묶음을 처리 폴더로 옮기고 큐에 추가"""
+        now = time.time()
+        seen = set()
+        for folder in self.folders:
+            for key, name, paths in self.find_candidates(folder):
+                seen.add(key)
+                current = snapshot(paths)
+                if not current:
+                    self._pending.pop(key, None)
+                    continue
+
+                ready_marker = any(os.path.exists(os.path.join(p, marker))
+                                   for p in paths if os.path.isdir(p) for marker in READY_MARKER_FILES)
+                previous = self._pending.get(key)
+                if previous is None or previous[0] != current:
+                    self._pending[key] = (current, now)
+                    if not ready_marker:
+                        continue
+                elif not ready_marker and now - previous[1] < self.settings['settle_seconds']:
+                    continue
+
+                self._pending.pop(key, None)
+                self.claim(folder, name, paths)
+
+        # 사라진 후보 정리
+        for key in list(self._pending):
+            if key not in seen:
+                del self._pending[key]
+
+    def claim(self, folder, name, paths):
+        """묶음을 processing 폴더로 옮기고 작업 등록"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        processing_root = os.path.join(folder['path'], PROCESSING_DIR)
+        os.makedirs(processing_root, exist_ok=True)
+        bundle = unique_path(os.path.join(processing_root, f"{name}_{timestamp}"))
+
+        try:
+            if len(paths) == 1 and os.path.isdir(paths[0]):
+                shutil.move(paths[0], bundle)
+            else:
+                os.makedirs(bundle)
+                for path in paths:
+                    shutil.move(path, os.path.join(bundle, os.path.basename(path)))
+        except OSError as e:
+            # 다른 프로그램이 아직 파일을 잡고 있음 - 다음 검사에서 다시 시도
+            self.log(f"⚠️ 묶음 이동 실패 (다음 검사에서 재시도): {name} ({e})")
+            return None
+
+        inputs = sorted(snapshot_name for snapshot_name, _, _ in snapshot([bundle]) or ())
+        now = datetime.now().isoformat(timespec='seconds')
+        job = {
+            'id': bundle,
+            'folder': folder['path'],
+            'kind': folder.get('kind', KIND_REPORT),
+            'bundle': bundle,
+            'inputs': inputs,
+            'status': STATUS_QUEUED,
+            'attempts': 0,
+            'next_attempt_at': 0,
+            'last_error': None,
+            'results': [],
+            'created': now,
+            'updated': now,
+        }
+        self.state.add(job)
+        self.log(f"✓ 작업 등록: {name} ({job['kind']}, 입력 파일 {len(inputs)}개)")
+        return job
+
+    # ========== JOB SPECS ==========
+
+    def build_specs(self, job, folder):
+        """
+        묶음 → report_cli 작업 정의 리스트 (Tab 1은 여러 작업을 이어서 실행)
+
+        Raises:
+            ValueError: 묶음 구성이 잘못됨 (재시도하지 않음)
+        """
+        bundle = job['bundle']
+        names = sorted(os.listdir(bundle))
+        word_files = [os.path.join(bundle, n) for n in names
+                      if n.lower().endswith(WORD_EXTENSIONS) and not is_temporary_file(n)]
+
+        # 묶음에 템플릿이 없으면 설정의 템플릿을 복사해서 사용 (결과가 묶음 폴더에 생기도록)
+        if not word_files and folder.get('template'):
+            template_copy = os.path.join(bundle, os.path.basename(folder['template']))
+            shutil.copy2(folder['template'], template_copy)
+            self.state.update(job['id'], inputs=job['inputs'] + [os.path.basename(template_copy)])
+            word_files = [template_copy]
+
+        if job['kind'] == KIND_EXCEL_RANGE:
+            excel_files = [os.path.join(bundle, n) for n in names if EXCEL_FILE_PATTERN.match(n)]
+            if not excel_files:
+                raise ValueError("엑셀 파일(파일명_#N.xlsx)이 없습니다")
+            if not word_files:
+                raise ValueError("Word 템플릿이 없습니다 (묶음에 넣거나 설정에 template 지정)")
+            spec = {
+                'operation': 'excel-range',
+                'excel': excel_files,
+                'word': word_files,
+                'workers': 1,
+            }
+            for key in ('config', 'mappings', 'export_mode', 'backend', 'sizing_mode',
+                        'recycle_after', 'backend_options'):
+                if key in folder:
+                    spec[key] = folder[key]
+            return [spec]
+
+        operations = folder.get('operations') or (['images'] if word_files else ['table'])
+        if any(op in ('filenames', 'images') for op in operations) and len(word_files) != 1:
+            raise ValueError(f"Word 템플릿이 1개여야 합니다 (현재 {len(word_files)}개)")
+
+        specs = []
+        for operation in operations:
+            spec = {
+                'operation': operation,
+                'folder': bundle,
+                'include_subfolders': folder.get('include_subfolders', True),
+            }
+            if operation == 'table':
+                spec['output_dir'] = bundle
+            else:
+                spec['word'] = word_files[0]  # 이전 작업 결과가 있으면 실행 시 교체
+            specs.append(spec)
+        return specs
+
+    # ========== EXECUTION ==========
+
+    def run_job(self, job_id):
+        """작업자 스레드에서 작업 하나 실행 (묶음 안의 작업들을 순서대로)"""
+        job = self.state.jobs[job_id]
+        folder = next((f for f in self.folders if f['path'] == job['folder']), {'kind': job['kind']})
+        self.reset_outputs(job)
+
+        try:
+            specs = self.build_specs(job, folder)
+        except (ValueError, OSError) as e:
+            return {'success': False, 'message': str(e), 'retry': False}, []
+
+        results = []
+        previous_output = None
+        for spec in specs:
+            if previous_output and 'word' in spec:
+                spec['word'] = previous_output  # 파일명 기입 → 이미지 삽입 순서로 이어서 처리
+
+            def log(message, name=os.path.basename(job['bundle'])):
+                self.log(f"[{name}] {message}")
+
+            if spec['operation'] == 'excel-range' and spec.get('export_mode', 'clipboard') == 'clipboard':
+                with self._clipboard_lock:
+                    result = run_job(spec, log_callback=log)
+            else:
+                result = run_job(spec, log_callback=log)
+
+            result.setdefault('operation', spec['operation'])
+            results.append(result)
+            if not result.get('success'):
+                return result, results
+            previous_output = result.get('output_file') or previous_output
+
+        return {'success': True, 'message': "처리 완료"}, results
+
+    def reset_outputs(self, job):
+        """재시도 전에 이전 시도가 만든 파일 삭제 (등록 시점의 입력 파일만 남김)"""
+        bundle = job['bundle']
+        inputs = set(job['inputs'])
+        for root, dirs, files in os.walk(bundle):
+            for name in files:
+                full = os.path.join(root, name)
+                if os.path.relpath(full, bundle) not in inputs:
+                    try:
+                        os.remove(full)
+                    except OSError:
+                        pass
+
+    def dispatch(self, executor):
+        """실행할 차례가 된 작업을 빈 작업자에 배정"""
+        for job in self.state.due_jobs(time.time()):
+            if len(self._running) >= self.settings['workers']:
+                return
+            if job['id'] in self._running:
+                continue
+            self.state.update(job['id'], status=STATUS_RUNNING, attempts=job['attempts'] + 1)
+            self.log(f"▶ 작업 시작: {os.path.basename(job['bundle'])} (시도 {job['attempts']}/{self.settings['max_retries']})")
+            future = executor.submit(self.run_job, job['id'])
+            future.add_done_callback(lambda _: self._wake.set())
+            self._running[job['id']] = future
+
+    def collect(self):
+        """끝난 작업 결과 반영 (성공 → done, 실패 → 재시도 또는 failed)"""
+        for job_id, future in list(self._running.items()):
+            if not future.done():
+                continue
+            del self._running[job_id]
+            job = self.state.jobs[job_id]
+
+            try:
+                outcome, results = future.result()
+            except Exception as e:
+                outcome, results = {'success': False, 'message': str(e), 'traceback': traceback.format_exc()}, []
+
+            summary = [{key: r.get(key) for key in ('operation', 'success', 'message', 'output_file',
+                                                     'output_files', 'images_inserted', 'images_failed')
+                        if key in r} for r in results]
+            name = os.path.basename(job['bundle'])
+
+            if outcome.get('success'):
+                destination = self.finish(job, DONE_DIR)
+                summary = relocate_outputs(summary, job['bundle'], destination)
+                self.state.update(job_id, status=STATUS_DONE, results=summary, last_error=None, bundle=destination)
+                self.log(f"✓ 작업 완료: {name}")
+                continue
+
+            retry = outcome.get('retry', True) and job['attempts'] < self.settings['max_retries']
+            if retry:
+                delay = self.settings['retry_delay'] * (2 ** (job['attempts'] - 1))
+                self.state.update(job_id, status=STATUS_QUEUED, results=summary,
+                                  last_error=outcome.get('message'), next_attempt_at=time.time() + delay)
+                self.log(f"⚠️ 작업 실패 - {delay:g}초 후 재시도: {name} ({outcome.get('message')})")
+            else:
+                destination = self.finish(job, FAILED_DIR)
+                summary = relocate_outputs(summary, job['bundle'], destination)
+                self.state.update(job_id, status=STATUS_FAILED, results=summary,
+                                  last_error=outcome.get('message'), bundle=destination)
+                self.log(f"✗ 작업 최종 실패: {name} ({outcome.get('message')})")
+
+    def finish(self, job, target_dir):
+        """묶음을 done/failed 폴더로 이동 (이동한 경로 반환)"""
+        target_root = os.path.join(job['folder'], target_dir)
+        os.makedirs(target_root, exist_ok=True)
+        destination = unique_path(os.path.join(target_root, os.path.basename(job['bundle'])))
+        try:
+            shutil.move(job['bundle'], destination)
+        except OSError as e:
+            self.log(f"⚠️ 묶음 이동 실패: {job['bundle']} → {target_dir} ({e})")
+            return job['bundle']
+        return destination
+
+    def recover(self):
+        """재시작 시 중단된 작업을 대기 상태로 되돌림 (묶음이 없어진 작업은 실패 처리)"""
+        for job_id, job in list(self.state.jobs.items()):
+            if job['status'] not in (STATUS_QUEUED, STATUS_RUNNING):
+                continue
+            if not os.path.isdir(job['bundle']):
+                self.state.update(job_id, status=STATUS_FAILED, last_error="묶음 폴더가 없음 (재시작 시 확인)")
+            elif job['status'] == STATUS_RUNNING:
+                self.state.update(job_id, status=STATUS_QUEUED, next_attempt_at=0)
+                self.log(f"⚠️ 중단된 작업 다시 대기: {os.path.basename(job['bundle'])}")
+
+    def has_work(self):
+        """처리할 작업(대기/안정화 대기/실행 중)이 남았는지"""
+        queued = any(job['status'] == STATUS_QUEUED for job in self.state.jobs.values())
+        return bool(queued or self._pending or self._running)
+
+    def run(self, once=False):
+        """
+        메인 루프
+
+        Args:
+            once: True이면 현재 있는 묶음과 재시도를 모두 처리한 뒤 종료
+        """
+        for folder in self.folders:
+            os.makedirs(folder['path'], exist_ok=True)
+
+        self.recover()
+        if not once:
+            self._start_observer()
+        self.log(f"핫 폴더 감시 시작: {len(self.folders)}개 폴더, 작업자 {self.settings['workers']}개")
+
+        with ThreadPoolExecutor(max_workers=self.settings['workers']) as executor:
+            try:
+                while not self._stop.is_set():
+                    self.scan()
+                    self.collect()
+                    self.dispatch(executor)
+
+                    if once and not self.has_work():
+                        break
+
+                    self._wake.wait(self.settings['poll_interval'])
+                    self._wake.clear()
+            except KeyboardInterrupt:
+                self.log("종료 요청 - 실행 중인 작업이 끝날 때까지 대기")
+            finally:
+                if self._observer is not None:
+                    self._observer.stop()
+
+            # 종료 요청 시 실행 중인 작업은 끝까지 기다려 상태 반영
+            for future in list(self._running.values()):
+                future.result()
+            self.collect()
+
+        self.log("핫 폴더 감시 종료")
+
+
+def load_settings(path):
+    """설정 파일 읽기 (상대 경로는 설정 파일 기준)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        settings = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    settings['state_file'] = os.path.join(base_dir, settings.get('state_file', DEFAULT_SETTINGS['state_file']))
+    for folder in settings.get('folders', []):
+        for key in ('path', 'template', 'config'):
+            if folder.get(key):
+                folder[key] = os.path.join(base_dir, folder[key])
+    return settings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="핫 폴더 감시 데몬")
+    parser.add_argument('--config', required=True, help="설정 파일 (JSON)")
+    parser.add_argument('--once', action='store_true', help="현재 있는 작업만 처리 후 종료")
+    parser.add_argument('--settle', type=float, help="안정화 대기 시간(초) - 설정 파일 값 대신 사용")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        stream=sys.stderr
+    )
+    # Tab 2 처리기는 log_callback과 logger 양쪽에 기록하므로 데몬 로그와 중복되지 않게 경고만 출력
+    for name in ('parallel_range_processor', 'excel_range_processor'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    settings = load_settings(args.config)
+    if args.settle is not None:
+        settings['settle_seconds'] = args.settle
+
+    HotFolderDaemon(settings).run(once=args.once)
+    return 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,191 @@
+# image_prefetch.py
+# 이미지 미리 준비 파이프라인 (Tab 1 이미지 삽입)
+# - 삽입 계획 순서대로 스레드 풀이 커서보다 앞서 이미지를 준비 (파일 읽기, 헤더/크기 파싱, SHA1)
+# - 문서를 바꾸는 작업 스레드는 준비된 결과만 꺼내 씀 (python-docx 문서는 한 스레드에서만 수정)
+# - 미리 준비하는 개수(lookahead)만큼만 메모리에 보관
+# - 단계별 소요 시간/작업자 사용률/대기 시간 통계
+#
+# 사용 예:
+#   prefetcher = ImagePrefetcher(plan_paths, lookahead=16, workers=4)
+#   image = prefetcher.get(path)   # 계획 순서대로 호출
+#   prefetcher.close()
+#   for line in prefetcher.summary_lines(): log(line)
+
+import io
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from docx.image.image import Image, _ImageHeaderFactory
+
+from tracing import span
+from streaming_images import FileBackedImage
+
+
+# 미리 준비해 둘 최대 이미지 수 (0이면 미리 준비 안 함) / 준비 스레드 수
+DEFAULT_LOOKAHEAD = 16
+DEFAULT_PREFETCH_WORKERS = min(4, os.cpu_count() or 1)
+
+STAGES = ('read', 'probe', 'hash')
+
+
+class ImagePrefetcher:
+    """
+    삽입 계획 순서대로 이미지를 미리 준비하는 스레드 풀
+
+    계획에 없거나 이미 지나간 이미지를 요청하면 그 자리에서 직접 준비하고,
+    요청된 이미지보다 앞선 항목(매칭 후 삽입되지 않은 셀 등)은 버립니다.
+
+    Args:
+        paths: 삽입 계획 순서의 이미지 경로 목록 (중복 가능)
+        lookahead: 미리 준비해 둘 최대 개수
+        workers: 준비 스레드 수
+        file_backed: True이면 바이트를 읽지 않고 헤더와 SHA1만 준비 (스트리밍 모드, FileBackedImage)
+    """
+
+    def __init__(self, paths, lookahead=DEFAULT_LOOKAHEAD, workers=DEFAULT_PREFETCH_WORKERS, file_backed=False):
+        self._plan = list(paths)
+        self.lookahead = max(1, lookahead)
+        self.workers = max(1, workers)
+        self.file_backed = file_backed
+
+        self._positions = defaultdict(deque)
+        for position, path in enumerate(self._plan):
+            self._positions[path].append(position)
+        self._cursor = -1
+        self._pending = deque()
+        self._next_submit = 0
+
+        self._lock = threading.Lock()
+        self._stage_seconds = dict.fromkeys(STAGES, 0.0)
+        self.prepared = 0
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.wait_seconds = 0.0
+        self._start = time.perf_counter()
+        self._end = None
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='image-prefetch')
+        self._fill()
+
+    # ========== PREPARATION (worker threads) ==========
+
+    def _prepare(self, path):
+        """이미지 하나 준비 - 단계별 시간은 통계에 누적"""
+        timings = dict.fromkeys(STAGES, 0.0)
+        try:
+            if self.file_backed:
+                started = time.perf_counter()
+                image = FileBackedImage.from_path(path)  # 헤더 파싱 + 조각 단위 SHA1
+                timings['hash'] = time.perf_counter() - started
+                return image
+
+            started = time.perf_counter()
+            with open(path, 'rb') as f:
+                blob = f.read()
+            probed = time.perf_counter()
+            image = Image(blob, os.path.basename(path), _ImageHeaderFactory(io.BytesIO(blob)))
+            hashed = time.perf_counter()
+            image.sha1  # 계산 결과는 Image에 캐시됨 (작업 스레드에서 다시 계산하지 않음)
+            done = time.perf_counter()
+            timings.update(read=probed - started, probe=hashed - probed, hash=done - hashed)
+            return image
+        finally:
+            with self._lock:
+                self.prepared += 1
+                for stage, seconds in timings.items():
+                    self._stage_seconds[stage] += seconds
+
+    # ========== CONSUMER (mutation thread) ==========
+
+    def _fill(self):
+        """미리 준비 창을 lookahead 개까지 채움 (계획 순서)"""
+        while len(self._pending) < self.lookahead and self._next_submit < len(self._plan):
+            position = self._next_submit
+            future = self._executor.submit(self._prepare, self._plan[position])
+            self._pending.append((position, future))
+            self._next_submit += 1
+
+    def get(self, path):
+        """준비된 이미지 꺼내기 (계획 순서대로 호출) - 준비 중 오류는 여기서 다시 발생"""
+        positions = self._positions.get(path)
+        while positions and positions[0] <= self._cursor:
+            positions.popleft()
+
+        if positions:
+            target = positions.popleft()
+            while True:
+                if not self._pending:
+                    self._fill()
+                if not self._pending:
+                    break
+                position, future = self._pending.popleft()
+                self._cursor = position
+                if position < target:
+                    future.cancel()
+                    self.skipped += 1
+                    continue
+                self._fill()
+                if not future.done():
+                    started = time.perf_counter()
+                    with span('prefetch_wait', image=os.path.basename(path)):
+                        future.result()
+                    self.wait_seconds += time.perf_counter() - started
+                self.hits += 1
+                return future.result()
+
+        self.misses += 1
+        return self._prepare(path)
+
+    def close(self):
+        """남은 준비 작업 취소 후 스레드 종료"""
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+        if self._end is None:
+            self._end = time.perf_counter()
+
+    # ========== METRICS ==========
+
+    def stats(self):
+        """
+        준비 통계
+
+        Returns:
+            dict - planned, prepared, hits(미리 준비된 것 사용), misses(직접 준비), skipped(버림),
+                   stage_seconds(단계별 합계), worker_utilization(준비 스레드 사용률 0~1),
+                   consumer_wait_seconds(작업 스레드가 준비를 기다린 시간), wall_seconds
+        """
+        wall = (self._end or time.perf_counter()) - self._start
+        with self._lock:
+            stage_seconds = {stage: round(seconds, 3) for stage, seconds in self._stage_seconds.items()}
+            busy = sum(self._stage_seconds.values())
+            prepared = self.prepared
+        return {
+            'planned': len(self._plan),
+            'lookahead': self.lookahead,
+            'workers': self.workers,
+            'prepared': prepared,
+            'hits': self.hits,
+            'misses': self.misses,
+            'skipped': self.skipped,
+            'stage_seconds': stage_seconds,
+            'worker_utilization': round(busy / (wall * self.workers), 3) if wall > 0 else 0.0,
+            'consumer_wait_seconds': round(self.wait_seconds, 3),
+            'wall_seconds': round(wall, 3),
+        }
+
+    def summary_lines(self):
+        """통계 요약 (로그 출력용 줄 목록)"""
+        stats = self.stats()
+        stages = ', '.join(f"{stage} {seconds:.2f}s" for stage, seconds in stats['stage_seconds'].items() if seconds)
+        return [
+            f"이미지 미리 준비: 계획 {stats['planned']}개, 사용 {stats['hits']}개, 직접 준비 {stats['misses']}개, "
+            f"버림 {stats['skipped']}개 (lookahead {stats['lookahead']}, 스레드 {stats['workers']}개)",
+            f"  준비 단계 합계: {stages or '-'} / 스레드 사용률 {stats['worker_utilization'] * 100:.0f}% / "
+            f"작업 스레드 대기 {stats['consumer_wait_seconds']:.2f}s",
+        ]
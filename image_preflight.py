@@ -0,0 +1,151 @@
+# image_preflight.py
+# Tab 1 이미지 사전 검사 (문서를 바꾸기 전)
+# - 삽입될 이미지마다 헤더(python-docx가 읽을 수 있는 형식인지)와 크기 확인
+# - 선택: 전체 디코드로 잘린/손상된 이미지 확인 (Pillow, 느림)
+# - 이미지별 검사는 스레드로 병렬 실행
+# - 결과는 ImagePreflightReport: 실패 이미지는 삽입에서 제외하거나 작업 전체를 중단
+
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from cancellation import check_cancelled
+
+# python-docx/Pillow는 로드 비용이 크므로 검사 함수에서 처음 사용할 때 불러옴 (GUI 시작 시간)
+
+
+logger = logging.getLogger(__name__)
+
+# 검사 수준: 끔 / 헤더와 크기 / 헤더와 크기 + 전체 디코드
+PREFLIGHT_OFF = 'off'
+PREFLIGHT_HEADER = 'header'
+PREFLIGHT_DECODE = 'decode'
+PREFLIGHT_LEVELS = (PREFLIGHT_OFF, PREFLIGHT_HEADER, PREFLIGHT_DECODE)
+
+# 사전 검사 스레드 수 상한 (파일 I/O 위주, 디코드는 Pillow가 GIL을 풀어 줌)
+DEFAULT_PREFLIGHT_THREADS = 8
+
+
+# ===================================================================
+# IMAGE INSPECTION
+# ===================================================================
+
+def verify_image(path, decode=False):
+    """
+    이미지 하나 검사
+
+    Returns:
+        실패 이유 (문제 없으면 None)
+    """
+    from docx.image.image import _ImageHeaderFactory
+    from docx.image.exceptions import UnrecognizedImageError
+
+    try:
+        if os.path.getsize(path) == 0:
+            return "빈 파일"
+        with open(path, 'rb') as f:
+            header = _ImageHeaderFactory(f)
+    except UnrecognizedImageError:
+        return "지원하지 않거나 손상된 이미지 형식 (헤더를 읽을 수 없음)"
+    except OSError as e:
+        return f"파일을 읽을 수 없음 ({str(e)})"
+    except Exception as e:
+        return f"헤더 손상 ({type(e).__name__}: {str(e)})"
+
+    if not header.px_width or not header.px_height:
+        return f"잘못된 이미지 크기: {header.px_width}x{header.px_height}"
+
+    if decode:
+        from PIL import Image
+        try:
+            with Image.open(path) as img:
+                img.load()  # 픽셀 데이터까지 모두 읽음 (잘린 파일은 여기서 실패)
+        except Exception as e:
+            return f"이미지 데이터 손상 ({str(e)})"
+    return None
+
+
+# ===================================================================
+# REPORT
+# ===================================================================
+
+class ImagePreflightReport:
+    """
+    이미지 사전 검사 결과
+
+    - failures: {이미지 경로: 실패 이유}
+    - failed_items(): 결과 dict/로그용 목록 [{'image', 'path', 'reason'}]
+    """
+
+    def __init__(self, level):
+        self.level = level
+        self.checked = 0
+        self.failures = {}
+        self.seconds = 0.0
+
+    @property
+    def failed_count(self):
+        return len(self.failures)
+
+    def failed_items(self):
+        return [
+            {'image': os.path.basename(path), 'path': path, 'reason': reason}
+            for path, reason in sorted(self.failures.items())
+        ]
+
+    def stats(self):
+        return {
+            'level': self.level,
+            'checked': self.checked,
+            'failed': self.failed_items(),
+            'seconds': round(self.seconds, 3),
+        }
+
+
+def verify_images(paths, level=PREFLIGHT_HEADER, max_workers=DEFAULT_PREFLIGHT_THREADS,
+                  log_callback=None, cancel_token=None):
+    """
+    이미지 목록 사전 검사 (중복 경로는 한 번만)
+
+    Args:
+        paths: 삽입될 이미지 경로 목록
+        level: PREFLIGHT_HEADER 또는 PREFLIGHT_DECODE
+        max_workers: 검사 스레드 수 상한
+        log_callback: 로그 출력 콜백
+        cancel_token: 취소 토큰 - 검사 결과를 모을 때 이미지마다 확인
+
+    Returns:
+        ImagePreflightReport
+    """
+    def log(message):
+        if log_callback:
+            log_callback(message)
+        else:
+            logger.info(message)
+
+    unique_paths = list(dict.fromkeys(paths))
+    report = ImagePreflightReport(level)
+    decode = level == PREFLIGHT_DECODE
+    started = time.perf_counter()
+
+    threads = max(1, min(max_workers, len(unique_paths)))
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='image-preflight') as executor:
+        futures = [(path, executor.submit(verify_image, path, decode)) for path in unique_paths]
+        try:
+            for path, future in futures:
+                check_cancelled(cancel_token)
+                reason = future.result()
+                report.checked += 1
+                if reason:
+                    report.failures[path] = reason
+        finally:
+            for _, future in futures:
+                future.cancel()  # 취소 시 시작 전 검사는 버림
+
+    report.seconds = time.perf_counter() - started
+    mode = "전체 디코드" if decode else "헤더/크기"
+    log(f"✓ 이미지 사전 검사 완료 ({mode}, {report.seconds:.2f}초): {report.checked}개 확인, 실패 {report.failed_count}개")
+    for item in report.failed_items():
+        log(f"  ✗ {item['image']}: {item['reason']}")
+    return report
@@ -0,0 +1,1309 @@
+# image_report_engine.py
+# Tab 1 처리 엔진 (Qt 비의존)
+# - 이미지 폴더 검색, 파일명 기입, 이미지 삽입, 2열 테이블 생성
+# - GUI 워커, 명령행(report_cli.py), 일괄 작업에서 공통으로 사용
+
+import os
+import re
+import glob
+import heapq
+import shutil
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+
+from docx import Document
+from docx.shared import Cm, Pt
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import nsmap
+from PIL import Image
+
+from tracing import span
+from memory_profiling import memory_checkpoint
+from streaming_images import install_image_parts, save_streaming
+from image_prefetch import ImagePrefetcher, DEFAULT_LOOKAHEAD, DEFAULT_PREFETCH_WORKERS
+from image_preflight import verify_images, PREFLIGHT_OFF, PREFLIGHT_HEADER
+from table_geometry import DocumentTableGeometry, CellBox, fit_to_box
+from cancellation import OperationCancelled, check_cancelled
+
+
+logger = logging.getLogger(__name__)
+
+# 제외할 폴더 키워드 (경로 어느 부분에든 포함되면 제외)
+EXCLUDED_FOLDER_KEYWORDS = ('old', 'etc')
+
+# 파일명 기입/테이블 생성에 쓰는 이미지 확장자 (검색 순서 = 같은 정렬 키일 때 순서)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')
+
+_DIGITS_RE = re.compile(r'(\d+)')
+
+
+def natural_sort_key(filename):
+    """Windows 탐색기 정렬 키 (숫자 부분은 숫자로, 나머지는 소문자로 비교) - 튜플이라 한 번만 계산해 두고 비교"""
+    return tuple((0, int(part)) if part.isdigit() else (1, part.lower())
+                 for part in _DIGITS_RE.split(filename) if part)
+
+
+def filename_target_cells(doc):
+    """파일명 기입 칸 수 - 첫 번째 테이블의 셀 수 (병합 셀도 칸마다 하나씩 기입됨, 테이블이 없으면 0)"""
+    if not doc.tables:
+        return 0
+    return sum(len(row.cells) for row in doc.tables[0].rows)
+
+
+class ReportJobError(Exception):
+    """작업을 진행할 수 없는 입력 오류 (이미지 없음, 테이블 없음 등) - 메시지는 사용자에게 그대로 표시"""
+
+
+def reserve_unique_path(stem, ext, separator=""):
+    """
+    겹치지 않는 출력 경로를 빈 파일로 미리 만들어 반환
+
+    존재 확인과 생성을 한 번에 하므로 동시에 실행 중인 다른 작업이 같은 이름을 고르지 않습니다.
+    (예: stem_copy.docx가 있으면 stem_copy1.docx, stem_copy2.docx ...)
+    """
+    candidate = f"{stem}{ext}"
+    counter = 1
+    while True:
+        try:
+            with open(candidate, 'xb'):
+                return candidate
+        except FileExistsError:
+            candidate = f"{stem}{separator}{counter}{ext}"
+            counter += 1
+
+
+class ImageReportEngine:
+    """
+    Tab 1 처리 엔진
+
+    인스턴스 하나가 작업 하나를 처리합니다 (이미지 삽입 중 상태를 가짐).
+    작업마다 인스턴스를 따로 만들면 여러 스레드/프로세스에서 동시에 실행할 수 있습니다.
+
+    Args:
+        log_callback: 로그 출력 콜백 (None이면 logger 사용)
+        progress_callback: 진행률(0~100) 콜백
+        cancel_token: 취소 토큰 (cancellation.py) - 파일/셀 단위로 확인, 취소 시 OperationCancelled
+        image_index: 폴더별 이미지 검색 결과 dict - 있으면 같은 폴더는 다시 검색하지 않고 재사용,
+                     없던 폴더는 검색 후 추가 (일괄 작업에서 공유, batch_report.py)
+    """
+
+    def __init__(self, log_callback=None, progress_callback=None, cancel_token=None, image_index=None):
+        self.log_callback = log_callback
+        self.progress_callback = progress_callback
+        self.cancel_token = cancel_token
+        self.image_index = image_index
+        self._image_parts = None  # 이미지 삽입 중 미리 준비된 이미지를 쓸 때만 설정
+        self._table_geometry = None  # 이미지 삽입 중 표 기하 모델 (셀별 이미지 상자)
+
+    def log(self, message):
+        """로그 출력"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            logger.info(message)
+
+    def progress(self, value):
+        """진행률 보고"""
+        if self.progress_callback:
+            self.progress_callback(value)
+
+    def check_cancelled(self):
+        """취소 요청 확인 (취소되었으면 OperationCancelled)"""
+        check_cancelled(self.cancel_token)
+
+    @contextmanager
+    def discard_on_cancel(self, path):
+        """취소되면 만들다 만 출력 파일 삭제"""
+        try:
+            yield
+        except OperationCancelled:
+            try:
+                os.remove(path)
+                self.log(f"⚠️ 작업 취소 - 미완성 파일 삭제: {os.path.basename(path)}")
+            except OSError:
+                pass
+            raise
+
+    def windows_sort_key(self, filename):
+        """Windows 탐색기 정렬 방식"""
+        return list(natural_sort_key(filename))
+
+    # ========== HELPER METHODS - Image File Operations ==========
+
+    def get_image_files(self, folder_path, include_subfolders=True):
+        """
+        이미지 파일 수집 (하위폴더 포함 옵션)
+
+        Args:
+            folder_path: 검색할 폴더 경로
+            include_subfolders: 하위 폴더 포함 여부
+        """
+        search_type = "하위폴더 포함" if include_subfolders else "현재 폴더만"
+        key = ('listing', os.path.abspath(folder_path), include_subfolders)
+        if self.image_index is not None and key in self.image_index:
+            filenames, image_files = self.image_index[key]
+            self.log(f"공유 이미지 색인 사용 ({search_type}): 총 {len(filenames)}개의 이미지 파일")
+            return list(filenames), list(image_files)
+
+        image_extensions = ['*' + ext for ext in IMAGE_EXTENSIONS]
+        image_files = []
+
+        self.log(f"{search_type} 이미지 파일 검색 중...")
+
+        with span('scan', folder=folder_path):
+            for ext in image_extensions:
+                if include_subfolders:
+                    pattern = os.path.join(folder_path, '**', ext)
+                    files = glob.iglob(pattern, recursive=True)
+                else:
+                    pattern = os.path.join(folder_path, ext)
+                    files = glob.iglob(pattern, recursive=False)
+
+                # old, etc 포함 폴더 제외
+                for file_path in files:
+                    self.check_cancelled()
+                    if not self.is_in_excluded_folder(file_path):
+                        image_files.append(file_path)
+
+        with span('index', files=len(image_files)):
+            filenames = [os.path.basename(f) for f in image_files]
+            filenames.sort(key=self.windows_sort_key)
+
+        self.log(f"=== Windows 탐색기 순서로 정렬 ===")
+        for i, filename in enumerate(filenames[:10]):
+            self.log(f"{i+1:2d}. {filename}")
+        if len(filenames) > 10:
+            self.log(f"    ... 총 {len(filenames)}개 파일")
+        self.log(f"검색 완료 ({search_type}): 총 {len(filenames)}개의 이미지 파일 발견")
+
+        if self.image_index is not None:
+            self.image_index[key] = (list(filenames), list(image_files))
+        return filenames, image_files
+
+    def iter_image_files(self, folder_path, include_subfolders=True):
+        """
+        이미지 파일을 하나씩 검색 (폴더 트리를 한 번만 순회, 목록을 만들지 않음)
+
+        get_image_files와 같은 규칙: 확장자(IMAGE_EXTENSIONS, 대소문자는 OS 규칙), 숨김 파일/폴더 제외,
+        경로에 old/etc가 들어간 파일 제외 (해당 폴더는 아래로 내려가지 않음)
+
+        Yields:
+            (파일 경로, 확장자 순번)
+        """
+        if self.is_in_excluded_folder(folder_path):
+            return
+        extension_order = {os.path.normcase(ext): order for order, ext in enumerate(IMAGE_EXTENSIONS)}
+
+        def excluded(name):
+            name = name.lower()
+            return any(keyword in name for keyword in EXCLUDED_FOLDER_KEYWORDS)
+
+        pending = [folder_path]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            subdirectories = []
+            for entry in entries:
+                self.check_cancelled()
+                if entry.name.startswith('.') or excluded(entry.name):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    if include_subfolders:
+                        subdirectories.append(entry.path)
+                    continue
+                order = extension_order.get(os.path.normcase(os.path.splitext(entry.name)[1]))
+                if order is not None:
+                    yield entry.path, order
+            # 하위 폴더는 발견 순서대로 (glob의 ** 순회 순서와 같음)
+            pending.extend(reversed(subdirectories))
+
+    def get_first_image_files(self, folder_path, limit, include_subfolders=True):
+        """
+        Windows 탐색기 순서로 앞에서 limit개의 이미지 파일명만 구함 (파일명 기입용)
+
+        전체 목록을 정렬하지 않고 크기 limit의 힙으로 고르므로 메모리는 limit에 비례합니다.
+        결과는 get_image_files()의 앞 limit개와 같습니다.
+
+        Returns:
+            (파일명 리스트, 검색된 전체 이미지 수)
+        """
+        search_type = "하위폴더 포함" if include_subfolders else "현재 폴더만"
+        folder = os.path.abspath(folder_path)
+        if self.image_index is not None:
+            listing = self.image_index.get(('listing', folder, include_subfolders))
+            if listing is not None:
+                filenames, _ = listing
+                self.log(f"공유 이미지 색인 사용 ({search_type}): 총 {len(filenames)}개의 이미지 파일")
+                return list(filenames[:limit]), len(filenames)
+            # 앞 N개 색인 (일괄 작업: 폴더를 쓰는 템플릿 중 가장 큰 셀 수만큼) - limit개 이상 있으면 사용
+            first = self.image_index.get(('first', folder, include_subfolders))
+            if first is not None and (len(first[0]) >= limit or len(first[0]) == first[1]):
+                filenames, total = first
+                self.log(f"공유 이미지 색인 사용 ({search_type}): 총 {total}개 중 앞 {len(filenames)}개")
+                return list(filenames[:limit]), total
+
+        self.log(f"{search_type} 이미지 파일 검색 중 (앞에서 {limit}개만 정렬)...")
+        total = 0
+
+        def keyed_files():
+            nonlocal total
+            for path, order in self.iter_image_files(folder_path, include_subfolders):
+                total += 1
+                name = os.path.basename(path)
+                yield natural_sort_key(name), order, total, name
+
+        with span('scan', folder=folder_path, limit=limit):
+            # 같은 정렬 키면 확장자 순서 → 검색 순서 (get_image_files의 안정 정렬과 같은 순서)
+            smallest = heapq.nsmallest(limit, keyed_files())
+        filenames = [name for _, _, _, name in smallest]
+
+        self.log(f"=== Windows 탐색기 순서로 정렬 ===")
+        for i, filename in enumerate(filenames[:10]):
+            self.log(f"{i+1:2d}. {filename}")
+        if total > 10:
+            self.log(f"    ... 총 {total}개 파일 중 {len(filenames)}개 사용")
+        self.log(f"검색 완료 ({search_type}): 총 {total}개의 이미지 파일 발견")
+        if self.image_index is not None:
+            key = ('first', folder, include_subfolders)
+            if key not in self.image_index or len(self.image_index[key][0]) < len(filenames):
+                self.image_index[key] = (list(filenames), total)
+        return filenames, total
+
+    def get_png_files(self, start_folder, include_subfolders=True):
+        """
+        모든 이미지 파일 수집 (PNG, JPG, JPEG 등 + old/etc 폴더 제외)
+
+        Args:
+            start_folder: 검색할 폴더 경로
+            include_subfolders: 하위 폴더 포함 여부
+        """
+        start_folder = os.path.abspath(start_folder)
+        key = ('by_name', start_folder, include_subfolders)
+        if self.image_index is not None and key in self.image_index:
+            self.log("공유 이미지 색인 사용")
+            return dict(self.image_index[key])
+
+        png_files = {}
+
+        # 모든 이미지 확장자 검색
+        image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff', '*.webp']
+
+        found = []
+        with span('scan', folder=start_folder):
+            for ext in image_extensions:
+                if include_subfolders:
+                    search_path = os.path.join(start_folder, '**', ext)
+                    files = glob.iglob(search_path, recursive=True)
+                else:
+                    search_path = os.path.join(start_folder, ext)
+                    files = glob.iglob(search_path, recursive=False)
+                for file_path in files:
+                    self.check_cancelled()
+                    found.append(file_path)
+
+        # 확장자 없는 파일명 → 경로 (같은 이름이면 나중 확장자 우선)
+        with span('index', files=len(found)):
+            for file_path in found:
+                if os.path.isfile(file_path):
+                    # old, etc 폴더 제외
+                    if self.is_in_excluded_folder(file_path):
+                        self.log(f"  제외 폴더 파일 스킵: {os.path.basename(file_path)}")
+                        continue
+
+                    name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+                    png_files[name_without_ext] = file_path
+
+        if self.image_index is not None:
+            self.image_index[key] = dict(png_files)
+        return png_files
+
+    def is_in_excluded_folder(self, file_path):
+        """파일이 제외 대상 폴더(old, etc 포함) 안에 있는지 확인"""
+        try:
+            normalized_path = os.path.normpath(file_path)
+            path_parts = normalized_path.split(os.sep)
+
+            for part in path_parts:
+                part_lower = part.lower()
+                for keyword in EXCLUDED_FOLDER_KEYWORDS:
+                    if keyword in part_lower:
+                        return True
+
+            return False
+        except Exception as e:
+            self.log(f"  제외 폴더 확인 중 오류: {str(e)}")
+            return False
+
+    def create_copy_path(self, original_path, suffix="_copy"):
+        """복사본 경로 생성 (빈 파일로 예약 - 복사 시 덮어씀)"""
+        path_parts = os.path.splitext(original_path)
+        return reserve_unique_path(f"{path_parts[0]}{suffix}", path_parts[1])
+
+    def create_copy(self, original_path):
+        """원본을 예약한 복사본 경로로 복사 (복사 실패 시 예약한 빈 파일 삭제)"""
+        copy_path = self.create_copy_path(original_path)
+        self.log(f"복사본 생성: {copy_path}")
+        try:
+            shutil.copy2(original_path, copy_path)
+        except BaseException:
+            os.remove(copy_path)
+            raise
+        return copy_path
+
+    # ========== HELPER METHODS - BE Test Cell Detection ==========
+
+    def is_filename_line(self, text):
+        """파일명 라인인지 판단"""
+        return (text.startswith('N') and '_' in text and
+                ('MHz' in text or 'QPSK' in text or 'QAM' in text or 'DFT' in text or 'CP' in text))
+
+    def is_description_line(self, text):
+        """설명 문구인지 판단"""
+        description_keywords = [
+            'dft-s', 'ofdm', 'qpsk', 'low', 'high', 'frb', 'chansnel', 'chan',
+            'spurious', 'emission', 'block', 'error', 'testmode', 'comparison'
+        ]
+        text_lower = text.lower()
+        return any(keyword in text_lower for keyword in description_keywords)
+
+    def is_be_test_cell(self, cell_text):
+        """
+        BE 테스트 셀 판단 - 극도로 보수적 접근
+        BE 전용 키워드가 있을 때만 True
+        """
+        if not cell_text:
+            return False
+
+        # BE 전용 키워드들 (대소문자 무관)
+        be_keywords = ['OFDM', 'DFT-s', 'CP_OFDM', 'DFT-s_OFDM']
+
+        text_upper = cell_text.upper()
+
+        # BE 키워드가 하나라도 있으면 BE 셀
+        return any(keyword.upper() in text_upper for keyword in be_keywords)
+
+    def update_description_with_testmode(self, text, matched_testmode):
+        """TESTMODE에 따라 설명 문구 업데이트"""
+        try:
+            ofdm_pattern = r'(.*)OFDM(.*)'
+            match = re.search(ofdm_pattern, text, re.IGNORECASE)
+
+            if match:
+                after_ofdm = match.group(2)
+
+                if matched_testmode == 'DFT':
+                    updated_text = f"DFT-s_OFDM{after_ofdm}"
+                elif matched_testmode == 'CP':
+                    updated_text = f"CP_OFDM{after_ofdm}"
+                else:
+                    updated_text = text
+
+                return updated_text
+            else:
+                return text
+
+        except Exception as e:
+            self.log(f"      설명 문구 업데이트 중 오류: {str(e)}")
+            return text
+
+    # ========== HELPER METHODS - BE Test Cell Processing ==========
+
+    def process_be_comparison_cell(self, cell, png_files):
+        """
+        BE 테스트 셀 처리
+        Args:
+            cell: Word 문서의 셀 객체
+            png_files: 이미지 파일 딕셔너리
+        """
+        try:
+            cell_text = cell.text.strip()
+            if not cell_text:
+                return 0
+
+            lines = [line.strip() for line in cell_text.split('\n') if line.strip()]
+
+            self.log(f"      BE 테스트 셀 분석: {len(lines)}개 줄")
+
+            # 각 줄 분류
+            filename_lines = []
+            description_lines = []
+            other_lines = []
+
+            for line in lines:
+                if self.is_filename_line(line):
+                    filename_lines.append(line)
+                elif self.is_description_line(line):
+                    description_lines.append(line)
+                else:
+                    other_lines.append(line)
+
+            self.log(f"      분류: 파일명 {len(filename_lines)}개, 설명 {len(description_lines)}개")
+
+            # 매칭되는 파일 찾기
+            matched_filename = None
+            matched_testmode = None
+
+            for filename_line in filename_lines:
+                filename_base = filename_line.replace('.png', '').replace('.jpg', '').replace('.jpeg', '')
+
+                if filename_base in png_files:
+                    matched_filename = filename_base
+
+                    # TESTMODE 추출
+                    if '_DFT' in filename_base.upper():
+                        matched_testmode = 'DFT'
+                    elif '_CP' in filename_base.upper():
+                        matched_testmode = 'CP'
+
+                    self.log(f"      ✅ 매칭: {filename_base} (TESTMODE: {matched_testmode})")
+                    break
+
+            if not matched_filename:
+                self.log(f"      ❌ 매칭 실패")
+                return 0
+
+            # 셀 내용 재구성
+            self.rebuild_be_cell_content(cell, matched_filename, matched_testmode,
+                                         description_lines, other_lines, png_files)
+
+            return 1
+
+        except Exception as e:
+            self.log(f"      ❌ BE 셀 처리 오류: {str(e)}")
+            return 0
+
+    def rebuild_be_cell_content(self, cell, matched_filename, matched_testmode,
+                                description_lines, other_lines, png_files):
+        """
+        BE 테스트 셀 내용 재구성 - 공란 완전 제거
+        Args:
+            cell: Word 문서의 셀 객체
+            matched_filename: 매칭된 파일명
+            matched_testmode: 추출된 테스트 모드 (DFT/CP)
+            description_lines: 설명 줄 리스트
+            other_lines: 기타 줄 리스트
+            png_files: 이미지 파일 딕셔너리
+        """
+        try:
+            # 원본 설명 문구 서식 저장
+            original_desc_formatting = self.save_description_formatting(cell, description_lines)
+
+            # 셀 내용 완전 삭제
+            self.clear_cell_safely(cell)
+
+            # 첫 번째 문단도 제거하고 완전히 새로 시작
+            tc = cell._tc
+            for p_element in list(tc.findall('.//w:p', namespaces=nsmap)):
+                tc.remove(p_element)
+
+            # 이미지 삽입 (새 문단 생성)
+            image_paragraph = cell.add_paragraph()
+            image_run = image_paragraph.add_run()
+
+            if self.insert_image_to_run(image_run, png_files[matched_filename], cell):
+                self.log(f"        ✅ 이미지 삽입: {os.path.basename(png_files[matched_filename])}")
+            else:
+                self.log(f"        ❌ 이미지 삽입 실패")
+                return
+
+            # 이미지 문단의 여백 완전 제거
+            pf = image_paragraph.paragraph_format
+            pf.space_before = Pt(0)
+            pf.space_after = Pt(0)
+            pf.line_spacing = 1.0
+
+            # 기타 텍스트 추가 (내용이 있을 때만)
+            for other_line in other_lines:
+                if other_line.strip():  # 빈 줄이 아닐 때만
+                    other_paragraph = cell.add_paragraph()
+                    other_run = other_paragraph.add_run(other_line)
+                    pf = other_paragraph.paragraph_format
+                    pf.space_before = Pt(0)
+                    pf.space_after = Pt(0)
+                    pf.line_spacing = 1.0
+
+            # 설명 문구 추가 (내용이 있을 때만)
+            for i, desc_line in enumerate(description_lines):
+                if desc_line.strip():  # 빈 줄 건너뛰기
+                    desc_paragraph = cell.add_paragraph()
+
+                    if matched_testmode and 'OFDM' in desc_line.upper():
+                        updated_desc = self.update_description_with_testmode(desc_line, matched_testmode)
+
+                        if updated_desc != desc_line:
+                            self.log(f"        🔄 설명 업데이트: {desc_line} → {updated_desc}")
+
+                        self.add_text_with_original_formatting(desc_paragraph, updated_desc,
+                                                              original_desc_formatting, i)
+                    else:
+                        self.add_text_with_original_formatting(desc_paragraph, desc_line,
+                                                              original_desc_formatting, i)
+
+                    # 설명 문단도 여백 제거
+                    pf = desc_paragraph.paragraph_format
+                    pf.space_before = Pt(0)
+                    pf.space_after = Pt(0)
+                    pf.line_spacing = 1.0
+
+            self.log(f"        ✅ 매칭 안 된 파일명 및 모든 공란 완전 제거 완료")
+
+        except Exception as e:
+            self.log(f"        ❌ BE 셀 재구성 오류: {str(e)}")
+
+    def save_description_formatting(self, cell, description_lines):
+        """설명 문구의 원본 서식 정보 저장"""
+        formatting_info = []
+
+        try:
+            for paragraph in cell.paragraphs:
+                text = paragraph.text.strip()
+
+                if text in description_lines:
+                    para_formatting = {
+                        'alignment': paragraph.alignment,
+                        'runs': []
+                    }
+
+                    for run in paragraph.runs:
+                        run_formatting = {
+                            'text': run.text,
+                            'bold': run.bold,
+                            'italic': run.italic,
+                            'underline': run.underline,
+                            'font_name': None,
+                            'font_size': None,
+                            'font_color': None
+                        }
+
+                        try:
+                            if run.font.name:
+                                run_formatting['font_name'] = run.font.name
+                        except:
+                            pass
+
+                        try:
+                            if run.font.size:
+                                run_formatting['font_size'] = run.font.size
+                        except:
+                            pass
+
+                        try:
+                            if run.font.color and run.font.color.rgb:
+                                run_formatting['font_color'] = run.font.color.rgb
+                        except:
+                            pass
+
+                        para_formatting['runs'].append(run_formatting)
+
+                    formatting_info.append(para_formatting)
+
+        except Exception as e:
+            self.log(f"          서식 저장 오류: {str(e)}")
+
+        return formatting_info
+
+    def add_text_with_original_formatting(self, paragraph, text, original_formatting, desc_index):
+        """원본 서식을 유지하면서 텍스트만 변경"""
+        try:
+            if desc_index < len(original_formatting):
+                format_info = original_formatting[desc_index]
+
+                if format_info.get('alignment'):
+                    paragraph.alignment = format_info['alignment']
+
+                if format_info.get('runs') and len(format_info['runs']) > 0:
+                    first_run_format = format_info['runs'][0]
+                    new_run = paragraph.add_run(text)
+
+                    if first_run_format.get('bold') is not None:
+                        new_run.bold = first_run_format['bold']
+                    if first_run_format.get('italic') is not None:
+                        new_run.italic = first_run_format['italic']
+                    if first_run_format.get('underline') is not None:
+                        new_run.underline = first_run_format['underline']
+
+                    try:
+                        if first_run_format.get('font_name'):
+                            new_run.font.name = first_run_format['font_name']
+                    except:
+                        pass
+
+                    try:
+                        if first_run_format.get('font_size'):
+                            new_run.font.size = first_run_format['font_size']
+                    except:
+                        pass
+
+                    try:
+                        if first_run_format.get('font_color'):
+                            new_run.font.color.rgb = first_run_format['font_color']
+                    except:
+                        pass
+                else:
+                    paragraph.add_run(text)
+            else:
+                paragraph.add_run(text)
+
+            self.apply_minimal_formatting(paragraph)
+
+        except Exception as e:
+            self.log(f"          서식 적용 오류: {str(e)}")
+            paragraph.add_run(text)
+
+    def clear_cell_safely(self, cell):
+        """셀 내용을 안전하게 삭제"""
+        try:
+            while len(cell.paragraphs) > 1:
+                try:
+                    last_paragraph = cell.paragraphs[-1]
+                    p_element = last_paragraph._element
+                    p_element.getparent().remove(p_element)
+                except:
+                    break
+
+            if cell.paragraphs:
+                first_paragraph = cell.paragraphs[0]
+                for run in first_paragraph.runs:
+                    run.text = ""
+                first_paragraph.text = ""
+
+                try:
+                    pf = first_paragraph.paragraph_format
+                    pf.space_before = Pt(0)
+                    pf.space_after = Pt(0)
+                    pf.line_spacing = 1.0
+                except:
+                    pass
+
+        except Exception as e:
+            self.log(f"          셀 삭제 오류: {str(e)}")
+
+    def apply_minimal_formatting(self, paragraph):
+        """공백을 최소화하는 문단 서식 적용"""
+        try:
+            pf = paragraph.paragraph_format
+            pf.space_before = Pt(0)
+            pf.space_after = Pt(0)
+            pf.line_spacing = 1.0
+        except:
+            pass
+
+    # ========== HELPER METHODS - Image Insertion ==========
+
+    def find_matching_image(self, text, png_files):
+        """이미지 매칭"""
+        if not text.strip():
+            return None
+
+        return png_files.get(text)
+
+    def get_paragraph_text(self, paragraph):
+        """문단 텍스트 추출"""
+        return ''.join(run.text for run in paragraph.runs).strip()
+
+    def insert_image_to_run(self, run, img_path, cell):
+        """
+        이미지를 Run에 삽입
+
+        Args:
+            run: Word 문서의 Run 객체
+            img_path: 이미지 파일 경로
+            cell: 셀 객체 (표 기하 모델에 있으면 미리 계산된 이미지 상자 사용)
+        """
+        try:
+            # ========================================
+            # 이미지 크기 조정 로직
+            # - 셀의 가로/세로 크기 모두 고려
+            # - 이미지 비율 유지하면서 셀 안에 꼭 맞게 조정
+            # - 가로 또는 세로 중 제한적인 쪽에 맞추고
+            #   다른 쪽은 비율에 맞게 자동 조정
+            # ========================================
+
+            # 표 기하 모델의 셀 상자 (tblGrid/gridSpan/행 높이/셀 여백/구역 너비 반영, table_geometry.py)
+            box = self._table_geometry.box_for(cell) if self._table_geometry is not None else None
+
+            if box is None:
+                # 모델에 없는 셀 (중첩 표 등): 기존 규칙
+                MARGIN = Cm(0.3)  # 셀 여백
+                DEFAULT_MAX_WIDTH = Cm(8)
+                DEFAULT_MAX_HEIGHT = Cm(6)
+
+                # 셀 너비 확인
+                if hasattr(cell, 'width') and hasattr(cell.width, 'cm') and cell.width.cm:
+                    max_width = Cm(cell.width.cm - MARGIN.cm)
+                else:
+                    max_width = DEFAULT_MAX_WIDTH
+
+                # 셀 높이 확인
+                if hasattr(cell, 'height') and hasattr(cell.height, 'cm') and cell.height.cm:
+                    max_height = Cm(cell.height.cm - MARGIN.cm)
+                else:
+                    max_height = DEFAULT_MAX_HEIGHT
+
+                box = CellBox(int(max_width), int(max_height), False, None)
+
+            # 이미지 원본 크기 및 비율 계산
+            with span('image_probe', image=os.path.basename(img_path)):
+                if self._image_parts is not None:
+                    # 미리 준비된 헤더 정보 사용 (파일을 다시 열지 않음)
+                    prepared = self._image_parts.prepare(img_path)
+                    img_width, img_height = prepared.px_width, prepared.px_height
+                else:
+                    with Image.open(img_path) as img:
+                        img_width, img_height = img.size
+            if img_width == 0 or img_height == 0:
+                raise ValueError(f"Invalid image dimensions: {img_width}x{img_height}")
+
+            # 비율 유지하며 상자 안에 맞춤: 가로 기준으로 맞추고 높이가 넘치면 세로 기준 (table_geometry.fit_to_box)
+            new_width, new_height = fit_to_box(img_width, img_height, box)
+
+            with span('insert', image=os.path.basename(img_path)):
+                run.add_picture(img_path, width=new_width, height=new_height)
+
+            self.log(f"    이미지 삽입 성공: {os.path.basename(img_path)}")
+            return True
+
+        except Exception as e:
+            self.log(f"    이미지 삽입 실패: {os.path.basename(img_path)}. 오류: {str(e)}")
+            return False
+
+    def copy_run_format(self, source_run, target_run):
+        """Run 서식 복사"""
+        target_run.bold = source_run.bold
+        target_run.italic = source_run.italic
+        target_run.underline = source_run.underline
+        target_run.font.name = source_run.font.name
+        if source_run.font.size:
+            target_run.font.size = source_run.font.size
+        if source_run.font.color and source_run.font.color.rgb:
+            target_run.font.color.rgb = source_run.font.color.rgb
+
+    def process_cell(self, cell, png_files):
+        """
+        일반 셀 처리 로직
+        Args:
+            cell: Word 문서의 셀 객체
+            png_files: 이미지 파일 리스트
+        """
+        total_attempts = 0
+        successful_matches = 0
+        successful_insertions = 0
+
+        paragraphs = list(cell.paragraphs)
+        for p_idx, paragraph in enumerate(paragraphs):
+            try:
+                original_text = self.get_paragraph_text(paragraph)
+                if not original_text:
+                    continue
+
+                total_attempts += 1
+                img_path = self.find_matching_image(original_text, png_files)
+
+                if img_path:
+                    successful_matches += 1
+
+                    runs_to_process = list(paragraph.runs)
+                    paragraph.clear()
+
+                    run = paragraph.add_run()
+                    if self.insert_image_to_run(run, img_path, cell):
+                        successful_insertions += 1
+                        self.log(f"    ✅ 이미지 매칭 및 삽입 성공: {original_text}")
+                    else:
+                        self.log(f"    ❌ 이미지 삽입 실패: {original_text}")
+                        for r in runs_to_process:
+                            new_run = paragraph.add_run(r.text)
+                            self.copy_run_format(r, new_run)
+
+            except Exception as e:
+                self.log(f"    단락 처리 중 오류 발생: {str(e)}")
+
+        return total_attempts, successful_matches, successful_insertions
+
+    def build_insertion_plan(self, doc, png_files):
+        """
+        이미지 삽입 순서 예측 (셀 처리 순서와 같은 규칙으로 매칭만 수행, 문서는 바꾸지 않음)
+
+        Returns:
+            삽입될 이미지 경로 목록 (순서대로, 중복 가능)
+        """
+        plan = []
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    cell_text = cell.text.strip()
+                    if self.is_be_test_cell(cell_text):
+                        for line in cell_text.split('\n'):
+                            line = line.strip()
+                            if not self.is_filename_line(line):
+                                continue
+                            filename_base = line.replace('.png', '').replace('.jpg', '').replace('.jpeg', '')
+                            if filename_base in png_files:
+                                plan.append(png_files[filename_base])
+                                break
+                    elif cell_text:
+                        for paragraph in cell.paragraphs:
+                            img_path = self.find_matching_image(self.get_paragraph_text(paragraph), png_files)
+                            if img_path:
+                                plan.append(img_path)
+        return plan
+
+    # ========== FEATURE IMPLEMENTATIONS ==========
+
+    # ========== OPERATIONS ==========
+
+    def insert_filenames(self, folder_path, word_file_path, include_subfolders=True):
+        """기능 1: 파일명 기입 - 첫 번째 테이블에 Windows 탐색기 순서로 파일명 기입 (복사본에 저장)"""
+        self.progress(0)
+        self.log("=== 파일명 기입 작업 시작 ===")
+
+        # Create backup copy
+        original_path = word_file_path
+        copy_path = self.create_copy(original_path)
+
+        with self.discard_on_cancel(copy_path):
+            return self._write_filenames(folder_path, copy_path, include_subfolders)
+
+    def _write_filenames(self, folder_path, copy_path, include_subfolders):
+        """insert_filenames 본문 - 첫 번째 테이블 셀 수만큼 이미지 파일명을 구해 복사본에 기입"""
+        # Open Word document
+        with span('open_document', file=os.path.basename(copy_path)):
+            doc = Document(copy_path)
+        memory_checkpoint('document_opened', file=os.path.basename(copy_path))
+        if not doc.tables:
+            self.log("Word 문서에 테이블이 없습니다.")
+            raise ReportJobError("Word 문서에 테이블이 없습니다.")
+
+        table = doc.tables[0]
+        target_cells = filename_target_cells(doc)
+        self.log(f"테이블 발견: {len(table.rows)}행 {len(table.columns)}열 (기입할 칸 {target_cells}개)")
+
+        # Get image files (셀 수만큼만 정렬)
+        filenames, _ = self.get_first_image_files(
+            folder_path,
+            target_cells,
+            include_subfolders=include_subfolders
+        )
+        if not filenames:
+            self.log("이미지 파일이 없습니다.")
+            raise ReportJobError("선택한 폴더에 이미지 파일이 없습니다.")
+
+        filename_index = 0
+        self.log(f"=== 파일명 기입 시작 (Windows 탐색기 순서) ===")
+
+        for row_idx, row in enumerate(table.rows):
+            for col_idx, cell in enumerate(row.cells):
+                self.check_cancelled()
+                if filename_index < len(filenames):
+                    existing_text = cell.text.strip()
+                    filename_without_ext = os.path.splitext(filenames[filename_index])[0]
+
+                    if existing_text:
+                        # Save original formatting
+                        original_paragraphs_data = []
+                        for p in cell.paragraphs:
+                            if not p.text.strip():
+                                continue
+
+                            paragraph_data = {'runs': [], 'alignment': p.alignment}
+                            for run in p.runs:
+                                run_data = {
+                                    "text": run.text,
+                                    "bold": run.bold,
+                                    "italic": run.italic,
+                                    "underline": run.underline,
+                                    "font_name": run.font.name,
+                                    "font_size": run.font.size,
+                                    "font_color_rgb": run.font.color.rgb if run.font.color else None,
+                                }
+                                paragraph_data['runs'].append(run_data)
+                            original_paragraphs_data.append(paragraph_data)
+
+                        # Clear cell and rebuild
+                        tc = cell._tc
+                        for p_element in tc.findall('.//w:p', namespaces=nsmap):
+                            tc.remove(p_element)
+
+                        # Add filename
+                        p_filename = cell.add_paragraph(filename_without_ext)
+                        p_filename.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                        pf1 = p_filename.paragraph_format
+                        pf1.space_before = Pt(0)
+                        pf1.space_after = Pt(0)
+                        pf1.line_spacing = 1.0
+
+                        # Restore original content
+                        for p_data in original_paragraphs_data:
+                            p_recreated = cell.add_paragraph()
+                            p_recreated.alignment = p_data['alignment']
+                            for run_data in p_data['runs']:
+                                new_run = p_recreated.add_run(run_data['text'])
+                                new_run.bold = run_data['bold']
+                                new_run.italic = run_data['italic']
+                                new_run.underline = run_data['underline']
+                                if run_data['font_name']:
+                                    new_run.font.name = run_data['font_name']
+                                if run_data['font_size']:
+                                    new_run.font.size = run_data['font_size']
+                                if run_data['font_color_rgb']:
+                                    new_run.font.color.rgb = run_data['font_color_rgb']
+
+                            pf_recreated = p_recreated.paragraph_format
+                            pf_recreated.space_before = Pt(0)
+                            pf_recreated.space_after = Pt(0)
+                            pf_recreated.line_spacing = 1.0
+
+                        self.log(f"셀 서식 포함 재구성 [{row_idx+1},{col_idx+1}]: {filename_without_ext}")
+
+                    else:
+                        # Empty cell - just add filename
+                        first_paragraph = cell.paragraphs[0]
+                        first_paragraph.text = filename_without_ext
+                        first_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                        pf = first_paragraph.paragraph_format
+                        pf.space_before = Pt(0)
+                        pf.space_after = Pt(0)
+                        pf.line_spacing = 1.0
+                        self.log(f"파일명 기입 [{row_idx+1},{col_idx+1}]: {filename_without_ext}")
+
+                    filename_index += 1
+                else:
+                    break
+            if filename_index >= len(filenames):
+                break
+
+        # Save document
+        self.progress(100)
+        with span('save', file=os.path.basename(copy_path)):
+            doc.save(copy_path)
+        memory_checkpoint('saved', file=os.path.basename(copy_path))
+        self.log(f"파일명 기입 완료! 저장된 파일: {copy_path}")
+
+        message = (
+            f"파일명이 성공적으로 기입되었습니다.\n\n"
+            f"저장된 파일: {os.path.basename(copy_path)}"
+        )
+
+        return {
+            'success': True,
+            'message': message,
+            'output_file': copy_path,
+            'stats': {'filenames_written': filename_index},
+        }
+
+    def insert_images(self, folder_path, word_file_path, include_subfolders=True, streaming=False,
+                      lookahead=DEFAULT_LOOKAHEAD, prefetch_workers=DEFAULT_PREFETCH_WORKERS,
+                      preflight=PREFLIGHT_HEADER, preflight_abort=False):
+        """
+        기능 2: 이미지 삽입 (통합) - 셀 텍스트와 이름이 같은 이미지 삽입, BE 테스트 셀 재구성 (복사본에 저장)
+
+        streaming=True이면 이미지 바이트를 메모리에 올리지 않고 저장할 때 원본 파일에서 복사합니다
+        (대용량 보고서용, streaming_images.py 참고).
+        lookahead개까지 이미지를 prefetch_workers개 스레드가 삽입 순서대로 미리 준비합니다
+        (0이면 셀마다 직접 준비, image_prefetch.py 참고).
+        preflight('header'/'decode'/'off')에 따라 삽입될 이미지를 복사본을 만들기 전에 검사합니다
+        (image_preflight.py 참고). 실패한 이미지는 삽입에서 제외하고 셀은 그대로 두며,
+        preflight_abort=True이면 실패 목록과 함께 작업을 중단합니다 (복사본을 만들지 않음).
+        """
+        self.progress(0)
+        self.log("=== 통합 이미지 삽입 작업 시작 ===")
+
+        # Get PNG files
+        png_files = self.get_png_files(
+            folder_path,
+            include_subfolders=include_subfolders
+        )
+        memory_checkpoint('images_indexed', images=len(png_files))
+        search_type = "하위폴더 포함" if include_subfolders else "현재 폴더만"
+        self.log(f"이미지 파일 검색 완료 ({search_type}): 총 {len(png_files)}개 발견")
+        if png_files:
+            self.log(f"발견된 이미지 파일 (최대 10개): {list(png_files.keys())[:10]}{'...' if len(png_files) > 10 else ''}")
+
+        # Open Word document (원본을 읽기만 함 - 저장은 복사본에)
+        original_path = word_file_path
+        with span('open_document', file=os.path.basename(original_path)):
+            doc = Document(original_path)
+        memory_checkpoint('document_opened', file=os.path.basename(original_path))
+        if not doc.tables:
+            self.log("Word 문서에 테이블이 없습니다.")
+            raise ReportJobError("Word 문서에 테이블이 없습니다.")
+
+        plan = None
+        if lookahead > 0 or preflight != PREFLIGHT_OFF:
+            plan = self.build_insertion_plan(doc, png_files)
+
+        # 이미지 사전 검사 (문서를 바꾸기 전 - 실패 이미지는 제외 또는 중단)
+        preflight_report = None
+        if preflight != PREFLIGHT_OFF:
+            with span('image_preflight', images=len(plan)):
+                preflight_report = verify_images(plan, preflight, log_callback=self.log_callback,
+                                                 cancel_token=self.cancel_token)
+            memory_checkpoint('image_preflight_done')
+            if preflight_report.failures:
+                if preflight_abort:
+                    lines = '\n'.join(f"- {item['image']}: {item['reason']}"
+                                       for item in preflight_report.failed_items()[:20])
+                    more = preflight_report.failed_count - 20
+                    raise ReportJobError(
+                        f"이미지 사전 검사에서 {preflight_report.failed_count}개가 실패하여 작업을 중단했습니다.\n"
+                        f"이미지를 고친 뒤 다시 실행하세요.\n\n{lines}" + (f"\n... 외 {more}개" if more > 0 else "")
+                    )
+                self.log(f"⚠️ 검사 실패 이미지 {preflight_report.failed_count}개는 삽입하지 않음 (셀 내용 유지)")
+                failed = preflight_report.failures
+                png_files = {name: path for name, path in png_files.items() if path not in failed}
+                plan = [path for path in plan if path not in failed]
+
+        # Create backup copy
+        copy_path = self.create_copy(original_path)
+
+        with self.discard_on_cancel(copy_path):
+            prefetcher = None
+            if lookahead > 0:
+                prefetcher = ImagePrefetcher(plan, lookahead, prefetch_workers, file_backed=streaming)
+            if streaming or prefetcher is not None:
+                self._image_parts = install_image_parts(doc, prefetcher)
+            if streaming:
+                self.log("스트리밍 모드: 이미지는 저장 시 원본 파일에서 복사")
+
+            # 셀별 이미지 상자는 표마다 한 번만 계산 (셀마다 다시 읽지 않음)
+            with span('table_geometry', tables=len(doc.tables)):
+                geometry = DocumentTableGeometry.from_document(doc)
+            geometry_stats = geometry.stats()
+            sources = geometry_stats['width_sources']
+            self.log(f"표 기하 모델: 표 {geometry_stats['tables']}개, 셀 {geometry_stats['cells']}개 "
+                     f"(너비 출처 - 그리드 {sources['grid']}, tcW {sources['tcW']}, 추정 {sources['estimated']}; "
+                     f"고정 높이 셀 {geometry_stats['fixed_height_cells']}개)")
+            self._table_geometry = geometry
+
+            try:
+                result = self._insert_images_into(doc, copy_path, png_files, streaming)
+            finally:
+                self._image_parts = None
+                self._table_geometry = None
+                if prefetcher is not None:
+                    prefetcher.close()
+                    for line in prefetcher.summary_lines():
+                        self.log(line)
+
+            result['stats']['table_geometry'] = geometry_stats
+            if prefetcher is not None:
+                result['stats']['prefetch'] = prefetcher.stats()
+            if preflight_report is not None:
+                result['stats']['preflight'] = preflight_report.stats()
+                if preflight_report.failures:
+                    result['message'] += f"\n\n⚠️ 사전 검사 실패로 제외한 이미지: {preflight_report.failed_count}개 (로그 참고)"
+            return result
+
+    def _insert_images_into(self, doc, copy_path, png_files, streaming):
+        """insert_images 본문 - 열린 문서의 모든 테이블 셀 처리 후 저장"""
+        total_cells = sum(len(row.cells) for table in doc.tables for row in table.rows)
+        processed_cells = 0
+
+        # Statistics
+        be_test_cells = 0
+        basic_cells = 0
+        total_be_images = 0
+        total_attempts = 0
+        total_matches = 0
+        total_insertions = 0
+
+        self.log(f"총 {len(doc.tables)}개 테이블, {total_cells}개 셀 처리 시작...")
+
+        for table_idx, table in enumerate(doc.tables):
+            self.log(f"=== 테이블 {table_idx + 1} 처리 중 ===")
+
+            for row_idx, row in enumerate(table.rows):
+                for col_idx, cell in enumerate(row.cells):
+                    self.check_cancelled()
+                    processed_cells += 1
+                    with span('cell_match', table=table_idx + 1, row=row_idx + 1, col=col_idx + 1):
+                        try:
+                            cell_text = cell.text.strip()
+
+                            # ★★★ 핵심 분기 로직 ★★★
+                            if self.is_be_test_cell(cell_text):
+                                # BE 테스트 셀 처리
+                                be_test_cells += 1
+                                self.log(f"  셀 [{row_idx+1},{col_idx+1}] - BE 테스트 타입 감지")
+                                images_inserted = self.process_be_comparison_cell(
+                                    cell, png_files
+                                )
+                                total_be_images += images_inserted
+                            else:
+                                # 일반 셀 처리
+                                if cell_text:
+                                    basic_cells += 1
+                                    self.log(f"  셀 [{row_idx+1},{col_idx+1}] - 일반 타입")
+                                    attempts, matches, insertions = self.process_cell(
+                                        cell, png_files
+                                    )
+                                    total_attempts += attempts
+                                    total_matches += matches
+                                    total_insertions += insertions
+
+                        except Exception as e:
+                            self.log(f"  셀 [{row_idx+1},{col_idx+1}] 처리 중 오류: {str(e)}")
+
+                    # Update progress
+                    progress_percent = (processed_cells / total_cells) * 100 if total_cells > 0 else 0
+                    self.progress(progress_percent)
+
+        # 이미지 파트는 저장 전까지 모두 메모리에 있음 (스트리밍 모드 제외) - 저장 직전이 최대 지점
+        memory_checkpoint('cells_processed', cells=processed_cells)
+
+        # Save document
+        self.log(f"  진행률: 100.0% ({processed_cells}/{total_cells})")
+        self.progress(100)
+        with span('save', file=os.path.basename(copy_path), streaming=streaming):
+            if streaming:
+                save_streaming(doc, copy_path)
+            else:
+                doc.save(copy_path)
+        memory_checkpoint('saved', file=os.path.basename(copy_path))
+
+        self.log("=== 통합 이미지 삽입 완료 ===")
+        self.log(f"전체 처리 셀: {processed_cells}개")
+        self.log(f"BE 테스트 셀: {be_test_cells}개 (삽입 이미지: {total_be_images}개)")
+        self.log(f"일반 셀: {basic_cells}개 (매칭 시도: {total_attempts}, 성공 매칭: {total_matches}, 성공 삽입: {total_insertions})")
+        self.log(f"저장된 파일: {copy_path}")
+
+        message = (
+            f"통합 이미지 삽입이 완료되었습니다!\n\n"
+            f"전체 처리 셀: {processed_cells:,}개\n"
+            f"├─ BE 테스트 셀: {be_test_cells}개\n"
+            f"│  └─ 삽입 이미지: {total_be_images}개\n"
+            f"└─ 일반 셀: {basic_cells}개\n"
+            f"   ├─ 매칭 시도: {total_attempts}개\n"
+            f"   ├─ 성공 매칭: {total_matches}개\n"
+            f"   └─ 성공 삽입: {total_insertions}개\n\n"
+            f"저장된 파일: {os.path.basename(copy_path)}"
+        )
+
+        return {
+            'success': True,
+            'message': message,
+            'output_file': copy_path,
+            'stats': {
+                'processed_cells': processed_cells,
+                'be_test_cells': be_test_cells,
+                'be_images': total_be_images,
+                'basic_cells': basic_cells,
+                'attempts': total_attempts,
+                'matches': total_matches,
+                'insertions': total_insertions,
+            },
+        }
+
+    def create_table(self, folder_path, include_subfolders=True, output_dir=None):
+        """기능 3: 2열 테이블 자동 생성 - 새 문서를 output_dir(기본: 이미지 폴더)에 저장"""
+        self.progress(0)
+        self.log("=== 2열 테이블 자동 생성 시작 ===")
+
+        # 1. 이미지 파일 수집
+        self.log("1. 이미지 파일 수집 중...")
+        filenames, image_files = self.get_image_files(
+            folder_path,
+            include_subfolders=include_subfolders
+        )
+
+        if not filenames:
+            self.log("이미지 파일이 없습니다.")
+            raise ReportJobError("선택한 폴더에 이미지 파일이 없습니다.")
+
+        self.log(f"총 {len(filenames)}개의 이미지 파일 발견")
+        self.progress(20)
+
+        # 2. 테이블 행 수 계산
+        num_images = len(filenames)
+        num_rows = (num_images + 1) // 2
+        self.log(f"2. 테이블 생성: 2열 x {num_rows}행")
+        self.progress(30)
+
+        # 3. 새 Word 문서 생성
+        self.log("3. 새 Word 문서 생성 중...")
+        doc = Document()
+        self.progress(40)
+
+        # 4. 2열 N행 테이블 추가
+        self.log(f"4. {num_rows}행 2열 테이블 추가 중...")
+        table = doc.add_table(rows=num_rows, cols=2)
+        table.style = 'Table Grid'
+        self.progress(50)
+
+        # 5. 파일명 기입
+        self.log("5. 파일명 기입 중 (좌→우, 위→아래 순서)...")
+        file_index = 0
+
+        for row_idx in range(num_rows):
+            self.check_cancelled()
+            for col_idx in range(2):
+                if file_index < num_images:
+                    cell = table.rows[row_idx].cells[col_idx]
+                    filename_without_ext = os.path.splitext(filenames[file_index])[0]
+
+                    paragraph = cell.paragraphs[0]
+                    paragraph.text = filename_without_ext
+                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+                    pf = paragraph.paragraph_format
+                    pf.space_before = Pt(0)
+                    pf.space_after = Pt(0)
+                    pf.line_spacing = 1.0
+
+                    self.log(f"  [{row_idx+1},{col_idx+1}]: {filename_without_ext}")
+                    file_index += 1
+                else:
+                    self.log(f"  [{row_idx+1},{col_idx+1}]: (빈 셀)")
+                    break
+
+            # Update progress
+            progress = 50 + ((row_idx + 1) / num_rows * 40)
+            self.progress(progress)
+
+        # 6. 파일 저장
+        self.check_cancelled()
+        self.log("6. 파일 저장 중...")
+
+        output_dir = output_dir or folder_path
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = reserve_unique_path(
+            os.path.join(output_dir, f"이미지_테이블_생성_{timestamp}"), ".docx", separator="_"
+        )
+        output_filename = os.path.basename(output_path)
+
+        try:
+            with span('save', file=output_filename):
+                doc.save(output_path)
+        except Exception:
+            os.remove(output_path)  # 예약해 둔 빈 파일 정리
+            raise
+        memory_checkpoint('saved', file=os.path.basename(output_path))
+        self.progress(100)
+
+        self.log("=== 2열 테이블 자동 생성 완료 ===")
+        self.log(f"총 이미지 개수: {num_images}개")
+        self.log(f"테이블 크기: {num_rows}행 x 2열")
+        self.log(f"저장된 파일: {output_path}")
+
+        message = (
+            f"2열 테이블이 성공적으로 생성되었습니다!\n\n"
+            f"이미지 개수: {num_images}개\n"
+            f"테이블 크기: {num_rows}행 x 2열\n\n"
+            f"저장된 파일:\n{output_filename}"
+        )
+
+        return {
+            'success': True,
+            'message': message,
+            'output_file': output_path,
+            'stats': {'images': num_images, 'rows': num_rows},
+        }
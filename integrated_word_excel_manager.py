@@ -5,41 +5,35 @@
 
 import sys
 import os
-import shutil
-import threading
 import traceback
-import glob
 import locale
-import re
-import time
-import gc
-import tempfile
 import logging
+import multiprocessing
 from datetime import datetime
 
 # PySide6 (Qt) imports
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QFileDialog, QTextEdit,
+    QPushButton, QLabel, QLineEdit, QFileDialog, QTextEdit, QPlainTextEdit,
     QGroupBox, QProgressBar, QMessageBox, QTableWidget, QTableWidgetItem,
-    QHeaderView, QComboBox, QTabWidget, QCheckBox
+    QHeaderView, QComboBox, QTabWidget, QCheckBox, QSpinBox
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QFont
 
-# python-docx imports (for Tab 1)
-from docx import Document
-from docx.shared import Cm, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import nsmap
-from PIL import Image
+# Tab 1 processing engine(image_report_engine)은 python-docx/Pillow 로드 비용 때문에
+# Tab1Worker.run에서 처음 사용할 때 불러옴
 
-# win32com imports (for Tab 2)
-import win32com.client as win32
-import pythoncom
-
-# openpyxl imports (for Tab 2 config)
-from openpyxl import Workbook, load_workbook
+# Tab 2 processing engine (Office 접근은 office_automation 계층을 통해서만 수행)
+from office_automation import DEFAULT_RECYCLE_AFTER, EXPORT_MODE_CLIPBOARD, EXPORT_MODE_FILE
+from picture_sizing import SIZING_MODE_COM, SIZING_MODE_MODEL, SIZING_MODE_COMPARE
+from parallel_range_processor import ParallelRangeProcessor, default_worker_count
+from range_config_cache import load_range_config, compile_range_config, write_cache
+from log_channel import LogChannel, LOG_FLUSH_INTERVAL_MS, LOG_VIEW_MAX_LINES
+from tracing import Tracer, set_tracer, write_trace, default_trace_path
+from memory_profiling import MemoryProfiler, set_memory_profiler, write_memory_report, default_memory_report_path
+from cancellation import CancellationToken, OperationCancelled
+from image_preflight import PREFLIGHT_HEADER, PREFLIGHT_DECODE
 
 
 # ===================================================================
@@ -50,6 +44,12 @@ from openpyxl import Workbook, load_workbook
 CONFIG_FILE_NAME = "range_config.xlsx"
 CONFIG_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), CONFIG_FILE_NAME)
 
+# 창을 닫을 때 취소한 작업의 정리(Office 종료)를 기다리는 최대 시간 (밀리초)
+CLOSE_CANCEL_WAIT_MS = 20000
+
+# Tab 1에서 동시에 실행할 수 있는 최대 작업 수 (작업마다 문서 하나를 메모리에 올림)
+MAX_TAB1_JOBS = 4
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -58,266 +58,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# ===================================================================
-# DEFAULT RANGE CONFIGURATION (from excel_to_word_gui.py)
-# ===================================================================
-
-DEFAULT_RANGE_CONFIG = {
-    "#1": [
-        # Below Worst Case Test Ranges
-        {"sheet": "GSM 850", "range": "B27:I31", "marker": "GSM 850", "category": "Below Worst Case Test"},
-        {"sheet": "W B5", "range": "B27:I31", "marker": "W B5", "category": "Below Worst Case Test"},
-        {"sheet": "5B", "range": "B27:J35", "marker": "5B", "category": "Below Worst Case Test"},
-        {"sheet": "B5", "range": "B52:J70", "marker": "B5", "category": "Below Worst Case Test"},
-        {"sheet": "B12", "range": "B52:J70", "marker": "B12", "category": "Below Worst Case Test"},
-        {"sheet": "B13", "range": "B32:J42", "marker": "B13", "category": "Below Worst Case Test"},
-        {"sheet": "B14", "range": "B32:J42", "marker": "B14", "category": "Below Worst Case Test"},
-        {"sheet": "B26", "range": "B101:J123", "marker": "B26_Part90", "category": "Below Worst Case Test"},
-        {"sheet": "B26", "range": "B125:J147", "marker": "B26_Strd", "category": "Below Worst Case Test"},
-        {"sheet": "B26", "range": "B149:J171", "marker": "B26_Part22", "category": "Below Worst Case Test"},
-        {"sheet": "B71", "range": "B52:J70", "marker": "B71", "category": "Below Worst Case Test"},
-
-        {"sheet": "n5", "range": "B52:K81", "marker": "n5", "category": "Below Worst Case Test"},
-        {"sheet": "n12", "range": "B46:K69", "marker": "n12", "category": "Below Worst Case Test"},
-        {"sheet": "n14", "range": "B32:K49", "marker": "n14", "category": "Below Worst Case Test"},
-        {"sheet": "n26", "range": "B70:K90", "marker": "N26_Part90", "category": "Below Worst Case Test"},
-        {"sheet": "n26", "range": "B92:K121", "marker": "N26_Strd", "category": "Below Worst Case Test"},
-        {"sheet": "n26", "range": "B123:K152", "marker": "N26_Part22", "category": "Below Worst Case Test"},
-        {"sheet": "n71", "range": "B66:K95", "marker": "n71", "category": "Below Worst Case Test"},
-
-        #Below Power Test Ranges
-        {"sheet": "GSM 850", "range": "B33:F60", "marker": "GSM 850_Pwr", "category": "Below Power Test"},
-        {"sheet": "W B5", "range": "B33:F75", "marker": "W B5_Pwr", "category": "Below Power Test"},
-        {"sheet": "5B", "range": "B37:J71", "marker": "5B_Pwr", "category": "Below Power Test"},
-        {"sheet": "B5", "range": "B72:H107", "marker": "B5_Pwr1", "category": "Below Power Test"},
-        {"sheet": "B5", "range": "B108:H143", "marker": "B5_Pwr2", "category": "Below Power Test"},
-        {"sheet": "B12", "range": "B72:H107", "marker": "B12_Pwr1", "category": "Below Power Test"},
-        {"sheet": "B12", "range": "B108:H143", "marker": "B12_Pwr2", "category": "Below Power Test"},
-        {"sheet": "B13", "range": "B44:H79", "marker": "B13_Pwr", "category": "Below Power Test"},
-        {"sheet": "B14", "range": "B44:H79", "marker": "B14_Pwr", "category": "Below Power Test"},
-        {"sheet": "B26", "range": "B173:K226", "marker": "B26_Part90_Pwr1", "category": "Below Power Test"},
-        {"sheet": "B26", "range": "B227:K262", "marker": "B26_Part90_Pwr2", "category": "Below Power Test"},
-        {"sheet": "B71", "range": "B72:H107", "marker": "B71_Pwr", "category": "Below Power Test"},
-
-        {"sheet": "n5", "range": "B83:I138", "marker": "n5_Pwr1", "category": "Below Power Test"},
-        {"sheet": "n5", "range": "B139:I178", "marker": "n5_Pwr2", "category": "Below Power Test"},
-        {"sheet": "n12", "range": "B71:I126", "marker": "n12_Pwr1", "category": "Below Power Test"},
-        {"sheet": "n12", "range": "B127:I146", "marker": "n12_Pwr2", "category": "Below Power Test"},
-        {"sheet": "n14", "range": "B51:I106", "marker": "n14_Pwr", "category": "Below Power Test"},
-        {"sheet": "n26", "range": "B154:L210", "marker": "N26_Pwr1", "category": "Below Power Test"},
-        {"sheet": "n26", "range": "B211:L252", "marker": "N26_Pwr2", "category": "Below Power Test"},
-        {"sheet": "n71", "range": "B97:I152", "marker": "n71_Pwr1", "category": "Below Power Test"},
-        {"sheet": "n71", "range": "B153:I192", "marker": "n71_Pwr2", "category": "Below Power Test"},
-
-        #Above Worst Case Test Ranges
-        {"sheet": "GSM 1900", "range": "B27:I31", "marker": "GSM 1900", "category": "Above Worst Case Test"},
-        {"sheet": "W B2", "range": "B27:I31", "marker": "W B2", "category": "Above Worst Case Test"},
-        {"sheet": "W B4", "range": "B27:I31", "marker": "W B4", "category": "Above Worst Case Test"},
-        {"sheet": "B2", "range": "B64:J90", "marker": "B2", "category": "Above Worst Case Test"},
-        {"sheet": "B4", "range": "B64:J90", "marker": "B4", "category": "Above Worst Case Test"},
-        {"sheet": "B7", "range": "B52:J70", "marker": "B7", "category": "Above Worst Case Test"},
-        {"sheet": "7C", "range": "B27:J35", "marker": "7C", "category": "Above Worst Case Test"},
-        {"sheet": "B25", "range": "B64:J90", "marker": "B25", "category": "Above Worst Case Test"},
-        {"sheet": "B30", "range": "B34:J44", "marker": "B30", "category": "Above Worst Case Test"},
-        {"sheet": "B41", "range": "B52:J70", "marker": "B41", "category": "Above Worst Case Test"},
-        {"sheet": "41C", "range": "B27:J37", "marker": "41C", "category": "Above Worst Case Test"},
-        {"sheet": "B48", "range": "B52:J70", "marker": "B48", "category": "Above Worst Case Test"},
-        {"sheet": "48C", "range": "B27:J37", "marker": "48C", "category": "Above Worst Case Test"},
-        {"sheet": "B66", "range": "B64:J90", "marker": "B66", "category": "Above Worst Case Test"},
-        {"sheet": "66B", "range": "B52:J70", "marker": "66B", "category": "Above Worst Case Test"},
-        {"sheet": "66C", "range": "B27:J37", "marker": "66C", "category": "Above Worst Case Test"},
-
-        {"sheet": "n7", "range": "B82:K141", "marker": "n7", "category": "Above Worst Case Test"},
-        {"sheet": "n12", "range": "B46:K69", "marker": "n12", "category": "Above Worst Case Test"},
-        {"sheet": "n14", "range": "B38:K55", "marker": "n14", "category": "Above Worst Case Test"},
-        {"sheet": "n25", "range": "B76:K129", "marker": "n25", "category": "Above Worst Case Test"},
-        {"sheet": "n30", "range": "B36:K53", "marker": "n30", "category": "Above Worst Case Test"},
-        {"sheet": "n41", "range": "B112:K201", "marker": "n41", "category": "Above Worst Case Test"},
-        {"sheet": "n41_SRS", "range": "B24:I38", "marker": "n41_SRS2", "category": "Above Worst Case Test"},
-        {"sheet": "n41_SRS", "range": "M24:T38", "marker": "n41_SRS3", "category": "Above Worst Case Test"},
-        {"sheet": "n41_SRS", "range": "X24:AE38", "marker": "n41_SRS4", "category": "Above Worst Case Test"},
-        {"sheet": "n48", "range": "B58:K93", "marker": "n48", "category": "Above Worst Case Test"},
-        {"sheet": "n48_SRS", "range": "B24:I31", "marker": "n48_SRS2", "category": "Above Worst Case Test"},
-        {"sheet": "n48_SRS", "range": "M24:T31", "marker": "n48_SRS3", "category": "Above Worst Case Test"},
-        {"sheet": "n48_SRS", "range": "X24:AE31", "marker": "n48_SRS4", "category": "Above Worst Case Test"},
-        {"sheet": "n66", "range": "B82:K144", "marker": "n66", "category": "Above Worst Case Test"},
-        {"sheet": "n70", "range": "B42:K65", "marker": "n70", "category": "Above Worst Case Test"},
-        {"sheet": "n71", "range": "B66:K95", "marker": "n71", "category": "Above Worst Case Test"},
-        {"sheet": "n77 DoD", "range": "B92:K169", "marker": "n77 DoD", "category": "Above Worst Case Test"},
-        {"sheet": "n77 DoD SRS", "range": "B22:I36", "marker": "n77 DoD SRS2", "category": "Above Worst Case Test"},
-        {"sheet": "n77 DoD SRS", "range": "M22:T36", "marker": "n77 DoD SRS3", "category": "Above Worst Case Test"},
-        {"sheet": "n77 DoD SRS", "range": "X22:AE36", "marker": "n77 DoD SRS4", "category": "Above Worst Case Test"},
-        {"sheet": "n77 Upper", "range": "B100:K177", "marker": "n77 Upper", "category": "Above Worst Case Test"},
-        {"sheet": "n77 Upper SRS", "range": "B24:I38", "marker": "n77 Upper SRS2", "category": "Above Worst Case Test"},
-        {"sheet": "n77 Upper SRS", "range": "M24:T38", "marker": "n77 Upper SRS3", "category": "Above Worst Case Test"},
-        {"sheet": "n77 Upper SRS", "range": "X24:AE38", "marker": "n77 Upper SRS4", "category": "Above Worst Case Test"},
-
-        #Above Power Test Ranges
-        {"sheet": "GSM 1900", "range": "B33:F60", "marker": "GSM 1900_Pwr", "category": "Above Power Test"},
-        {"sheet": "W B2", "range": "B33:F75", "marker": "W B2_Pwr", "category": "Above Power Test"},
-        {"sheet": "W B4", "range": "B33:F75", "marker": "W B4_Pwr", "category": "Above Power Test"},
-        {"sheet": "B2", "range": "B92:H145", "marker": "B2_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B2", "range": "B146:H199", "marker": "B2_Pwr2", "category": "Above Power Test"},
-        {"sheet": "B4", "range": "B92:H145", "marker": "B4_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B4", "range": "B146:H199", "marker": "B4_Pwr2", "category": "Above Power Test"},
-        {"sheet": "B7", "range": "B72:H107", "marker": "B7_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B7", "range": "B108:H143", "marker": "B7_Pwr2", "category": "Above Power Test"},
-        {"sheet": "7C", "range": "B37:J71", "marker": "7C_Pwr", "category": "Above Power Test"},
-        {"sheet": "B25", "range": "B92:H145", "marker": "B25_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B25", "range": "B146:H199", "marker": "B25_Pwr2", "category": "Above Power Test"},
-        {"sheet": "B30", "range": "B46:H81", "marker": "B30_Pwr", "category": "Above Power Test"},
-        {"sheet": "B41", "range": "B72:H107", "marker": "B41_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B41", "range": "B108:H143", "marker": "B41_Pwr2", "category": "Above Power Test"},
-        {"sheet": "41C", "range": "B39:J85", "marker": "41C_Pwr", "category": "Above Power Test"},
-        {"sheet": "B48", "range": "B72:H107", "marker": "B48_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B48", "range": "B108:H143", "marker": "B48_Pwr2", "category": "Above Power Test"},
-        {"sheet": "48C", "range": "B39:J85", "marker": "48C_Pwr", "category": "Above Power Test"},
-        {"sheet": "B66", "range": "B92:H145", "marker": "B66_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B66", "range": "B146:H199", "marker": "B66_Pwr2", "category": "Above Power Test"},
-        {"sheet": "66B", "range": "B37:J71", "marker": "66B_Pwr", "category": "Above Power Test"},
-        {"sheet": "66C", "range": "B39:J85", "marker": "66C_Pwr", "category": "Above Power Test"},
-
-        {"sheet": "n7", "range": "B82:K141", "marker": "n7", "category": "Above Power Test"},
-        {"sheet": "n12", "range": "B46:K69", "marker": "n12", "category": "Above Power Test"},
-        {"sheet": "n14", "range": "B38:K55", "marker": "n14", "category": "Above Power Test"},
-        {"sheet": "n25", "range": "B76:K129", "marker": "n25", "category": "Above Power Test"},
-        {"sheet": "n26", "range": "B70:K90", "marker": "N26_Part90", "category": "Above Power Test"},
-        {"sheet": "n26", "range": "B92:K121", "marker": "N26_Strd", "category": "Above Power Test"},
-        {"sheet": "n26", "range": "B123:K152", "marker": "N26_Part22", "category": "Above Power Test"},
-        {"sheet": "n30", "range": "B36:K53", "marker": "n30", "category": "Above Power Test"},
-        {"sheet": "n41", "range": "B112:K201", "marker": "n41", "category": "Above Power Test"},
-        {"sheet": "n41_SRS", "range": "B24:I38", "marker": "n41_SRS2", "category": "Above Power Test"},
-        {"sheet": "n41_SRS", "range": "M24:T38", "marker": "n41_SRS3", "category": "Above Power Test"},
-        {"sheet": "n41_SRS", "range": "X24:AE38", "marker": "n41_SRS4", "category": "Above Power Test"},
-        {"sheet": "n48", "range": "B58:K93", "marker": "n48", "category": "Above Power Test"},
-        {"sheet": "n48_SRS", "range": "B24:I31", "marker": "n48_SRS2", "category": "Above Power Test"},
-        {"sheet": "n48_SRS", "range": "M24:T31", "marker": "n48_SRS3", "category": "Above Power Test"},
-        {"sheet": "n48_SRS", "range": "X24:AE31", "marker": "n48_SRS4", "category": "Above Power Test"},
-        {"sheet": "n66", "range": "B82:K144", "marker": "n66", "category": "Above Power Test"},
-        {"sheet": "n70", "range": "B42:K65", "marker": "n70", "category": "Above Power Test"},
-        {"sheet": "n71", "range": "B66:K95", "marker": "n71", "category": "Above Power Test"},
-        {"sheet": "n77 DoD", "range": "B92:K169", "marker": "n77 DoD", "category": "Above Power Test"},
-        {"sheet": "n77 DoD SRS", "range": "B22:I36", "marker": "n77 DoD SRS2", "category": "Above Power Test"},
-        {"sheet": "n77 DoD SRS", "range": "M22:T36", "marker": "n77 DoD SRS3", "category": "Above Power Test"},
-        {"sheet": "n77 DoD SRS", "range": "X22:AE36", "marker": "n77 DoD SRS4", "category": "Above Power Test"},
-        {"sheet": "n77 Upper", "range": "B100:K177", "marker": "n77 Upper", "category": "Above Power Test"},
-        {"sheet": "n77 Upper SRS", "range": "B24:I38", "marker": "n77 Upper SRS2", "category": "Above Power Test"},
-        {"sheet": "n77 Upper SRS", "range": "M24:T38", "marker": "n77 Upper SRS3", "category": "Above Power Test"},
-        {"sheet": "n77 Upper SRS", "range": "X24:AE38", "marker": "n77 Upper SRS4", "category": "Above Power Test"},
-    ],
-    "#2": [
-        #Below Worst Case Test Ranges
-        {"sheet": "GSM 850", "range": "B30:I31", "marker": "GSM 850", "category": "Below Worst Case Test"},
-        {"sheet": "W B5", "range": "B33:F75", "marker": "W B5", "category": "Below Worst Case Test"},
-        {"sheet": "5B", "range": "B30:J35", "marker": "5B", "category": "Below Worst Case Test"},
-        {"sheet": "B5", "range": "B55:J70", "marker": "B5", "category": "Below Worst Case Test"},
-        {"sheet": "B12", "range": "B55:J70", "marker": "B12", "category": "Below Worst Case Test"},
-        {"sheet": "B13", "range": "B41:J48", "marker": "B13", "category": "Below Worst Case Test"},
-        {"sheet": "B14", "range": "B41:J48", "marker": "B14", "category": "Below Worst Case Test"},
-        {"sheet": "B26", "range": "B104:J123", "marker": "B26_Part90", "category": "Below Worst Case Test"},
-        {"sheet": "B26", "range": "B128:J147", "marker": "B26_Strd", "category": "Below Worst Case Test"},
-        {"sheet": "B26", "range": "B152:J171", "marker": "B26_Part22", "category": "Below Worst Case Test"},
-        {"sheet": "B71", "range": "B55:J70", "marker": "B71", "category": "Below Worst Case Test"},
-        {"sheet": "n5", "range": "B55:K81", "marker": "n5", "category": "Below Worst Case Test"},
-        {"sheet": "n12", "range": "B49:K69", "marker": "n12", "category": "Below Worst Case Test"},
-        {"sheet": "n14", "range": "B41:K55", "marker": "n14", "category": "Below Worst Case Test"},
-        {"sheet": "n26", "range": "B73:K90", "marker": "N26_Part90", "category": "Below Worst Case Test"},
-        {"sheet": "n26", "range": "B95:K121", "marker": "N26_Strd", "category": "Below Worst Case Test"},
-        {"sheet": "n26", "range": "B126:K152", "marker": "N26_Part22", "category": "Below Worst Case Test"},
-        {"sheet": "n71", "range": "B69:K95", "marker": "n71", "category": "Below Worst Case Test"},
-
-        #Below Power Test Ranges
-        {"sheet": "GSM 850", "range": "B33:F60", "marker": "GSM 850_Pwr", "category": "Below Power Test"},
-        {"sheet": "W B5", "range": "B33:F75", "marker": "W B5_Pwr", "category": "Below Power Test"},
-        {"sheet": "5B", "range": "B37:J71", "marker": "5B_Pwr", "category": "Below Power Test"},
-        {"sheet": "B5", "range": "B72:H107", "marker": "B5_Pwr1", "category": "Below Power Test"},
-        {"sheet": "B5", "range": "B108:H143", "marker": "B5_Pwr2", "category": "Below Power Test"},
-        {"sheet": "B12", "range": "B72:H107", "marker": "B12_Pwr1", "category": "Below Power Test"},
-        {"sheet": "B12", "range": "B108:H143", "marker": "B12_Pwr2", "category": "Below Power Test"},
-        {"sheet": "B13", "range": "B50:H85", "marker": "B13_Pwr", "category": "Below Power Test"},
-        {"sheet": "B14", "range": "B50:H85", "marker": "B14_Pwr", "category": "Below Power Test"},
-        {"sheet": "B26", "range": "B173:K226", "marker": "B26_Pwr1", "category": "Below Power Test"},
-        {"sheet": "B26", "range": "B227:K262", "marker": "B26_Pwr2", "category": "Below Power Test"},
-        {"sheet": "B71", "range": "B72:H107", "marker": "B71_Pwr", "category": "Below Power Test"},
-
-        {"sheet": "n5", "range": "B83:I138", "marker": "n5_Pwr1", "category": "Below Power Test"},
-        {"sheet": "n5", "range": "B139:I178", "marker": "n5_Pwr2", "category": "Below Power Test"},
-        {"sheet": "n12", "range": "B71:I126", "marker": "n12_Pwr1", "category": "Below Power Test"},
-        {"sheet": "n12", "range": "B127:I146", "marker": "n12_Pwr2", "category": "Below Power Test"},
-        {"sheet": "n14", "range": "B57:I112", "marker": "n14_Pwr", "category": "Below Power Test"},
-        {"sheet": "n26", "range": "B154:L210", "marker": "N26_Pwr1", "category": "Below Power Test"},
-        {"sheet": "n26", "range": "B211:L252", "marker": "N26_Pwr2", "category": "Below Power Test"},
-        {"sheet": "n71", "range": "B97:I152", "marker": "n71_Pwr1", "category": "Below Power Test"},
-        {"sheet": "n71", "range": "B153:I192", "marker": "n71_Pwr2", "category": "Below Power Test"},
-
-        #Above Worst Case Test Ranges
-        {"sheet": "GSM 1900", "range": "B30:I31", "marker": "GSM 1900", "category": "Above Worst Case Test"},
-        {"sheet": "W B2", "range": "B30:I31", "marker": "W B2", "category": "Above Worst Case Test"},
-        {"sheet": "W B4", "range": "B30:I31", "marker": "W B4", "category": "Above Worst Case Test"},
-        {"sheet": "B2", "range": "B67:J90", "marker": "B2", "category": "Above Worst Case Test"},
-        {"sheet": "B4", "range": "B67:J90", "marker": "B4", "category": "Above Worst Case Test"},
-        {"sheet": "B7", "range": "B55:J70", "marker": "B7", "category": "Above Worst Case Test"},
-        {"sheet": "7C", "range": "B27:J35", "marker": "7C", "category": "Above Worst Case Test"},
-        {"sheet": "B25", "range": "B67:J90", "marker": "B25", "category": "Above Worst Case Test"},
-        {"sheet": "B30", "range": "B37:J44", "marker": "B30", "category": "Above Worst Case Test"},
-        {"sheet": "B41", "range": "B55:J70", "marker": "B41", "category": "Above Worst Case Test"},
-        {"sheet": "41C", "range": "B27:J37", "marker": "41C", "category": "Above Worst Case Test"},
-        {"sheet": "B48", "range": "B55:J70", "marker": "B48", "category": "Above Worst Case Test"},
-        {"sheet": "48C", "range": "B27:J37", "marker": "48C", "category": "Above Worst Case Test"},
-        {"sheet": "B66", "range": "B67:J90", "marker": "B66", "category": "Above Worst Case Test"},
-        {"sheet": "66B", "range": "B52:J70", "marker": "66B", "category": "Above Worst Case Test"},
-        {"sheet": "66C", "range": "B27:J37", "marker": "66C", "category": "Above Worst Case Test"},
-
-        {"sheet": "n7", "range": "B82:K141", "marker": "n7", "category": "Above Worst Case Test"},
-        {"sheet": "n12", "range": "B49:K69", "marker": "n12", "category": "Above Worst Case Test"},
-        {"sheet": "n14", "range": "B41:K55", "marker": "n14", "category": "Above Worst Case Test"},
-        {"sheet": "n25", "range": "B76:K129", "marker": "n25", "category": "Above Worst Case Test"},
-        {"sheet": "n30", "range": "B39:K53", "marker": "n30", "category": "Above Worst Case Test"},
-        {"sheet": "n41", "range": "B112:K201", "marker": "n41", "category": "Above Worst Case Test"},
-        {"sheet": "n41_SRS", "range": "B24:I38", "marker": "n41_SRS2", "category": "Above Worst Case Test"},
-        {"sheet": "n41_SRS", "range": "M24:T38", "marker": "n41_SRS3", "category": "Above Worst Case Test"},
-        {"sheet": "n41_SRS", "range": "X24:AE38", "marker": "n41_SRS4", "category": "Above Worst Case Test"},
-        {"sheet": "n48", "range": "B58:K93", "marker": "n48", "category": "Above Worst Case Test"},
-        {"sheet": "n48_SRS", "range": "B24:I31", "marker": "n48_SRS2", "category": "Above Worst Case Test"},
-        {"sheet": "n48_SRS", "range": "M24:T31", "marker": "n48_SRS3", "category": "Above Worst Case Test"},
-        {"sheet": "n48_SRS", "range": "X24:AE31", "marker": "n48_SRS4", "category": "Above Worst Case Test"},
-        {"sheet": "n66", "range": "B82:K144", "marker": "n66", "category": "Above Worst Case Test"},
-        {"sheet": "n70", "range": "B45:K65", "marker": "n70", "category": "Above Worst Case Test"},
-        {"sheet": "n77 DoD", "range": "B92:K169", "marker": "n77 DoD", "category": "Above Worst Case Test"},
-        {"sheet": "n77 DoD SRS", "range": "B22:I36", "marker": "n77 DoD SRS2", "category": "Above Worst Case Test"},
-        {"sheet": "n77 DoD SRS", "range": "M22:T36", "marker": "n77 DoD SRS3", "category": "Above Worst Case Test"},
-        {"sheet": "n77 DoD SRS", "range": "X22:AE36", "marker": "n77 DoD SRS4", "category": "Above Worst Case Test"},
-        {"sheet": "n77 Upper", "range": "B100:K177", "marker": "n77 Upper", "category": "Above Worst Case Test"},
-        {"sheet": "n77 Upper SRS", "range": "B24:I38", "marker": "n77 Upper SRS2", "category": "Above Worst Case Test"},
-        {"sheet": "n77 Upper SRS", "range": "M24:T38", "marker": "n77 Upper SRS3", "category": "Above Worst Case Test"},
-        {"sheet": "n77 Upper SRS", "range": "X24:AE38", "marker": "n77 Upper SRS4", "category": "Above Worst Case Test"},
-
-        #Above Power Test Ranges
-        {"sheet": "GSM 850", "range": "B33:F60", "marker": "GSM 850_Pwr", "category": "Above Power Test"},
-        {"sheet": "W B5", "range": "B33:F75", "marker": "W B5_Pwr", "category": "Above Power Test"},
-        {"sheet": "5B", "range": "B37:J71", "marker": "5B_Pwr", "category": "Above Power Test"},
-        {"sheet": "B5", "range": "B72:H107", "marker": "B5_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B5", "range": "B108:H143", "marker": "B5_Pwr2", "category": "Above Power Test"},
-        {"sheet": "B12", "range": "B72:H107", "marker": "B12_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B12", "range": "B108:H143", "marker": "B12_Pwr2", "category": "Above Power Test"},
-        {"sheet": "B13", "range": "B50:H85", "marker": "B13_Pwr", "category": "Above Power Test"},
-        {"sheet": "B14", "range": "B50:H85", "marker": "B14_Pwr", "category": "Above Power Test"},
-        {"sheet": "B26", "range": "B173:K226", "marker": "B26_Part90_Pwr1", "category": "Above Power Test"},
-        {"sheet": "B26", "range": "B227:K262", "marker": "B26_Part90_Pwr2", "category": "Above Power Test"},
-        {"sheet": "B71", "range": "B72:H107", "marker": "B71_Pwr", "category": "Above Power Test"},
-
-        {"sheet": "n5", "range": "B83:I138", "marker": "n5_Pwr1", "category": "Above Power Test"},
-        {"sheet": "n5", "range": "B139:I178", "marker": "n5_Pwr2", "category": "Above Power Test"},
-        {"sheet": "n12", "range": "B71:I126", "marker": "n12_Pwr1", "category": "Above Power Test"},
-        {"sheet": "n12", "range": "B127:I146", "marker": "n12_Pwr2", "category": "Above Power Test"},
-        {"sheet": "n14", "range": "B57:I112", "marker": "n14_Pwr", "category": "Above Power Test"},
-        {"sheet": "n26", "range": "B154:L210", "marker": "N26_Pwr1", "category": "Above Power Test"},
-        {"sheet": "n26", "range": "B211:L252", "marker": "N26_Pwr2", "category": "Above Power Test"},
-        {"sheet": "n71", "range": "B97:I152", "marker": "n71_Pwr1", "category": "Above Power Test"},
-        {"sheet": "n71", "range": "B153:I192", "marker": "n71_Pwr2", "category": "Above Power Test"},
-    ]
-}
-
 # Global variable for range config
 RANGE_CONFIG = {}
 
@@ -407,6 +147,15 @@ class IntegratedWordExcelManager(QMainWindow):
         """상태 바 업데이트 (Tab 2에서 호출)"""
         self.statusBar().showMessage(message)
 
+    def closeEvent(self, event):
+        """창 닫기 - 실행 중인 작업은 취소하고 정리(Office 종료, 임시 파일 삭제)가 끝날 때까지 대기"""
+        workers = self.tab1.running_workers() + self.tab2.running_workers()
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            worker.wait(CLOSE_CANCEL_WAIT_MS)
+        event.accept()
+
     def apply_global_styles(self):
         """전역 스타일 적용"""
         self.setStyleSheet("""
@@ -467,7 +216,7 @@ class IntegratedWordExcelManager(QMainWindow):
             QCheckBox {
                 color: #2c3e50;
             }
-            QTextEdit {
+            QTextEdit, QPlainTextEdit {
                 color: #2c3e50;
                 background-color: white;
             }
@@ -481,6 +230,37 @@ class IntegratedWordExcelManager(QMainWindow):
         """)
 
 
+# ===================================================================
+# LOG VIEW
+# ===================================================================
+
+class LogView(QPlainTextEdit):
+    """
+    처리 로그 표시 (QTextEdit 대체)
+
+    최근 LOG_VIEW_MAX_LINES줄만 유지하며 (전체 로그는 LogChannel 파일),
+    작업 로그는 append_lines로 한 번에 추가합니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(LOG_VIEW_MAX_LINES)
+
+    def append(self, text):
+        """한 줄 추가 (QTextEdit.append와 같은 사용법)"""
+        self.append_lines([text])
+
+    def append_lines(self, lines):
+        """여러 줄을 한 번에 추가하고 맨 아래로 스크롤"""
+        if not lines:
+            return
+        self.appendPlainText('\n'.join(lines))
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+
 # ===================================================================
 # TAB 1: IMAGE FILENAME MANAGER (from report.py)
 # ===================================================================
@@ -493,11 +273,16 @@ class ImageFilenameManagerTab(QWidget):
         self.selected_folder = ""
         self.selected_word_file = ""
         self.include_subfolders = True
-        self.worker = None  # QThread worker reference (prevents garbage collection)
+        self.jobs = {}  # 실행 중인 작업: 작업 번호 → worker, 로그 채널, 이름, 진행률
+        self.next_job_id = 1
         self.btn1 = None  # Function buttons (stored for enable/disable)
         self.btn2 = None
         self.btn3 = None
-        self._silent_mode = False  # Worker 스레드용: True면 self.log() 호출 무시 (Qt 스레드 안전성)
+        self.btn4 = None
+        self.stop_btn = None  # 작업 중지 버튼 (작업 중에만 활성화)
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_timer.timeout.connect(self.flush_log_channel)
 
         # Set locale for Korean support
         try:
@@ -544,6 +329,28 @@ class ImageFilenameManagerTab(QWidget):
         self.subfolder_check.setChecked(True)
         folder_layout.addWidget(self.subfolder_check)
 
+        # 대용량 보고서: 이미지 바이트를 메모리에 올리지 않고 저장 시 원본 파일에서 복사 (기능 2)
+        self.streaming_check = QCheckBox("대용량 모드 (이미지 메모리 절약)")
+        self.streaming_check.setToolTip("이미지 삽입 시 이미지를 저장 단계에서 원본 파일에서 바로 복사합니다.\n"
+                                        "저장이 끝날 때까지 이미지 파일을 옮기거나 수정하지 마세요.")
+        folder_layout.addWidget(self.streaming_check)
+
+        # 이미지 사전 검사: 헤더/크기는 항상 확인, 체크하면 전체 디코드까지 (기능 2)
+        self.decode_check = QCheckBox("이미지 정밀 검사 (전체 디코드)")
+        self.decode_check.setToolTip("삽입 전에 이미지를 모두 읽어 잘리거나 손상된 파일을 찾습니다 (느려짐).\n"
+                                     "검사에 실패한 이미지는 삽입하지 않고 로그에 목록을 표시합니다.")
+        folder_layout.addWidget(self.decode_check)
+
+        # 단계별 소요 시간 기록 (logs/trace_tab1_*.json + 로그에 요약 표)
+        self.trace_check = QCheckBox("단계별 시간 기록 (trace)")
+        self.trace_check.setToolTip("검색/문서 열기/셀 매칭/이미지 삽입/저장 구간을 Chrome trace JSON으로 저장")
+        folder_layout.addWidget(self.trace_check)
+
+        # 단계 경계별 메모리 기록 (logs/memory_tab1_*.json + 로그에 요약 표, 처리 속도 느려짐)
+        self.memory_check = QCheckBox("단계별 메모리 기록 (느려짐)")
+        self.memory_check.setToolTip("RSS와 tracemalloc 상위 할당 위치를 단계 경계마다 기록 (동시에 실행 중인 다른 작업의 할당도 포함)")
+        folder_layout.addWidget(self.memory_check)
+
         folder_group.setLayout(folder_layout)
         left_column.addWidget(folder_group)
 
@@ -607,6 +414,41 @@ class ImageFilenameManagerTab(QWidget):
         self.btn3.clicked.connect(self.create_auto_table_with_filenames)
         function_layout.addWidget(self.btn3)
 
+        # 일괄 작업 (매니페스트 JSON - 형식은 batch_report.py 참고)
+        self.btn4 = QPushButton("4. 일괄 작업 (매니페스트)")
+        self.btn4.setMinimumHeight(40)
+        self.btn4.setToolTip("(이미지 폴더, Word 템플릿, 작업) 목록 JSON을 선택하여 여러 문서를 병렬 처리")
+        self.btn4.setStyleSheet("""
+            QPushButton {
+                background-color: #8e44ad;
+                font-size: 11pt;
+            }
+            QPushButton:hover {
+                background-color: #7d3c98;
+            }
+        """)
+        self.btn4.clicked.connect(self.run_batch_manifest)
+        function_layout.addWidget(self.btn4)
+
+        # 작업 중지 (셀 단위로 확인 - 만들던 복사본은 삭제)
+        self.stop_btn = QPushButton("■ 작업 중지")
+        self.stop_btn.setMinimumHeight(32)
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #c0392b;
+                font-size: 10pt;
+            }
+            QPushButton:hover {
+                background-color: #a93226;
+            }
+            QPushButton:disabled {
+                background-color: #bdc3c7;
+            }
+        """)
+        self.stop_btn.clicked.connect(self.cancel_task)
+        function_layout.addWidget(self.stop_btn)
+
         function_group.setLayout(function_layout)
         left_column.addWidget(function_group)
 
@@ -703,13 +545,12 @@ class ImageFilenameManagerTab(QWidget):
         log_layout = QVBoxLayout()
         log_layout.setSpacing(8)
 
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogView()
         self.log_text.setMinimumHeight(200)
         self.log_text.setMaximumHeight(250)
         self.log_text.setFont(QFont("Consolas", 9))
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #2c3e50;
                 color: #2ecc71;
                 border: 1px solid #dcdde1;
@@ -738,33 +579,76 @@ class ImageFilenameManagerTab(QWidget):
     # ========== HELPER METHODS ==========
 
     def log(self, message):
+        """로그 메시지 출력 (GUI 스레드 전용 - Worker 로그는 log_channel로 전달)"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.log_text.append(f"[{timestamp}] {message}")
+
+    def start_job(self, label, make_worker):
         """
-        로그 메시지 출력
+        작업 스레드 시작 - 작업마다 로그 채널/취소 토큰/엔진이 따로 있어 여러 작업을 동시에 실행 가능
 
-        주의: Worker 스레드에서 호출 시 Qt 스레드 안전성 위반을 방지하기 위해
-        _silent_mode가 True면 로그를 출력하지 않습니다.
+        Args:
+            label: 로그/완료 메시지에 표시할 작업 이름
+            make_worker: 로그 채널을 받아 작업 스레드를 만드는 함수
         """
-        # Worker 스레드에서 호출된 경우 GUI 업데이트 건너뛰기 (Qt 스레드 안전성)
-        if self._silent_mode:
+        if len(self.jobs) >= MAX_TAB1_JOBS:
+            QMessageBox.warning(self, "경고", f"동시에 실행할 수 있는 작업은 최대 {MAX_TAB1_JOBS}개입니다.")
             return
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
-        QApplication.processEvents()
-
-    def windows_sort_key(self, filename):
-        """Windows 탐색기 정렬 방식"""
-        def convert_part(text):
-            if text.isdigit():
-                return (0, int(text))
-            else:
-                return (1, text.lower())
-
-        parts = re.split(r'(\d+)', filename)
-        return [convert_part(part) for part in parts if part]
+        job_id = self.next_job_id
+        self.next_job_id += 1
+        channel = LogChannel(f'tab1_job{job_id}', timestamps=True)
+        worker = make_worker(channel)
+        # 작업 정보 보관 (QThread 참조 유지 - garbage collection 방지)
+        self.jobs[job_id] = {'worker': worker, 'channel': channel, 'label': label, 'progress': 0}
+
+        worker.finished.connect(lambda message, job_id=job_id: self.on_task_finished(job_id, message))
+        worker.error.connect(lambda message, job_id=job_id: self.on_task_error(job_id, message))
+        worker.cancelled.connect(lambda message, job_id=job_id: self.on_task_cancelled(job_id, message))
+
+        self.log(f"▶ [{job_id}] {label} 시작")
+        self.update_job_controls()
+        if not self.log_timer.isActive():
+            self.log_timer.start()
+        worker.start()
+
+    def running_workers(self):
+        """실행 중인 작업 스레드 목록 (창 닫기 시 취소용)"""
+        return [job['worker'] for job in self.jobs.values() if job['worker'].isRunning()]
+
+    def flush_log_channel(self):
+        """작업별 채널에 쌓인 로그를 한 번에 화면에 추가 ([작업 번호] 접두사) + 진행률(실행 중 작업 평균) 반영"""
+        for job_id, job in self.jobs.items():
+            lines, progress = job['channel'].drain()
+            self.log_text.append_lines([f"[{job_id}] {line}" for line in lines])
+            if progress is not None:
+                job['progress'] = progress
+        if self.jobs:
+            average = sum(job['progress'] for job in self.jobs.values()) / len(self.jobs)
+            self.progress_bar.setValue(int(average))
+
+    def finish_job(self, job_id):
+        """남은 로그 반영 후 작업 정리 (전체 로그 파일 경로 표시) - 작업 정보 반환"""
+        self.flush_log_channel()
+        job = self.jobs.pop(job_id)
+        job['channel'].close()
+        if job['channel'].log_path:
+            self.log(f"[{job_id}] 전체 로그: {job['channel'].log_path}")
+        if not self.jobs:
+            self.log_timer.stop()
+        self.update_job_controls()
+        return job
+
+    def update_job_controls(self):
+        """실행 중인 작업 수에 맞춰 진행률 표시/버튼 상태 갱신"""
+        running = len(self.jobs)
+        self.progress_bar.setVisible(running > 0)
+        self.progress_bar.setFormat(f"%p% (실행 중인 작업 {running}개)" if running > 1 else "%p%")
+        if running == 0:
+            self.progress_bar.setValue(0)
+        for button in (self.btn1, self.btn2, self.btn3, self.btn4):
+            button.setEnabled(running < MAX_TAB1_JOBS)
+        self.stop_btn.setEnabled(any(not job['worker'].cancel_token.cancelled for job in self.jobs.values()))
 
     def browse_folder(self):
         """폴더 선택 다이얼로그"""
@@ -787,668 +671,6 @@ class ImageFilenameManagerTab(QWidget):
             self.word_edit.setText(file_path)
             self.log(f"✓ Word 파일 선택: {os.path.basename(file_path)}")
 
-    # ========== HELPER METHODS - Image File Operations ==========
-
-    def get_image_files(self, folder_path, include_subfolders=True, log_callback=None):
-        """
-        이미지 파일 수집 (하위폴더 포함 옵션)
-
-        주의: 이 메서드는 워커 스레드에서 호출될 수 있으므로 GUI 요소에 직접 접근하지 않습니다.
-
-        Args:
-            folder_path: 검색할 폴더 경로
-            include_subfolders: 하위 폴더 포함 여부 (GUI에서 전달받은 값)
-            log_callback: 로그 출력 콜백 함수 (워커 스레드에서는 시그널 전달)
-        """
-        image_extensions = ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.bmp', '*.tiff', '*.webp']
-        image_files = []
-
-        search_type = "하위폴더 포함" if include_subfolders else "현재 폴더만"
-        if log_callback:
-            log_callback(f"{search_type} 이미지 파일 검색 중...")
-
-        for ext in image_extensions:
-            # GUI 요소에 직접 접근하지 않고 전달받은 파라미터 사용 (Qt 스레드 안전성)
-            if include_subfolders:
-                pattern = os.path.join(folder_path, '**', ext)
-                files = glob.glob(pattern, recursive=True)
-            else:
-                pattern = os.path.join(folder_path, ext)
-                files = glob.glob(pattern, recursive=False)
-
-            # old, etc 포함 폴더 제외
-            for file_path in files:
-                if not self.is_in_excluded_folder(file_path):
-                    image_files.append(file_path)
-
-        filenames = [os.path.basename(f) for f in image_files]
-        filenames.sort(key=self.windows_sort_key)
-
-        if log_callback:
-            log_callback(f"=== Windows 탐색기 순서로 정렬 ===")
-            for i, filename in enumerate(filenames[:10]):
-                log_callback(f"{i+1:2d}. {filename}")
-            if len(filenames) > 10:
-                log_callback(f"    ... 총 {len(filenames)}개 파일")
-            log_callback(f"검색 완료 ({search_type}): 총 {len(filenames)}개의 이미지 파일 발견")
-
-        return filenames, image_files
-
-    def get_png_files(self, start_folder, include_subfolders=True, log_callback=None):
-        """
-        모든 이미지 파일 수집 (PNG, JPG, JPEG 등 + old/etc 폴더 제외)
-
-        주의: 이 메서드는 워커 스레드에서 호출될 수 있으므로 GUI 요소에 직접 접근하지 않습니다.
-
-        Args:
-            start_folder: 검색할 폴더 경로
-            include_subfolders: 하위 폴더 포함 여부 (GUI에서 전달받은 값)
-            log_callback: 로그 출력 콜백 함수 (워커 스레드에서는 시그널 전달)
-        """
-        png_files = {}
-        start_folder = os.path.abspath(start_folder)
-
-        # 모든 이미지 확장자 검색
-        image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff', '*.webp']
-
-        for ext in image_extensions:
-            # GUI 요소에 직접 접근하지 않고 전달받은 파라미터 사용 (Qt 스레드 안전성)
-            if include_subfolders:
-                search_path = os.path.join(start_folder, '**', ext)
-                files = glob.glob(search_path, recursive=True)
-            else:
-                search_path = os.path.join(start_folder, ext)
-                files = glob.glob(search_path, recursive=False)
-
-            for file_path in files:
-                if os.path.isfile(file_path):
-                    # old, etc 폴더 제외
-                    if self.is_in_excluded_folder(file_path):
-                        # 로그 콜백이 제공된 경우에만 로그 출력 (워커 스레드용)
-                        if log_callback:
-                            log_callback(f"  제외 폴더 파일 스킵: {os.path.basename(file_path)}")
-                        continue
-
-                    name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
-                    png_files[name_without_ext] = file_path
-
-        return png_files
-
-    def is_in_excluded_folder(self, file_path):
-        """파일이 제외 대상 폴더(old, etc 포함) 안에 있는지 확인"""
-        try:
-            normalized_path = os.path.normpath(file_path)
-            path_parts = normalized_path.split(os.sep)
-
-            # 제외할 폴더 키워드 목록
-            excluded_keywords = ['old', 'etc']
-
-            for part in path_parts:
-                part_lower = part.lower()
-                for keyword in excluded_keywords:
-                    if keyword in part_lower:
-                        return True
-
-            return False
-        except Exception as e:
-            self.log(f"  제외 폴더 확인 중 오류: {str(e)}")
-            return False
-
-    def create_copy_path(self, original_path, suffix="_copy"):
-        """복사본 경로 생성"""
-        path_parts = os.path.splitext(original_path)
-        copy_path = f"{path_parts[0]}{suffix}{path_parts[1]}"
-
-        counter = 1
-        while os.path.exists(copy_path):
-            copy_path = f"{path_parts[0]}{suffix}{counter}{path_parts[1]}"
-            counter += 1
-
-        return copy_path
-
-    # ========== HELPER METHODS - BE Test Cell Detection ==========
-
-    def is_filename_line(self, text):
-        """파일명 라인인지 판단"""
-        return (text.startswith('N') and '_' in text and
-                ('MHz' in text or 'QPSK' in text or 'QAM' in text or 'DFT' in text or 'CP' in text))
-
-    def is_description_line(self, text):
-        """설명 문구인지 판단"""
-        description_keywords = [
-            'dft-s', 'ofdm', 'qpsk', 'low', 'high', 'frb', 'chansnel', 'chan',
-            'spurious', 'emission', 'block', 'error', 'testmode', 'comparison'
-        ]
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in description_keywords)
-
-    def is_be_test_cell(self, cell_text):
-        """
-        BE 테스트 셀 판단 - 극도로 보수적 접근
-        BE 전용 키워드가 있을 때만 True
-        """
-        if not cell_text:
-            return False
-
-        # BE 전용 키워드들 (대소문자 무관)
-        be_keywords = ['OFDM', 'DFT-s', 'CP_OFDM', 'DFT-s_OFDM']
-
-        text_upper = cell_text.upper()
-
-        # BE 키워드가 하나라도 있으면 BE 셀
-        return any(keyword.upper() in text_upper for keyword in be_keywords)
-
-    def update_description_with_testmode(self, text, matched_testmode):
-        """TESTMODE에 따라 설명 문구 업데이트"""
-        try:
-            ofdm_pattern = r'(.*)OFDM(.*)'
-            match = re.search(ofdm_pattern, text, re.IGNORECASE)
-
-            if match:
-                after_ofdm = match.group(2)
-
-                if matched_testmode == 'DFT':
-                    updated_text = f"DFT-s_OFDM{after_ofdm}"
-                elif matched_testmode == 'CP':
-                    updated_text = f"CP_OFDM{after_ofdm}"
-                else:
-                    updated_text = text
-
-                return updated_text
-            else:
-                return text
-
-        except Exception as e:
-            self.log(f"      설명 문구 업데이트 중 오류: {str(e)}")
-            return text
-
-    # ========== HELPER METHODS - BE Test Cell Processing ==========
-
-    def process_be_comparison_cell(self, cell, png_files, log_callback=None):
-        """
-        BE 테스트 셀 처리
-        Args:
-            cell: Word 문서의 셀 객체
-            png_files: 이미지 파일 딕셔너리
-            log_callback: 로그 출력 콜백 (Worker 스레드용, None이면 self.log 사용)
-        """
-        try:
-            cell_text = cell.text.strip()
-            if not cell_text:
-                return 0
-
-            lines = [line.strip() for line in cell_text.split('\n') if line.strip()]
-
-            msg = f"      BE 테스트 셀 분석: {len(lines)}개 줄"
-            if log_callback:
-                log_callback(msg)
-            elif not self._silent_mode:
-                self.log(msg)
-
-            # 각 줄 분류
-            filename_lines = []
-            description_lines = []
-            other_lines = []
-
-            for line in lines:
-                if self.is_filename_line(line):
-                    filename_lines.append(line)
-                elif self.is_description_line(line):
-                    description_lines.append(line)
-                else:
-                    other_lines.append(line)
-
-            msg = f"      분류: 파일명 {len(filename_lines)}개, 설명 {len(description_lines)}개"
-            if log_callback:
-                log_callback(msg)
-            elif not self._silent_mode:
-                self.log(msg)
-
-            # 매칭되는 파일 찾기
-            matched_filename = None
-            matched_testmode = None
-
-            for filename_line in filename_lines:
-                filename_base = filename_line.replace('.png', '').replace('.jpg', '').replace('.jpeg', '')
-
-                if filename_base in png_files:
-                    matched_filename = filename_base
-
-                    # TESTMODE 추출
-                    if '_DFT' in filename_base.upper():
-                        matched_testmode = 'DFT'
-                    elif '_CP' in filename_base.upper():
-                        matched_testmode = 'CP'
-
-                    msg = f"      ✅ 매칭: {filename_base} (TESTMODE: {matched_testmode})"
-                    if log_callback:
-                        log_callback(msg)
-                    elif not self._silent_mode:
-                        self.log(msg)
-                    break
-
-            if not matched_filename:
-                msg = f"      ❌ 매칭 실패"
-                if log_callback:
-                    log_callback(msg)
-                elif not self._silent_mode:
-                    self.log(msg)
-                return 0
-
-            # 셀 내용 재구성 (log_callback 전달)
-            self.rebuild_be_cell_content(cell, matched_filename, matched_testmode,
-                                         description_lines, other_lines, png_files, log_callback=log_callback)
-
-            return 1
-
-        except Exception as e:
-            error_msg = f"      ❌ BE 셀 처리 오류: {str(e)}"
-            if log_callback:
-                log_callback(error_msg)
-            elif not self._silent_mode:
-                self.log(error_msg)
-            return 0
-
-    def rebuild_be_cell_content(self, cell, matched_filename, matched_testmode,
-                                description_lines, other_lines, png_files, log_callback=None):
-        """
-        BE 테스트 셀 내용 재구성 - 공란 완전 제거
-        Args:
-            cell: Word 문서의 셀 객체
-            matched_filename: 매칭된 파일명
-            matched_testmode: 추출된 테스트 모드 (DFT/CP)
-            description_lines: 설명 줄 리스트
-            other_lines: 기타 줄 리스트
-            png_files: 이미지 파일 딕셔너리
-            log_callback: 로그 출력 콜백 (Worker 스레드용, None이면 self.log 사용)
-        """
-        try:
-            # 원본 설명 문구 서식 저장
-            original_desc_formatting = self.save_description_formatting(cell, description_lines)
-
-            # 셀 내용 완전 삭제
-            self.clear_cell_safely(cell)
-
-            # 첫 번째 문단도 제거하고 완전히 새로 시작
-            tc = cell._tc
-            for p_element in list(tc.findall('.//w:p', namespaces=nsmap)):
-                tc.remove(p_element)
-
-            # 이미지 삽입 (새 문단 생성) - log_callback 전달하여 에러 메시지 항상 출력
-            image_paragraph = cell.add_paragraph()
-            image_run = image_paragraph.add_run()
-
-            if self.insert_image_to_run(image_run, png_files[matched_filename], cell, log_callback=log_callback):
-                msg = f"        ✅ 이미지 삽입: {os.path.basename(png_files[matched_filename])}"
-                if log_callback:
-                    log_callback(msg)
-                elif not self._silent_mode:
-                    self.log(msg)
-            else:
-                error_msg = f"        ❌ 이미지 삽입 실패"
-                if log_callback:
-                    log_callback(error_msg)
-                elif not self._silent_mode:
-                    self.log(error_msg)
-                return
-
-            # 이미지 문단의 여백 완전 제거
-            pf = image_paragraph.paragraph_format
-            pf.space_before = Pt(0)
-            pf.space_after = Pt(0)
-            pf.line_spacing = 1.0
-
-            # 기타 텍스트 추가 (내용이 있을 때만)
-            for other_line in other_lines:
-                if other_line.strip():  # 빈 줄이 아닐 때만
-                    other_paragraph = cell.add_paragraph()
-                    other_run = other_paragraph.add_run(other_line)
-                    pf = other_paragraph.paragraph_format
-                    pf.space_before = Pt(0)
-                    pf.space_after = Pt(0)
-                    pf.line_spacing = 1.0
-
-            # 설명 문구 추가 (내용이 있을 때만)
-            for i, desc_line in enumerate(description_lines):
-                if desc_line.strip():  # 빈 줄 건너뛰기
-                    desc_paragraph = cell.add_paragraph()
-
-                    if matched_testmode and 'OFDM' in desc_line.upper():
-                        updated_desc = self.update_description_with_testmode(desc_line, matched_testmode)
-
-                        if updated_desc != desc_line:
-                            msg = f"        🔄 설명 업데이트: {desc_line} → {updated_desc}"
-                            if log_callback:
-                                log_callback(msg)
-                            elif not self._silent_mode:
-                                self.log(msg)
-
-                        self.add_text_with_original_formatting(desc_paragraph, updated_desc,
-                                                              original_desc_formatting, i)
-                    else:
-                        self.add_text_with_original_formatting(desc_paragraph, desc_line,
-                                                              original_desc_formatting, i)
-
-                    # 설명 문단도 여백 제거
-                    pf = desc_paragraph.paragraph_format
-                    pf.space_before = Pt(0)
-                    pf.space_after = Pt(0)
-                    pf.line_spacing = 1.0
-
-            msg = f"        ✅ 매칭 안 된 파일명 및 모든 공란 완전 제거 완료"
-            if log_callback:
-                log_callback(msg)
-            elif not self._silent_mode:
-                self.log(msg)
-
-        except Exception as e:
-            error_msg = f"        ❌ BE 셀 재구성 오류: {str(e)}"
-            if log_callback:
-                log_callback(error_msg)
-            elif not self._silent_mode:
-                self.log(error_msg)
-
-    def save_description_formatting(self, cell, description_lines):
-        """설명 문구의 원본 서식 정보 저장"""
-        formatting_info = []
-
-        try:
-            for paragraph in cell.paragraphs:
-                text = paragraph.text.strip()
-
-                if text in description_lines:
-                    para_formatting = {
-                        'alignment': paragraph.alignment,
-                        'runs': []
-                    }
-
-                    for run in paragraph.runs:
-                        run_formatting = {
-                            'text': run.text,
-                            'bold': run.bold,
-                            'italic': run.italic,
-                            'underline': run.underline,
-                            'font_name': None,
-                            'font_size': None,
-                            'font_color': None
-                        }
-
-                        try:
-                            if run.font.name:
-                                run_formatting['font_name'] = run.font.name
-                        except:
-                            pass
-
-                        try:
-                            if run.font.size:
-                                run_formatting['font_size'] = run.font.size
-                        except:
-                            pass
-
-                        try:
-                            if run.font.color and run.font.color.rgb:
-                                run_formatting['font_color'] = run.font.color.rgb
-                        except:
-                            pass
-
-                        para_formatting['runs'].append(run_formatting)
-
-                    formatting_info.append(para_formatting)
-
-        except Exception as e:
-            self.log(f"          서식 저장 오류: {str(e)}")
-
-        return formatting_info
-
-    def add_text_with_original_formatting(self, paragraph, text, original_formatting, desc_index):
-        """원본 서식을 유지하면서 텍스트만 변경"""
-        try:
-            if desc_index < len(original_formatting):
-                format_info = original_formatting[desc_index]
-
-                if format_info.get('alignment'):
-                    paragraph.alignment = format_info['alignment']
-
-                if format_info.get('runs') and len(format_info['runs']) > 0:
-                    first_run_format = format_info['runs'][0]
-                    new_run = paragraph.add_run(text)
-
-                    if first_run_format.get('bold') is not None:
-                        new_run.bold = first_run_format['bold']
-                    if first_run_format.get('italic') is not None:
-                        new_run.italic = first_run_format['italic']
-                    if first_run_format.get('underline') is not None:
-                        new_run.underline = first_run_format['underline']
-
-                    try:
-                        if first_run_format.get('font_name'):
-                            new_run.font.name = first_run_format['font_name']
-                    except:
-                        pass
-
-                    try:
-                        if first_run_format.get('font_size'):
-                            new_run.font.size = first_run_format['font_size']
-                    except:
-                        pass
-
-                    try:
-                        if first_run_format.get('font_color'):
-                            new_run.font.color.rgb = first_run_format['font_color']
-                    except:
-                        pass
-                else:
-                    paragraph.add_run(text)
-            else:
-                paragraph.add_run(text)
-
-            self.apply_minimal_formatting(paragraph)
-
-        except Exception as e:
-            self.log(f"          서식 적용 오류: {str(e)}")
-            paragraph.add_run(text)
-
-    def clear_cell_safely(self, cell):
-        """셀 내용을 안전하게 삭제"""
-        try:
-            while len(cell.paragraphs) > 1:
-                try:
-                    last_paragraph = cell.paragraphs[-1]
-                    p_element = last_paragraph._element
-                    p_element.getparent().remove(p_element)
-                except:
-                    break
-
-            if cell.paragraphs:
-                first_paragraph = cell.paragraphs[0]
-                for run in first_paragraph.runs:
-                    run.text = ""
-                first_paragraph.text = ""
-
-                try:
-                    pf = first_paragraph.paragraph_format
-                    pf.space_before = Pt(0)
-                    pf.space_after = Pt(0)
-                    pf.line_spacing = 1.0
-                except:
-                    pass
-
-        except Exception as e:
-            self.log(f"          셀 삭제 오류: {str(e)}")
-
-    def apply_minimal_formatting(self, paragraph):
-        """공백을 최소화하는 문단 서식 적용"""
-        try:
-            pf = paragraph.paragraph_format
-            pf.space_before = Pt(0)
-            pf.space_after = Pt(0)
-            pf.line_spacing = 1.0
-        except:
-            pass
-
-    # ========== HELPER METHODS - Image Insertion ==========
-
-    def find_matching_image(self, text, png_files):
-        """이미지 매칭"""
-        if not text.strip():
-            return None
-
-        return png_files.get(text)
-
-    def get_paragraph_text(self, paragraph):
-        """문단 텍스트 추출"""
-        return ''.join(run.text for run in paragraph.runs).strip()
-
-    def insert_image_to_run(self, run, img_path, cell, log_callback=None):
-        """
-        이미지를 Run에 삽입
-
-        Args:
-            run: Word 문서의 Run 객체
-            img_path: 이미지 파일 경로
-            cell: 셀 객체 (width와 height 정보 포함)
-            log_callback: 로그 출력 콜백 (Worker 스레드용, None이면 self.log 사용)
-                         Worker 스레드에서는 시그널로 전달하여 _silent_mode 영향 회피
-        """
-        try:
-            # ========================================
-            # 이미지 크기 조정 로직
-            # - 셀의 가로/세로 크기 모두 고려
-            # - 이미지 비율 유지하면서 셀 안에 꼭 맞게 조정
-            # - 가로 또는 세로 중 제한적인 쪽에 맞추고
-            #   다른 쪽은 비율에 맞게 자동 조정
-            # ========================================
-
-            # 셀 크기 가져오기 (여백 고려)
-            MARGIN = Cm(0.3)  # 셀 여백
-            DEFAULT_MAX_WIDTH = Cm(8)
-            DEFAULT_MAX_HEIGHT = Cm(6)
-
-            # 셀 너비 확인
-            if hasattr(cell, 'width') and hasattr(cell.width, 'cm') and cell.width.cm:
-                max_width = Cm(cell.width.cm - MARGIN.cm)
-            else:
-                max_width = DEFAULT_MAX_WIDTH
-
-            # 셀 높이 확인
-            if hasattr(cell, 'height') and hasattr(cell.height, 'cm') and cell.height.cm:
-                max_height = Cm(cell.height.cm - MARGIN.cm)
-            else:
-                max_height = DEFAULT_MAX_HEIGHT
-
-            # 이미지 원본 크기 및 비율 계산
-            with Image.open(img_path) as img:
-                img_width, img_height = img.size
-                if img_width == 0 or img_height == 0:
-                    raise ValueError(f"Invalid image dimensions: {img_width}x{img_height}")
-
-                aspect_ratio = img_height / img_width
-
-            # 가로/세로 제한을 모두 고려하여 크기 결정
-            # 1. 가로 기준으로 계산
-            width_based_width = max_width
-            width_based_height = max_width * aspect_ratio
-
-            # 2. 세로 기준으로 계산
-            height_based_height = max_height
-            height_based_width = max_height / aspect_ratio
-
-            # 3. 두 방식 중 셀 안에 들어가는 작은 쪽 선택
-            if width_based_height <= max_height:
-                # 가로 기준이 셀 안에 맞음
-                new_width = width_based_width
-                new_height = width_based_height
-            else:
-                # 세로 기준으로 조정 필요
-                new_width = height_based_width
-                new_height = height_based_height
-
-            run.add_picture(img_path, width=new_width, height=new_height)
-
-            # 성공 로그 - _silent_mode의 영향을 받지 않음
-            success_msg = f"    이미지 삽입 성공: {os.path.basename(img_path)}"
-            if log_callback:
-                log_callback(success_msg)  # Worker 스레드: 시그널로 전달
-            elif not self._silent_mode:
-                self.log(success_msg)  # 일반 호출: 기본 log 사용
-            return True
-
-        except Exception as e:
-            # ★★★ 중요: 에러 로그는 반드시 출력되어야 함 (_silent_mode 무시) ★★★
-            error_msg = f"    이미지 삽입 실패: {os.path.basename(img_path)}. 오류: {str(e)}"
-            if log_callback:
-                log_callback(error_msg)  # Worker 스레드: 시그널로 전달 (항상 표시됨)
-            elif not self._silent_mode:
-                self.log(error_msg)  # 일반 호출: 기본 log 사용
-            return False
-
-    def copy_run_format(self, source_run, target_run):
-        """Run 서식 복사"""
-        target_run.bold = source_run.bold
-        target_run.italic = source_run.italic
-        target_run.underline = source_run.underline
-        target_run.font.name = source_run.font.name
-        if source_run.font.size:
-            target_run.font.size = source_run.font.size
-        if source_run.font.color and source_run.font.color.rgb:
-            target_run.font.color.rgb = source_run.font.color.rgb
-
-    def process_cell(self, cell, png_files, log_callback=None):
-        """
-        일반 셀 처리 로직
-        Args:
-            cell: Word 문서의 셀 객체
-            png_files: 이미지 파일 리스트
-            log_callback: 로그 출력 콜백 (Worker 스레드용, None이면 self.log 사용)
-        """
-        total_attempts = 0
-        successful_matches = 0
-        successful_insertions = 0
-
-        paragraphs = list(cell.paragraphs)
-        for p_idx, paragraph in enumerate(paragraphs):
-            try:
-                original_text = self.get_paragraph_text(paragraph)
-                if not original_text:
-                    continue
-
-                total_attempts += 1
-                img_path = self.find_matching_image(original_text, png_files)
-
-                if img_path:
-                    successful_matches += 1
-
-                    runs_to_process = list(paragraph.runs)
-                    paragraph.clear()
-
-                    run = paragraph.add_run()
-                    # log_callback을 전달하여 에러 메시지 항상 출력
-                    if self.insert_image_to_run(run, img_path, cell, log_callback=log_callback):
-                        successful_insertions += 1
-                        success_msg = f"    ✅ 이미지 매칭 및 삽입 성공: {original_text}"
-                        if log_callback:
-                            log_callback(success_msg)
-                        elif not self._silent_mode:
-                            self.log(success_msg)
-                    else:
-                        error_msg = f"    ❌ 이미지 삽입 실패: {original_text}"
-                        if log_callback:
-                            log_callback(error_msg)
-                        elif not self._silent_mode:
-                            self.log(error_msg)
-                        for r in runs_to_process:
-                            new_run = paragraph.add_run(r.text)
-                            self.copy_run_format(r, new_run)
-
-            except Exception as e:
-                error_msg = f"    단락 처리 중 오류 발생: {str(e)}"
-                if log_callback:
-                    log_callback(error_msg)
-                elif not self._silent_mode:
-                    self.log(error_msg)
-
-        return total_attempts, successful_matches, successful_insertions
-
     # ========== FEATURE IMPLEMENTATIONS ==========
 
     def insert_filenames_to_word(self):
@@ -1457,32 +679,15 @@ class ImageFilenameManagerTab(QWidget):
             QMessageBox.critical(self, "오류", "폴더와 Word 파일을 모두 선택해주세요.")
             return
 
-        # Check if worker is already running
-        if self.worker and self.worker.isRunning():
-            QMessageBox.warning(self, "경고", "작업이 이미 진행 중입니다. 완료될 때까지 기다려주세요.")
-            return
-
-        # Disable all function buttons during processing
-        self.btn1.setEnabled(False)
-        self.btn2.setEnabled(False)
-        self.btn3.setEnabled(False)
-
-        # Show progress bar
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-
-        # Create and start worker thread (stored as instance variable to prevent garbage collection)
-        self.worker = FilenameInsertWorker(
-            self.selected_folder,
-            self.selected_word_file,
-            self.subfolder_check.isChecked(),
-            self
-        )
-        self.worker.progress_update.connect(self.on_progress_update)
-        self.worker.log_update.connect(self.log)
-        self.worker.finished.connect(self.on_task_finished)
-        self.worker.error.connect(self.on_task_error)
-        self.worker.start()
+        # 시작 시점의 설정으로 작업 생성 (실행 중에 화면 설정을 바꿔도 영향 없음)
+        folder_path = self.selected_folder
+        word_file_path = self.selected_word_file
+        include_subfolders = self.subfolder_check.isChecked()
+        trace = self.trace_check.isChecked()
+        memory = self.memory_check.isChecked()
+        self.start_job("파일명 기입", lambda channel: FilenameInsertWorker(
+            folder_path, word_file_path, include_subfolders, channel, trace=trace, memory=memory
+        ))
 
     def insert_images_to_word(self):
         """기능 2: 이미지 삽입 (통합)"""
@@ -1490,32 +695,17 @@ class ImageFilenameManagerTab(QWidget):
             QMessageBox.critical(self, "오류", "폴더와 Word 파일을 모두 선택해주세요.")
             return
 
-        # Check if worker is already running
-        if self.worker and self.worker.isRunning():
-            QMessageBox.warning(self, "경고", "작업이 이미 진행 중입니다. 완료될 때까지 기다려주세요.")
-            return
-
-        # Disable all function buttons during processing
-        self.btn1.setEnabled(False)
-        self.btn2.setEnabled(False)
-        self.btn3.setEnabled(False)
-
-        # Show progress bar
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-
-        # Create and start worker thread (stored as instance variable to prevent garbage collection)
-        self.worker = ImageInsertWorker(
-            self.selected_folder,
-            self.selected_word_file,
-            self.subfolder_check.isChecked(),
-            self
-        )
-        self.worker.progress_update.connect(self.on_progress_update)
-        self.worker.log_update.connect(self.log)
-        self.worker.finished.connect(self.on_task_finished)
-        self.worker.error.connect(self.on_task_error)
-        self.worker.start()
+        folder_path = self.selected_folder
+        word_file_path = self.selected_word_file
+        include_subfolders = self.subfolder_check.isChecked()
+        trace = self.trace_check.isChecked()
+        memory = self.memory_check.isChecked()
+        streaming = self.streaming_check.isChecked()
+        preflight = PREFLIGHT_DECODE if self.decode_check.isChecked() else PREFLIGHT_HEADER
+        self.start_job("이미지 삽입", lambda channel: ImageInsertWorker(
+            folder_path, word_file_path, include_subfolders, channel, trace=trace, memory=memory,
+            streaming=streaming, preflight=preflight
+        ))
 
     def create_auto_table_with_filenames(self):
         """기능 3: 2열 테이블 자동 생성"""
@@ -1523,459 +713,196 @@ class ImageFilenameManagerTab(QWidget):
             QMessageBox.critical(self, "오류", "이미지 폴더를 선택해주세요.")
             return
 
-        # Check if worker is already running
-        if self.worker and self.worker.isRunning():
-            QMessageBox.warning(self, "경고", "작업이 이미 진행 중입니다. 완료될 때까지 기다려주세요.")
+        folder_path = self.selected_folder
+        include_subfolders = self.subfolder_check.isChecked()
+        trace = self.trace_check.isChecked()
+        memory = self.memory_check.isChecked()
+        self.start_job("2열 테이블 생성", lambda channel: TableCreationWorker(
+            folder_path, include_subfolders, channel, trace=trace, memory=memory
+        ))
+
+    def run_batch_manifest(self):
+        """기능 4: 일괄 작업 - 매니페스트의 항목을 작업자 프로세스 풀에서 처리"""
+        manifest_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "일괄 작업 매니페스트 선택",
+            "",
+            "JSON Files (*.json)"
+        )
+        if not manifest_path:
             return
 
-        # Disable all function buttons during processing
-        self.btn1.setEnabled(False)
-        self.btn2.setEnabled(False)
-        self.btn3.setEnabled(False)
-
-        # Show progress bar
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-
-        # Create and start worker thread (stored as instance variable to prevent garbage collection)
-        self.worker = TableCreationWorker(
-            self.selected_folder,
-            self.subfolder_check.isChecked(),
-            self
-        )
-        self.worker.progress_update.connect(self.on_progress_update)
-        self.worker.log_update.connect(self.log)
-        self.worker.finished.connect(self.on_task_finished)
-        self.worker.error.connect(self.on_task_error)
-        self.worker.start()
+        self.log(f"✓ 매니페스트 선택: {os.path.basename(manifest_path)}")
+        trace = self.trace_check.isChecked()
+        memory = self.memory_check.isChecked()
+        self.start_job("일괄 작업", lambda channel: BatchWorker(
+            manifest_path, channel, trace=trace, memory=memory
+        ))
 
     # ========== THREAD CALLBACK METHODS ==========
 
-    def on_progress_update(self, value):
-        """진행률 업데이트"""
-        self.progress_bar.setValue(int(value))
-
-    def on_task_finished(self, message):
+    def on_task_finished(self, job_id, message):
         """작업 완료"""
-        self.progress_bar.setVisible(False)
-        self.log("✅ 작업 완료!")
+        job = self.finish_job(job_id)
+        self.log(f"✅ [{job_id}] {job['label']} 작업 완료!")
+        QMessageBox.information(self, f"완료 - [{job_id}] {job['label']}", message)
 
-        # Re-enable all function buttons
-        self.btn1.setEnabled(True)
-        self.btn2.setEnabled(True)
-        self.btn3.setEnabled(True)
-
-        QMessageBox.information(self, "완료", message)
-
-    def on_task_error(self, error_message):
+    def on_task_error(self, job_id, error_message):
         """작업 오류"""
-        self.progress_bar.setVisible(False)
-        self.log(f"❌ 오류 발생: {error_message}")
+        job = self.finish_job(job_id)
+        self.log(f"❌ [{job_id}] {job['label']} 오류 발생: {error_message}")
+        QMessageBox.critical(self, f"오류 - [{job_id}] {job['label']}", error_message)
 
-        # Re-enable all function buttons
-        self.btn1.setEnabled(True)
-        self.btn2.setEnabled(True)
-        self.btn3.setEnabled(True)
+    def cancel_task(self):
+        """실행 중인 모든 작업에 중지 요청 (작업 스레드가 다음 셀 경계에서 정리 후 종료)"""
+        for job_id, job in self.jobs.items():
+            if job['worker'].isRunning() and not job['worker'].cancel_token.cancelled:
+                job['worker'].cancel()
+                self.log(f"⏹ [{job_id}] {job['label']} 중지 요청...")
+        self.stop_btn.setEnabled(False)
 
-        QMessageBox.critical(self, "오류", error_message)
+    def on_task_cancelled(self, job_id, message):
+        """작업 취소 완료"""
+        self.finish_job(job_id)
+        self.log(f"⏹ [{job_id}] {message}")
 
 
 # ===================================================================
 # WORKER THREADS FOR TAB 1 (QThread implementations)
 # ===================================================================
 
-class FilenameInsertWorker(QThread):
-    """파일명 기입 작업 스레드"""
-    progress_update = Signal(float)
-    log_update = Signal(str)
+class Tab1Worker(QThread):
+    """
+    Tab 1 작업 스레드 공통 부분
+
+    실제 처리는 ImageReportEngine(image_report_engine.py)이 담당합니다.
+    로그/진행률은 LogChannel 버퍼에 넣기만 하고 (GUI가 주기적으로 가져감),
+    결과만 시그널로 GUI에 전달합니다.
+    trace가 True이면 단계별 구간을 기록하여 logs/trace_tab1_*.json으로,
+    memory가 True이면 단계 경계별 메모리를 logs/memory_tab1_*.json으로 저장합니다.
+    cancel()은 엔진이 다음 파일/셀 경계에서 멈추도록 요청합니다 (완료 시 cancelled 시그널).
+    """
     finished = Signal(str)
     error = Signal(str)
+    cancelled = Signal(str)
 
-    def __init__(self, folder_path, word_file_path, include_subfolders, parent_tab):
+    def __init__(self, channel, trace=False, memory=False):
         super().__init__()
-        self.folder_path = folder_path
-        self.word_file_path = word_file_path
-        self.include_subfolders = include_subfolders
-        self.parent_tab = parent_tab
+        self.channel = channel
+        self.trace = trace
+        self.memory = memory
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """작업 취소 요청 (GUI 스레드에서 호출)"""
+        self.cancel_token.cancel()
+
+    def execute(self, engine):
+        """하위 클래스에서 엔진 작업 실행 후 결과 dict 반환"""
+        raise NotImplementedError
 
     def run(self):
+        ReportJobError = None  # 엔진을 불러오지 못하면 모든 오류를 일반 오류로 보고
         try:
-            # ★★★ Qt 스레드 안전성: Worker 스레드에서는 GUI 접근 금지 ★★★
-            self.parent_tab._silent_mode = True
-
-            self.progress_update.emit(0)
-            self.log_update.emit("=== 파일명 기입 작업 시작 ===")
-
-            # Create backup copy
-            original_path = self.word_file_path
-            copy_path = self.parent_tab.create_copy_path(original_path)
-            self.log_update.emit(f"복사본 생성: {copy_path}")
-            shutil.copy2(original_path, copy_path)
-
-            # Get image files - GUI 요소 대신 전달받은 파라미터 사용
-            filenames, _ = self.parent_tab.get_image_files(
-                self.folder_path,
-                include_subfolders=self.include_subfolders,
-                log_callback=self.log_update.emit
-            )
-            if not filenames:
-                self.log_update.emit("이미지 파일이 없습니다.")
-                self.error.emit("선택한 폴더에 이미지 파일이 없습니다.")
-                return
-
-            # Open Word document
-            doc = Document(copy_path)
-            if not doc.tables:
-                self.log_update.emit("Word 문서에 테이블이 없습니다.")
-                self.error.emit("Word 문서에 테이블이 없습니다.")
-                return
-
-            table = doc.tables[0]
-            self.log_update.emit(f"테이블 발견: {len(table.rows)}행 {len(table.columns)}열")
-
-            filename_index = 0
-            self.log_update.emit(f"=== 파일명 기입 시작 (Windows 탐색기 순서) ===")
-
-            for row_idx, row in enumerate(table.rows):
-                for col_idx, cell in enumerate(row.cells):
-                    if filename_index < len(filenames):
-                        existing_text = cell.text.strip()
-                        filename_without_ext = os.path.splitext(filenames[filename_index])[0]
-
-                        if existing_text:
-                            # Save original formatting
-                            original_paragraphs_data = []
-                            for p in cell.paragraphs:
-                                if not p.text.strip():
-                                    continue
-
-                                paragraph_data = {'runs': [], 'alignment': p.alignment}
-                                for run in p.runs:
-                                    run_data = {
-                                        "text": run.text,
-                                        "bold": run.bold,
-                                        "italic": run.italic,
-                                        "underline": run.underline,
-                                        "font_name": run.font.name,
-                                        "font_size": run.font.size,
-                                        "font_color_rgb": run.font.color.rgb if run.font.color else None,
-                                    }
-                                    paragraph_data['runs'].append(run_data)
-                                original_paragraphs_data.append(paragraph_data)
-
-                            # Clear cell and rebuild
-                            tc = cell._tc
-                            for p_element in tc.findall('.//w:p', namespaces=nsmap):
-                                tc.remove(p_element)
-
-                            # Add filename
-                            p_filename = cell.add_paragraph(filename_without_ext)
-                            p_filename.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            pf1 = p_filename.paragraph_format
-                            pf1.space_before = Pt(0)
-                            pf1.space_after = Pt(0)
-                            pf1.line_spacing = 1.0
-
-                            # Restore original content
-                            for p_data in original_paragraphs_data:
-                                p_recreated = cell.add_paragraph()
-                                p_recreated.alignment = p_data['alignment']
-                                for run_data in p_data['runs']:
-                                    new_run = p_recreated.add_run(run_data['text'])
-                                    new_run.bold = run_data['bold']
-                                    new_run.italic = run_data['italic']
-                                    new_run.underline = run_data['underline']
-                                    if run_data['font_name']:
-                                        new_run.font.name = run_data['font_name']
-                                    if run_data['font_size']:
-                                        new_run.font.size = run_data['font_size']
-                                    if run_data['font_color_rgb']:
-                                        new_run.font.color.rgb = run_data['font_color_rgb']
-
-                                pf_recreated = p_recreated.paragraph_format
-                                pf_recreated.space_before = Pt(0)
-                                pf_recreated.space_after = Pt(0)
-                                pf_recreated.line_spacing = 1.0
-
-                            self.log_update.emit(f"셀 서식 포함 재구성 [{row_idx+1},{col_idx+1}]: {filename_without_ext}")
-
-                        else:
-                            # Empty cell - just add filename
-                            first_paragraph = cell.paragraphs[0]
-                            first_paragraph.text = filename_without_ext
-                            first_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            pf = first_paragraph.paragraph_format
-                            pf.space_before = Pt(0)
-                            pf.space_after = Pt(0)
-                            pf.line_spacing = 1.0
-                            self.log_update.emit(f"파일명 기입 [{row_idx+1},{col_idx+1}]: {filename_without_ext}")
-
-                        filename_index += 1
-                    else:
-                        break
-                if filename_index >= len(filenames):
-                    break
-
-            # Save document
-            self.progress_update.emit(100)
-            doc.save(copy_path)
-            self.log_update.emit(f"파일명 기입 완료! 저장된 파일: {copy_path}")
-
-            self.finished.emit(
-                f"파일명이 성공적으로 기입되었습니다.\n\n"
-                f"저장된 파일: {os.path.basename(copy_path)}"
+            # python-docx/Pillow는 Tab 1 작업을 처음 실행할 때 불러옴 (프로그램 시작 시간 단축)
+            # 불러오기/엔진 생성 실패도 error 시그널로 보내야 작업 행이 실행 중으로 남지 않음
+            from image_report_engine import ImageReportEngine, ReportJobError
+
+            engine = ImageReportEngine(
+                log_callback=self.channel.put,
+                progress_callback=self.channel.set_progress,
+                cancel_token=self.cancel_token
             )
-
+            name = self.channel.name or 'tab1'  # 동시에 실행 중인 작업끼리 보고서 파일이 겹치지 않게
+            tracer = Tracer(name) if self.trace else None
+            set_tracer(tracer)
+            profiler = MemoryProfiler(name) if self.memory else None
+            set_memory_profiler(profiler)
+            if profiler is not None:
+                profiler.start()
+            try:
+                result = self.execute(engine)
+            finally:
+                # 완료 시그널 전에 요약을 채널에 넣어야 화면에 표시됨
+                set_tracer(None)
+                if tracer is not None:
+                    write_trace(tracer, default_trace_path(name), self.channel.put)
+                set_memory_profiler(None)
+                if profiler is not None:
+                    profiler.stop()
+                    write_memory_report(profiler, default_memory_report_path(name), self.channel.put)
+            self.finished.emit(result['message'])
+        except OperationCancelled:
+            self.cancelled.emit(f"작업이 취소되었습니다 (중지 요청 → 정리 완료 {self.cancel_token.latency():.2f}초)")
         except Exception as e:
-            self.error.emit(f"작업 중 오류가 발생했습니다:\n{str(e)}\n\n{traceback.format_exc()}")
-        finally:
-            # _silent_mode 복원 (Qt 스레드 안전성 정리 작업)
-            self.parent_tab._silent_mode = False
+            if ReportJobError is not None and isinstance(e, ReportJobError):
+                self.error.emit(str(e))
+            else:
+                self.error.emit(f"작업 중 오류가 발생했습니다:\n{str(e)}\n\n{traceback.format_exc()}")
 
 
-class ImageInsertWorker(QThread):
-    """이미지 삽입 작업 스레드"""
-    progress_update = Signal(float)
-    log_update = Signal(str)
-    finished = Signal(str)
-    error = Signal(str)
+class FilenameInsertWorker(Tab1Worker):
+    """파일명 기입 작업 스레드"""
 
-    def __init__(self, folder_path, word_file_path, include_subfolders, parent_tab):
-        super().__init__()
+    def __init__(self, folder_path, word_file_path, include_subfolders, channel, trace=False, memory=False):
+        super().__init__(channel, trace, memory)
         self.folder_path = folder_path
         self.word_file_path = word_file_path
         self.include_subfolders = include_subfolders
-        self.parent_tab = parent_tab
 
-    def run(self):
-        try:
-            # ★★★ Qt 스레드 안전성: Worker 스레드에서는 GUI 접근 금지 ★★★
-            # _silent_mode를 True로 설정하여 헬퍼 메서드의 self.log() 호출 무시
-            self.parent_tab._silent_mode = True
-
-            self.progress_update.emit(0)
-            self.log_update.emit("=== 통합 이미지 삽입 작업 시작 ===")
-
-            # Create backup copy
-            original_path = self.word_file_path
-            copy_path = self.parent_tab.create_copy_path(original_path)
-            self.log_update.emit(f"복사본 생성: {copy_path}")
-            shutil.copy2(original_path, copy_path)
-
-            # Get PNG files - GUI 요소 대신 전달받은 파라미터 사용
-            png_files = self.parent_tab.get_png_files(
-                self.folder_path,
-                include_subfolders=self.include_subfolders,  # GUI에서 전달받은 값 사용
-                log_callback=self.log_update.emit  # 로그는 시그널로 전달
-            )
-            search_type = "하위폴더 포함" if self.include_subfolders else "현재 폴더만"
-            self.log_update.emit(f"이미지 파일 검색 완료 ({search_type}): 총 {len(png_files)}개 발견")
-            if png_files:
-                self.log_update.emit(f"발견된 이미지 파일 (최대 10개): {list(png_files.keys())[:10]}{'...' if len(png_files) > 10 else ''}")
-
-            # Open Word document
-            doc = Document(copy_path)
-            if not doc.tables:
-                self.log_update.emit("Word 문서에 테이블이 없습니다.")
-                self.error.emit("Word 문서에 테이블이 없습니다.")
-                return
-
-            total_cells = sum(len(row.cells) for table in doc.tables for row in table.rows)
-            processed_cells = 0
-
-            # Statistics
-            be_test_cells = 0
-            basic_cells = 0
-            total_be_images = 0
-            total_attempts = 0
-            total_matches = 0
-            total_insertions = 0
-
-            self.log_update.emit(f"총 {len(doc.tables)}개 테이블, {total_cells}개 셀 처리 시작...")
-
-            for table_idx, table in enumerate(doc.tables):
-                self.log_update.emit(f"=== 테이블 {table_idx + 1} 처리 중 ===")
-
-                for row_idx, row in enumerate(table.rows):
-                    for col_idx, cell in enumerate(row.cells):
-                        processed_cells += 1
-                        try:
-                            cell_text = cell.text.strip()
-
-                            # ★★★ 핵심 분기 로직 ★★★
-                            if self.parent_tab.is_be_test_cell(cell_text):
-                                # BE 테스트 셀 처리 - log_callback 전달하여 에러 메시지 항상 출력
-                                be_test_cells += 1
-                                self.log_update.emit(f"  셀 [{row_idx+1},{col_idx+1}] - BE 테스트 타입 감지")
-                                images_inserted = self.parent_tab.process_be_comparison_cell(
-                                    cell, png_files, log_callback=self.log_update.emit
-                                )
-                                total_be_images += images_inserted
-                            else:
-                                # 일반 셀 처리 - log_callback 전달하여 에러 메시지 항상 출력
-                                if cell_text:
-                                    basic_cells += 1
-                                    self.log_update.emit(f"  셀 [{row_idx+1},{col_idx+1}] - 일반 타입")
-                                    attempts, matches, insertions = self.parent_tab.process_cell(
-                                        cell, png_files, log_callback=self.log_update.emit
-                                    )
-                                    total_attempts += attempts
-                                    total_matches += matches
-                                    total_insertions += insertions
-
-                        except Exception as e:
-                            self.log_update.emit(f"  셀 [{row_idx+1},{col_idx+1}] 처리 중 오류: {str(e)}")
-
-                        # Update progress
-                        progress_percent = (processed_cells / total_cells) * 100 if total_cells > 0 else 0
-                        self.progress_update.emit(progress_percent)
-
-            # Save document
-            self.log_update.emit(f"  진행률: 100.0% ({processed_cells}/{total_cells})")
-            self.progress_update.emit(100)
-            doc.save(copy_path)
-
-            self.log_update.emit("=== 통합 이미지 삽입 완료 ===")
-            self.log_update.emit(f"전체 처리 셀: {processed_cells}개")
-            self.log_update.emit(f"BE 테스트 셀: {be_test_cells}개 (삽입 이미지: {total_be_images}개)")
-            self.log_update.emit(f"일반 셀: {basic_cells}개 (매칭 시도: {total_attempts}, 성공 매칭: {total_matches}, 성공 삽입: {total_insertions})")
-            self.log_update.emit(f"저장된 파일: {copy_path}")
-
-            self.finished.emit(
-                f"통합 이미지 삽입이 완료되었습니다!\n\n"
-                f"전체 처리 셀: {processed_cells:,}개\n"
-                f"├─ BE 테스트 셀: {be_test_cells}개\n"
-                f"│  └─ 삽입 이미지: {total_be_images}개\n"
-                f"└─ 일반 셀: {basic_cells}개\n"
-                f"   ├─ 매칭 시도: {total_attempts}개\n"
-                f"   ├─ 성공 매칭: {total_matches}개\n"
-                f"   └─ 성공 삽입: {total_insertions}개\n\n"
-                f"저장된 파일: {os.path.basename(copy_path)}"
-            )
+    def execute(self, engine):
+        return engine.insert_filenames(self.folder_path, self.word_file_path, self.include_subfolders)
 
-        except Exception as e:
-            self.error.emit(f"작업 중 오류가 발생했습니다:\n{str(e)}\n\n{traceback.format_exc()}")
-        finally:
-            # _silent_mode 복원 (Qt 스레드 안전성 정리 작업)
-            self.parent_tab._silent_mode = False
 
+class ImageInsertWorker(Tab1Worker):
+    """이미지 삽입 작업 스레드"""
 
-class TableCreationWorker(QThread):
+    def __init__(self, folder_path, word_file_path, include_subfolders, channel, trace=False, memory=False,
+                 streaming=False, preflight=PREFLIGHT_HEADER):
+        super().__init__(channel, trace, memory)
+        self.folder_path = folder_path
+        self.word_file_path = word_file_path
+        self.include_subfolders = include_subfolders
+        self.streaming = streaming
+        self.preflight = preflight
+
+    def execute(self, engine):
+        return engine.insert_images(self.folder_path, self.word_file_path, self.include_subfolders,
+                                    streaming=self.streaming, preflight=self.preflight)
+
+
+class TableCreationWorker(Tab1Worker):
     """테이블 자동 생성 작업 스레드"""
-    progress_update = Signal(float)
-    log_update = Signal(str)
-    finished = Signal(str)
-    error = Signal(str)
 
-    def __init__(self, folder_path, include_subfolders, parent_tab):
-        super().__init__()
+    def __init__(self, folder_path, include_subfolders, channel, trace=False, memory=False):
+        super().__init__(channel, trace, memory)
         self.folder_path = folder_path
         self.include_subfolders = include_subfolders
-        self.parent_tab = parent_tab
 
-    def run(self):
-        try:
-            # ★★★ Qt 스레드 안전성: Worker 스레드에서는 GUI 접근 금지 ★★★
-            self.parent_tab._silent_mode = True
-
-            self.progress_update.emit(0)
-            self.log_update.emit("=== 2열 테이블 자동 생성 시작 ===")
-
-            # 1. 이미지 파일 수집 - GUI 요소 대신 전달받은 파라미터 사용
-            self.log_update.emit("1. 이미지 파일 수집 중...")
-            filenames, image_files = self.parent_tab.get_image_files(
-                self.folder_path,
-                include_subfolders=self.include_subfolders,
-                log_callback=self.log_update.emit
-            )
+    def execute(self, engine):
+        return engine.create_table(self.folder_path, self.include_subfolders)
 
-            if not filenames:
-                self.log_update.emit("이미지 파일이 없습니다.")
-                self.error.emit("선택한 폴더에 이미지 파일이 없습니다.")
-                return
-
-            self.log_update.emit(f"총 {len(filenames)}개의 이미지 파일 발견")
-            self.progress_update.emit(20)
-
-            # 2. 테이블 행 수 계산
-            num_images = len(filenames)
-            num_rows = (num_images + 1) // 2
-            self.log_update.emit(f"2. 테이블 생성: 2열 x {num_rows}행")
-            self.progress_update.emit(30)
-
-            # 3. 새 Word 문서 생성
-            self.log_update.emit("3. 새 Word 문서 생성 중...")
-            doc = Document()
-            self.progress_update.emit(40)
-
-            # 4. 2열 N행 테이블 추가
-            self.log_update.emit(f"4. {num_rows}행 2열 테이블 추가 중...")
-            table = doc.add_table(rows=num_rows, cols=2)
-            table.style = 'Table Grid'
-            self.progress_update.emit(50)
-
-            # 5. 파일명 기입
-            self.log_update.emit("5. 파일명 기입 중 (좌→우, 위→아래 순서)...")
-            file_index = 0
-
-            for row_idx in range(num_rows):
-                for col_idx in range(2):
-                    if file_index < num_images:
-                        cell = table.rows[row_idx].cells[col_idx]
-                        filename_without_ext = os.path.splitext(filenames[file_index])[0]
-
-                        paragraph = cell.paragraphs[0]
-                        paragraph.text = filename_without_ext
-                        paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-                        pf = paragraph.paragraph_format
-                        pf.space_before = Pt(0)
-                        pf.space_after = Pt(0)
-                        pf.line_spacing = 1.0
-
-                        self.log_update.emit(f"  [{row_idx+1},{col_idx+1}]: {filename_without_ext}")
-                        file_index += 1
-                    else:
-                        self.log_update.emit(f"  [{row_idx+1},{col_idx+1}]: (빈 셀)")
-                        break
-
-                # Update progress
-                progress = 50 + ((row_idx + 1) / num_rows * 40)
-                self.progress_update.emit(progress)
-
-            # 6. 파일 저장
-            self.log_update.emit("6. 파일 저장 중...")
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"이미지_테이블_생성_{timestamp}.docx"
-            output_path = os.path.join(self.folder_path, output_filename)
-
-            counter = 1
-            while os.path.exists(output_path):
-                output_filename = f"이미지_테이블_생성_{timestamp}_{counter}.docx"
-                output_path = os.path.join(self.folder_path, output_filename)
-                counter += 1
-
-            doc.save(output_path)
-            self.progress_update.emit(100)
-
-            self.log_update.emit("=== 2열 테이블 자동 생성 완료 ===")
-            self.log_update.emit(f"총 이미지 개수: {num_images}개")
-            self.log_update.emit(f"테이블 크기: {num_rows}행 x 2열")
-            self.log_update.emit(f"저장된 파일: {output_path}")
-
-            self.finished.emit(
-                f"2열 테이블이 성공적으로 생성되었습니다!\n\n"
-                f"이미지 개수: {num_images}개\n"
-                f"테이블 크기: {num_rows}행 x 2열\n\n"
-                f"저장된 파일:\n{output_filename}"
-            )
 
-        except Exception as e:
-            self.error.emit(f"작업 중 오류가 발생했습니다:\n{str(e)}\n\n{traceback.format_exc()}")
-        finally:
-            # _silent_mode 복원 (Qt 스레드 안전성 정리 작업)
-            self.parent_tab._silent_mode = False
+class BatchWorker(Tab1Worker):
+    """일괄 작업 스레드 - 문서는 작업자 프로세스에서 처리 (batch_report.py)"""
+
+    def __init__(self, manifest_path, channel, trace=False, memory=False):
+        super().__init__(channel, trace, memory)
+        self.manifest_path = manifest_path
+
+    def execute(self, engine):
+        from batch_report import BatchReportProcessor, load_manifest
+
+        processor = BatchReportProcessor(
+            load_manifest(self.manifest_path),
+            log_callback=engine.log_callback,
+            progress_callback=engine.progress_callback,
+            cancel_token=self.cancel_token
+        )
+        result = processor.run()
+        if result['cancelled']:
+            raise OperationCancelled(result['message'])
+        return result
 
 
 # ===================================================================
@@ -1983,583 +910,76 @@ class TableCreationWorker(QThread):
 # ===================================================================
 
 class ExcelRangeProcessorThread(QThread):
-    """백그라운드 작업 스레드 - Excel 범위를 Word에 삽입"""
+    """
+    백그라운드 작업 스레드 - Excel 범위를 Word에 삽입
+
+    실제 처리는 ParallelRangeProcessor(parallel_range_processor.py)가 담당하고,
+    이 스레드는 로그를 LogChannel 버퍼에 넣고 결과만 시그널로 GUI에 전달합니다.
+    작업자 프로세스의 로그도 이 스레드를 거쳐 채널로 전달됩니다.
+    """
 
-    progress = Signal(str)
     finished = Signal(dict)
 
-    def __init__(self, excel_files, word_files, mappings):
+    def __init__(self, excel_files, word_files, mappings, channel, recycle_after=DEFAULT_RECYCLE_AFTER,
+                 export_mode=EXPORT_MODE_CLIPBOARD, workers=1, sizing_mode=SIZING_MODE_COM, trace=False,
+                 memory=False):
         super().__init__()
+        self.channel = channel          # 로그 버퍼 (GUI가 주기적으로 가져감)
         self.excel_files = excel_files  # 엑셀 파일 리스트
         self.word_files = word_files    # 워드 파일 리스트
         self.mappings = mappings
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_word_files = []     # 생성된 워드 파일 리스트
+        self.recycle_after = recycle_after  # Office 인스턴스 재생성 주기
+        self.export_mode = export_mode      # 범위 변환 방식 (clipboard/file)
+        self.workers = workers              # 병렬 작업자 프로세스 수
+        self.sizing_mode = sizing_mode      # 그림 크기 계산 방식 (com/model/compare)
+        self.trace = trace                  # 단계별 구간 기록 (logs/trace_tab2_*.json)
+        self.memory = memory                # 단계 경계별 메모리 기록 (logs/memory_tab2_*.json)
+        self.cancel_token = CancellationToken()  # 중지 버튼 → 범위/파일 경계에서 정리 후 종료
+
+    def cancel(self):
+        """작업 취소 요청 (GUI 스레드에서 호출)"""
+        self.cancel_token.cancel()
 
     def log(self, message):
-        """로그 출력"""
-        logger.info(message)
-        self.progress.emit(message)
-
-    # ========================================
-    # 주의: 재시도 로직 제거됨 (사용자 요청)
-    # 이전 버전에서는 최대 3회 재시도했으나
-    # 현재는 1회만 시도 후 실패 시 즉시 예외 발생
-    # ========================================
-    def create_excel_app_with_retry(self):
-        """Excel 애플리케이션 생성 (재시도 로직 제거됨)"""
-        try:
-            # COM 초기화 (스레드별로 필요)
-            pythoncom.CoInitialize()
-
-            # Excel 애플리케이션 생성
-            excel = win32.gencache.EnsureDispatch('Excel.Application')
-
-            excel.Visible = False
-            excel.DisplayAlerts = False
-            self.log(f"  ✓ Excel 애플리케이션 생성 성공")
-            return excel
-
-        except Exception as e:
-            self.log(f"  ✗ Excel 생성 실패: {str(e)}")
-
-            # COM 정리
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
-
-            # 가비지 컬렉션
-            gc.collect()
-
-            raise Exception(f"Excel 애플리케이션 생성 실패: {str(e)}")
-
-    # ========================================
-    # 주의: 재시도 로직 제거됨 (사용자 요청)
-    # 이전 버전에서는 최대 3회 재시도했으나
-    # 현재는 1회만 시도 후 실패 시 즉시 예외 발생
-    # ========================================
-    def create_word_app_with_retry(self):
-        """Word 애플리케이션 생성 (재시도 로직 제거됨)"""
-        try:
-            # COM 초기화 (스레드별로 필요)
-            pythoncom.CoInitialize()
-
-            # Word 애플리케이션 생성
-            word = win32.gencache.EnsureDispatch('Word.Application')
-
-            word.Visible = False
-            return word
-
-        except Exception as e:
-            self.log(f"  ✗ Word 생성 실패: {str(e)}")
-
-            # COM 정리
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
-
-            # 가비지 컬렉션
-            gc.collect()
-
-            raise Exception(f"Word 애플리케이션 생성 실패: {str(e)}")
-
-    def cleanup_com_object(self, obj, obj_name=""):
-        """COM 객체 안전하게 정리"""
-        if obj is not None:
-            try:
-                if hasattr(obj, 'Quit'):
-                    obj.Quit()
-                elif hasattr(obj, 'Close'):
-                    obj.Close()
-                if obj_name:
-                    self.log(f"  ✓ {obj_name} 정리 완료")
-            except Exception as e:
-                self.log(f"  ⚠️ {obj_name} 정리 중 오류 (무시됨): {str(e)}")
-
-    def create_word_copy(self, word_file):
-        """Word 파일 복사본 생성"""
-        try:
-            # 원본 파일명에서 확장자 분리
-            base_name = os.path.splitext(word_file)[0]
-            ext = os.path.splitext(word_file)[1]
-
-            # 복사본 파일명 생성
-            copy_file = f"{base_name}_copy{ext}"
-
-            # 이미 존재하면 번호 추가
-            counter = 1
-            while os.path.exists(copy_file):
-                copy_file = f"{base_name}_copy{counter}{ext}"
-                counter += 1
-
-            # 파일 복사
-            shutil.copy2(word_file, copy_file)
-            self.log(f"✓ Word 복사본 생성: {os.path.basename(copy_file)}")
-
-            return copy_file
-
-        except Exception as e:
-            self.log(f"✗ Word 파일 복사 실패: {str(e)}")
-            return None
-
-    def extract_suffix(self, filename):
-        """파일명에서 접미사 추출 (#1, #2 등)"""
-        match = re.search(r'_#(\d+)\.xlsx?$', filename, re.IGNORECASE)
-        if match:
-            return f"#{match.group(1)}"
-        return None
-
-    def copy_range_as_picture(self, wb, sheet_name, range_address):
-        """엑셀 범위를 화면에 보이는 대로 그림으로 복사 (클립보드에)"""
-        try:
-            # 시트 존재 확인
-            try:
-                sheet = wb.Sheets(sheet_name)
-            except:
-                # 시트가 없으면 조용히 건너뜀 (로그 출력 안 함)
-                return False
-
-            # 시트가 숨김 상태인지 확인
-            # xlSheetVisible = -1 (보임)
-            # xlSheetHidden = 0 (숨김)
-            # xlSheetVeryHidden = 2 (매우 숨김)
-            if sheet.Visible != -1:
-                # 숨김 시트도 조용히 건너뜀
-                return False
-
-            # 범위 선택
-            range_obj = sheet.Range(range_address)
-
-            # 화면에 보이는 대로 그림으로 복사 (클립보드에 복사됨)
-            # xlScreen=1, xlPicture=-4147
-            range_obj.CopyPicture(Appearance=1, Format=-4147)
-
-            # ★★★ 클립보드 복사 완료 대기 (동기화) ★★★
-            # Excel COM의 CopyPicture()는 비동기 작업일 수 있으므로
-            # 클립보드에 실제로 복사될 시간을 확보
-            #time.sleep(0.15)  # 클립보드 안정화 시간 (150ms)
-
-            self.log(f"  ✓ 범위 복사 완료 (클립보드)")
-            return True
-
-        except Exception as e:
-            # 복사 실패는 조용히 처리 (시트 없음/범위 오류 등)
-            return False
-
-    def paste_picture_at_marker(self, word_app, marker):
-        """Word 마커 위치에 클립보드의 그림 붙여넣기"""
-        try:
-            # Selection 초기화
-            word_app.Selection.HomeKey(Unit=6)  # wdStory
-
-            # Find 설정
-            find = word_app.Selection.Find
-            find.ClearFormatting()
-            find.Text = marker
-            find.Forward = True
-            find.Wrap = 1  # wdFindContinue
-
-            # ========================================
-            # 주의: 마커 찾기 재시도 로직 제거됨 (사용자 요청)
-            # 이전 버전에서는 최대 2회 재시도했으나
-            # 현재는 1회만 시도 후 실패 시 즉시 다음 로직으로 진행
-            # ========================================
-            marker_found = find.Execute()
-
-            # 마커 찾기 결과 확인
-            if marker_found:
-                # 페이지 설정 정보
-                page_setup = word_app.ActiveDocument.PageSetup
-                page_height = page_setup.PageHeight
-                top_margin = page_setup.TopMargin
-                bottom_margin = page_setup.BottomMargin
-
-                # 마커 위치의 세로 위치 저장 (포인트 단위)
-                # 3단계 폴백: Selection.Information(6) → Range.Information(6) → 추정값
-                vertical_position = None
-                try:
-                    vertical_position = word_app.Selection.Information(6)
-                except:
-                    try:
-                        vertical_position = word_app.Selection.Range.Information(6)
-                    except:
-                        vertical_position = top_margin + 100  # 추정값
-                        self.log(f"  ⚠️ 세로 위치 감지 실패, 추정값 사용")
-
-                # 본문 영역 경계 계산
-                content_start = top_margin  # 본문 시작 (머릿말 아래)
-                content_end = page_height - bottom_margin  # 본문 끝 (바닥글 위)
-
-                # 마커 위치가 본문 영역 내에 있는지 확인
-                if vertical_position < content_start:
-                    self.log(f"  ⚠️ 경고: 마커가 머릿말 영역에 있음")
-                elif vertical_position > content_end:
-                    self.log(f"  ⚠️ 경고: 마커가 바닥글 영역에 있음")
-
-                # 안전 여유 공간 (14pt = 약 0.5cm)
-                SAFETY_MARGIN = 14
-
-                # 마커부터 본문 끝까지의 거리
-                distance_to_content_end = content_end - vertical_position
-
-                # 사용 가능한 높이 = (본문 끝 - 마커 위치 - 안전 여유) × 90%
-                raw_available_height = distance_to_content_end - SAFETY_MARGIN
-                available_height = raw_available_height * 0.90  # 90% 적용
-
-                self.log(f"  📍 사용 가능 높이: {available_height:.1f}pt ({available_height/28.35:.1f}cm) [90% 적용]")
-
-                # 마커 삭제
-                word_app.Selection.Text = ""
-
-                # 클립보드의 그림 붙여넣기
-                word_app.Selection.Paste()
-
-                # 방금 붙여넣은 그림 찾기
-                picture = None
-
-                # 방법 1: InlineShape 확인 (일반적인 경우)
-                if word_app.Selection.InlineShapes.Count > 0:
-                    picture = word_app.Selection.InlineShapes(1)
-
-                # 방법 2: Range의 InlineShape 확인 (표 안의 경우)
-                elif word_app.Selection.Range.InlineShapes.Count > 0:
-                    picture = word_app.Selection.Range.InlineShapes(1)
-
-                # 방법 3: 셀을 선택한 후 InlineShape 확인 (표 셀 안)
-                else:
-                    try:
-                        # 커서를 한 칸 뒤로 이동하여 방금 삽입한 이미지 선택
-                        word_app.Selection.MoveLeft(Unit=1, Count=1, Extend=1)
-                        if word_app.Selection.InlineShapes.Count > 0:
-                            picture = word_app.Selection.InlineShapes(1)
-                    except:
-                        pass
-
-                if picture is not None:
-                    # 원본 크기 저장
-                    original_width = picture.Width
-                    original_height = picture.Height
-                    aspect_ratio = original_height / original_width
-
-                    # 기본 너비를 16.5cm로 설정
-                    target_width_cm = 16.5
-                    target_width_pt = target_width_cm * 28.35  # 467.72pt
-
-                    # 16.5cm 너비에 맞춘 세로 높이 계산
-                    calculated_height = target_width_pt * aspect_ratio
-
-                    if calculated_height > available_height:
-                        # 페이지를 넘어가는 경우 → 자동 크기 조정
-                        target_height = available_height
-                        target_width = target_height / aspect_ratio
-
-                        picture.Height = target_height
-                        picture.Width = target_width
-
-                        self.log(f"  ✓ 크기 자동 조정: {target_width/28.35:.1f}cm × {target_height/28.35:.1f}cm")
-                    else:
-                        # 페이지 내 수용 가능 → 16.5cm 기본 크기 유지
-                        picture.Width = target_width_pt
-                        picture.Height = calculated_height
-                        self.log(f"  ✓ 기본 크기 적용: 16.5cm × {calculated_height/28.35:.1f}cm")
-                else:
-                    # ★★★ 이미지 객체를 찾을 수 없는 경우 - 명확한 에러 처리 ★★★
-                    # picture is None이면 클립보드가 비어있거나 붙여넣기 실패
-                    error_msg = f"붙여넣기 후 이미지 객체를 찾을 수 없음 (클립보드 비어있음 또는 COM 오류)"
-                    self.log(f"  ❌ 삽입 실패 [{marker}]: {error_msg}")
-                    return False, error_msg
-
-                self.log(f"  ✓ 그림 삽입 성공: {marker}")
-                return True, None
-            else:
-                error_msg = f"마커를 Word 문서에서 찾을 수 없음"
-                self.log(f"  ✗ 삽입 실패 [{marker}]: {error_msg}")
-                return False, error_msg
-
-        except Exception as e:
-            error_msg = str(e)
-            self.log(f"  ✗ 삽입 실패 [{marker}]: {error_msg}")
-            import traceback
-            self.log(f"  상세: {traceback.format_exc()}")
-            return False, error_msg
+        """로그 출력 (logger 기록은 ExcelRangeProcessor가 수행)"""
+        self.channel.put(message)
 
     def run(self):
         """메인 처리 - 엑셀-워드 다중 파일 처리"""
-        result = {
-            'success': False,
-            'message': '',
-            'images_inserted': 0,
-            'images_failed': 0,
-            'failed_markers': [],
-            'output_files': [],
-            'elapsed_time': 0
-        }
-
-        # 시작 시간 기록
-        start_time = time.time()
-
+        tracer = Tracer('tab2') if self.trace else None
+        set_tracer(tracer)
+        profiler = MemoryProfiler('tab2') if self.memory else None
+        set_memory_profiler(profiler)
+        if profiler is not None:
+            profiler.start()
         try:
-            self.log("=" * 60)
-            self.log("엑셀-워드 다중 파일 처리 시작")
-            self.log("=" * 60)
-            self.log(f"엑셀 파일: {len(self.excel_files)}개")
-            self.log(f"워드 파일: {len(self.word_files)}개\n")
-
-            # 워드 파일별로 복사본 생성
-            word_copy_files = []
-            for word_file in self.word_files:
-                copy_file = self.create_word_copy(word_file)
-                if copy_file:
-                    word_copy_files.append(copy_file)
-                    result['output_files'].append(copy_file)
-                else:
-                    self.log(f"✗ 워드 복사 실패: {os.path.basename(word_file)}")
-
-            if not word_copy_files:
-                raise Exception("워드 복사본 생성 실패")
-
-            self.log(f"\n✓ {len(word_copy_files)}개 워드 복사본 생성 완료\n")
-
-            # 워드 파일별로 처리 (Word 기준 방식)
-            for word_copy_index, word_copy_file in enumerate(word_copy_files, 1):
-                self.log("\n" + "=" * 60)
-                self.log(f"[{word_copy_index}/{len(word_copy_files)}] 워드 파일 처리")
-                self.log("=" * 60)
-                self.log(f"파일: {os.path.basename(word_copy_file)}")
-
-                word = None
-                doc = None
-
-                try:
-                    # Word 애플리케이션 생성 (한 번만)
-                    word = self.create_word_app_with_retry(max_retries=3)
-                    doc = word.Documents.Open(os.path.abspath(word_copy_file))
-                    self.log(f"✓ 워드 파일 열기 완료")
-
-                    # 모든 엑셀 파일 처리
-                    for excel_index, excel_file in enumerate(self.excel_files, 1):
-                        self.log(f"\n  [{excel_index}/{len(self.excel_files)}] 엑셀 파일: {os.path.basename(excel_file)}")
-
-                        # 엑셀 파일명에서 접미사 추출
-                        suffix = self.extract_suffix(os.path.basename(excel_file))
-
-                        if not suffix:
-                            self.log(f"  ⚠️ 접미사를 찾을 수 없음 - 건너뜀")
-                            continue
-
-                        self.log(f"  ✓ 접미사: {suffix}")
-
-                        # Excel 열기
-                        excel = None
-                        wb = None
-
-                        try:
-                            # Excel 애플리케이션 생성 (재시도 로직 포함)
-                            excel = self.create_excel_app_with_retry(max_retries=3)
-                            wb = excel.Workbooks.Open(os.path.abspath(excel_file))
-                            self.log(f"  ✓ 엑셀 파일 열기 완료")
-
-                            # RANGE_CONFIG에서 설정 가져오기
-                            if suffix in RANGE_CONFIG:
-                                config_list = RANGE_CONFIG[suffix]
-                                self.log(f"  ✓ {suffix} 설정 사용 ({len(config_list)}개 항목)")
-
-                                for config in config_list:
-                                    sheet_name = config['sheet']
-                                    range_address = config['range']
-                                    marker_prefix = config['marker']
-                                    marker = f"{marker_prefix}_{suffix}"
-
-                                    self.log(f"    처리 중: [{sheet_name}] {range_address} → {marker}")
-
-                                    # 엑셀 범위를 그림으로 복사 (클립보드)
-                                    if self.copy_range_as_picture(wb, sheet_name, range_address):
-                                        # Word에 붙여넣기
-                                        success, error_msg = self.paste_picture_at_marker(word, marker)
-                                        if success:
-                                            result['images_inserted'] += 1
-                                            # 이미지 삽입 후 짧은 대기 (Word 과부하 방지 및 안정화)
-                                            time.sleep(0.05)
-                                        else:
-                                            result['images_failed'] += 1
-                                            result['failed_markers'].append({
-                                                'excel_file': os.path.basename(excel_file),
-                                                'word_file': os.path.basename(word_copy_file),
-                                                'marker': marker,
-                                                'sheet': sheet_name,
-                                                'range': range_address,
-                                                'reason': error_msg or '알 수 없는 오류'
-                                            })
-                                    else:
-                                        result['images_failed'] += 1
-                                        result['failed_markers'].append({
-                                            'excel_file': os.path.basename(excel_file),
-                                            'word_file': os.path.basename(word_copy_file),
-                                            'marker': marker,
-                                            'sheet': sheet_name,
-                                            'range': range_address,
-                                            'reason': '엑셀 범위 복사 실패 (숨김 시트 또는 오류)'
-                                        })
-                            else:
-                                # GUI 테이블 사용 (Fallback)
-                                self.log(f"  ⚠️ {suffix} 설정이 없음 - GUI 테이블 사용")
-
-                                for mapping in self.mappings:
-                                    sheet_name = mapping['sheet']
-                                    range_address = mapping['range']
-                                    marker_prefix = mapping['marker']
-                                    marker = f"{marker_prefix}_{suffix}"
-
-                                    self.log(f"    처리 중: [{sheet_name}] {range_address} → {marker} (GUI)")
-
-                                    if self.copy_range_as_picture(wb, sheet_name, range_address):
-                                        success, error_msg = self.paste_picture_at_marker(word, marker)
-                                        if success:
-                                            result['images_inserted'] += 1
-                                            time.sleep(0.05)
-                                        else:
-                                            result['images_failed'] += 1
-                                            result['failed_markers'].append({
-                                                'excel_file': os.path.basename(excel_file),
-                                                'word_file': os.path.basename(word_copy_file),
-                                                'marker': marker,
-                                                'sheet': sheet_name,
-                                                'range': range_address,
-                                                'reason': error_msg or '알 수 없는 오류'
-                                            })
-                                    else:
-                                        result['images_failed'] += 1
-                                        result['failed_markers'].append({
-                                            'excel_file': os.path.basename(excel_file),
-                                            'word_file': os.path.basename(word_copy_file),
-                                            'marker': marker,
-                                            'sheet': sheet_name,
-                                            'range': range_address,
-                                            'reason': '엑셀 범위 복사 실패'
-                                        })
-
-                        finally:
-                            # 엑셀 정리 (각 Excel 파일 처리 후)
-                            if wb is not None:
-                                try:
-                                    wb.Close(SaveChanges=False)
-                                except:
-                                    pass
-
-                            if excel is not None:
-                                try:
-                                    excel.Quit()
-                                    self.log(f"  ✓ Excel Application 정리 완료")
-                                except Exception as e:
-                                    self.log(f"  ⚠️ Excel Application 정리 중 오류: {str(e)}")
-
-                            # 참조 제거
-                            wb = None
-                            excel = None
-
-                                            # 이미지 삽입 후 짧은 대기 (Word 과부하 방지 및 안정화)
-                            # Excel 파일 간 짧은 대기
-                            gc.collect()
-                            time.sleep(0.3)
-
-                    # 모든 엑셀 파일 처리 완료 - 워드 저장
-                    if doc is not None:
-                        try:
-                            # Word가 안정화될 시간 주기
-                            time.sleep(0.5)
-                            doc.Save()
-                            self.log(f"\n✓ 워드 저장 완료: {os.path.basename(word_copy_file)}")
-                        except Exception as e:
-                            self.log(f"\n✗ 워드 저장 오류: {str(e)}")
-                            # 저장 실패해도 계속 진행 (파일은 이미 수정됨)
-
-                finally:
-                    # 워드 정리 (각 Word 파일 처리 후)
-                    if doc is not None:
-                        try:
-                            doc.Close(SaveChanges=False)  # 이미 Save() 호출했으므로
-                        except:
-                            pass
-
-                    if word is not None:
-                        try:
-                            word.Quit()
-                            self.log(f"✓ Word Application 정리 완료")
-                        except Exception as e:
-                            self.log(f"⚠️ Word Application 정리 중 오류: {str(e)}")
-
-                    # 참조 제거
-                    doc = None
-                    word = None
-
-                    # COM 정리 및 가비지 컬렉션 (다음 Word 파일 처리 전)
-                    gc.collect()
-                    try:
-                        pythoncom.CoUninitialize()
-                    except:
-                        pass
-                    time.sleep(1.0)  # Word 파일 간 대기 시간
-
-            # 종료 시간 기록 및 경과 시간 계산
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-            result['elapsed_time'] = elapsed_time
-
-            minutes = int(elapsed_time // 60)
-            seconds = int(elapsed_time % 60)
-
-            # 최종 결과 출력
-            self.log("\n" + "=" * 60)
-            self.log("전체 처리 완료")
-            self.log("=" * 60)
-            self.log(f"처리 시간: {minutes}분 {seconds}초")
-            self.log(f"생성된 워드 파일: {len(result['output_files'])}개")
-            self.log(f"삽입 성공: {result['images_inserted']}개")
-            self.log(f"삽입 실패: {result['images_failed']}개")
-
-            # 생성된 파일 목록
-            if result['output_files']:
-                self.log("\n생성된 파일 목록:")
-                for idx, file in enumerate(result['output_files'], 1):
-                    self.log(f"  {idx}. {os.path.basename(file)}")
-
-            # 실패한 마커 상세 정보
-            if result['failed_markers']:
-                self.log("\n" + "-" * 60)
-                self.log("실패한 마커 목록:")
-                self.log("-" * 60)
-                for idx, failed in enumerate(result['failed_markers'], 1):
-                    self.log(f"{idx}. 엑셀: {failed['excel_file']} → 워드: {failed['word_file']}")
-                    self.log(f"   마커: {failed['marker']}, 시트: {failed['sheet']}, 범위: {failed['range']}")
-                    self.log(f"   실패 이유: {failed['reason']}")
-
-            result['success'] = True
-            result['message'] = "처리 완료"
-
+            processor = ParallelRangeProcessor(
+                self.excel_files,
+                self.word_files,
+                self.mappings,
+                RANGE_CONFIG,
+                workers=self.workers,
+                backend='com',
+                backend_options={'recycle_after': self.recycle_after, 'sizing_mode': self.sizing_mode},
+                log_callback=self.log,
+                export_mode=self.export_mode,
+                cancel_token=self.cancel_token,
+            )
+            result = processor.run()
         except Exception as e:
+            # 처리기 생성/Office 시작 실패 등 - 완료 시그널은 반드시 보내야 Tab 2가 실행 상태에서 풀림
             self.log(f"\n✗ 치명적 오류 발생: {str(e)}")
-            import traceback
             self.log(f"상세 오류:\n{traceback.format_exc()}")
-            result['message'] = f"오류: {str(e)}"
-
+            result = {'success': False, 'message': f"오류: {str(e)}", 'output_files': []}
         finally:
-            # 최종 안전 정리
-            self.log("\n최종 정리 작업 중...")
-
-            # 최종 COM 정리
-            gc.collect()
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
-
-            try:
-                os.rmdir(self.temp_dir)
-            except:
-                pass
-
+            set_tracer(None)
+            set_memory_profiler(None)
+            if profiler is not None:
+                profiler.stop()
+        if tracer is not None:
+            result['trace_file'] = write_trace(tracer, default_trace_path('tab2'), self.log)
+        if profiler is not None:
+            result['memory_report'] = write_memory_report(profiler, default_memory_report_path('tab2'), self.log)
         self.finished.emit(result)
 
 
@@ -2579,12 +999,17 @@ class ExcelRangeInserterTab(QWidget):
         self.word_files = []
         self.mappings = []
         self.worker = None
+        self.log_channel = None  # 작업 중 로그 버퍼 (log_channel.py)
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_timer.timeout.connect(self.flush_log_channel)
 
         # Load configuration
         global RANGE_CONFIG
         RANGE_CONFIG = self.load_or_create_config()
 
         self.setup_ui()
+        self.log_config_issues()
 
     def setup_ui(self):
         """UI 구성"""
@@ -2646,6 +1071,41 @@ class ExcelRangeInserterTab(QWidget):
         load_config_btn = QPushButton("📥 불러오기")
         load_config_btn.clicked.connect(self.load_config_to_table)
         suffix_layout.addWidget(load_config_btn)
+
+        # 범위 변환 방식 (파일 방식은 클립보드를 사용하지 않아 다른 작업과 동시 실행 가능)
+        suffix_layout.addSpacing(20)
+        suffix_layout.addWidget(QLabel("변환 방식:"))
+        self.export_mode_combo = QComboBox()
+        self.export_mode_combo.addItem("클립보드 (기존)", EXPORT_MODE_CLIPBOARD)
+        self.export_mode_combo.addItem("파일 (클립보드 미사용)", EXPORT_MODE_FILE)
+        suffix_layout.addWidget(self.export_mode_combo)
+
+        # 병렬 작업자 수 (파일 방식에서만 적용, Word 파일 단위로 분할)
+        suffix_layout.addSpacing(20)
+        suffix_layout.addWidget(QLabel("작업자:"))
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, default_worker_count())
+        self.workers_spin.setValue(1)
+        self.workers_spin.setToolTip("파일 방식에서 Word 파일을 나누어 동시에 처리할 프로세스 수")
+        suffix_layout.addWidget(self.workers_spin)
+
+        # 그림 크기 계산 방식 (모델: Word 레이아웃 조회 없이 페이지 설정/셀 너비로 계산)
+        suffix_layout.addSpacing(20)
+        suffix_layout.addWidget(QLabel("크기 계산:"))
+        self.sizing_mode_combo = QComboBox()
+        self.sizing_mode_combo.addItem("Word 측정 (기존)", SIZING_MODE_COM)
+        self.sizing_mode_combo.addItem("페이지 설정 모델", SIZING_MODE_MODEL)
+        self.sizing_mode_combo.addItem("비교 (로그 기록)", SIZING_MODE_COMPARE)
+        suffix_layout.addWidget(self.sizing_mode_combo)
+
+        # 단계별 소요 시간 기록 (logs/trace_tab2_*.json + 로그에 요약 표)
+        suffix_layout.addSpacing(20)
+        self.trace_check = QCheckBox("trace")
+        self.trace_check.setToolTip("Office 시작/종료, 범위 복사, 마커 붙여넣기, 저장 구간을 Chrome trace JSON으로 저장")
+        suffix_layout.addWidget(self.trace_check)
+        self.memory_check = QCheckBox("메모리")
+        self.memory_check.setToolTip("단계 경계별 RSS/tracemalloc 기록 (logs/memory_tab2_*.json, 처리 속도 느려짐)")
+        suffix_layout.addWidget(self.memory_check)
         suffix_layout.addStretch()
         left_column.addLayout(suffix_layout)
 
@@ -2816,11 +1276,10 @@ class ExcelRangeInserterTab(QWidget):
         log_layout.setSpacing(8)
         log_group.setLayout(log_layout)
 
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogView()
         self.log_text.setFont(QFont("Consolas", 9))
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 border: 1px solid #dcdde1;
                 border-radius: 4px;
                 background-color: #2c3e50;
@@ -2873,7 +1332,34 @@ class ExcelRangeInserterTab(QWidget):
             }
         """)
         self.run_btn.clicked.connect(self.run_process)
-        main_layout.addWidget(self.run_btn)
+
+        # 중지 버튼 (작업 중에만 활성화 - Office 종료와 임시 파일 정리 후 멈춤)
+        self.stop_btn = QPushButton("■ 중지")
+        self.stop_btn.setMinimumHeight(45)
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #c0392b;
+                color: white;
+                border: none;
+                padding: 10px;
+                border-radius: 6px;
+                font-weight: bold;
+                font-size: 12pt;
+            }
+            QPushButton:hover {
+                background-color: #a93226;
+            }
+            QPushButton:disabled {
+                background-color: #bdc3c7;
+            }
+        """)
+        self.stop_btn.clicked.connect(self.cancel_process)
+
+        run_layout = QHBoxLayout()
+        run_layout.addWidget(self.run_btn, 4)
+        run_layout.addWidget(self.stop_btn, 1)
+        main_layout.addLayout(run_layout)
 
         # 진행 표시줄
         self.progress_bar = QProgressBar()
@@ -2987,6 +1473,7 @@ class ExcelRangeInserterTab(QWidget):
             self.suffix_combo.clear()
             self.suffix_combo.addItems(sorted(RANGE_CONFIG.keys()))
             self.log_text.append(f"✓ 설정 파일 새로고침 완료: {len(RANGE_CONFIG)}개 접미사")
+            self.log_config_issues()
             QMessageBox.information(self, "완료", "설정 파일을 새로고침했습니다.")
         else:
             QMessageBox.critical(self, "오류", "설정 파일 로드에 실패했습니다.")
@@ -3008,8 +1495,10 @@ class ExcelRangeInserterTab(QWidget):
             QMessageBox.warning(self, "경고", "테이블이 비어있습니다.")
             return
 
-        # RANGE_CONFIG 업데이트
+        # RANGE_CONFIG 업데이트 (인덱스/검사 재생성)
         RANGE_CONFIG[current_suffix] = config_list
+        RANGE_CONFIG = compile_range_config(RANGE_CONFIG)
+        self.log_config_issues()
 
         # 엑셀 파일로 저장
         if self.save_config_to_excel_file(RANGE_CONFIG, CONFIG_FILE_PATH):
@@ -3089,31 +1578,69 @@ class ExcelRangeInserterTab(QWidget):
 
         # UI 업데이트
         self.run_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
         self.log_text.clear()
 
         # 상태 바 업데이트
         self.status_update.emit("⏳ 처리 중... 잠시만 기다려주세요")
 
-        # 워커 스레드 시작
-        self.worker = ExcelRangeProcessorThread(self.excel_files, self.word_files, mappings)
-        self.worker.progress.connect(self.update_log)
+        # 워커 스레드 시작 (로그는 채널에 모았다가 주기적으로 화면에 추가)
+        self.log_channel = LogChannel('tab2')
+        self.log_timer.start()
+        self.worker = ExcelRangeProcessorThread(
+            self.excel_files, self.word_files, mappings, self.log_channel,
+            export_mode=self.export_mode_combo.currentData(),
+            workers=self.workers_spin.value(),
+            sizing_mode=self.sizing_mode_combo.currentData(),
+            trace=self.trace_check.isChecked(),
+            memory=self.memory_check.isChecked()
+        )
         self.worker.finished.connect(self.process_finished)
         self.worker.start()
 
-    def update_log(self, message):
-        """로그 업데이트"""
-        self.log_text.append(message)
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+    def running_workers(self):
+        """실행 중인 작업 스레드 목록 (창 닫기 시 취소용)"""
+        return [self.worker] if self.worker is not None and self.worker.isRunning() else []
+
+    def cancel_process(self):
+        """중지 요청 (작업 스레드가 다음 범위/파일 경계에서 Office 정리 후 종료)"""
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+            self.stop_btn.setEnabled(False)
+            self.log_text.append("⏹ 중지 요청 - 현재 범위 처리 후 정리합니다...")
+            self.status_update.emit("⏹ 중지 중...")
+
+    def flush_log_channel(self):
+        """채널에 쌓인 로그를 한 번에 화면에 추가"""
+        if self.log_channel is not None:
+            lines, _ = self.log_channel.drain()
+            self.log_text.append_lines(lines)
 
     def process_finished(self, result):
         """처리 완료"""
+        self.log_timer.stop()
+        self.flush_log_channel()
+        if self.log_channel is not None:
+            self.log_channel.close()
+            if self.log_channel.log_path:
+                self.log_text.append(f"전체 로그: {self.log_channel.log_path}")
+            self.log_channel = None
+
         self.run_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
 
-        if result['success']:
+        if result.get('cancelled'):
+            latency = result.get('cancel_latency')
+            latency_text = f" (중지 요청 → 정리 완료 {latency:.2f}초)" if latency is not None else ""
+            self.status_update.emit(f"⏹ 중지됨{latency_text}")
+            QMessageBox.information(
+                self, "중지됨",
+                f"작업이 중지되었습니다{latency_text}.\n\n"
+                f"저장 완료된 워드 파일: {len(result['output_files'])}개 (미완성 복사본은 삭제됨)"
+            )
+        elif result['success']:
             # 처리 시간 포맷팅
             elapsed_time = result.get('elapsed_time', 0)
             minutes = int(elapsed_time // 60)
@@ -3137,6 +1664,13 @@ class ExcelRangeInserterTab(QWidget):
                     failed_list += f"\n  ... 외 {len(result['failed_markers']) - 5}개"
                 msg += f"\n실패한 마커:\n{failed_list}\n\n(자세한 내용은 로그 확인)\n"
 
+            # 실패한 작업자 샤드가 있으면 표시 (나머지 샤드 결과는 유효)
+            if result.get('failed_shards'):
+                shard_list = "\n".join(
+                    [f"  • W{s['shard']}: {', '.join(s['word_files'])}" for s in result['failed_shards']]
+                )
+                msg += f"\n실패한 작업자:\n{shard_list}\n"
+
             if result['output_files']:
                 msg += f"\n생성된 파일 목록:\n"
                 for f in result['output_files'][:3]:
@@ -3158,40 +1692,40 @@ class ExcelRangeInserterTab(QWidget):
             return self.load_config_from_excel()
         else:
             self.create_default_config_file()
-            return DEFAULT_RANGE_CONFIG.copy()
+            from default_range_config import DEFAULT_RANGE_CONFIG
+            return compile_range_config(DEFAULT_RANGE_CONFIG)
 
     def load_config_from_excel(self):
-        """Excel 설정 파일 로드"""
+        """Excel 설정 파일 로드 (컴파일 캐시 사용, range_config_cache 참고)"""
         try:
-            wb = load_workbook(CONFIG_FILE_PATH)
-            config = {}
-
-            for sheet_name in wb.sheetnames:
-                if sheet_name.startswith("#"):
-                    suffix = sheet_name
-                    config[suffix] = []
-
-                    ws = wb[sheet_name]
-                    for row in ws.iter_rows(min_row=2, values_only=True):
-                        if row[0]:  # Sheet name exists
-                            config[suffix].append({
-                                "sheet": str(row[0]),
-                                "range": str(row[1]),
-                                "marker": str(row[2]),
-                                "category": str(row[3]) if len(row) > 3 and row[3] else ""
-                            })
-
-            wb.close()
-            logger.info(f"✓ 설정 파일 로드 완료: {len(config)}개 접미사")
+            config, from_cache = load_range_config(CONFIG_FILE_PATH)
+            source = "캐시" if from_cache else "엑셀"
+            logger.info(f"✓ 설정 파일 로드 완료 ({source}): {len(config)}개 접미사")
             return config
         except Exception as e:
             logger.error(f"설정 파일 로드 실패: {e}")
-            return DEFAULT_RANGE_CONFIG.copy()
+            from default_range_config import DEFAULT_RANGE_CONFIG
+            return compile_range_config(DEFAULT_RANGE_CONFIG)
+
+    def log_config_issues(self):
+        """설정 검사 결과 (중복 마커/겹치는 범위) 로그 출력 - 화면에는 처음 5건만"""
+        issues = getattr(RANGE_CONFIG, 'issues', [])
+        for issue in issues:
+            logger.warning(f"⚠️ 설정 확인 필요 - {issue}")
+
+        if issues and hasattr(self, 'log_text'):
+            self.log_text.append(f"⚠️ 설정 확인 필요: {len(issues)}건 (중복 마커/범위 겹침)")
+            for issue in issues[:5]:
+                self.log_text.append(f"  • {issue}")
+            if len(issues) > 5:
+                self.log_text.append(f"  ... 외 {len(issues) - 5}건 (전체 목록은 로그 참고)")
 
     def create_default_config_file(self):
         """기본 설정 파일 생성"""
         try:
+            from openpyxl import Workbook
             from openpyxl.styles import Font, PatternFill, Alignment
+            from default_range_config import DEFAULT_RANGE_CONFIG
 
             wb = Workbook()
             wb.remove(wb.active)
@@ -3230,6 +1764,7 @@ class ExcelRangeInserterTab(QWidget):
     def save_config_to_excel_file(self, config, file_path):
         """RANGE_CONFIG를 엑셀 파일로 저장"""
         try:
+            from openpyxl import Workbook
             from openpyxl.styles import Font, PatternFill, Alignment
 
             wb = Workbook()
@@ -3295,6 +1830,9 @@ class ExcelRangeInserterTab(QWidget):
             wb.save(file_path)
             wb.close()
             logger.info(f"✓ 설정 파일 저장 완료: {file_path}")
+
+            # 다음 실행 시 엑셀을 다시 파싱하지 않도록 캐시 갱신
+            write_cache(file_path, {suffix: list(items) for suffix, items in config.items()})
             return True
 
         except Exception as e:
@@ -3308,6 +1846,9 @@ class ExcelRangeInserterTab(QWidget):
 
 def main():
     """메인 애플리케이션 실행"""
+    # 실행 파일로 패키징된 경우 작업자 프로세스 지원
+    multiprocessing.freeze_support()
+
     app = QApplication(sys.argv)
 
     # Set application font
@@ -0,0 +1,84 @@
+# log_channel.py
+# 작업 스레드 → GUI 로그/진행률 채널 (Qt 비의존)
+# - 작업 스레드는 메시지를 버퍼에 넣기만 함 (줄마다 시그널/화면 갱신 없음)
+# - GUI 스레드가 일정 주기로 drain()하여 한 번에 화면에 추가 (진행률은 마지막 값만 전달)
+# - 전체 로그는 작업별 파일(logs/)에 기록 - 화면에는 최근 줄만 유지
+
+import os
+import threading
+from datetime import datetime
+
+
+# 전체 로그 저장 폴더 (프로그램 폴더 아래)
+LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+
+# GUI 갱신 주기 (밀리초) / 화면에 유지할 최대 줄 수
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_VIEW_MAX_LINES = 5000
+
+
+class LogChannel:
+    """
+    로그/진행률 채널
+
+    Args:
+        name: 로그 파일 이름 앞부분 (예: 'tab1' → logs/tab1_20250101_120000.log), None이면 파일 기록 안 함
+        timestamps: True이면 줄마다 [시각] 접두사
+        log_dir: 로그 파일 폴더
+    """
+
+    def __init__(self, name=None, timestamps=False, log_dir=LOG_DIR):
+        self.name = name
+        self.timestamps = timestamps
+        self._lock = threading.Lock()
+        self._lines = []
+        self._progress = None
+        self._file = None
+        self.log_path = None
+        self.total_lines = 0
+
+        if name:
+            try:
+                os.makedirs(log_dir, exist_ok=True)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                self.log_path = os.path.join(log_dir, f"{name}_{timestamp}.log")
+                self._file = open(self.log_path, 'a', encoding='utf-8')
+            except OSError:
+                self.log_path = None  # 파일 기록 실패는 화면 로그에 영향 없음
+
+    def put(self, message):
+        """로그 추가 (어느 스레드에서나 호출 가능)"""
+        message = str(message)
+        if self.timestamps:
+            message = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}"
+        with self._lock:
+            self._lines.append(message)
+            self.total_lines += 1
+            if self._file is not None:
+                self._file.write(message + '\n')
+
+    def set_progress(self, value):
+        """진행률 갱신 (drain 전까지 마지막 값만 유지)"""
+        with self._lock:
+            self._progress = value
+
+    def drain(self):
+        """
+        버퍼에 쌓인 로그와 마지막 진행률 꺼내기 (GUI 스레드에서 주기적으로 호출)
+
+        Returns:
+            (줄 리스트, 진행률 또는 None)
+        """
+        with self._lock:
+            lines, self._lines = self._lines, []
+            progress, self._progress = self._progress, None
+            if self._file is not None and lines:
+                self._file.flush()
+        return lines, progress
+
+    def close(self):
+        """로그 파일 닫기 (남은 버퍼는 drain으로 먼저 꺼낼 것)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
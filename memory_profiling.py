@@ -0,0 +1,328 @@
+# memory_profiling.py
+# 단계 경계 메모리 측정 (선택 기능)
+# - tracemalloc 스냅샷과 프로세스 RSS를 단계 경계(checkpoint)마다 기록
+# - 직전 경계 대비 가장 많이 늘어난 할당 위치(파일:줄) 상위 N개 기록
+# - 결과: JSON 보고서 + 경계별 RSS/파이썬 힙/최대값 요약 표
+# - 작업 스레드마다 현재 측정기를 지정 (꺼져 있으면 memory_checkpoint()는 아무것도 하지 않음)
+#
+# 사용 예:
+#   profiler = MemoryProfiler()
+#   set_memory_profiler(profiler)
+#   profiler.start()
+#   ...
+#   memory_checkpoint('document_opened', file=path)
+#   ...
+#   profiler.stop()
+#   set_memory_profiler(None)
+#   profiler.export_report('memory.json')
+
+import os
+import sys
+import json
+import time
+import threading
+import tracemalloc
+from datetime import datetime
+
+
+# 상위 할당 위치 개수 / 스냅샷에 보관할 호출 스택 깊이
+DEFAULT_TOP_ALLOCATORS = 10
+DEFAULT_TRACE_FRAMES = 1
+
+# 측정기 자체와 import 과정의 할당은 상위 목록에서 제외
+# (Snapshot.filter_traces/compare_to는 블록 수에 비례해 느리므로 줄 단위 통계에서 직접 거름)
+_EXCLUDED_FILES = frozenset((
+    tracemalloc.__file__,
+    __file__,
+    '<frozen importlib._bootstrap>',
+    '<frozen importlib._bootstrap_external>',
+    '<unknown>',
+))
+
+_local = threading.local()
+
+# tracemalloc은 프로세스에 하나 - 같은 프로세스에서 동시에 측정하는 측정기끼리 공유
+# (측정기가 켠 tracemalloc은 마지막 측정기가 끝날 때 끔, 전역 최대값은 측정기마다 나눠 기록)
+_tracing_lock = threading.Lock()
+_active_profilers = set()
+_owns_tracemalloc = False
+
+
+# ===================================================================
+# PROCESS MEMORY
+# ===================================================================
+
+def _windows_memory_counters():
+    """Windows 프로세스 메모리 정보 (PROCESS_MEMORY_COUNTERS)"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return None
+    return counters
+
+
+def current_rss_bytes():
+    """현재 프로세스 RSS (측정할 수 없으면 None)"""
+    if sys.platform == 'win32':
+        counters = _windows_memory_counters()
+        return counters.WorkingSetSize if counters else None
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_bytes():
+    """현재 프로세스의 최대 RSS (측정할 수 없으면 None)"""
+    if sys.platform == 'win32':
+        counters = _windows_memory_counters()
+        return counters.PeakWorkingSetSize if counters else None
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def _mb(value):
+    return round(value / (1024 * 1024), 2) if value is not None else None
+
+
+# ===================================================================
+# PROFILER
+# ===================================================================
+
+def set_memory_profiler(profiler):
+    """현재 스레드의 메모리 측정기 지정 (None이면 해제)"""
+    _local.profiler = profiler
+
+
+def current_memory_profiler():
+    """현재 스레드의 메모리 측정기 (없으면 None)"""
+    return getattr(_local, 'profiler', None)
+
+
+def _fold_peak():
+    """전역 최대값을 측정 중인 모든 측정기의 구간 최대값에 반영 후 초기화 (_tracing_lock 안에서 호출)
+
+    Returns:
+        현재 파이썬 힙 크기
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for profiler in _active_profilers:
+        profiler._interval_peak = max(profiler._interval_peak, peak)
+    return current
+
+
+def memory_checkpoint(label, **args):
+    """현재 스레드 측정기에 단계 경계 기록 (측정기가 없으면 비용 없음)"""
+    profiler = current_memory_profiler()
+    if profiler is not None:
+        profiler.checkpoint(label, **args)
+
+
+class MemoryProfiler:
+    """
+    단계 경계 메모리 측정기
+
+    tracemalloc은 프로세스 전체에 적용되므로 같은 프로세스의 다른 스레드 할당도 포함됩니다.
+    여러 측정기가 동시에 측정해도 됩니다 (tracemalloc은 마지막 측정기가 끝날 때 끄고,
+    최대 힙은 측정기마다 자기 직전 경계 이후 값으로 기록).
+
+    Args:
+        name: 보고서 이름
+        top: 경계마다 기록할 상위 할당 위치 개수
+        frames: tracemalloc 호출 스택 깊이 (깊을수록 정확하지만 느림)
+
+    경계마다 힙 전체 통계를 계산하므로 경계 하나에 수백 ms가 걸릴 수 있습니다 (측정 모드 전용).
+    """
+
+    def __init__(self, name=None, top=DEFAULT_TOP_ALLOCATORS, frames=DEFAULT_TRACE_FRAMES):
+        self.name = name
+        self.top = top
+        self.frames = frames
+        self._lock = threading.Lock()
+        self._checkpoints = []
+        self._previous = None
+        self._interval_peak = 0  # 직전 경계 이후 최대 힙 (_fold_peak가 갱신)
+        self._start_time = None
+
+    def start(self):
+        """측정 시작 (tracemalloc이 꺼져 있으면 켬) + 기준 경계 기록"""
+        global _owns_tracemalloc
+        if self._start_time is not None:
+            return
+        with _tracing_lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                _owns_tracemalloc = True
+            self._interval_peak = _fold_peak()
+            _active_profilers.add(self)
+        self._start_time = time.perf_counter()
+        self.checkpoint('start')
+
+    def stop(self):
+        """마지막 경계 기록 후 측정 종료 (측정기가 켠 tracemalloc은 마지막 측정기가 끝날 때만 끔)"""
+        global _owns_tracemalloc
+        if self._start_time is None:
+            return
+        self.checkpoint('end')
+        self._previous = None
+        with _tracing_lock:
+            _active_profilers.discard(self)
+            if not _active_profilers and _owns_tracemalloc:
+                tracemalloc.stop()
+                _owns_tracemalloc = False
+        self._start_time = None
+
+    def checkpoint(self, label, **args):
+        """단계 경계 기록 - RSS, 파이썬 힙(현재/직전 경계 이후 최대), 직전 경계 대비 상위 할당 위치"""
+        if self._start_time is None or not tracemalloc.is_tracing():
+            return
+
+        with self._lock:
+            with _tracing_lock:
+                # 전역 최대값 초기화는 다른 측정기 구간에도 반영 (다음 경계의 최대값은 그 구간 안에서만)
+                current = _fold_peak()
+                peak = max(self._interval_peak, current)
+                self._interval_peak = current
+
+            # 줄 단위 크기만 보관 (스냅샷 전체를 들고 있지 않음)
+            sizes = {}
+            for stat in tracemalloc.take_snapshot().statistics('lineno'):
+                frame = stat.traceback[0]
+                if frame.filename not in _EXCLUDED_FILES:
+                    sizes[(frame.filename, frame.lineno)] = (stat.size, stat.count)
+
+            previous = self._previous or {}
+            growth = sorted(
+                ((size - previous.get(key, (0, 0))[0], key) for key, (size, _) in sizes.items()),
+                reverse=True
+            )[:self.top]
+            top = [
+                {
+                    'location': f"{filename}:{lineno}",
+                    'size_mb': _mb(sizes[(filename, lineno)][0]),
+                    'size_diff_mb': _mb(diff),
+                    'count': sizes[(filename, lineno)][1],
+                }
+                for diff, (filename, lineno) in growth
+            ]
+            self._previous = sizes
+
+            record = {
+                'label': label,
+                'seconds': round(time.perf_counter() - self._start_time, 3),
+                'pid': os.getpid(),
+                'rss_mb': _mb(current_rss_bytes()),
+                'peak_rss_mb': _mb(peak_rss_bytes()),
+                'python_current_mb': _mb(current),
+                'python_peak_mb': _mb(peak),
+                'top_allocators': top,
+            }
+            if args:
+                record['args'] = {key: str(value) for key, value in args.items()}
+            self._checkpoints.append(record)
+
+    def merge(self, checkpoints, process_name=None):
+        """다른 프로세스(병렬 작업자)의 경계 기록 합치기"""
+        if not checkpoints:
+            return
+        with self._lock:
+            for record in checkpoints:
+                record = dict(record)
+                if process_name:
+                    record['process'] = process_name
+                self._checkpoints.append(record)
+
+    @property
+    def checkpoints(self):
+        """기록된 경계 목록 (복사본)"""
+        with self._lock:
+            return list(self._checkpoints)
+
+    def report(self):
+        """보고서 dict - 경계 목록과 최대값"""
+        checkpoints = self.checkpoints
+        peak_rss = [c['peak_rss_mb'] for c in checkpoints if c['peak_rss_mb'] is not None]
+        peak_python = [c['python_peak_mb'] for c in checkpoints if c['python_peak_mb'] is not None]
+        return {
+            'name': self.name,
+            'peak_rss_mb': max(peak_rss) if peak_rss else None,
+            'python_peak_mb': max(peak_python) if peak_python else None,
+            'checkpoints': checkpoints,
+        }
+
+    def export_report(self, path):
+        """JSON 보고서 저장"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def summary_lines(self):
+        """경계별 요약 표와 가장 크게 늘어난 할당 위치 (로그 출력용 줄 목록)"""
+        report = self.report()
+        checkpoints = report['checkpoints']
+        if not checkpoints:
+            return []
+
+        def fmt(value):
+            return f"{value:9.1f}" if value is not None else f"{'-':>9s}"
+
+        lines = [f"{'경계':24s} {'시각(s)':>8s} {'RSS(MB)':>9s} {'최대RSS':>9s} {'힙(MB)':>9s} {'최대힙':>9s}"]
+        for record in checkpoints:
+            label = record['label'] if 'process' not in record else f"[{record['process']}] {record['label']}"
+            lines.append(
+                f"{label[:24]:24s} {record['seconds']:8.2f} {fmt(record['rss_mb'])} {fmt(record['peak_rss_mb'])} "
+                f"{fmt(record['python_current_mb'])} {fmt(record['python_peak_mb'])}"
+            )
+
+        # 전체 경계 중 가장 크게 늘어난 할당 위치
+        growth = {}
+        for record in checkpoints[1:]:
+            for item in record['top_allocators']:
+                if item['size_diff_mb'] and item['size_diff_mb'] > 0:
+                    growth[item['location']] = growth.get(item['location'], 0) + item['size_diff_mb']
+        if growth:
+            lines.append("증가량 상위 할당 위치:")
+            for location, size in sorted(growth.items(), key=lambda item: -item[1])[:5]:
+                lines.append(f"  {size:9.1f} MB  {location}")
+        return lines
+
+
+def write_memory_report(profiler, path, log_callback):
+    """메모리 보고서 저장 후 요약을 로그로 출력 (저장 실패는 작업 결과에 영향 없음)"""
+    try:
+        profiler.export_report(path)
+    except OSError as e:
+        log_callback(f"⚠️ 메모리 보고서 저장 실패: {str(e)}")
+        path = None
+    log_callback("\n단계별 메모리" + (f" (보고서: {path})" if path else ""))
+    for line in profiler.summary_lines():
+        log_callback(f"  {line}")
+    return path
+
+
+def default_memory_report_path(name, report_dir=None):
+    """작업별 메모리 보고서 경로 (기본: 로그 폴더의 memory_<name>_<시각>.json)"""
+    if report_dir is None:
+        from log_channel import LOG_DIR
+        report_dir = LOG_DIR
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(report_dir, f"memory_{name}_{timestamp}.json")
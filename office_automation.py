@@ -0,0 +1,1116 @@
+# office_automation.py
+# Tab 2 Office 자동화 계층
+# - OfficeAutomation: 통합문서 열기, 범위→그림, 문서 열기, 마커 찾기/삽입, 저장 인터페이스
+# - ComOfficeAutomation: win32com 기반 실제 Excel/Word 구현 (Windows 전용)
+# - FakeOfficeAutomation: Office 없이 동작하는 스크립트형 가짜 구현 (Linux 테스트/벤치마크용)
+# - 범위 변환 방식: 'clipboard'(CopyPicture → Paste) 또는 'file'(PNG 파일 → AddPicture, 클립보드 미사용)
+
+import os
+import gc
+import time
+import random
+import logging
+import threading
+import traceback
+from collections import Counter, defaultdict
+
+# win32com은 Windows에서만 사용 가능 (다른 환경에서는 Fake 백엔드만 사용)
+# 모듈 로드 비용이 크므로 COM 백엔드가 처음 시작될 때 _load_win32()로 불러옴
+win32 = None
+win32clipboard = None
+pythoncom = None
+_win32_checked = False
+
+from readiness import ReadinessPoller
+from picture_sizing import (
+    DocumentGeometry, compute_picture_size, SIZING_MODE_COM, SIZING_MODES,
+    POINTS_PER_CM, SAFETY_MARGIN_PT, AVAILABLE_HEIGHT_RATIO
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def _load_win32():
+    """pywin32 모듈 지연 로드 (한 번만 시도) - 사용할 수 있으면 True"""
+    global win32, win32clipboard, pythoncom, _win32_checked
+    if not _win32_checked:
+        _win32_checked = True
+        try:
+            import win32com.client as win32
+            import win32clipboard
+            import pythoncom
+        except ImportError:
+            win32 = win32clipboard = pythoncom = None
+    return pythoncom is not None
+
+
+# ===================================================================
+# OFFICE APPLICATION POOL
+# ===================================================================
+
+# Office COM 상수 (gencache 상수 모듈에 의존하지 않도록 숫자로 정의)
+XL_CALCULATION_MANUAL = -4135   # xlCalculationManual
+XL_UPDATE_LINKS_NEVER = 0       # Workbooks.Open(UpdateLinks=0)
+WD_ALERTS_NONE = 0              # wdAlertsNone
+
+# CopyPicture(Format=xlPicture)가 클립보드에 올리는 그림 형식
+CF_METAFILEPICT = 3
+CF_ENHMETAFILE = 14
+
+# 준비 상태 대기 시간 초과 (초)
+CLIPBOARD_READY_TIMEOUT = 2.0
+DOCUMENT_READY_TIMEOUT = 10.0
+APPLICATION_READY_TIMEOUT = 10.0
+
+# 인스턴스 재생성 주기 (이 개수만큼 문서/통합문서를 처리한 뒤 새 인스턴스로 교체)
+DEFAULT_RECYCLE_AFTER = 20
+
+# 범위 변환 방식
+EXPORT_MODE_CLIPBOARD = 'clipboard'  # CopyPicture → Selection.Paste (시스템 클립보드 공유)
+EXPORT_MODE_FILE = 'file'            # 범위를 PNG 파일로 렌더링 → 파일에서 삽입
+EXPORT_MODES = (EXPORT_MODE_CLIPBOARD, EXPORT_MODE_FILE)
+
+# 시스템 클립보드는 하나뿐이므로 같은 프로세스의 작업들은 복사~붙여넣기 구간을 직렬화
+CLIPBOARD_LOCK = threading.Lock()
+
+
+class OfficeAppPool:
+    """
+    작업(Job) 단위 Excel/Word 애플리케이션 풀
+
+    - 작업당 Excel/Word를 한 번만 생성하여 모든 통합문서/문서에서 재사용
+    - 세션별 속도 설정 적용 (ScreenUpdating 끔, 수동 계산, 링크 업데이트 끔)
+    - recycle_after 개수만큼 처리했거나 오류가 발생한 경우에만 상태 확인 후 재생성
+    - COM 초기화/해제는 start()/shutdown()에서 스레드당 한 번만 수행
+    """
+
+    APP_PROG_IDS = {
+        'excel': 'Excel.Application',
+        'word': 'Word.Application',
+    }
+    APP_LABELS = {
+        'excel': 'Excel',
+        'word': 'Word',
+    }
+
+    def __init__(self, log_callback=None, recycle_after=DEFAULT_RECYCLE_AFTER):
+        self.log_callback = log_callback
+        self.recycle_after = recycle_after
+        self._apps = {'excel': None, 'word': None}
+        self._use_counts = {'excel': 0, 'word': 0}
+        self._calculation_pending = False  # 현재 Excel에 수동 계산 설정이 아직 적용되지 않음
+        self._com_initialized = False
+        self.stats = {
+            'excel_started': 0,
+            'word_started': 0,
+            'reused': 0,
+            'recycled': 0,
+        }
+
+    def log(self, message):
+        """로그 출력 (log_callback이 없으면 logger 사용)"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            logger.info(message)
+
+    # ========== LIFECYCLE ==========
+
+    def start(self):
+        """COM 초기화 (작업 스레드에서 한 번만 호출)"""
+        if not _load_win32():
+            raise RuntimeError("win32com(pywin32)을 사용할 수 없는 환경입니다. Fake 백엔드를 사용하세요.")
+
+        if not self._com_initialized:
+            pythoncom.CoInitialize()
+            self._com_initialized = True
+
+    def shutdown(self):
+        """모든 애플리케이션 종료 및 COM 해제 (작업 종료 시 한 번만 호출)"""
+        for kind in list(self._apps):
+            self._quit_app(kind)
+
+        gc.collect()
+
+        if self._com_initialized:
+            try:
+                pythoncom.CoUninitialize()
+            except:
+                pass
+            self._com_initialized = False
+
+        self.log(
+            f"✓ Office 풀 정리 완료 (Excel 생성 {self.stats['excel_started']}회, "
+            f"Word 생성 {self.stats['word_started']}회, 재사용 {self.stats['reused']}회, "
+            f"재생성 {self.stats['recycled']}회)"
+        )
+
+    # ========== APPLICATION ACCESS ==========
+
+    def excel(self):
+        """사용 가능한 Excel 애플리케이션 반환 (필요 시 생성/재생성)"""
+        return self._acquire('excel')
+
+    def word(self):
+        """사용 가능한 Word 애플리케이션 반환 (필요 시 생성/재생성)"""
+        return self._acquire('word')
+
+    def current(self, kind):
+        """현재 애플리케이션 반환 (생성/재생성/통계 기록 없음, 없으면 None)"""
+        return self._apps[kind]
+
+    def mark_used(self, kind):
+        """문서/통합문서 하나의 처리가 끝났음을 기록 (재생성 주기 계산용)"""
+        self._use_counts[kind] += 1
+
+    def report_error(self, kind):
+        """
+        오류 발생 보고 - 애플리케이션이 응답하지 않으면 즉시 폐기
+
+        다음 excel()/word() 호출 시 새 인스턴스가 생성됩니다.
+        """
+        app = self._apps.get(kind)
+        if app is not None and not self._is_healthy(app):
+            self.log(f"  ⚠️ {self.APP_LABELS[kind]} 응답 없음 - 인스턴스 폐기")
+            self._quit_app(kind)
+            self.stats['recycled'] += 1
+
+    def open_workbook(self, path):
+        """통합문서 열기 (읽기 전용, 외부 링크 업데이트 안 함)"""
+        excel = self.excel()
+        workbook = excel.Workbooks.Open(
+            os.path.abspath(path),
+            UpdateLinks=XL_UPDATE_LINKS_NEVER,
+            ReadOnly=True,
+            AddToMru=False,
+        )
+        if self._calculation_pending:
+            # 통합문서가 없어 생성 시 설정하지 못한 경우 - 첫 통합문서를 연 뒤 인스턴스당 한 번 다시 적용
+            self._calculation_pending = False
+            try:
+                excel.Calculation = XL_CALCULATION_MANUAL
+            except Exception as e:
+                logger.warning(f"Excel 수동 계산 설정 실패 (자동 계산으로 진행): {e}")
+        return workbook
+
+    def open_document(self, path):
+        """Word 문서 열기 (최근 문서 목록에 추가 안 함)"""
+        word = self.word()
+        return word.Documents.Open(
+            os.path.abspath(path),
+            ConfirmConversions=False,
+            AddToRecentFiles=False,
+        )
+
+    # ========== INTERNAL ==========
+
+    def _acquire(self, kind):
+        app = self._apps[kind]
+
+        if app is not None:
+            # 상태 확인/재생성은 처리 개수 초과 시에만 수행 (매 호출마다 COM 왕복 방지)
+            if self._use_counts[kind] < self.recycle_after:
+                self.stats['reused'] += 1
+                return app
+
+            self.log(f"  ↻ {self.APP_LABELS[kind]} {self._use_counts[kind]}건 처리 - 인스턴스 재생성")
+            self._quit_app(kind)
+            self.stats['recycled'] += 1
+
+        app = self._create_app(kind)
+        self._apps[kind] = app
+        self._use_counts[kind] = 0
+        return app
+
+    def _create_app(self, kind):
+        """애플리케이션 생성 및 세션 속도 설정 적용 (1회 시도, 실패 시 예외)"""
+        label = self.APP_LABELS[kind]
+        self.start()
+
+        try:
+            app = win32.gencache.EnsureDispatch(self.APP_PROG_IDS[kind])
+        except Exception as e:
+            self.log(f"  ✗ {label} 생성 실패: {str(e)}")
+            raise Exception(f"{label} 애플리케이션 생성 실패: {str(e)}")
+
+        app.Visible = False
+        if kind == 'excel':
+            self._apply_excel_session_settings(app)
+        else:
+            self._apply_word_session_settings(app)
+
+        self.stats[f'{kind}_started'] += 1
+        self.log(f"  ✓ {label} 애플리케이션 생성 성공")
+        return app
+
+    def _apply_excel_session_settings(self, excel):
+        """Excel 세션 속도 설정 (개별 설정 실패는 무시)"""
+        settings = [
+            ('DisplayAlerts', False),
+            ('ScreenUpdating', False),
+            ('EnableEvents', False),
+            ('AskToUpdateLinks', False),
+            ('Calculation', XL_CALCULATION_MANUAL),
+        ]
+        self._calculation_pending = False
+        for name, value in settings:
+            try:
+                setattr(excel, name, value)
+            except Exception as e:
+                # Calculation은 열린 통합문서가 없으면 설정 불가한 버전이 있음 → 첫 통합문서를 연 뒤 다시 적용
+                if name == 'Calculation':
+                    self._calculation_pending = True
+                logger.debug(f"Excel {name} 설정 건너뜀: {e}")
+
+    def _apply_word_session_settings(self, word):
+        """Word 세션 속도 설정 (개별 설정 실패는 무시)"""
+        try:
+            word.DisplayAlerts = WD_ALERTS_NONE
+        except Exception as e:
+            logger.debug(f"Word DisplayAlerts 설정 건너뜀: {e}")
+        try:
+            word.ScreenUpdating = False
+        except Exception as e:
+            logger.debug(f"Word ScreenUpdating 설정 건너뜀: {e}")
+        try:
+            word.Options.UpdateLinksAtOpen = False
+        except Exception as e:
+            logger.debug(f"Word UpdateLinksAtOpen 설정 건너뜀: {e}")
+
+    def _is_healthy(self, app):
+        """애플리케이션이 COM 호출에 응답하는지 확인"""
+        try:
+            _ = app.Name
+            return True
+        except Exception:
+            return False
+
+    def _quit_app(self, kind):
+        app = self._apps.get(kind)
+        self._apps[kind] = None
+        self._use_counts[kind] = 0
+        if app is None:
+            return
+
+        label = self.APP_LABELS[kind]
+        try:
+            if kind == 'excel':
+                # 열려 있는 통합문서는 저장하지 않고 닫음
+                for wb in list(app.Workbooks):
+                    try:
+                        wb.Close(SaveChanges=False)
+                    except:
+                        pass
+            app.Quit()
+            self.log(f"✓ {label} Application 정리 완료")
+        except Exception as e:
+            self.log(f"⚠️ {label} Application 정리 중 오류 (무시됨): {str(e)}")
+
+
+# ===================================================================
+# AUTOMATION INTERFACE
+# ===================================================================
+
+class OfficeAutomation:
+    """
+    Tab 2 Office 자동화 인터페이스
+
+    ExcelRangeProcessor는 이 인터페이스만 사용하므로
+    COM 구현과 Fake 구현을 바꿔 끼울 수 있습니다.
+
+    - 통합문서: open_workbook / close_workbook
+    - 범위→그림: copy_range_picture (클립보드) / export_range_image (파일)
+    - 문서: open_document / close_document / save_document
+    - 마커: find_marker / insert_picture_at_marker / insert_picture_file_at_marker
+    - 준비 상태: wait_clipboard_picture / wait_document_ready / wait_application_ready
+      (고정 sleep 대신 실제 조건을 폴링, 대기 시간은 readiness 통계에 기록)
+    """
+
+    name = "base"
+
+    def __init__(self, log_callback=None):
+        self.log_callback = log_callback
+        self._renderer = None
+        self.readiness = ReadinessPoller(log_callback=self.log)
+
+    def log(self, message):
+        """로그 출력 (log_callback이 없으면 logger 사용)"""
+        if self.log_callback:
+            self.log_callback(message)
+        else:
+            logger.info(message)
+
+    # ========== LIFECYCLE ==========
+
+    def start(self):
+        """작업 시작 시 한 번 호출"""
+
+    def shutdown(self):
+        """작업 종료 시 한 번 호출 (모든 리소스 정리)"""
+
+    def report_error(self, kind):
+        """오류 발생 보고 ('excel' 또는 'word')"""
+
+    def get_stats(self):
+        """백엔드 통계 (결과 dict에 포함됨)"""
+        return {}
+
+    def clipboard_session(self):
+        """
+        클립보드 복사~붙여넣기 구간 잠금
+
+        사용 예: with automation.clipboard_session(): copy → insert
+        """
+        return CLIPBOARD_LOCK
+
+    def close_renderer(self):
+        """파일 변환용 렌더러 캐시 해제"""
+        if self._renderer is not None:
+            self._renderer.close()
+            self._renderer = None
+
+    # ========== EXCEL ==========
+
+    def open_workbook(self, path):
+        """통합문서 열기 - 백엔드별 통합문서 핸들 반환"""
+        raise NotImplementedError
+
+    def close_workbook(self, wb):
+        """통합문서 닫기 (저장 안 함)"""
+        raise NotImplementedError
+
+    def copy_range_picture(self, wb, sheet_name, range_address):
+        """범위를 그림으로 복사 (클립보드) - 성공 여부(bool) 반환"""
+        raise NotImplementedError
+
+    def export_range_image(self, workbook_path, sheet_name, range_address, image_path):
+        """
+        범위를 PNG 파일로 저장 (클립보드 미사용) - (성공 여부, 실패 이유) 반환
+
+        기본 구현은 순수 렌더러(range_renderer)를 사용하므로 Excel을 열지 않습니다.
+        """
+        # openpyxl/Pillow는 파일 변환 방식에서만 필요하므로 사용 시점에 import
+        from range_renderer import RangeRenderer, RangeRenderError
+
+        if self._renderer is None:
+            self._renderer = RangeRenderer()
+        try:
+            self._renderer.render(workbook_path, sheet_name, range_address, image_path)
+            return True, None
+        except RangeRenderError as e:
+            return False, str(e)
+        except Exception as e:
+            return False, f"범위 렌더링 오류: {str(e)}"
+
+    # ========== WORD ==========
+
+    def open_document(self, path):
+        """Word 문서 열기 - 백엔드별 문서 핸들 반환"""
+        raise NotImplementedError
+
+    def close_document(self, doc):
+        """Word 문서 닫기 (저장 안 함)"""
+        raise NotImplementedError
+
+    def find_marker(self, doc, marker):
+        """문서에서 마커 찾기 - 찾으면 해당 위치가 선택된 상태로 True 반환"""
+        raise NotImplementedError
+
+    def insert_picture_at_marker(self, doc, marker):
+        """마커 위치에 클립보드의 그림 삽입 - (성공 여부, 오류 메시지) 반환"""
+        raise NotImplementedError
+
+    def insert_picture_file_at_marker(self, doc, marker, image_path):
+        """마커 위치에 이미지 파일 삽입 - (성공 여부, 오류 메시지) 반환"""
+        raise NotImplementedError
+
+    def save_document(self, doc):
+        """Word 문서 저장"""
+        raise NotImplementedError
+
+    # ========== READINESS ==========
+
+    def wait_clipboard_picture(self, sequence=None):
+        """
+        클립보드에 새 그림이 올라올 때까지 대기 - 준비 여부 반환
+
+        Args:
+            sequence: 복사 직전 클립보드 순번 - 순번이 바뀌어야 새 내용으로 판정
+                      (이전 범위의 그림이 남아 있어도 통과하지 않음)
+        """
+        return True
+
+    def wait_document_ready(self, doc):
+        """Word 문서/애플리케이션이 유휴 상태가 될 때까지 대기 - 준비 여부 반환"""
+        return True
+
+    def wait_application_ready(self, kind):
+        """애플리케이션('excel' 또는 'word')이 응답할 때까지 대기 - 준비 여부 반환"""
+        return True
+
+
+# ===================================================================
+# COM IMPLEMENTATION
+# ===================================================================
+
+class ComOfficeAutomation(OfficeAutomation):
+    """
+    win32com 기반 실제 Excel/Word 구현 (OfficeAppPool 사용)
+
+    Args:
+        recycle_after: Office 인스턴스 재생성 주기
+        sizing_mode: 그림 크기 계산 방식 (picture_sizing 참고)
+                     'com'(마커마다 Word 측정), 'model'(페이지 설정/셀 너비 모델),
+                     'compare'(Word 측정으로 적용하고 모델 추정값과 비교 기록)
+    """
+
+    name = "com"
+
+    def __init__(self, log_callback=None, recycle_after=DEFAULT_RECYCLE_AFTER, sizing_mode=SIZING_MODE_COM):
+        super().__init__(log_callback)
+        if sizing_mode not in SIZING_MODES:
+            raise ValueError(f"알 수 없는 크기 계산 방식: {sizing_mode} (사용 가능: {', '.join(SIZING_MODES)})")
+        self.pool = OfficeAppPool(log_callback=self.log, recycle_after=recycle_after)
+        self.sizing_mode = sizing_mode
+        self._geometry = {}  # id(doc) → DocumentGeometry
+        self.sizing_stats = Counter(compare_max_diff_cm=0.0)
+
+    # ========== LIFECYCLE ==========
+
+    def start(self):
+        self.pool.start()
+
+    def shutdown(self):
+        # Office 풀 종료 (Excel/Word 종료 및 COM 해제)
+        self.pool.shutdown()
+        self.close_renderer()
+
+    def report_error(self, kind):
+        self.pool.report_error(kind)
+
+    def get_stats(self):
+        stats = dict(self.pool.stats)
+        stats['sizing_mode'] = self.sizing_mode
+        stats['sizing'] = dict(self.sizing_stats)
+        return stats
+
+    # ========== EXCEL ==========
+
+    def open_workbook(self, path):
+        # 풀의 Excel로 통합문서 열기 (읽기 전용, 링크 업데이트 안 함)
+        wb = self.pool.open_workbook(path)
+        self.wait_application_ready('excel')
+        return wb
+
+    def close_workbook(self, wb):
+        # 통합문서만 닫음 (Excel 애플리케이션은 풀에서 재사용)
+        try:
+            wb.Close(SaveChanges=False)
+        except:
+            pass
+        self.pool.mark_used('excel')
+
+    def copy_range_picture(self, wb, sheet_name, range_address):
+        """엑셀 범위를 화면에 보이는 대로 그림으로 복사 (클립보드에)"""
+        try:
+            # 시트 존재 확인
+            try:
+                sheet = wb.Sheets(sheet_name)
+            except:
+                self.log(f"  ✗ 범위 복사 실패: 시트 없음 ({sheet_name})")
+                return False
+
+            # 시트가 숨김 상태인지 확인
+            # xlSheetVisible = -1 (보임)
+            # xlSheetHidden = 0 (숨김)
+            # xlSheetVeryHidden = 2 (매우 숨김)
+            if sheet.Visible != -1:
+                self.log(f"  ✗ 범위 복사 실패: 숨김 시트 ({sheet_name})")
+                return False
+
+            # 범위 선택
+            range_obj = sheet.Range(range_address)
+
+            # 복사 전 클립보드 순번 (이전 범위의 그림과 새 그림을 구분)
+            sequence = win32clipboard.GetClipboardSequenceNumber()
+
+            # 화면에 보이는 대로 그림으로 복사 (클립보드에 복사됨)
+            # xlScreen=1, xlPicture=-4147
+            range_obj.CopyPicture(Appearance=1, Format=-4147)
+
+            # 클립보드에 새 그림이 실제로 올라왔는지 확인 (남아 있던 이전 그림은 붙여넣지 않음)
+            if not self.wait_clipboard_picture(sequence):
+                self.log(f"  ✗ 범위 복사 실패: 클립보드에 새 그림이 올라오지 않음 ({range_address})")
+                return False
+
+            self.log(f"  ✓ 범위 복사 완료 (클립보드)")
+            return True
+
+        except Exception as e:
+            self.log(f"  ✗ 범위 복사 실패: {range_address} ({str(e)})")
+            return False
+
+    # ========== WORD ==========
+
+    def open_document(self, path):
+        # 풀에서 Word 가져오기 (작업 내 재사용)
+        doc = self.pool.open_document(path)
+
+        # 크기 모델용 구역/셀 정보 읽기 (읽을 수 없으면 Word 측정으로 대체)
+        if self.sizing_mode != SIZING_MODE_COM:
+            try:
+                self._geometry[id(doc)] = DocumentGeometry.from_docx(path)
+            except Exception as e:
+                self.log(f"  ⚠️ 크기 모델 사용 불가 - Word 측정 사용 ({str(e)})")
+        return doc
+
+    def close_document(self, doc):
+        self._geometry.pop(id(doc), None)
+        # 문서만 닫음 (Word 애플리케이션은 풀에서 재사용)
+        try:
+            doc.Close(SaveChanges=False)
+        except:
+            pass
+        self.pool.mark_used('word')
+
+    def save_document(self, doc):
+        # 저장 전후로 Word가 유휴 상태인지 확인 (백그라운드 저장 완료까지)
+        self.wait_document_ready(doc)
+        doc.Save()
+        self.wait_document_ready(doc)
+
+    # ========== READINESS ==========
+
+    def wait_clipboard_picture(self, sequence=None):
+        """클립보드 순번이 바뀌고(새 내용) EMF/메타파일 그림 형식이 있는지 폴링"""
+        def has_picture():
+            if sequence is not None and win32clipboard.GetClipboardSequenceNumber() == sequence:
+                return False
+            return (win32clipboard.IsClipboardFormatAvailable(CF_ENHMETAFILE)
+                    or win32clipboard.IsClipboardFormatAvailable(CF_METAFILEPICT))
+        return self.readiness.wait('clipboard', has_picture, timeout=CLIPBOARD_READY_TIMEOUT)
+
+    def wait_document_ready(self, doc):
+        """Word가 응답하고 백그라운드 저장/인쇄가 없을 때까지 폴링 (바쁘면 COM 호출이 거부되어 재시도)"""
+        def is_idle():
+            word_app = doc.Application
+            return word_app.BackgroundSavingStatus == 0 and word_app.BackgroundPrintingStatus == 0
+        return self.readiness.wait('document', is_idle, timeout=DOCUMENT_READY_TIMEOUT)
+
+    def wait_application_ready(self, kind):
+        """Excel은 Application.Ready, Word는 속성 조회 응답으로 확인"""
+        app = self.pool.current(kind)
+        if app is None:
+            return False
+        if kind == 'excel':
+            condition = lambda: app.Ready
+        else:
+            condition = lambda: app.Name is not None
+        return self.readiness.wait(f"{kind}_app", condition, timeout=APPLICATION_READY_TIMEOUT)
+
+    def find_marker(self, doc, marker):
+        """마커를 찾아 선택 (문서 처음부터 검색)"""
+        word_app = doc.Application
+
+        # Selection 초기화
+        word_app.Selection.HomeKey(Unit=6)  # wdStory
+
+        # Find 설정
+        find = word_app.Selection.Find
+        find.ClearFormatting()
+        find.Text = marker
+        find.Forward = True
+        find.Wrap = 1  # wdFindContinue
+
+        # ========================================
+        # 주의: 마커 찾기 재시도 로직 제거됨 (사용자 요청)
+        # 이전 버전에서는 최대 2회 재시도했으나
+        # 현재는 1회만 시도 후 실패 시 즉시 다음 로직으로 진행
+        # ========================================
+        return bool(find.Execute())
+
+    def insert_picture_at_marker(self, doc, marker):
+        """Word 마커 위치에 클립보드의 그림 붙여넣기"""
+        return self._insert_at_marker(doc, marker, self._paste_from_clipboard)
+
+    def insert_picture_file_at_marker(self, doc, marker, image_path):
+        """Word 마커 위치에 이미지 파일 삽입 (클립보드 미사용)"""
+        def place(word_app):
+            return self._add_picture_from_file(doc, word_app, image_path)
+        return self._insert_at_marker(doc, marker, place)
+
+    def _paste_from_clipboard(self, word_app):
+        """선택 위치에 클립보드 그림 붙여넣기 후 InlineShape 반환 (없으면 None)"""
+        # 클립보드의 그림 붙여넣기
+        word_app.Selection.Paste()
+
+        # 방금 붙여넣은 그림 찾기
+        picture = None
+
+        # 방법 1: InlineShape 확인 (일반적인 경우)
+        if word_app.Selection.InlineShapes.Count > 0:
+            picture = word_app.Selection.InlineShapes(1)
+
+        # 방법 2: Range의 InlineShape 확인 (표 안의 경우)
+        elif word_app.Selection.Range.InlineShapes.Count > 0:
+            picture = word_app.Selection.Range.InlineShapes(1)
+
+        # 방법 3: 셀을 선택한 후 InlineShape 확인 (표 셀 안)
+        else:
+            try:
+                # 커서를 한 칸 뒤로 이동하여 방금 삽입한 이미지 선택
+                word_app.Selection.MoveLeft(Unit=1, Count=1, Extend=1)
+                if word_app.Selection.InlineShapes.Count > 0:
+                    picture = word_app.Selection.InlineShapes(1)
+            except:
+                pass
+
+        return picture
+
+    def _add_picture_from_file(self, doc, word_app, image_path):
+        """
+        선택 위치에 이미지 파일을 InlineShape로 삽입 (문서에 포함, 링크 안 함)
+
+        ActiveDocument가 아니라 대상 문서에 삽입 (재사용 인스턴스/사용자 문서가 앞에 있어도 안전)
+        """
+        return doc.InlineShapes.AddPicture(
+            FileName=os.path.abspath(image_path),
+            LinkToFile=False,
+            SaveWithDocument=True,
+            Range=word_app.Selection.Range,
+        )
+
+    def _insert_at_marker(self, doc, marker, place_picture):
+        """
+        마커를 찾아 삭제한 뒤 place_picture(word_app)로 그림을 배치하고 크기 조정
+
+        Args:
+            place_picture: 선택 위치에 그림을 넣고 InlineShape(없으면 None)를 반환하는 함수
+        """
+        try:
+            word_app = doc.Application
+
+            # 마커 찾기 결과 확인
+            if self.find_marker(doc, marker):
+                # 크기 모델 (model/compare 방식) - 문서를 열 때 읽은 구역/셀 정보
+                geometry = None
+                if self.sizing_mode != SIZING_MODE_COM:
+                    document_geometry = self._geometry.get(id(doc))
+                    if document_geometry is not None:
+                        geometry = document_geometry.take(marker)
+                    if geometry is None:
+                        self.sizing_stats['model_fallback'] += 1
+
+                # model 방식은 Word 레이아웃 조회 없이 크기 결정
+                if self.sizing_mode == SIZING_MODE_MODEL and geometry is not None:
+                    available_height = None
+                else:
+                    available_height = self._measure_available_height(doc, word_app)
+
+                # 마커 삭제
+                word_app.Selection.Text = ""
+
+                # 그림 배치 (클립보드 붙여넣기 또는 파일 삽입)
+                picture = place_picture(word_app)
+
+                if picture is not None:
+                    # 원본 크기 (그림 자체의 가로세로 비율)
+                    original_width = picture.Width
+                    original_height = picture.Height
+
+                    if available_height is None:
+                        # 모델: 본문/셀 너비와 본문 높이 기준
+                        width, height, scaled = compute_picture_size(
+                            original_width, original_height, geometry.max_width, geometry.max_height
+                        )
+                        self.sizing_stats['model'] += 1
+                    else:
+                        # 기존: 16.5cm 너비, 마커 아래 사용 가능 높이를 넘으면 축소
+                        width, height, scaled = compute_picture_size(
+                            original_width, original_height, None, available_height
+                        )
+                        self.sizing_stats['com'] += 1
+                        if geometry is not None:
+                            self._compare_sizing(marker, original_width, original_height, geometry, width, height)
+
+                    picture.Height = height
+                    picture.Width = width
+
+                    if scaled:
+                        self.log(f"  ✓ 크기 자동 조정: {width/POINTS_PER_CM:.1f}cm × {height/POINTS_PER_CM:.1f}cm")
+                    else:
+                        self.log(f"  ✓ 기본 크기 적용: {width/POINTS_PER_CM:.1f}cm × {height/POINTS_PER_CM:.1f}cm")
+                else:
+                    # ★★★ 이미지 객체를 찾을 수 없는 경우 - 명확한 에러 처리 ★★★
+                    # picture is None이면 클립보드가 비어있거나 붙여넣기 실패
+                    error_msg = f"붙여넣기 후 이미지 객체를 찾을 수 없음 (클립보드 비어있음 또는 COM 오류)"
+                    self.log(f"  ❌ 삽입 실패 [{marker}]: {error_msg}")
+                    return False, error_msg
+
+                self.log(f"  ✓ 그림 삽입 성공: {marker}")
+                return True, None
+            else:
+                error_msg = f"마커를 Word 문서에서 찾을 수 없음"
+                self.log(f"  ✗ 삽입 실패 [{marker}]: {error_msg}")
+                return False, error_msg
+
+        except Exception as e:
+            error_msg = str(e)
+            self.log(f"  ✗ 삽입 실패 [{marker}]: {error_msg}")
+            self.log(f"  상세: {traceback.format_exc()}")
+            return False, error_msg
+
+    def _measure_available_height(self, doc, word_app):
+        """
+        선택된 마커 위치 아래의 사용 가능 높이 (Word 측정, 포인트)
+
+        Selection.Information(6)은 Word가 페이지를 다시 계산하게 만드는 느린 호출입니다.
+        """
+        # 페이지 설정 정보 (ActiveDocument가 아닌 대상 문서)
+        page_setup = doc.PageSetup
+        page_height = page_setup.PageHeight
+        top_margin = page_setup.TopMargin
+        bottom_margin = page_setup.BottomMargin
+
+        # 마커 위치의 세로 위치 저장 (포인트 단위)
+        # 3단계 폴백: Selection.Information(6) → Range.Information(6) → 추정값
+        vertical_position = None
+        try:
+            vertical_position = word_app.Selection.Information(6)
+        except:
+            try:
+                vertical_position = word_app.Selection.Range.Information(6)
+            except:
+                vertical_position = top_margin + 100  # 추정값
+                self.log(f"  ⚠️ 세로 위치 감지 실패, 추정값 사용")
+
+        # 본문 영역 경계 계산
+        content_start = top_margin  # 본문 시작 (머릿말 아래)
+        content_end = page_height - bottom_margin  # 본문 끝 (바닥글 위)
+
+        # 마커 위치가 본문 영역 내에 있는지 확인
+        if vertical_position < content_start:
+            self.log(f"  ⚠️ 경고: 마커가 머릿말 영역에 있음")
+        elif vertical_position > content_end:
+            self.log(f"  ⚠️ 경고: 마커가 바닥글 영역에 있음")
+
+        # 마커부터 본문 끝까지의 거리
+        distance_to_content_end = content_end - vertical_position
+
+        # 사용 가능한 높이 = (본문 끝 - 마커 위치 - 안전 여유) × 90%
+        raw_available_height = distance_to_content_end - SAFETY_MARGIN_PT
+        available_height = raw_available_height * AVAILABLE_HEIGHT_RATIO
+
+        self.log(f"  📍 사용 가능 높이: {available_height:.1f}pt ({available_height/POINTS_PER_CM:.1f}cm) [90% 적용]")
+        return available_height
+
+    def _compare_sizing(self, marker, original_width, original_height, geometry, width, height):
+        """compare 방식: 모델 추정 크기와 Word 측정 기반 크기 비교 기록"""
+        model_width, model_height, _ = compute_picture_size(
+            original_width, original_height, geometry.max_width, geometry.max_height
+        )
+        diff_cm = max(abs(model_width - width), abs(model_height - height)) / POINTS_PER_CM
+        self.sizing_stats['compared'] += 1
+        self.sizing_stats['compare_max_diff_cm'] = max(self.sizing_stats['compare_max_diff_cm'], round(diff_cm, 2))
+        if diff_cm >= 0.1:
+            self.sizing_stats['compare_mismatch'] += 1
+        self.log(
+            f"  📐 크기 비교 [{marker}]: 모델 {model_width/POINTS_PER_CM:.1f}cm × {model_height/POINTS_PER_CM:.1f}cm"
+            f" / Word {width/POINTS_PER_CM:.1f}cm × {height/POINTS_PER_CM:.1f}cm (차이 {diff_cm:.2f}cm)"
+        )
+
+
+# ===================================================================
+# FAKE IMPLEMENTATION (Linux 테스트/벤치마크용)
+# ===================================================================
+
+class FakeOfficeError(Exception):
+    """Fake 백엔드에서 주입된 오류"""
+
+
+class FakeWorkbook:
+    """Fake 통합문서 핸들"""
+
+    def __init__(self, path, sheets):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.sheets = sheets  # {시트명: 보임 여부} 또는 None(모든 시트 존재)
+        self.closed = False
+
+
+class FakeDocument:
+    """Fake Word 문서 핸들"""
+
+    def __init__(self, path, markers):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.markers = markers  # 남아 있는 마커 집합 또는 None(모든 마커 존재)
+        self.consumed = set()   # 이미 그림으로 교체된 마커
+        self.inserted = []      # 삽입된 (마커, 복사 원본) 목록
+        self.saved = 0
+        self.closed = False
+
+
+class FakeOfficeAutomation(OfficeAutomation):
+    """
+    Office 없이 동작하는 스크립트형 Fake 구현
+
+    Args:
+        latency: 작업별 지연 시간(초) dict (예: {'open_workbook': 0.4, 'insert_picture_at_marker': 0.05})
+        failures: 작업별 실패 주입 dict ('clipboard_update': 복사는 성공했지만 클립보드가 바뀌지 않음). 값은 다음 중 하나
+                  - True: 항상 실패
+                  - float(0~1): 확률적 실패 (seed로 재현 가능)
+                  - set/list/tuple: 대상 키(마커/시트명/파일명)가 포함되면 실패
+                  - callable(key) -> bool: True를 반환하면 실패
+        workbook_sheets: {통합문서 파일명: {시트명: 보임 여부}} (None이면 모든 시트가 보임 상태로 존재)
+        document_markers: {문서 파일명: 마커 목록} (None이면 모든 마커가 존재)
+        time_scale: 지연 시간 배율 (0이면 지연 없이 호출 수만 기록)
+        settle: 준비 상태별 안정화 시간(초) dict (예: {'clipboard': 0.02, 'document': 0.1})
+                - 대기 호출 후 이 시간이 지나야 준비 완료로 판정 (readiness 폴링 검증용)
+        seed: 확률적 실패용 난수 시드
+    """
+
+    name = "fake"
+
+    OPERATIONS = (
+        'start', 'shutdown',
+        'open_workbook', 'close_workbook', 'copy_range_picture',
+        'export_range_image',
+        'open_document', 'close_document', 'find_marker',
+        'insert_picture_at_marker', 'insert_picture_file_at_marker', 'save_document',
+    )
+
+    def __init__(self, log_callback=None, latency=None, failures=None,
+                 workbook_sheets=None, document_markers=None, time_scale=1.0, seed=None,
+                 settle=None):
+        super().__init__(log_callback)
+        self.latency = dict(latency or {})
+        self.failures = dict(failures or {})
+        self.workbook_sheets = workbook_sheets
+        self.document_markers = document_markers
+        self.time_scale = time_scale
+        self.settle = dict(settle or {})
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._clipboard = None
+        self._clipboard_sequence = 0  # 클립보드 내용이 바뀔 때마다 증가 (GetClipboardSequenceNumber 모사)
+
+        # 호출 통계
+        self.calls = Counter()
+        self.failures_injected = Counter()
+        self.call_seconds = defaultdict(float)
+        self.documents = []
+
+    # ========== INTERNAL ==========
+
+    def _call(self, operation, key=None):
+        """호출 기록 + 지연 + 실패 주입 판정 (실패 시 True 반환)"""
+        with self._lock:
+            self.calls[operation] += 1
+
+        delay = self.latency.get(operation, 0.0) * self.time_scale
+        if delay > 0:
+            time.sleep(delay)
+            with self._lock:
+                self.call_seconds[operation] += delay
+
+        if self._should_fail(operation, key):
+            with self._lock:
+                self.failures_injected[operation] += 1
+            return True
+        return False
+
+    def _should_fail(self, operation, key):
+        spec = self.failures.get(operation)
+        if spec is None or spec is False:
+            return False
+        if spec is True:
+            return True
+        if callable(spec):
+            return bool(spec(key))
+        if isinstance(spec, float):
+            with self._lock:
+                return self._random.random() < spec
+        if isinstance(spec, (set, frozenset, list, tuple)):
+            return key in spec
+        return False
+
+    def _wait_settled(self, label, condition=None, timeout=None):
+        """settle[label]초가 지나고 condition()(있으면)이 참이면 준비 완료가 되는 조건을 readiness로 폴링"""
+        ready_at = time.perf_counter() + self.settle.get(label, 0.0) * self.time_scale
+        return self.readiness.wait(
+            label,
+            lambda: time.perf_counter() >= ready_at and (condition is None or condition()),
+            timeout=timeout
+        )
+
+    def _lookup(self, table, path):
+        """파일명 또는 전체 경로로 스크립트 항목 조회"""
+        if table is None:
+            return None
+        if path in table:
+            return table[path]
+        return table.get(os.path.basename(path))
+
+    # ========== LIFECYCLE ==========
+
+    def start(self):
+        if self._call('start'):
+            raise FakeOfficeError("Office 시작 실패 (주입된 오류)")
+
+    def shutdown(self):
+        self._call('shutdown')
+        self._clipboard = None
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'calls': dict(self.calls),
+                'failures_injected': dict(self.failures_injected),
+                'simulated_seconds': dict(self.call_seconds),
+            }
+
+    # ========== EXCEL ==========
+
+    def open_workbook(self, path):
+        if self._call('open_workbook', os.path.basename(path)):
+            raise FakeOfficeError(f"통합문서 열기 실패 (주입된 오류): {os.path.basename(path)}")
+        sheets = self._lookup(self.workbook_sheets, path)
+        self.wait_application_ready('excel')
+        return FakeWorkbook(path, dict(sheets) if sheets is not None else None)
+
+    def close_workbook(self, wb):
+        self._call('close_workbook', wb.name)
+        wb.closed = True
+
+    def copy_range_picture(self, wb, sheet_name, range_address):
+        if self._call('copy_range_picture', sheet_name):
+            return False
+
+        if wb.sheets is not None:
+            # 시트 없음 또는 숨김 시트는 실제 구현과 동일하게 실패 처리
+            if not wb.sheets.get(sheet_name, False):
+                return False
+
+        sequence = self._clipboard_sequence
+        if self._should_fail('clipboard_update', sheet_name):
+            # CopyPicture가 조용히 실패 - 클립보드에는 이전 범위의 그림이 그대로 남음 (호출 수에는 넣지 않음)
+            with self._lock:
+                self.failures_injected['clipboard_update'] += 1
+        else:
+            with self._lock:
+                self._clipboard = (wb.name, sheet_name, range_address)
+                self._clipboard_sequence += 1
+        return self.wait_clipboard_picture(sequence)
+
+    def export_range_image(self, workbook_path, sheet_name, range_address, image_path):
+        """Fake 파일 변환 - 렌더러 대신 작은 자리표시 파일만 기록"""
+        if self._call('export_range_image', sheet_name):
+            return False, "범위 렌더링 오류 (주입된 오류)"
+
+        sheets = self._lookup(self.workbook_sheets, workbook_path)
+        if sheets is not None:
+            if sheet_name not in sheets:
+                return False, f"시트 없음: {sheet_name}"
+            if not sheets[sheet_name]:
+                return False, f"숨김 시트: {sheet_name}"
+
+        with open(image_path, 'wb') as f:
+            f.write(f"{os.path.basename(workbook_path)}|{sheet_name}|{range_address}".encode('utf-8'))
+        return True, None
+
+    # ========== WORD ==========
+
+    def open_document(self, path):
+        if self._call('open_document', os.path.basename(path)):
+            raise FakeOfficeError(f"문서 열기 실패 (주입된 오류): {os.path.basename(path)}")
+        markers = self._lookup(self.document_markers, path)
+        doc = FakeDocument(path, set(markers) if markers is not None else None)
+        with self._lock:
+            self.documents.append(doc)
+        return doc
+
+    def close_document(self, doc):
+        self._call('close_document', doc.name)
+        doc.closed = True
+
+    def save_document(self, doc):
+        self.wait_document_ready(doc)
+        if self._call('save_document', doc.name):
+            raise FakeOfficeError(f"문서 저장 실패 (주입된 오류): {doc.name}")
+        doc.saved += 1
+        self.wait_document_ready(doc)
+
+    # ========== READINESS ==========
+
+    def wait_clipboard_picture(self, sequence=None):
+        # 실제 구현과 같이 순번이 바뀐 새 내용만 인정 (바뀌지 않으면 시간 초과로 실패)
+        def changed():
+            return self._clipboard is not None and (sequence is None or self._clipboard_sequence != sequence)
+        return self._wait_settled('clipboard', changed, timeout=CLIPBOARD_READY_TIMEOUT * self.time_scale)
+
+    def wait_document_ready(self, doc):
+        return self._wait_settled('document')
+
+    def wait_application_ready(self, kind):
+        return self._wait_settled(f"{kind}_app")
+
+    def find_marker(self, doc, marker):
+        if self._call('find_marker', marker):
+            return False
+        if marker in doc.consumed:
+            return False
+        return doc.markers is None or marker in doc.markers
+
+    def insert_picture_at_marker(self, doc, marker):
+        if not self.find_marker(doc, marker):
+            return False, "마커를 Word 문서에서 찾을 수 없음"
+
+        if self._call('insert_picture_at_marker', marker):
+            return False, "붙여넣기 실패 (주입된 오류)"
+
+        if self._clipboard is None:
+            return False, "붙여넣기 후 이미지 객체를 찾을 수 없음 (클립보드 비어있음 또는 COM 오류)"
+
+        doc.consumed.add(marker)
+        doc.inserted.append((marker, self._clipboard))
+        return True, None
+
+    def insert_picture_file_at_marker(self, doc, marker, image_path):
+        if not self.find_marker(doc, marker):
+            return False, "마커를 Word 문서에서 찾을 수 없음"
+
+        if self._call('insert_picture_file_at_marker', marker):
+            return False, "그림 파일 삽입 실패 (주입된 오류)"
+
+        if not os.path.exists(image_path):
+            return False, f"그림 파일 없음: {os.path.basename(image_path)}"
+
+        doc.consumed.add(marker)
+        doc.inserted.append((marker, image_path))
+        return True, None
+
+
+# ===================================================================
+# FACTORY
+# ===================================================================
+
+OFFICE_BACKENDS = {
+    'com': ComOfficeAutomation,
+    'fake': FakeOfficeAutomation,
+}
+
+
+def create_office_automation(backend='com', log_callback=None, **options):
+    """
+    백엔드 이름으로 OfficeAutomation 생성
+
+    Args:
+        backend: 'com' 또는 'fake'
+        log_callback: 로그 출력 콜백
+        options: 백엔드별 생성자 인자 (예: recycle_after, latency, failures)
+    """
+    if backend not in OFFICE_BACKENDS:
+        raise ValueError(f"알 수 없는 Office 백엔드: {backend} (사용 가능: {', '.join(OFFICE_BACKENDS)})")
+    return OFFICE_BACKENDS[backend](log_callback=log_callback, **options)
@@ -0,0 +1,346 @@
+# parallel_range_processor.py
+# Tab 2 병렬 처리 (프로세스 풀)
+# - Word 출력 파일을 샤드로 나누어 작업자 프로세스마다 ExcelRangeProcessor 실행
+# - 작업자마다 자체 COM 아파트/렌더러를 가지므로 Office 인스턴스가 공유되지 않음
+# - 로그/결과는 큐로 부모 프로세스(GUI 스레드)에 전달
+# - 한 작업자가 비정상 종료되면 해당 샤드만 실패 처리
+# - 취소 시 공유 Event로 작업자에 전달 → 작업자가 Office 종료/임시 파일 정리 후 종료
+#   (유예 시간 안에 끝나지 않으면 강제 종료)
+
+import os
+import time
+import queue
+import signal
+import logging
+import traceback
+import multiprocessing
+
+from excel_range_processor import ExcelRangeProcessor
+from office_automation import EXPORT_MODE_CLIPBOARD
+from tracing import Tracer, current_tracer, set_tracer
+from memory_profiling import MemoryProfiler, current_memory_profiler, set_memory_profiler
+from cancellation import CancellationToken
+
+
+logger = logging.getLogger(__name__)
+
+# 큐 폴링 간격 (초) - 작업자 종료/취소 요청 감지 주기
+QUEUE_POLL_INTERVAL = 0.2
+
+# 취소 후 작업자가 스스로 정리하고 끝나기를 기다리는 시간 (초) - 넘으면 강제 종료
+# (강제 종료하면 작업자의 Excel/Word 프로세스가 남을 수 있으므로 넉넉하게)
+CANCEL_GRACE_SECONDS = 15.0
+
+
+def default_worker_count():
+    """기본 작업자 수 (CPU 코어 수)"""
+    return max(1, os.cpu_count() or 1)
+
+
+def split_shards(word_files, workers):
+    """Word 파일을 작업자 수만큼 라운드로빈으로 분할 (빈 샤드 제외)"""
+    shard_count = max(1, min(workers, len(word_files)))
+    shards = [[] for _ in range(shard_count)]
+    for index, word_file in enumerate(word_files):
+        shards[index % shard_count].append(word_file)
+    return [shard for shard in shards if shard]
+
+
+def merge_readiness_stats(total, stats):
+    """작업자별 준비 상태 대기 통계 합산 (max_seconds는 최댓값)"""
+    for label, item in stats.items():
+        merged = total.setdefault(label, {
+            'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'polls': 0, 'timeouts': 0
+        })
+        for key in ('count', 'total_seconds', 'polls', 'timeouts'):
+            merged[key] += item.get(key, 0)
+        merged['max_seconds'] = max(merged['max_seconds'], item.get('max_seconds', 0.0))
+
+
+def _run_shard(shard_index, excel_files, word_files, mappings, range_config,
+               backend, backend_options, export_mode, message_queue, trace=False, memory=False,
+               cancel_event=None):
+    """
+    작업자 프로세스 진입점 - 샤드 하나 처리 후 결과를 큐로 전달
+
+    trace/memory: 구간/메모리 경계를 기록하여 결과에 포함 (부모가 합침)
+    cancel_event: 부모가 취소 시 설정하는 multiprocessing Event
+    """
+
+    # Ctrl+C는 부모가 받아 취소 Event로 전달 (작업자가 직접 중단되면 Office 정리를 못 함)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    def log(message):
+        message_queue.put(('log', shard_index, message))
+
+    tracer = Tracer() if trace else None
+    set_tracer(tracer)
+    profiler = MemoryProfiler() if memory else None
+    set_memory_profiler(profiler)
+    if profiler is not None:
+        profiler.start()
+
+    try:
+        processor = ExcelRangeProcessor(
+            excel_files, word_files, mappings, range_config,
+            backend=backend,
+            backend_options=backend_options,
+            log_callback=log,
+            export_mode=export_mode,
+            cancel_token=CancellationToken(cancel_event) if cancel_event is not None else None,
+        )
+        result = processor.run()
+    except Exception as e:
+        result = {
+            'success': False,
+            'message': f"오류: {str(e)}",
+            'traceback': traceback.format_exc(),
+        }
+    if tracer is not None:
+        result['trace_events'] = tracer.events
+    if profiler is not None:
+        profiler.stop()
+        result['memory_checkpoints'] = profiler.checkpoints
+    message_queue.put(('result', shard_index, result))
+
+
+class ParallelRangeProcessor:
+    """
+    Excel 범위 → Word 마커 삽입 병렬 처리기
+
+    Word 출력 파일 단위로 샤드를 나누어 작업자 프로세스에서 처리합니다.
+    하나의 Word 문서에는 모든 엑셀 파일의 범위가 들어가므로 엑셀 파일 단위로는 나누지 않습니다.
+
+    Args:
+        excel_files, word_files, mappings, range_config: ExcelRangeProcessor와 동일
+        workers: 최대 동시 작업자 프로세스 수
+        backend: 작업자에서 사용할 OfficeAutomation 백엔드 이름
+        backend_options: 백엔드 생성자 인자
+        log_callback: 로그 출력 콜백 (부모 프로세스에서 호출)
+        export_mode: 범위 변환 방식 - 클립보드는 시스템에 하나뿐이므로
+                     'clipboard'이면 작업자 1개로 제한
+        cancel_token: 취소 토큰 (cancellation.py) - 취소되면 시작 전 샤드는 건너뛰고
+                      실행 중인 작업자에 전달, result['cancelled']와 취소 지연(cancel_latency) 보고
+    """
+
+    def __init__(self, excel_files, word_files, mappings, range_config,
+                 workers=None, backend='com', backend_options=None, log_callback=None,
+                 export_mode=EXPORT_MODE_CLIPBOARD, cancel_token=None):
+        self.excel_files = excel_files
+        self.word_files = word_files
+        self.mappings = mappings
+        self.range_config = range_config
+        self.workers = workers or default_worker_count()
+        self.backend = backend
+        self.backend_options = backend_options or {}
+        self.log_callback = log_callback
+        self.export_mode = export_mode
+        self.cancel_token = cancel_token
+
+    def log(self, message):
+        """로그 출력"""
+        logger.info(message)
+        if self.log_callback:
+            self.log_callback(message)
+
+    def run(self):
+        """샤드별 작업자 실행 후 결과 병합 (결과 dict 반환)"""
+        workers = self.workers
+        if workers > 1 and self.export_mode == EXPORT_MODE_CLIPBOARD:
+            self.log("⚠️ 클립보드 방식은 병렬 처리할 수 없음 - 작업자 1개로 실행")
+            workers = 1
+
+        shards = split_shards(self.word_files, workers)
+
+        # 샤드가 하나면 프로세스를 띄우지 않고 현재 스레드에서 처리
+        if len(shards) <= 1:
+            processor = ExcelRangeProcessor(
+                self.excel_files, self.word_files, self.mappings, self.range_config,
+                backend=self.backend,
+                backend_options=self.backend_options,
+                log_callback=self.log_callback,
+                export_mode=self.export_mode,
+                cancel_token=self.cancel_token,
+            )
+            result = processor.run()
+            result['workers'] = 1
+            result['failed_shards'] = []
+            return result
+
+        start_time = time.time()
+        self.log(f"병렬 처리: 작업자 {len(shards)}개, Word 파일 {len(self.word_files)}개")
+
+        # 부모 스레드에서 추적/메모리 측정 중이면 작업자도 기록하여 결과로 돌려줌
+        tracer = current_tracer()
+        profiler = current_memory_profiler()
+
+        # spawn: Windows와 동일한 방식 (COM 상태를 부모에게서 물려받지 않음)
+        ctx = multiprocessing.get_context('spawn')
+        message_queue = ctx.Queue()
+        cancel_event = ctx.Event()
+        cancel_deadline = None
+
+        pending = list(enumerate(shards, 1))
+        running = {}   # 샤드 번호 → Process
+        results = {}   # 샤드 번호 → 결과 dict
+
+        try:
+            while pending or running:
+                # 취소 요청: 시작 전 샤드는 건너뛰고 실행 중인 작업자에 전달
+                if cancel_deadline is None and self.cancel_token is not None and self.cancel_token.cancelled:
+                    cancel_event.set()
+                    cancel_deadline = time.monotonic() + CANCEL_GRACE_SECONDS
+                    self.log(f"⚠️ 취소 요청 - 작업자 {len(running)}개 정리 대기, 시작 전 샤드 {len(pending)}개 건너뜀")
+                    for shard_index, _ in pending:
+                        results[shard_index] = {'success': False, 'cancelled': True, 'message': "취소됨 (시작 전)"}
+                    pending = []
+                if cancel_deadline is not None and time.monotonic() > cancel_deadline:
+                    self.log(f"⚠️ 작업자가 {CANCEL_GRACE_SECONDS:.0f}초 안에 정리되지 않아 강제 종료")
+                    break
+
+                # 빈 자리만큼 작업자 시작
+                while pending and len(running) < workers:
+                    shard_index, shard_files = pending.pop(0)
+                    process = ctx.Process(
+                        target=_run_shard,
+                        args=(shard_index, self.excel_files, shard_files, self.mappings,
+                              self.range_config, self.backend, self.backend_options,
+                              self.export_mode, message_queue, tracer is not None, profiler is not None,
+                              cancel_event),
+                        daemon=True,
+                    )
+                    process.start()
+                    running[shard_index] = process
+                    names = ', '.join(os.path.basename(f) for f in shard_files)
+                    self.log(f"[W{shard_index}] 작업자 시작 (PID {process.pid}): {names}")
+
+                # 큐 메시지 처리
+                try:
+                    kind, shard_index, payload = message_queue.get(timeout=QUEUE_POLL_INTERVAL)
+                except queue.Empty:
+                    kind = None
+
+                if kind == 'log':
+                    self.log(f"[W{shard_index}] {payload}")
+                elif kind == 'result':
+                    results[shard_index] = payload
+
+                # 종료된 작업자 정리 (결과 없이 종료 = 비정상 종료)
+                for shard_index, process in list(running.items()):
+                    if process.is_alive():
+                        continue
+                    if shard_index not in results:
+                        # 종료 직전에 넣은 결과가 아직 큐에 남아 있을 수 있음
+                        self._drain(message_queue, results)
+                    if shard_index not in results:
+                        results[shard_index] = {
+                            'success': False,
+                            'message': f"작업자 비정상 종료 (종료 코드 {process.exitcode})",
+                        }
+                    process.join()
+                    del running[shard_index]
+
+            self._drain(message_queue, results)
+
+        finally:
+            for shard_index, process in running.items():
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+                results.setdefault(shard_index, {
+                    'success': False, 'cancelled': cancel_deadline is not None,
+                    'message': "작업자 강제 종료",
+                })
+
+        for shard_index, shard_result in sorted(results.items()):
+            events = shard_result.pop('trace_events', None)
+            checkpoints = shard_result.pop('memory_checkpoints', None)
+            if tracer is not None:
+                tracer.merge(events, process_name=f"W{shard_index}")
+            if profiler is not None:
+                profiler.merge(checkpoints, process_name=f"W{shard_index}")
+
+        merged = self.merge_results(shards, results, time.time() - start_time, len(shards))
+        if merged['cancelled'] and self.cancel_token is not None:
+            latency = self.cancel_token.latency()
+            if latency is not None:
+                merged['cancel_latency'] = round(latency, 3)
+                self.log(f"취소 완료 (요청 → 모든 작업자 정리 완료 {latency:.2f}초)")
+        return merged
+
+    def _drain(self, message_queue, results):
+        """큐에 남은 메시지 처리"""
+        while True:
+            try:
+                kind, shard_index, payload = message_queue.get_nowait()
+            except queue.Empty:
+                return
+            if kind == 'log':
+                self.log(f"[W{shard_index}] {payload}")
+            elif kind == 'result':
+                results[shard_index] = payload
+
+    def merge_results(self, shards, results, elapsed_time, workers):
+        """샤드별 결과를 하나의 결과 dict로 병합"""
+        merged = {
+            'success': False,
+            'message': '',
+            'images_inserted': 0,
+            'images_failed': 0,
+            'failed_markers': [],
+            'output_files': [],
+            'elapsed_time': elapsed_time,
+            'export_mode': self.export_mode,
+            'ranges_exported': 0,
+            'export_cache_hits': 0,
+            'preflight_skipped': 0,
+            'automation_backend': self.backend,
+            'automation_stats': {},
+            'readiness_stats': {},
+            'workers': workers,
+            'failed_shards': [],
+            'cancelled': False,
+        }
+
+        for shard_index, shard_files in enumerate(shards, 1):
+            shard_result = results.get(shard_index, {'success': False, 'message': '결과 없음'})
+            for key in ('images_inserted', 'images_failed', 'ranges_exported', 'export_cache_hits',
+                        'preflight_skipped'):
+                merged[key] += shard_result.get(key, 0)
+            merged['failed_markers'].extend(shard_result.get('failed_markers', []))
+            merged['output_files'].extend(shard_result.get('output_files', []))
+            merged['automation_stats'][f"W{shard_index}"] = shard_result.get('automation_stats', {})
+            merge_readiness_stats(merged['readiness_stats'], shard_result.get('readiness_stats', {}))
+
+            if shard_result.get('cancelled'):
+                merged['cancelled'] = True
+            elif not shard_result.get('success'):
+                merged['failed_shards'].append({
+                    'shard': shard_index,
+                    'word_files': [os.path.basename(f) for f in shard_files],
+                    'message': shard_result.get('message', ''),
+                })
+
+        # 일부 샤드만 실패하면 나머지 결과는 유효하므로 성공으로 보고
+        ok_count = len(shards) - len(merged['failed_shards'])
+        if merged['cancelled']:
+            ok_count = sum(1 for r in results.values() if r.get('success'))
+            merged['message'] = "작업이 취소되었습니다"
+        elif ok_count == 0:
+            merged['message'] = "; ".join(f"W{s['shard']}: {s['message']}" for s in merged['failed_shards'])
+        else:
+            merged['success'] = True
+            merged['message'] = "처리 완료"
+
+        self.log("\n" + "=" * 60)
+        self.log(f"병렬 처리 완료 ({ok_count}/{len(shards)} 작업자 성공)")
+        self.log("=" * 60)
+        minutes = int(elapsed_time // 60)
+        seconds = int(elapsed_time % 60)
+        self.log(f"처리 시간: {minutes}분 {seconds}초")
+        self.log(f"삽입 성공: {merged['images_inserted']}개")
+        self.log(f"삽입 실패: {merged['images_failed']}개")
+        for failed in merged['failed_shards']:
+            self.log(f"✗ [W{failed['shard']}] 샤드 실패 ({', '.join(failed['word_files'])}): {failed['message']}")
+
+        return merged
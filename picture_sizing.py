@@ -0,0 +1,259 @@
+# picture_sizing.py
+# Tab 2 그림 크기 모델 (Word 레이아웃 계산 없이 크기 결정)
+# - docx 구역 속성(w:pgSz, w:pgMar)에서 본문 너비/높이 계산
+# - 마커가 표 셀 안에 있으면 셀 너비(w:tcW 또는 w:tblGrid)에서 셀 여백을 뺀 너비 사용
+#   (셀 너비/여백 규칙은 Tab 1 표 기하 모델 table_geometry.py와 공용: cell_width_twips, cell_margins_twips)
+# - 그림 자체의 가로세로 비율로 최종 크기 결정
+
+import zipfile
+from collections import defaultdict
+
+from excel_range_preflight import WORD_NS, W_P, W_T
+
+
+# 크기 계산 방식
+SIZING_MODE_COM = 'com'          # 마커마다 Selection.Information/PageSetup 조회 (기존, 레이아웃 강제)
+SIZING_MODE_MODEL = 'model'      # 페이지 설정/셀 너비 모델로 계산 (레이아웃 강제 없음)
+SIZING_MODE_COMPARE = 'compare'  # 기존 방식으로 적용하고 모델 추정값과 비교 기록
+SIZING_MODES = (SIZING_MODE_COM, SIZING_MODE_MODEL, SIZING_MODE_COMPARE)
+
+# 크기 규칙 (기존 붙여넣기 로직과 동일)
+POINTS_PER_CM = 28.35
+TARGET_WIDTH_CM = 16.5                       # 기본 그림 너비
+TARGET_WIDTH_PT = TARGET_WIDTH_CM * POINTS_PER_CM
+SAFETY_MARGIN_PT = 14                        # 본문 끝 안전 여유 (약 0.5cm)
+AVAILABLE_HEIGHT_RATIO = 0.90                # 사용 가능 높이의 90%만 사용
+
+TWIPS_PER_POINT = 20
+DEFAULT_CELL_MARGIN_TWIPS = 108              # Word 기본 셀 좌우 여백 (0.19cm)
+
+# A4, 기본 여백 (sectPr 값이 없을 때)
+DEFAULT_PAGE = {'w': 11906, 'h': 16838, 'top': 1440, 'bottom': 1440, 'left': 1440, 'right': 1440}
+
+
+def _w(name):
+    return f'{{{WORD_NS}}}{name}'
+
+
+def _twips(element, attr, default=None):
+    """w:속성 값을 twip 정수로 (없거나 잘못되면 default)"""
+    if element is None:
+        return default
+    value = element.get(_w(attr))
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+class SectionGeometry:
+    """구역 하나의 페이지 기하 정보 (포인트 단위)"""
+
+    def __init__(self, sect_pr=None):
+        pg_sz = sect_pr.find(_w('pgSz')) if sect_pr is not None else None
+        pg_mar = sect_pr.find(_w('pgMar')) if sect_pr is not None else None
+
+        self.page_width = _twips(pg_sz, 'w', DEFAULT_PAGE['w']) / TWIPS_PER_POINT
+        self.page_height = _twips(pg_sz, 'h', DEFAULT_PAGE['h']) / TWIPS_PER_POINT
+        # 위/아래 여백은 음수일 수 있음 (머리글과 겹침 허용) - 크기 계산에는 절댓값 사용
+        self.top_margin = abs(_twips(pg_mar, 'top', DEFAULT_PAGE['top'])) / TWIPS_PER_POINT
+        self.bottom_margin = abs(_twips(pg_mar, 'bottom', DEFAULT_PAGE['bottom'])) / TWIPS_PER_POINT
+        self.left_margin = _twips(pg_mar, 'left', DEFAULT_PAGE['left']) / TWIPS_PER_POINT
+        self.right_margin = _twips(pg_mar, 'right', DEFAULT_PAGE['right']) / TWIPS_PER_POINT
+
+    @property
+    def content_width(self):
+        return self.page_width - self.left_margin - self.right_margin
+
+    @property
+    def content_height(self):
+        return self.page_height - self.top_margin - self.bottom_margin
+
+
+class MarkerGeometry:
+    """마커 위치의 배치 영역 (포인트 단위)"""
+
+    def __init__(self, section, cell_width=None):
+        self.section = section
+        self.cell_width = cell_width
+
+    @property
+    def max_width(self):
+        """그림이 들어갈 수 있는 최대 너비 (셀 안이면 셀 너비, 아니면 본문 너비)"""
+        if self.cell_width is not None:
+            return self.cell_width
+        return self.section.content_width
+
+    @property
+    def max_height(self):
+        """페이지 맨 위에 놓였을 때 기준 사용 가능 높이 (기존 규칙: 안전 여유 제외 후 90%)"""
+        return (self.section.content_height - SAFETY_MARGIN_PT) * AVAILABLE_HEIGHT_RATIO
+
+
+def compute_picture_size(original_width, original_height, max_width, max_height,
+                         target_width=TARGET_WIDTH_PT):
+    """
+    그림 크기 계산 (가로세로 비율 유지)
+
+    기본 너비(16.5cm, 배치 영역보다 넓으면 영역 너비)로 맞추고,
+    높이가 사용 가능 높이를 넘으면 높이 기준으로 축소합니다.
+
+    Returns:
+        (너비, 높이, 높이 기준 축소 여부) - 포인트 단위
+    """
+    aspect_ratio = original_height / original_width
+    width = min(target_width, max_width) if max_width and max_width > 0 else target_width
+    height = width * aspect_ratio
+    if max_height and height > max_height:
+        height = max_height
+        width = height / aspect_ratio
+        return width, height, True
+    return width, height, False
+
+
+# ===================================================================
+# DOCUMENT GEOMETRY
+# ===================================================================
+
+def cell_width_twips(tc, tbl, grid=None, grid_index=None):
+    """
+    표 셀 전체 너비 (twip, 셀 여백 포함) - Tab 1 표 기하 모델과 Tab 2 그림 크기 모델 공용
+
+    w:tcW(dxa)를 먼저 쓰고, 없으면 표 그리드에서 셀 위치(gridBefore + 앞 셀들의 gridSpan)만큼 열 너비를 합산합니다.
+
+    Args:
+        tc: w:tc 요소
+        tbl: 셀이 속한 w:tbl 요소
+        grid: 미리 읽은 열 너비 목록 (None이면 tbl에서 읽음)
+        grid_index: 셀이 시작하는 그리드 열 (None이면 같은 행의 앞 셀들로 계산)
+
+    Returns:
+        (너비, 출처 'tcW'|'grid') - 알 수 없으면 (None, None)
+    """
+    tc_w = tc.find(f"{_w('tcPr')}/{_w('tcW')}")
+    if tc_w is not None and tc_w.get(_w('type')) == 'dxa':
+        width = _twips(tc_w, 'w')
+        if width:
+            return width, 'tcW'
+
+    if grid is None:
+        grid = [_twips(col, 'w', 0) for col in tbl.iterfind(f"{_w('tblGrid')}/{_w('gridCol')}")]
+    if not grid:
+        return None, None
+    span = _twips(tc.find(f"{_w('tcPr')}/{_w('gridSpan')}"), 'val', 1)
+    if grid_index is None:
+        tr = tc.getparent()
+        grid_index = _twips(tr.find(f"{_w('trPr')}/{_w('gridBefore')}"), 'val', 0)
+        for sibling in tr.iterfind(_w('tc')):
+            if sibling is tc:
+                break
+            grid_index += _twips(sibling.find(f"{_w('tcPr')}/{_w('gridSpan')}"), 'val', 1)
+    if grid_index + span > len(grid):
+        return None, None
+    width = sum(grid[grid_index:grid_index + span])
+    return (width, 'grid') if width else (None, None)
+
+
+def cell_margins_twips(tc, tbl):
+    """
+    표 셀 여백 (twip) - 셀 설정(w:tcMar) → 표 설정(w:tblCellMar) → Word 기본값 (좌우 108, 위아래 0)
+
+    Returns:
+        (왼쪽, 오른쪽, 위, 아래)
+    """
+    mars = (tc.find(f"{_w('tcPr')}/{_w('tcMar')}"), tbl.find(f"{_w('tblPr')}/{_w('tblCellMar')}"))
+    margins = []
+    for side, alias, default in (('left', 'start', DEFAULT_CELL_MARGIN_TWIPS),
+                                 ('right', 'end', DEFAULT_CELL_MARGIN_TWIPS),
+                                 ('top', 'top', 0), ('bottom', 'bottom', 0)):
+        margin = None
+        for mar in mars:
+            if mar is None:
+                continue
+            node = mar.find(_w(side))
+            if node is None:
+                node = mar.find(_w(alias))
+            if node is not None:
+                margin = 0 if node.get(_w('type')) == 'nil' else _twips(node, 'w')
+                if margin is not None:
+                    break
+        margins.append(default if margin is None else margin)
+    return tuple(margins)
+
+
+def _cell_width(tc):
+    """표 셀의 내용 너비 (포인트) - 알 수 없으면 None"""
+    tr = tc.getparent()
+    tbl = tr.getparent() if tr is not None else None
+    if tbl is None or tbl.tag != _w('tbl'):
+        return None
+
+    width, _ = cell_width_twips(tc, tbl)
+    if not width:
+        return None
+    left, right, _, _ = cell_margins_twips(tc, tbl)
+    return max(width - left - right, 0) / TWIPS_PER_POINT
+
+
+class DocumentGeometry:
+    """
+    docx 파일의 마커별 배치 영역
+
+    Word Find와 같이 문서 앞쪽부터 찾으므로 같은 마커가 여러 번 있으면
+    take()가 앞에서부터 하나씩 꺼냅니다.
+    """
+
+    def __init__(self, occurrences):
+        self._occurrences = occurrences  # 단락 텍스트 → [MarkerGeometry] (문서 순서)
+        self._taken = defaultdict(int)
+
+    @classmethod
+    def from_docx(cls, path):
+        from lxml import etree  # 모델 크기 계산을 쓸 때만 필요
+
+        with zipfile.ZipFile(path) as zf:
+            with zf.open('word/document.xml') as f:
+                root = etree.parse(f).getroot()
+
+        body = root.find(_w('body'))
+        paragraphs = []   # (단락 텍스트, 셀 너비, 구역 번호)
+        pending = []      # 구역이 아직 정해지지 않은 단락
+        sections = []
+
+        # 구역은 단락의 w:pPr/w:sectPr로 끝나고, 마지막 구역은 body의 w:sectPr
+        for child in body:
+            if child.tag == _w('sectPr'):
+                continue
+            for p in child.iter(W_P):
+                text = ''.join(t.text or '' for t in p.iter(W_T))
+                if not text:
+                    continue
+                tc = next(p.iterancestors(_w('tc')), None)
+                pending.append([text, _cell_width(tc) if tc is not None else None])
+            sect_pr = child.find(f"{_w('pPr')}/{_w('sectPr')}") if child.tag == W_P else None
+            if sect_pr is not None:
+                sections.append(SectionGeometry(sect_pr))
+                paragraphs.extend((text, width, len(sections) - 1) for text, width in pending)
+                pending = []
+
+        sections.append(SectionGeometry(body.find(_w('sectPr'))))
+        paragraphs.extend((text, width, len(sections) - 1) for text, width in pending)
+
+        return cls([(text, MarkerGeometry(sections[index], width)) for text, width, index in paragraphs])
+
+    def locate(self, marker):
+        """마커의 다음 위치 (없으면 None) - 꺼내지 않음"""
+        skip = self._taken[marker]
+        for text, geometry in self._occurrences:
+            count = text.count(marker)
+            if count > skip:
+                return geometry
+            skip -= count
+        return None
+
+    def take(self, marker):
+        """마커의 다음 위치를 꺼냄 (삽입 후 마커가 삭제되는 것과 대응)"""
+        geometry = self.locate(marker)
+        if geometry is not None:
+            self._taken[marker] += 1
+        return geometry
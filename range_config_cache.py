@@ -0,0 +1,230 @@
+# range_config_cache.py
+# Tab 2 범위 설정 컴파일/캐시
+# - range_config.xlsx를 읽기 전용 스트리밍으로 파싱 (【카테고리】 구분 행 제외)
+# - 파싱 결과를 JSON 사이드카 파일에 저장하고 수정 시각/크기 + SHA-256으로 검증
+# - 접미사/시트/마커 인덱스와 중복 마커/겹치는 범위 검사 제공
+
+import os
+import re
+import json
+import hashlib
+import logging
+
+# openpyxl은 캐시가 없거나 바뀌었을 때(parse_range_config)만 불러옴
+# - 캐시 적중 시 시작 경로에서 openpyxl 로드 비용을 피함
+
+
+logger = logging.getLogger(__name__)
+
+# 사이드카 형식 버전 (파싱 규칙이 바뀌면 올려서 기존 캐시 무효화)
+CACHE_VERSION = 1
+CACHE_SUFFIX = '.cache.json'
+
+# A1 형식 범위 주소 (B27:I31, $B$27:$I$31, B27)
+RANGE_PATTERN = re.compile(r'^\$?([A-Z]{1,3})\$?(\d+)(?::\$?([A-Z]{1,3})\$?(\d+))?$')
+
+# save_config_to_excel_file이 쓰는 헤더/카테고리 구분 행
+HEADER_FIRST_CELL = 'Sheet Name'
+CATEGORY_PREFIX = '【'
+CATEGORY_SUFFIX = '】'
+
+
+# ===================================================================
+# COMPILED CONFIG
+# ===================================================================
+
+class CompiledRangeConfig(dict):
+    """
+    컴파일된 범위 설정 (접미사 → 항목 리스트 dict, 기존 RANGE_CONFIG와 호환)
+
+    - entries_for_sheet(suffix, sheet): 시트별 항목
+    - lookup_marker(suffix, marker): 마커로 항목 조회 (중복이면 첫 항목)
+    - issues: 중복 마커/겹치는 범위 경고 목록
+    """
+
+    def __init__(self, config=None):
+        super().__init__(config or {})
+        self.by_sheet = {}
+        self.by_marker = {}
+        self.issues = []
+        self._build_indexes()
+
+    def _build_indexes(self):
+        for suffix, entries in self.items():
+            sheets = self.by_sheet.setdefault(suffix, {})
+            markers = self.by_marker.setdefault(suffix, {})
+            for entry in entries:
+                sheets.setdefault(entry['sheet'], []).append(entry)
+                if entry['marker'] in markers:
+                    self.issues.append(
+                        f"{suffix}: 중복 마커 '{entry['marker']}' "
+                        f"([{markers[entry['marker']]['sheet']}] {markers[entry['marker']]['range']}, "
+                        f"[{entry['sheet']}] {entry['range']})"
+                    )
+                else:
+                    markers[entry['marker']] = entry
+
+            # 같은 시트 안에서 범위가 겹치는 항목 (같은 셀이 두 그림에 들어감)
+            for sheet, sheet_entries in sheets.items():
+                bounds = [(entry, _bounds(entry['range'])) for entry in sheet_entries]
+                bounds = [(entry, b) for entry, b in bounds if b is not None]
+                bounds.sort(key=lambda item: (item[1][1], item[1][0]))
+                for i, (entry_a, a) in enumerate(bounds):
+                    for entry_b, b in bounds[i + 1:]:
+                        if b[1] > a[3]:
+                            break  # 시작 행 기준 정렬 - 이후 항목은 겹칠 수 없음
+                        if a[0] <= b[2] and b[0] <= a[2]:
+                            self.issues.append(
+                                f"{suffix}: [{sheet}] 범위 겹침 {entry_a['range']}({entry_a['marker']}) ↔ "
+                                f"{entry_b['range']}({entry_b['marker']})"
+                            )
+
+    def entries_for_sheet(self, suffix, sheet):
+        return self.by_sheet.get(suffix, {}).get(sheet, [])
+
+    def lookup_marker(self, suffix, marker):
+        return self.by_marker.get(suffix, {}).get(marker)
+
+
+def _column_index(letters):
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - ord('A') + 1
+    return index
+
+
+def _bounds(range_address):
+    """범위 → (min_col, min_row, max_col, max_row), 해석할 수 없으면 None (행/열 전체 범위 포함)"""
+    match = RANGE_PATTERN.match(str(range_address).strip().upper())
+    if not match:
+        return None
+    col1, row1, col2, row2 = match.groups()
+    col2, row2 = col2 or col1, row2 or row1
+    min_col, max_col = sorted((_column_index(col1), _column_index(col2)))
+    min_row, max_row = sorted((int(row1), int(row2)))
+    return min_col, min_row, max_col, max_row
+
+
+def compile_range_config(config):
+    """dict 설정을 CompiledRangeConfig로 (인덱스/검사 재생성)"""
+    return CompiledRangeConfig({suffix: list(entries) for suffix, entries in config.items()})
+
+
+# ===================================================================
+# PARSING
+# ===================================================================
+
+def is_category_row(value):
+    """【카테고리】 구분 행 여부"""
+    text = str(value).strip()
+    return text.startswith(CATEGORY_PREFIX) and text.endswith(CATEGORY_SUFFIX)
+
+
+def parse_range_config(path):
+    """range_config.xlsx 파싱 (읽기 전용 스트리밍) - 접미사 → 항목 리스트 dict"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True)
+    try:
+        config = {}
+        for ws in wb.worksheets:
+            if not ws.title.startswith("#"):
+                continue
+            entries = config[ws.title] = []
+            for row in ws.iter_rows(values_only=True):
+                if not row or not row[0]:
+                    continue
+                if str(row[0]) == HEADER_FIRST_CELL or is_category_row(row[0]):
+                    continue
+                if len(row) < 3 or not row[1] or not row[2]:
+                    continue
+                entries.append({
+                    "sheet": str(row[0]),
+                    "range": str(row[1]),
+                    "marker": str(row[2]),
+                    "category": str(row[3]) if len(row) > 3 and row[3] else ""
+                })
+        return config
+    finally:
+        wb.close()
+
+
+# ===================================================================
+# SIDECAR CACHE
+# ===================================================================
+
+def cache_path_for(path):
+    """사이드카 파일 경로 (range_config.xlsx → range_config.cache.json)"""
+    return os.path.splitext(path)[0] + CACHE_SUFFIX
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return None
+    return data
+
+
+def write_cache(path, config, sha256=None):
+    """파싱 결과를 사이드카에 저장 (원자적 교체)"""
+    stat = os.stat(path)
+    data = {
+        'version': CACHE_VERSION,
+        'source': {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': sha256 or file_sha256(path),
+        },
+        'config': config,
+    }
+    cache_path = cache_path_for(path)
+    temp_path = cache_path + '.tmp'
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"⚠️ 설정 캐시 저장 실패 (무시됨): {e}")
+
+
+def load_range_config(path):
+    """
+    범위 설정 로드 (캐시 우선)
+
+    1. 사이드카의 수정 시각/크기가 같으면 캐시 사용 (xlsx를 열지 않음)
+    2. 다르면 SHA-256 비교 - 내용이 같으면 캐시 사용 후 수정 시각만 갱신
+    3. 내용이 바뀌었으면 xlsx 파싱 후 캐시 다시 저장
+
+    Returns:
+        (CompiledRangeConfig, 캐시 사용 여부)
+    """
+    stat = os.stat(path)
+    cached = _read_cache(cache_path_for(path))
+
+    if cached is not None:
+        source = cached['source']
+        if source['mtime_ns'] == stat.st_mtime_ns and source['size'] == stat.st_size:
+            return CompiledRangeConfig(cached['config']), True
+
+        sha256 = file_sha256(path)
+        if source['sha256'] == sha256:
+            write_cache(path, cached['config'], sha256)
+            return CompiledRangeConfig(cached['config']), True
+    else:
+        sha256 = None
+
+    config = parse_range_config(path)
+    write_cache(path, config, sha256)
+    return CompiledRangeConfig(config), False
@@ -0,0 +1,361 @@
+# range_renderer.py
+# Excel 범위 → PNG 렌더러 (Office/클립보드 비의존)
+# - openpyxl로 셀 값(캐시된 계산 결과)/서식/열 너비/행 높이/병합 셀을 읽어 Pillow로 그림 생성
+# - 시스템 클립보드를 사용하지 않으므로 여러 작업/스레드에서 동시에 사용 가능
+
+import os
+import re
+import datetime
+import threading
+import logging
+
+from openpyxl import load_workbook
+from openpyxl.utils import range_boundaries
+from PIL import Image, ImageDraw, ImageFont
+
+
+logger = logging.getLogger(__name__)
+
+
+# Excel 기본 크기 (열 너비: 문자 단위, 행 높이: pt)
+DEFAULT_COLUMN_WIDTH = 8.43
+DEFAULT_ROW_HEIGHT = 15.0
+DEFAULT_FONT_SIZE = 11.0
+
+# 렌더링 배율 (2 = 화면 대비 2배 해상도, Word 삽입 시 선명도 확보)
+DEFAULT_RENDER_SCALE = 2
+
+# 셀 안쪽 여백 (px, 배율 적용 전)
+CELL_PADDING = 2
+
+GRIDLINE_COLOR = (212, 212, 212)
+BORDER_COLOR = (0, 0, 0)
+
+# 폰트 후보 (Windows 한글 폰트 우선, 없으면 일반 폰트 → Pillow 기본 폰트)
+FONT_CANDIDATES = {
+    False: ['malgun.ttf', 'arial.ttf', 'DejaVuSans.ttf'],
+    True: ['malgunbd.ttf', 'arialbd.ttf', 'DejaVuSans-Bold.ttf'],
+}
+
+BORDER_WIDTHS = {
+    'hair': 1, 'thin': 1, 'dotted': 1, 'dashed': 1, 'dashDot': 1, 'dashDotDot': 1,
+    'medium': 2, 'mediumDashed': 2, 'mediumDashDot': 2, 'mediumDashDotDot': 2, 'slantDashDot': 2,
+    'thick': 3, 'double': 3,
+}
+
+
+class RangeRenderError(Exception):
+    """범위 렌더링 실패 (시트 없음, 숨김 시트, 잘못된 범위 등)"""
+
+
+def column_width_to_px(width):
+    """Excel 열 너비(문자 단위)를 픽셀로 변환 (기본 글꼴 Calibri 11 기준)"""
+    return int(width * 7 + 5)
+
+
+def points_to_px(points):
+    """포인트를 96dpi 픽셀로 변환"""
+    return int(round(points * 96 / 72))
+
+
+def argb_to_rgb(color):
+    """openpyxl 색상(ARGB 문자열)을 RGB 튜플로 변환 (테마/인덱스 색상은 None)"""
+    try:
+        rgb = color.rgb if color is not None else None
+    except Exception:
+        return None
+    if not isinstance(rgb, str) or len(rgb) not in (6, 8):
+        return None
+    rgb = rgb[-6:]
+    try:
+        return tuple(int(rgb[i:i + 2], 16) for i in (0, 2, 4))
+    except ValueError:
+        return None
+
+
+def format_cell_value(value, number_format="General"):
+    """
+    셀 값을 표시 문자열로 변환 (자주 쓰는 Excel 표시 형식만 지원)
+
+    - General: 정수는 그대로, 실수는 유효숫자 10자리
+    - 0, 0.00, #,##0.0 등: 소수 자릿수/천 단위 구분
+    - 0.0%: 백분율
+    - 날짜/시간
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        fmt = (number_format or "").lower()
+        if isinstance(value, datetime.time):
+            return value.strftime("%H:%M:%S" if 's' in fmt else "%H:%M")
+        if isinstance(value, datetime.datetime) and ('h' in fmt or ':' in fmt):
+            return value.strftime("%Y-%m-%d %H:%M")
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, (int, float)):
+        section = (number_format or "General").split(';')[0]
+        if section == "General" or not re.search(r'[0#]', section):
+            if isinstance(value, int) or (float(value).is_integer() and abs(value) < 1e15):
+                return str(int(value))
+            return f"{value:.10g}"
+
+        decimals_match = re.search(r'\.([0#]+)', section)
+        decimals = len(decimals_match.group(1)) if decimals_match else 0
+        if '%' in section:
+            return f"{value * 100:.{decimals}f}%"
+        if ',' in section:
+            return f"{value:,.{decimals}f}"
+        return f"{value:.{decimals}f}"
+    return str(value)
+
+
+class RangeRenderer:
+    """
+    Excel 범위를 PNG 파일로 렌더링
+
+    통합문서는 경로별로 캐시되어(파일 수정 시각 기준) 같은 파일의 여러 범위를 렌더링할 때
+    다시 읽지 않습니다. 스레드 안전합니다.
+    """
+
+    def __init__(self, scale=DEFAULT_RENDER_SCALE):
+        self.scale = scale
+        self._workbooks = {}  # 절대 경로 → (mtime, Workbook)
+        self._fonts = {}
+        self._lock = threading.Lock()
+
+    # ========== WORKBOOK / FONT CACHE ==========
+
+    def _get_workbook(self, workbook_path):
+        path = os.path.abspath(workbook_path)
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            cached = self._workbooks.get(path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+        # data_only=True: 수식 대신 Excel이 마지막으로 계산해 저장한 값 사용
+        wb = load_workbook(path, data_only=True)
+        with self._lock:
+            self._workbooks[path] = (mtime, wb)
+        return wb
+
+    def _get_font(self, size_pt, bold):
+        size_px = max(6, int(round(points_to_px(size_pt) * self.scale)))
+        key = (size_px, bool(bold))
+        with self._lock:
+            font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        font = None
+        for candidate in FONT_CANDIDATES[bool(bold)]:
+            try:
+                font = ImageFont.truetype(candidate, size_px)
+                break
+            except (OSError, IOError):
+                continue
+        if font is None:
+            font = ImageFont.load_default()
+
+        with self._lock:
+            self._fonts[key] = font
+        return font
+
+    def close(self):
+        """캐시된 통합문서 해제"""
+        with self._lock:
+            for _, wb in self._workbooks.values():
+                try:
+                    wb.close()
+                except Exception:
+                    pass
+            self._workbooks.clear()
+
+    # ========== GEOMETRY ==========
+
+    def _column_widths(self, ws, min_col, max_col):
+        """열 번호 → 픽셀 너비 (숨김 열은 0)"""
+        default_width = ws.sheet_format.defaultColWidth or DEFAULT_COLUMN_WIDTH
+        widths = {col: column_width_to_px(default_width) for col in range(min_col, max_col + 1)}
+
+        # column_dimensions는 min~max로 묶여 저장될 수 있으므로 범위 단위로 적용
+        for dim in ws.column_dimensions.values():
+            lo = dim.min or 0
+            hi = dim.max or lo
+            for col in range(max(lo, min_col), min(hi, max_col) + 1):
+                if dim.hidden:
+                    widths[col] = 0
+                elif dim.width:
+                    widths[col] = column_width_to_px(dim.width)
+        return widths
+
+    def _row_heights(self, ws, min_row, max_row):
+        """행 번호 → 픽셀 높이 (숨김 행은 0)"""
+        default_height = ws.sheet_format.defaultRowHeight or DEFAULT_ROW_HEIGHT
+        heights = {}
+        for row in range(min_row, max_row + 1):
+            dim = ws.row_dimensions.get(row)
+            if dim is not None and dim.hidden:
+                heights[row] = 0
+            elif dim is not None and dim.height:
+                heights[row] = points_to_px(dim.height)
+            else:
+                heights[row] = points_to_px(default_height)
+        return heights
+
+    # ========== RENDER ==========
+
+    def render(self, workbook_path, sheet_name, range_address, image_path):
+        """
+        범위를 PNG로 저장
+
+        Returns:
+            (가로 px, 세로 px)
+
+        Raises:
+            RangeRenderError: 시트 없음, 숨김 시트, 잘못된 범위
+        """
+        wb = self._get_workbook(workbook_path)
+
+        if sheet_name not in wb.sheetnames:
+            raise RangeRenderError(f"시트 없음: {sheet_name}")
+        ws = wb[sheet_name]
+        if ws.sheet_state != 'visible':
+            raise RangeRenderError(f"숨김 시트: {sheet_name}")
+
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(range_address)
+        except (ValueError, TypeError) as e:
+            raise RangeRenderError(f"잘못된 범위: {range_address} ({e})")
+        if None in (min_col, min_row, max_col, max_row):
+            raise RangeRenderError(f"잘못된 범위: {range_address}")
+
+        scale = self.scale
+        col_widths = self._column_widths(ws, min_col, max_col)
+        row_heights = self._row_heights(ws, min_row, max_row)
+
+        # 각 열/행의 시작 좌표 (배율 적용)
+        col_x = {}
+        x = 0
+        for col in range(min_col, max_col + 1):
+            col_x[col] = x
+            x += col_widths[col] * scale
+        total_width = x
+
+        row_y = {}
+        y = 0
+        for row in range(min_row, max_row + 1):
+            row_y[row] = y
+            y += row_heights[row] * scale
+        total_height = y
+
+        if total_width <= 0 or total_height <= 0:
+            raise RangeRenderError(f"표시할 셀이 없음 (숨김 행/열): {range_address}")
+
+        # 병합 셀: 좌상단 셀 → 병합 영역, 나머지 셀 → 그리지 않음
+        merged_anchor = {}
+        merged_hidden = set()
+        for merged in ws.merged_cells.ranges:
+            if (merged.max_col < min_col or merged.min_col > max_col or
+                    merged.max_row < min_row or merged.min_row > max_row):
+                continue
+            anchor = (max(merged.min_row, min_row), max(merged.min_col, min_col))
+            merged_anchor[anchor] = (min(merged.max_row, max_row), min(merged.max_col, max_col))
+            for r in range(merged.min_row, merged.max_row + 1):
+                for c in range(merged.min_col, merged.max_col + 1):
+                    if (r, c) != anchor:
+                        merged_hidden.add((r, c))
+
+        image = Image.new('RGB', (total_width, total_height), (255, 255, 255))
+        draw = ImageDraw.Draw(image)
+        show_gridlines = ws.sheet_view.showGridLines is not False
+
+        cell_boxes = []
+        for row in range(min_row, max_row + 1):
+            if row_heights[row] == 0:
+                continue
+            for col in range(min_col, max_col + 1):
+                if col_widths[col] == 0 or (row, col) in merged_hidden:
+                    continue
+                end_row, end_col = merged_anchor.get((row, col), (row, col))
+                x0 = col_x[col]
+                y0 = row_y[row]
+                x1 = col_x[end_col] + col_widths[end_col] * scale
+                y1 = row_y[end_row] + row_heights[end_row] * scale
+                cell_boxes.append((ws.cell(row=row, column=col), (x0, y0, x1, y1)))
+
+        # 1단계: 배경/격자선
+        for cell, (x0, y0, x1, y1) in cell_boxes:
+            fill_rgb = None
+            if cell.fill is not None and cell.fill.fill_type == 'solid':
+                fill_rgb = argb_to_rgb(cell.fill.fgColor)
+            if fill_rgb:
+                draw.rectangle([x0, y0, x1 - 1, y1 - 1], fill=fill_rgb)
+            if show_gridlines:
+                draw.rectangle([x0, y0, x1 - 1, y1 - 1], outline=GRIDLINE_COLOR)
+
+        # 2단계: 테두리 (격자선 위에 그림)
+        for cell, (x0, y0, x1, y1) in cell_boxes:
+            self._draw_borders(draw, cell, x0, y0, x1, y1)
+
+        # 3단계: 텍스트
+        for cell, box in cell_boxes:
+            self._draw_text(draw, cell, box)
+
+        image.save(image_path, format='PNG', dpi=(96 * scale, 96 * scale))
+        return total_width, total_height
+
+    def _draw_borders(self, draw, cell, x0, y0, x1, y1):
+        border = cell.border
+        if border is None:
+            return
+        sides = (
+            (border.left, [(x0, y0), (x0, y1 - 1)]),
+            (border.right, [(x1 - 1, y0), (x1 - 1, y1 - 1)]),
+            (border.top, [(x0, y0), (x1 - 1, y0)]),
+            (border.bottom, [(x0, y1 - 1), (x1 - 1, y1 - 1)]),
+        )
+        for side, line in sides:
+            if side is None or not side.style:
+                continue
+            width = BORDER_WIDTHS.get(side.style, 1) * self.scale
+            color = argb_to_rgb(side.color) or BORDER_COLOR
+            draw.line(line, fill=color, width=width)
+
+    def _draw_text(self, draw, cell, box):
+        text = format_cell_value(cell.value, cell.number_format)
+        if not text:
+            return
+
+        x0, y0, x1, y1 = box
+        font_size = (cell.font.sz if cell.font is not None and cell.font.sz else DEFAULT_FONT_SIZE)
+        bold = bool(cell.font.b) if cell.font is not None else False
+        font = self._get_font(font_size, bold)
+        color = argb_to_rgb(cell.font.color) if cell.font is not None else None
+
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        text_w = right - left
+        text_h = bottom - top
+        pad = CELL_PADDING * self.scale
+
+        horizontal = cell.alignment.horizontal if cell.alignment is not None else None
+        if horizontal is None or horizontal == 'general':
+            # Excel 기본: 숫자는 오른쪽, 나머지는 왼쪽 정렬
+            horizontal = 'right' if isinstance(cell.value, (int, float)) and not isinstance(cell.value, bool) else 'left'
+        if horizontal in ('center', 'centerContinuous', 'distributed', 'justify'):
+            tx = x0 + ((x1 - x0) - text_w) / 2
+        elif horizontal == 'right':
+            tx = x1 - pad - text_w
+        else:
+            tx = x0 + pad
+
+        vertical = cell.alignment.vertical if cell.alignment is not None else None
+        if vertical == 'top':
+            ty = y0 + pad
+        elif vertical == 'center':
+            ty = y0 + ((y1 - y0) - text_h) / 2
+        else:
+            ty = y1 - pad - text_h
+
+        draw.text((tx - left, ty - top), text, fill=color or (0, 0, 0), font=font)
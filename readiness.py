@@ -0,0 +1,108 @@
+# readiness.py
+# Office 준비 상태 폴링 (고정 sleep 대체)
+# - 실제 조건(클립보드 그림 형식, 문서 유휴, 애플리케이션 응답)을 지수 백오프로 확인
+# - 조건별 실제 대기 시간/폴링 횟수/시간 초과를 기록
+# - 취소 토큰(cancel_token)이 설정되면 취소 즉시 대기 중단
+
+import time
+import threading
+
+
+# 기본 폴링 설정 (초)
+DEFAULT_INITIAL_DELAY = 0.005   # 첫 재확인까지 대기
+DEFAULT_MAX_DELAY = 0.2         # 재확인 간격 상한
+DEFAULT_BACKOFF = 2.0           # 재확인 간격 배율
+DEFAULT_TIMEOUT = 5.0           # 시간 초과 (초과 시 False 반환)
+
+
+class ReadinessPoller:
+    """
+    조건 폴링기
+
+    사용 예:
+        poller = ReadinessPoller(log_callback)
+        if not poller.wait('clipboard', lambda: has_picture(), timeout=2.0):
+            ...  # 시간 초과
+
+    조건 함수가 예외를 던지면 '아직 준비 안 됨'으로 간주합니다
+    (Word/Excel이 바쁠 때 COM 호출이 거부되는 경우 포함).
+    """
+
+    def __init__(self, log_callback=None, initial_delay=DEFAULT_INITIAL_DELAY,
+                 max_delay=DEFAULT_MAX_DELAY, backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT):
+        self.log_callback = log_callback
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cancel_token = None  # 설정되면 취소 시 대기 중단 (cancellation.CancellationToken)
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def log(self, message):
+        if self.log_callback:
+            self.log_callback(message)
+
+    def wait(self, label, condition, timeout=None):
+        """
+        condition()이 참이 될 때까지 지수 백오프로 폴링
+
+        Returns:
+            준비 완료 여부 (시간 초과 또는 취소 시 False)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        deadline = start + timeout
+        delay = self.initial_delay
+        polls = 0
+
+        while True:
+            polls += 1
+            try:
+                ready = bool(condition())
+            except Exception:
+                ready = False
+
+            now = time.perf_counter()
+            if ready or now >= deadline:
+                break
+
+            if self.cancel_token is not None:
+                if self.cancel_token.wait(min(delay, deadline - now)):
+                    return False  # 취소 - 통계/시간 초과로 기록하지 않음
+            else:
+                time.sleep(min(delay, deadline - now))
+            delay = min(delay * self.backoff, self.max_delay)
+
+        self._record(label, now - start, polls, ready)
+        if not ready:
+            self.log(f"  ⚠️ 준비 대기 시간 초과: {label} ({timeout:.1f}초)")
+        return ready
+
+    def _record(self, label, seconds, polls, ready):
+        with self._lock:
+            stats = self._stats.setdefault(label, {
+                'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'polls': 0, 'timeouts': 0
+            })
+            stats['count'] += 1
+            stats['total_seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            stats['polls'] += polls
+            if not ready:
+                stats['timeouts'] += 1
+
+    def get_stats(self):
+        """조건별 대기 통계 ({label: {count, total_seconds, max_seconds, polls, timeouts}})"""
+        with self._lock:
+            return {label: dict(stats) for label, stats in self._stats.items()}
+
+    def summary_lines(self):
+        """로그 출력용 요약"""
+        lines = []
+        for label, stats in sorted(self.get_stats().items()):
+            line = (f"{label}: {stats['count']}회, 총 {stats['total_seconds']:.2f}초 "
+                    f"(최대 {stats['max_seconds']:.3f}초, 폴링 {stats['polls']}회)")
+            if stats['timeouts']:
+                line += f", 시간 초과 {stats['timeouts']}회"
+            lines.append(line)
+        return lines
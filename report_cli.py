@@ -0,0 +1,360 @@
+# report_cli.py
+# 명령행/라이브러리 진입점 (GUI 없이 실행)
+# - Tab 1: 파일명 기입, 이미지 삽입, 2열 테이블 생성 (image_report_engine)
+# - Tab 2: Excel 범위 삽입 (parallel_range_processor)
+# - 작업 정의는 명령행 인자 또는 JSON 파일 (작업 하나 또는 목록)
+# - 로그는 stderr, 결과는 stdout에 JSON으로 출력 / 종료 코드 0: 모두 성공, 1: 실패 포함
+#
+# 사용 예:
+#   python report_cli.py filenames --folder imgs --word report.docx
+#   python report_cli.py images --folder imgs --word report.docx --no-subfolders
+#   python report_cli.py images --folder imgs --word big_report.docx --streaming
+#   python report_cli.py images --folder imgs --word report.docx --preflight decode --preflight-abort
+#   python report_cli.py table --folder imgs --output-dir out
+#   python report_cli.py batch --manifest release.json --workers 4
+#   python report_cli.py excel-range --excel a_#1.xlsx b_#2.xlsx --word report.docx --export-mode file --workers 4
+#   python report_cli.py --job jobs.json
+#   python report_cli.py --trace trace.json images --folder imgs --word report.docx
+#   python report_cli.py --memory-profile memory.json images --folder imgs --word report.docx
+
+import os
+import sys
+import json
+import signal
+import argparse
+import logging
+import traceback
+import multiprocessing
+
+from cancellation import CancellationToken, OperationCancelled
+
+# 무거운 의존성(python-docx/Pillow, openpyxl, win32com)은 작업 종류별로 실행할 때 불러옴
+
+
+logger = logging.getLogger(__name__)
+
+# Tab 2 기본 범위 설정 파일 (GUI와 동일 위치)
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "range_config.xlsx")
+
+OPERATIONS = ('filenames', 'images', 'table', 'batch', 'excel-range')
+
+
+# ===================================================================
+# JOB EXECUTION
+# ===================================================================
+
+def run_job(spec, log_callback=None, progress_callback=None, cancel_token=None, image_index=None):
+    """
+    작업 하나 실행
+
+    Args:
+        spec: {'operation': 'filenames'|'images'|'table'|'excel-range', ...작업별 인자}
+            filenames/images: folder, word, include_subfolders(기본 True)
+            images: streaming(기본 False, 대용량 보고서용 - 이미지를 저장 시 원본 파일에서 복사),
+                    lookahead(미리 준비할 이미지 수, 0이면 끔), prefetch_workers(준비 스레드 수),
+                    preflight('header'|'decode'|'off', 기본 header - 삽입 전 이미지 검사),
+                    preflight_abort(기본 False - True이면 검사 실패 시 복사본을 만들지 않고 중단)
+            table: folder, include_subfolders, output_dir(기본: 이미지 폴더)
+            batch: manifest(매니페스트 JSON 경로) 또는 entries(항목 목록), workers(작업자 프로세스 수)
+                   - Tab 1 작업 여러 개를 프로세스 풀에서 처리 (batch_report.py)
+            excel-range: excel(목록), word(목록), config(기본 range_config.xlsx) 또는 range_config(dict), mappings,
+                         export_mode, workers, backend, sizing_mode, recycle_after,
+                         backend_options(com 이외 백엔드)
+        log_callback: 로그 출력 콜백
+        progress_callback: 진행률 콜백 (Tab 1 작업만)
+        cancel_token: 취소 토큰 (cancellation.py) - 취소되면 결과에 'cancelled': True
+        image_index: 폴더별 이미지 검색 결과 공유 dict (Tab 1 작업만, 일괄 작업에서 사용)
+
+    Returns:
+        결과 dict ('success', 'message' 포함)
+    """
+    operation = spec.get('operation')
+    if operation not in OPERATIONS:
+        return {'success': False, 'message': f"알 수 없는 작업: {operation} (사용 가능: {', '.join(OPERATIONS)})"}
+
+    try:
+        if operation == 'excel-range':
+            return _run_excel_range(spec, log_callback, cancel_token)
+        if operation == 'batch':
+            return _run_batch(spec, log_callback, progress_callback, cancel_token)
+        return _run_report_job(operation, spec, log_callback, progress_callback, cancel_token, image_index)
+    except OperationCancelled:
+        return {'success': False, 'cancelled': True, 'message': "작업이 취소되었습니다",
+                'cancel_latency': round(cancel_token.latency() or 0.0, 3)}
+    except KeyError as e:
+        return {'success': False, 'message': f"작업 정의에 필수 항목이 없습니다: {e}"}
+    except Exception as e:
+        return {'success': False, 'message': f"작업 중 오류가 발생했습니다: {str(e)}",
+                'traceback': traceback.format_exc()}
+
+
+def _run_report_job(operation, spec, log_callback, progress_callback, cancel_token, image_index=None):
+    """Tab 1 작업 - python-docx/Pillow는 이 작업에서만 불러옴"""
+    from image_report_engine import ImageReportEngine, ReportJobError
+
+    engine = ImageReportEngine(log_callback=log_callback, progress_callback=progress_callback,
+                               cancel_token=cancel_token, image_index=image_index)
+    include_subfolders = spec.get('include_subfolders', True)
+    try:
+        if operation == 'filenames':
+            return engine.insert_filenames(spec['folder'], spec['word'], include_subfolders)
+        if operation == 'images':
+            options = {key: spec[key] for key in ('lookahead', 'prefetch_workers', 'preflight', 'preflight_abort')
+                       if key in spec}
+            return engine.insert_images(spec['folder'], spec['word'], include_subfolders,
+                                        streaming=spec.get('streaming', False), **options)
+        return engine.create_table(spec['folder'], include_subfolders, spec.get('output_dir'))
+    except ReportJobError as e:
+        return {'success': False, 'message': str(e)}
+
+
+def _run_batch(spec, log_callback, progress_callback, cancel_token):
+    """Tab 1 일괄 작업 - 매니페스트 항목을 작업자 프로세스 풀에서 처리"""
+    from batch_report import BatchReportProcessor, BatchManifestError, load_manifest, normalize_entries
+
+    try:
+        if spec.get('entries') is not None:
+            entries = normalize_entries(spec['entries'])
+        else:
+            entries = load_manifest(spec['manifest'])
+    except BatchManifestError as e:
+        return {'success': False, 'message': str(e)}
+
+    processor = BatchReportProcessor(
+        entries,
+        workers=spec.get('workers'),
+        log_callback=log_callback,
+        progress_callback=progress_callback,
+        cancel_token=cancel_token,
+    )
+    return processor.run()
+
+
+def _run_excel_range(spec, log_callback, cancel_token):
+    """Tab 2 작업 - Office 관련 모듈은 이 작업에서만 불러옴"""
+    from office_automation import DEFAULT_RECYCLE_AFTER, EXPORT_MODE_CLIPBOARD
+    from picture_sizing import SIZING_MODE_COM
+    from parallel_range_processor import ParallelRangeProcessor
+    from range_config_cache import load_range_config, compile_range_config
+
+    config_path = spec.get('config') or DEFAULT_CONFIG_PATH
+    if spec.get('range_config'):
+        # 작업 정의에 접미사별 설정을 직접 넣은 경우 ({'#1': [{'sheet', 'range', 'marker'}]})
+        range_config = compile_range_config(spec['range_config'])
+    elif os.path.exists(config_path):
+        range_config, _ = load_range_config(config_path)
+    elif spec.get('config'):
+        return {'success': False, 'message': f"범위 설정 파일이 없습니다: {config_path}"}
+    else:
+        # GUI와 같이 설정 파일이 없으면 기본 설정 사용
+        from default_range_config import DEFAULT_RANGE_CONFIG
+        range_config = DEFAULT_RANGE_CONFIG
+
+    backend = spec.get('backend', 'com')
+    if backend == 'com':
+        backend_options = {
+            'recycle_after': spec.get('recycle_after', DEFAULT_RECYCLE_AFTER),
+            'sizing_mode': spec.get('sizing_mode', SIZING_MODE_COM),
+        }
+    else:
+        backend_options = spec.get('backend_options', {})
+
+    processor = ParallelRangeProcessor(
+        _as_list(spec['excel']),
+        _as_list(spec['word']),
+        spec.get('mappings', []),
+        range_config,
+        workers=spec.get('workers', 1),
+        backend=backend,
+        backend_options=backend_options,
+        log_callback=log_callback,
+        export_mode=spec.get('export_mode', EXPORT_MODE_CLIPBOARD),
+        cancel_token=cancel_token,
+    )
+    return processor.run()
+
+
+def _as_list(value):
+    return [value] if isinstance(value, str) else list(value)
+
+
+def load_jobs(path):
+    """JSON 작업 파일 읽기 (작업 하나 또는 목록)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data if isinstance(data, list) else [data]
+
+
+# ===================================================================
+# COMMAND LINE
+# ===================================================================
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Word-Excel 이미지 관리 (명령행)")
+    parser.add_argument('--job', help="작업 정의 JSON 파일 (작업 하나 또는 목록)")
+    parser.add_argument('--quiet', action='store_true', help="로그 출력 안 함 (결과 JSON만 출력)")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="단계별 구간을 Chrome trace JSON으로 저장 (요약 표는 stderr)")
+    parser.add_argument('--memory-profile', metavar='PATH',
+                        help="단계 경계별 메모리(RSS/tracemalloc) 보고서 JSON 저장 (느려짐, 요약은 stderr)")
+    sub = parser.add_subparsers(dest='operation')
+
+    for name, help_text in (('filenames', "파일명 기입"), ('images', "이미지 삽입")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument('--folder', required=True, help="이미지 폴더")
+        p.add_argument('--word', required=True, help="Word 파일 (.docx)")
+        p.add_argument('--no-subfolders', action='store_true', help="하위 폴더 제외")
+        if name == 'images':
+            p.add_argument('--streaming', action='store_true',
+                           help="이미지를 메모리에 올리지 않고 저장 시 원본 파일에서 복사 (대용량 보고서)")
+            p.add_argument('--lookahead', type=int, help="삽입 순서대로 미리 준비할 이미지 수 (0이면 끔, 기본 16)")
+            p.add_argument('--prefetch-workers', type=int, help="이미지 준비 스레드 수 (기본: CPU 수, 최대 4)")
+            p.add_argument('--preflight', choices=('header', 'decode', 'off'),
+                           help="삽입 전 이미지 검사 (header: 헤더/크기, decode: 전체 디코드 포함, 기본 header)")
+            p.add_argument('--preflight-abort', action='store_true',
+                           help="검사에 실패한 이미지가 있으면 문서를 만들지 않고 중단 (기본: 해당 이미지만 제외)")
+
+    p = sub.add_parser('table', help="2열 테이블 자동 생성")
+    p.add_argument('--folder', required=True, help="이미지 폴더")
+    p.add_argument('--output-dir', help="저장 폴더 (기본: 이미지 폴더)")
+    p.add_argument('--no-subfolders', action='store_true', help="하위 폴더 제외")
+
+    p = sub.add_parser('batch', help="Tab 1 일괄 작업 (매니페스트의 여러 문서를 병렬 처리)")
+    p.add_argument('--manifest', required=True, help="매니페스트 JSON (형식은 batch_report.py 참고)")
+    p.add_argument('--workers', type=int, help="작업자 프로세스 수 (기본: CPU 수)")
+
+    p = sub.add_parser('excel-range', help="Excel 범위 → Word 마커 삽입")
+    p.add_argument('--excel', nargs='+', required=True, help="엑셀 파일 (파일명_#N.xlsx)")
+    p.add_argument('--word', nargs='+', required=True, help="Word 파일")
+    p.add_argument('--config', help="범위 설정 파일 (기본: range_config.xlsx)")
+    p.add_argument('--mappings', help="설정에 없는 접미사용 매핑 JSON 파일 ([{sheet, range, marker}])")
+    p.add_argument('--export-mode', choices=('clipboard', 'file'), default='clipboard')
+    p.add_argument('--workers', type=int, default=1)
+    p.add_argument('--backend', default='com')
+    p.add_argument('--sizing-mode', choices=('com', 'model', 'compare'), default='com')
+
+    return parser
+
+
+def spec_from_args(args):
+    """명령행 인자 → 작업 정의 dict"""
+    spec = {'operation': args.operation}
+    if args.operation in ('filenames', 'images', 'table'):
+        spec['folder'] = args.folder
+        spec['include_subfolders'] = not args.no_subfolders
+    if args.operation in ('filenames', 'images'):
+        spec['word'] = args.word
+    if args.operation == 'images':
+        if args.streaming:
+            spec['streaming'] = True
+        if args.lookahead is not None:
+            spec['lookahead'] = args.lookahead
+        if args.prefetch_workers is not None:
+            spec['prefetch_workers'] = args.prefetch_workers
+        if args.preflight:
+            spec['preflight'] = args.preflight
+        if args.preflight_abort:
+            spec['preflight_abort'] = True
+    elif args.operation == 'table':
+        spec['output_dir'] = args.output_dir
+    elif args.operation == 'batch':
+        spec['manifest'] = args.manifest
+        spec['workers'] = args.workers
+    elif args.operation == 'excel-range':
+        spec.update({
+            'excel': args.excel,
+            'word': args.word,
+            'config': args.config,
+            'export_mode': args.export_mode,
+            'workers': args.workers,
+            'backend': args.backend,
+            'sizing_mode': args.sizing_mode,
+        })
+        if args.mappings:
+            with open(args.mappings, 'r', encoding='utf-8') as f:
+                spec['mappings'] = json.load(f)
+    return spec
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.job:
+        jobs = load_jobs(args.job)
+    elif args.operation:
+        jobs = [spec_from_args(args)]
+    else:
+        parser.error("작업(subcommand) 또는 --job을 지정하세요")
+
+    # 진행 로그는 log_callback으로 출력하므로 logger는 경고 이상만 (중복 출력 방지)
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        stream=sys.stderr
+    )
+
+    def log(message):
+        if not args.quiet:
+            print(message, file=sys.stderr, flush=True)
+
+    tracer = None
+    if args.trace:
+        from tracing import Tracer, set_tracer, write_trace
+        tracer = Tracer('report_cli')
+        set_tracer(tracer)
+
+    profiler = None
+    if args.memory_profile:
+        from memory_profiling import MemoryProfiler, set_memory_profiler, write_memory_report
+        profiler = MemoryProfiler('report_cli')
+        set_memory_profiler(profiler)
+        profiler.start()
+
+    # Ctrl+C 첫 번째: 현재 작업을 셀/범위 경계에서 취소하고 정리 (두 번째: 즉시 중단)
+    cancel_token = CancellationToken()
+
+    def on_interrupt(signum, frame):
+        if cancel_token.cancelled:
+            raise KeyboardInterrupt
+        log("⚠️ 취소 요청 - 정리 후 종료합니다 (한 번 더 누르면 즉시 중단)")
+        cancel_token.cancel()
+
+    previous_handler = signal.signal(signal.SIGINT, on_interrupt)
+
+    results = []
+    try:
+        for spec in jobs:
+            if cancel_token.cancelled:
+                results.append({'success': False, 'cancelled': True, 'operation': spec.get('operation'),
+                                'message': "취소되어 실행하지 않음"})
+                continue
+            result = run_job(spec, log_callback=log, cancel_token=cancel_token)
+            result.setdefault('operation', spec.get('operation'))
+            results.append(result)
+            if result.get('cancelled'):
+                log(f"⚠️ {spec.get('operation')}: 취소됨 (취소 지연 {result.get('cancel_latency', 0):.2f}초)")
+            elif not result.get('success'):
+                log(f"✗ {spec.get('operation')}: {result.get('message')}")
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+    if tracer is not None:
+        # 요약 표는 --quiet이어도 stderr에 출력
+        set_tracer(None)
+        write_trace(tracer, args.trace, lambda line: print(line, file=sys.stderr))
+
+    if profiler is not None:
+        profiler.stop()
+        set_memory_profiler(None)
+        write_memory_report(profiler, args.memory_profile, lambda line: print(line, file=sys.stderr))
+
+    output = results[0] if len(results) == 1 and not args.job else results
+    json.dump(output, sys.stdout, ensure_ascii=False, indent=2, default=str)
+    sys.stdout.write('\n')
+    return 0 if all(r.get('success') for r in results) else 1
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
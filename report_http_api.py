@@ -0,0 +1,452 @@
+# report_http_api.py
+# 로컬 HTTP 작업 API (GUI 없이 여러 사용자의 작업을 동시에 처리)
+# - POST로 작업 제출 (report_cli 작업 정의와 같은 JSON), 상태/진행률 조회, 로그 스트리밍, 결과 파일 다운로드
+# - 작업은 작업자 스레드 풀에서 실행, 대기열 길이 제한 (초과 시 429)
+# - 끝난 작업은 개수/보관 시간을 넘으면 작업 제출 시 목록에서 제거 (제거된 작업은 404)
+# - 기본적으로 127.0.0.1에서만 접속 가능 (경로는 서버 PC 기준)
+#
+# API:
+#   POST   /jobs                      작업 제출 → 202 {"id": ...}
+#   GET    /jobs                      작업 목록
+#   GET    /jobs/<id>                 상태/진행률/결과
+#   GET    /jobs/<id>/logs?since=N    로그 (N번째 줄부터, follow=1이면 작업이 끝날 때까지 스트리밍)
+#   GET    /jobs/<id>/outputs/<n>     결과 파일 다운로드
+#   DELETE /jobs/<id>                 작업 취소 (대기 중: 즉시, 실행 중: 셀/범위 경계에서 정리 후 중단),
+#                                     끝난 작업은 목록에서 제거 (결과 파일은 그대로)
+#
+# 사용 예:
+#   python report_http_api.py --port 8765 --workers 2 --max-queue 20 --max-finished 200 --finished-ttl 3600
+#   curl -X POST localhost:8765/jobs -d '{"operation": "table", "folder": "D:/shots"}'
+
+import os
+import sys
+import json
+import time
+import uuid
+import logging
+import argparse
+import threading
+import traceback
+import multiprocessing
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs, quote
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from report_cli import run_job, OPERATIONS
+from cancellation import CancellationToken, OperationCancelled
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 20
+
+# 끝난 작업 보관 (로그/결과를 메모리에 들고 있으므로 오래 실행되는 서버에서 무한히 쌓이지 않게)
+DEFAULT_MAX_FINISHED = 200       # 끝난 작업 수 상한 (넘으면 오래된 것부터 제거)
+DEFAULT_FINISHED_TTL = 3600.0    # 끝난 뒤 보관 시간 (초)
+
+# 작업 상태
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+STATUS_CANCELLED = 'cancelled'
+FINISHED_STATUSES = (STATUS_DONE, STATUS_FAILED, STATUS_CANCELLED)
+
+# 로그 스트리밍 대기 간격 (초) - 새 로그가 없을 때 연결 유지 확인 주기
+LOG_STREAM_WAIT = 1.0
+
+
+# ===================================================================
+# JOB MANAGER
+# ===================================================================
+
+class ApiJob:
+    """제출된 작업 하나 (상태/진행률/로그/결과)"""
+
+    def __init__(self, spec):
+        self.id = uuid.uuid4().hex[:12]
+        self.spec = spec
+        self.status = STATUS_QUEUED
+        self.progress = 0.0
+        self.logs = []
+        self.result = None
+        self.created = datetime.now().isoformat(timespec='seconds')
+        self.started = None
+        self.finished = None
+        self.finished_at = None  # 보관 시간 계산용 (time.monotonic)
+        self.future = None
+        self.cancel_token = CancellationToken()
+        self.changed = threading.Condition()
+
+    def append_log(self, message):
+        with self.changed:
+            self.logs.append(message)
+            self.changed.notify_all()
+
+    def set_progress(self, value):
+        with self.changed:
+            self.progress = float(value)
+            self.changed.notify_all()
+
+    def set_status(self, status, result=None):
+        with self.changed:
+            self.status = status
+            if status == STATUS_RUNNING:
+                self.started = datetime.now().isoformat(timespec='seconds')
+            if status in FINISHED_STATUSES:
+                self.finished = datetime.now().isoformat(timespec='seconds')
+                self.finished_at = time.monotonic()
+                self.result = result
+            self.changed.notify_all()
+
+    @property
+    def outputs(self):
+        """결과 파일 목록 (Tab 1: output_file, Tab 2: output_files)"""
+        if not self.result:
+            return []
+        files = list(self.result.get('output_files') or [])
+        if self.result.get('output_file'):
+            files.append(self.result['output_file'])
+        return [path for path in files if os.path.isfile(path)]
+
+    def to_dict(self, detail=False):
+        data = {
+            'id': self.id,
+            'operation': self.spec.get('operation'),
+            'status': self.status,
+            'progress': self.progress,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'log_count': len(self.logs),
+        }
+        if detail:
+            data['spec'] = self.spec
+            data['result'] = self.result
+            data['outputs'] = [{'index': i, 'name': os.path.basename(path)} for i, path in enumerate(self.outputs)]
+        return data
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 참 (HTTP 429)"""
+
+
+class ApiJobManager:
+    """
+    작업 관리자 - 작업자 스레드 풀과 대기열 길이 제한
+
+    Args:
+        workers: 동시 실행 작업 수
+        max_queue: 실행 대기 작업 수 상한 (초과하면 QueueFullError)
+        max_finished: 보관할 끝난 작업 수 상한 (넘으면 오래된 것부터 제거)
+        finished_ttl: 끝난 작업 보관 시간 (초, 0 이하면 시간 제한 없음)
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, max_queue=DEFAULT_MAX_QUEUE,
+                 max_finished=DEFAULT_MAX_FINISHED, finished_ttl=DEFAULT_FINISHED_TTL):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_finished = max_finished
+        self.finished_ttl = finished_ttl
+        self.jobs = {}
+        self._lock = threading.Lock()
+        self._clipboard_lock = threading.Lock()  # 클립보드 방식 Tab 2 작업은 한 번에 하나만
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    def job_list(self):
+        """작업 목록 (복사본 - 다른 스레드가 제거해도 안전하게 순회)"""
+        return list(self.jobs.values())
+
+    def queued_count(self):
+        return sum(1 for job in self.job_list() if job.status == STATUS_QUEUED)
+
+    def _trim_finished(self):
+        """보관 시간이 지났거나 개수 상한을 넘은 끝난 작업 제거 (self._lock 안에서 호출)"""
+        finished = sorted((job for job in self.job_list() if job.finished_at is not None),
+                          key=lambda job: job.finished_at)
+        now = time.monotonic()
+        expired, kept = [], []
+        for job in finished:
+            if self.finished_ttl > 0 and now - job.finished_at > self.finished_ttl:
+                expired.append(job)
+            else:
+                kept.append(job)
+        excess = len(kept) - max(self.max_finished, 0)
+        if excess > 0:
+            expired += kept[:excess]  # 가장 먼저 끝난 것부터
+        for job in expired:
+            del self.jobs[job.id]
+        if expired:
+            logger.info(f"끝난 작업 {len(expired)}개 목록에서 제거")
+
+    def remove(self, job_id):
+        """끝난 작업을 목록에서 제거 (결과 파일은 그대로) - 제거했으면 True"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status not in FINISHED_STATUSES:
+                return False
+            del self.jobs[job_id]
+        return True
+
+    def submit(self, spec):
+        """작업 제출 - 작업 정의가 잘못되면 ValueError, 대기열이 가득 차면 QueueFullError"""
+        if not isinstance(spec, dict):
+            raise ValueError("작업 정의는 JSON 객체여야 합니다")
+        if spec.get('operation') not in OPERATIONS:
+            raise ValueError(f"알 수 없는 작업: {spec.get('operation')} (사용 가능: {', '.join(OPERATIONS)})")
+
+        with self._lock:
+            self._trim_finished()
+            if self.queued_count() >= self.max_queue:
+                raise QueueFullError(f"대기 중인 작업이 너무 많습니다 (최대 {self.max_queue}개)")
+            job = ApiJob(spec)
+            self.jobs[job.id] = job
+            job.future = self._executor.submit(self._run, job)
+
+        logger.info(f"작업 접수: {job.id} ({spec.get('operation')})")
+        return job
+
+    def cancel(self, job_id):
+        """작업 취소 - 대기 중이면 바로, 실행 중이면 취소 요청 (작업이 정리 후 cancelled로 끝남)"""
+        job = self.jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATUSES:
+            return False
+        job.cancel_token.cancel("API 취소 요청")
+        if job.status == STATUS_QUEUED and job.future.cancel():
+            job.set_status(STATUS_CANCELLED, {'success': False, 'message': "취소됨"})
+        return True
+
+    def _run(self, job):
+        job.set_status(STATUS_RUNNING)
+        spec = job.spec
+        kwargs = {'log_callback': job.append_log, 'progress_callback': job.set_progress,
+                  'cancel_token': job.cancel_token}
+        try:
+            if spec['operation'] == 'excel-range' and spec.get('export_mode', 'clipboard') == 'clipboard':
+                with self._clipboard_lock:
+                    job.cancel_token.check()  # 클립보드 대기 중에 취소된 경우
+                    result = run_job(spec, **kwargs)
+            else:
+                result = run_job(spec, **kwargs)
+        except OperationCancelled:
+            result = {'success': False, 'cancelled': True, 'message': "취소됨"}
+        except Exception as e:
+            result = {'success': False, 'message': str(e), 'traceback': traceback.format_exc()}
+
+        if result.get('success'):
+            job.set_progress(100)
+            status = STATUS_DONE
+        else:
+            status = STATUS_CANCELLED if result.get('cancelled') else STATUS_FAILED
+        job.set_status(status, result)
+        logger.info(f"작업 종료: {job.id} ({job.status})")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ===================================================================
+# HTTP HANDLER
+# ===================================================================
+
+class ReportApiHandler(BaseHTTPRequestHandler):
+    """작업 API 요청 처리 (server.manager가 ApiJobManager)"""
+
+    server_version = 'ReportJobAPI/1.0'
+
+    @property
+    def manager(self):
+        return self.server.manager
+
+    def log_message(self, format, *args):
+        logger.info(f"{self.address_string()} - {format % args}")
+
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message):
+        self.send_json(status, {'error': message})
+
+    def query_index(self, value, name):
+        """0 이상의 정수 쿼리/경로 값 (잘못되면 400 응답 후 None)"""
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            number = -1
+        if number < 0:
+            self.send_error_json(400, f"잘못된 {name} 값: {value!r} (0 이상의 정수)")
+            return None
+        return number
+
+    def route(self):
+        """경로 → (작업, 나머지 경로 요소, 쿼리) - 작업이 없으면 작업 None"""
+        parsed = urlparse(self.path)
+        parts = [p for p in parsed.path.split('/') if p]
+        query = parse_qs(parsed.query)
+        if not parts or parts[0] != 'jobs':
+            return False, None, [], query
+        job = self.manager.jobs.get(parts[1]) if len(parts) > 1 else None
+        return True, job, parts[1:], query
+
+    def do_POST(self):
+        ok, _, rest, _ = self.route()
+        if not ok or rest:
+            return self.send_error_json(404, "경로를 찾을 수 없습니다")
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            spec = json.loads(self.rfile.read(length).decode('utf-8') or 'null')
+            job = self.manager.submit(spec)
+        except QueueFullError as e:
+            return self.send_error_json(429, str(e))
+        except (ValueError, UnicodeDecodeError) as e:
+            return self.send_error_json(400, str(e))
+        self.send_json(202, {'id': job.id, 'status': job.status, 'url': f"/jobs/{job.id}"})
+
+    def do_DELETE(self):
+        ok, job, rest, _ = self.route()
+        if not ok or job is None or len(rest) != 1:
+            return self.send_error_json(404, "작업을 찾을 수 없습니다")
+        if job.status in FINISHED_STATUSES:
+            # 끝난 작업: 목록에서 제거 (다른 요청이 먼저 제거했으면 404)
+            if not self.manager.remove(job.id):
+                return self.send_error_json(404, "작업을 찾을 수 없습니다")
+            return self.send_json(200, {'id': job.id, 'status': job.status, 'removed': True})
+        if not self.manager.cancel(job.id):
+            return self.send_error_json(409, f"이미 끝난 작업입니다 (현재: {job.status})")
+        self.send_json(200 if job.status == STATUS_CANCELLED else 202, job.to_dict())
+
+    def do_GET(self):
+        ok, job, rest, query = self.route()
+        if not ok:
+            return self.send_error_json(404, "경로를 찾을 수 없습니다")
+
+        if not rest:
+            jobs = sorted(self.manager.job_list(), key=lambda j: j.created)
+            return self.send_json(200, {
+                'jobs': [j.to_dict() for j in jobs],
+                'queued': self.manager.queued_count(),
+                'workers': self.manager.workers,
+                'max_queue': self.manager.max_queue,
+            })
+
+        if job is None:
+            return self.send_error_json(404, "작업을 찾을 수 없습니다")
+        if len(rest) == 1:
+            return self.send_json(200, job.to_dict(detail=True))
+        if rest[1] == 'logs' and len(rest) == 2:
+            since = self.query_index(query.get('since', ['0'])[0] or 0, 'since')
+            if since is None:
+                return
+            if query.get('follow', ['0'])[0] in ('1', 'true'):
+                return self.stream_logs(job, since)
+            return self.send_json(200, {'lines': job.logs[since:], 'next': len(job.logs), 'status': job.status})
+        if rest[1] == 'outputs' and len(rest) == 3:
+            return self.send_output(job, rest[2])
+        self.send_error_json(404, "경로를 찾을 수 없습니다")
+
+    def stream_logs(self, job, since):
+        """로그를 줄 단위로 스트리밍 (작업이 끝나면 연결 종료)"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        position = since
+        try:
+            while True:
+                with job.changed:
+                    if position >= len(job.logs) and job.status not in FINISHED_STATUSES:
+                        job.changed.wait(LOG_STREAM_WAIT)
+                    lines = job.logs[position:]
+                    finished = job.status in FINISHED_STATUSES
+                position += len(lines)
+                if lines:
+                    self.wfile.write(''.join(f"{line}\n" for line in lines).encode('utf-8'))
+                    self.wfile.flush()
+                if finished and position >= len(job.logs):
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            return
+        self.close_connection = True
+
+    def send_output(self, job, index):
+        """결과 파일 다운로드 (작업 결과 목록에 있는 파일만)"""
+        outputs = job.outputs
+        number = self.query_index(index, '결과 파일 번호')
+        if number is None:
+            return
+        try:
+            path = outputs[number]
+            size = os.path.getsize(path)
+        except (IndexError, OSError):
+            return self.send_error_json(404, "결과 파일을 찾을 수 없습니다")
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(size))
+        self.send_header('Content-Disposition', f"attachment; filename*=UTF-8''{quote(os.path.basename(path))}")
+        self.end_headers()
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(1024 * 1024)
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=DEFAULT_WORKERS, max_queue=DEFAULT_MAX_QUEUE,
+                  max_finished=DEFAULT_MAX_FINISHED, finished_ttl=DEFAULT_FINISHED_TTL):
+    """작업 API 서버 생성 (serve_forever()로 실행)"""
+    server = ThreadingHTTPServer((host, port), ReportApiHandler)
+    server.daemon_threads = True
+    server.manager = ApiJobManager(workers=workers, max_queue=max_queue,
+                                   max_finished=max_finished, finished_ttl=finished_ttl)
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 HTTP 작업 API")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="접속 주소 (기본: 127.0.0.1, 다른 PC에서 접속하려면 0.0.0.0)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="동시 실행 작업 수")
+    parser.add_argument('--max-queue', type=int, default=DEFAULT_MAX_QUEUE, help="대기 작업 수 상한")
+    parser.add_argument('--max-finished', type=int, default=DEFAULT_MAX_FINISHED,
+                        help="보관할 끝난 작업 수 상한 (넘으면 오래된 것부터 제거)")
+    parser.add_argument('--finished-ttl', type=float, default=DEFAULT_FINISHED_TTL,
+                        help="끝난 작업 보관 시간 (초, 0이면 시간 제한 없음)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        stream=sys.stderr
+    )
+    # 작업 로그는 작업별로 API에서 제공하므로 처리기 logger는 경고만 출력
+    for name in ('parallel_range_processor', 'excel_range_processor'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    server = create_server(args.host, args.port, args.workers, args.max_queue,
+                           args.max_finished, args.finished_ttl)
+    logger.info(f"작업 API 시작: http://{args.host}:{args.port} (작업자 {args.workers}개, 대기열 {args.max_queue}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.manager.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
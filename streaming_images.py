@@ -0,0 +1,215 @@
+# streaming_images.py
+# 대용량 보고서용 이미지 스트리밍 (선택 기능, Tab 1 이미지 삽입)
+# - 이미지 파트를 파일 경로만 들고 있는 지연 파트로 등록 (바이트는 저장 중에만 읽음)
+# - 문서 저장 시 이미지 파일을 zip에 조각 단위로 복사 (이미지 전체를 메모리에 올리지 않음)
+# - 미리 준비된 이미지(image_prefetch.ImagePrefetcher)를 파트 등록에 그대로 사용
+#
+# 주의: 원본 이미지 파일은 저장이 끝날 때까지 바뀌거나 지워지면 안 됩니다.
+#
+# 사용 예:
+#   install_image_parts(doc, ImagePrefetcher(plan_paths, file_backed=True))
+#   ...  run.add_picture(path, ...)
+#   save_streaming(doc, output_path)
+
+import os
+import time
+import shutil
+import hashlib
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
+
+from docx.image.image import Image, _ImageHeaderFactory
+from docx.opc.packuri import PackURI
+from docx.opc.pkgwriter import PackageWriter
+from docx.parts.image import ImagePart
+from docx.package import ImageParts
+
+
+# 파일 읽기/복사 단위
+_CHUNK_SIZE = 1024 * 1024
+
+# 이미 압축된 형식은 다시 압축하지 않음 (CPU만 쓰고 크기는 거의 그대로)
+_STORED_EXTENSIONS = frozenset(('png', 'jpg', 'jpeg', 'gif'))
+
+
+# ===================================================================
+# FILE-BACKED IMAGE PARTS
+# ===================================================================
+
+class FileBackedImage(Image):
+    """
+    파일 경로만 보관하는 이미지 (헤더 정보와 해시만 미리 계산)
+
+    blob은 접근할 때마다 파일에서 읽습니다 (저장 중에만 접근됨).
+    """
+
+    def __init__(self, path, sha1, size, image_header):
+        super().__init__(None, os.path.basename(path), image_header)
+        self.path = path
+        self.size = size
+        self._sha1 = sha1
+
+    @classmethod
+    def from_path(cls, path):
+        """헤더 파싱 + 조각 단위 SHA1 (파일 전체를 메모리에 올리지 않음)"""
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            image_header = _ImageHeaderFactory(f)
+            f.seek(0)
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                digest.update(chunk)
+            size = f.tell()
+        return cls(path, digest.hexdigest(), size, image_header)
+
+    @property
+    def blob(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    @property
+    def sha1(self):
+        return self._sha1
+
+
+class FileBackedImagePart(ImagePart):
+    """저장 시 원본 파일에서 바로 복사되는 이미지 파트"""
+
+    def __init__(self, partname, image):
+        super().__init__(partname, image.content_type, None, image)
+
+    @property
+    def blob(self):
+        return self._image.blob
+
+    @property
+    def sha1(self):
+        return self._image.sha1
+
+    @property
+    def path(self):
+        return self._image.path
+
+
+class StreamingImageParts(ImageParts):
+    """
+    파일 경로로 추가되는 이미지를 미리 준비된 이미지로 등록하는 이미지 파트 목록
+
+    - FileBackedImage는 지연 파트, 바이트를 읽어 둔 Image는 일반 파트로 등록
+    - 같은 이미지(SHA1) 재사용은 dict로 찾음 (기본 구현은 매번 전체 목록 검색)
+    - 파트 이름 번호도 집합으로 관리 (기본 구현은 이미지 수의 제곱에 비례)
+    """
+
+    def __init__(self, existing=()):
+        super().__init__()
+        self.source = None
+        self._by_sha1 = {}
+        self._used_numbers = set()
+        self._next_number = 1
+        self._last = None
+        for image_part in existing:
+            self.append(image_part)
+
+    def append(self, item, sha1=None):
+        super().append(item)
+        self._by_sha1.setdefault(sha1 or item.sha1, item)
+        self._used_numbers.add(item.partname.idx)
+
+    def prepare(self, path):
+        """삽입할 이미지 준비 (미리 준비된 것이 있으면 사용) - 크기 계산과 파트 등록에 같은 객체 사용"""
+        if self._last is not None and self._last[0] == path:
+            return self._last[1]
+        image = self.source.get(path) if self.source is not None else FileBackedImage.from_path(path)
+        self._last = (path, image)
+        return image
+
+    def get_or_add_image_part(self, image_descriptor):
+        if not isinstance(image_descriptor, str):
+            return super().get_or_add_image_part(image_descriptor)
+
+        image = self.prepare(image_descriptor)
+        self._last = None
+        image_part = self._by_sha1.get(image.sha1)
+        if image_part is not None:
+            return image_part
+        partname = self._next_image_partname(image.ext)
+        if isinstance(image, FileBackedImage):
+            image_part = FileBackedImagePart(partname, image)
+        else:
+            image_part = ImagePart.from_image(image, partname)
+        self.append(image_part, image.sha1)  # ImagePart.sha1은 접근할 때마다 다시 계산
+        return image_part
+
+    def _get_by_sha1(self, sha1):
+        return self._by_sha1.get(sha1)
+
+    def _next_image_partname(self, ext):
+        while self._next_number in self._used_numbers:
+            self._next_number += 1
+        return PackURI(f"/word/media/image{self._next_number}.{ext}")
+
+
+def install_image_parts(document, source=None):
+    """
+    문서의 이미지 파트 목록을 StreamingImageParts로 교체
+
+    Args:
+        document: python-docx Document
+        source: 미리 준비된 이미지 공급원 (ImagePrefetcher, None이면 그때그때 FileBackedImage 준비)
+    """
+    package = document.part.package
+    image_parts = package.image_parts
+    if not isinstance(image_parts, StreamingImageParts):
+        image_parts = StreamingImageParts(image_parts)
+        package.__dict__['image_parts'] = image_parts  # lazyproperty 캐시 자리 교체
+    image_parts.source = source
+    return image_parts
+
+
+# ===================================================================
+# STREAMING SAVE
+# ===================================================================
+
+class _StreamingZipWriter:
+    """docx zip 작성기 - 지연 이미지 파트는 파일에서 조각 단위로 복사"""
+
+    def __init__(self, path):
+        self._zipf = ZipFile(path, 'w', compression=ZIP_DEFLATED)
+
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(pack_uri.membername, blob)
+
+    def write_file(self, pack_uri, path):
+        info = ZipInfo(pack_uri.membername, date_time=time.localtime()[:6])
+        extension = os.path.splitext(path)[1].lstrip('.').lower()
+        info.compress_type = ZIP_STORED if extension in _STORED_EXTENSIONS else ZIP_DEFLATED
+        info.file_size = os.path.getsize(path)  # 4GB 이상이면 zip64 사용
+        with open(path, 'rb') as src, self._zipf.open(info, 'w') as dst:
+            shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+
+    def close(self):
+        self._zipf.close()
+
+
+def save_streaming(document, path):
+    """
+    문서 저장 (Document.save와 같은 결과, 지연 이미지 파트는 원본 파일에서 복사)
+
+    저장 중에도 메모리에는 이미지 하나 분량의 버퍼만 사용합니다.
+    """
+    package = document.part.package
+    parts = list(package.parts)
+    for part in parts:
+        part.before_marshal()
+
+    writer = _StreamingZipWriter(path)
+    try:
+        PackageWriter._write_content_types_stream(writer, parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        for part in parts:
+            if isinstance(part, FileBackedImagePart):
+                writer.write_file(part.partname, part.path)
+            else:
+                writer.write(part.partname, part.blob)
+            if len(part.rels):
+                writer.write(part.partname.rels_uri, part.rels.xml)
+    finally:
+        writer.close()
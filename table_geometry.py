@@ -0,0 +1,171 @@
+# table_geometry.py
+# Tab 1 표 기하 모델 (이미지 크기 계산용, Word 레이아웃 계산 없이)
+# - 표마다 한 번 계산: 셀 너비는 w:tcW, 없으면 w:tblGrid 열 너비 + w:gridBefore/w:gridSpan (그래도 없으면 균등 분할)
+# - 행 높이 규칙(w:trHeight exact/atLeast)과 세로 병합(w:vMerge) → 셀 높이 상한
+# - 셀 여백(tcMar → tblCellMar → Word 기본값)을 빼고 구역 본문 크기(picture_sizing.SectionGeometry)로 제한
+#   (셀 너비/여백 규칙은 Tab 2 그림 크기 모델과 공용: picture_sizing.cell_width_twips, cell_margins_twips)
+# - 결과: 셀마다 이미지가 들어갈 상자 (EMU) → fit_to_box()로 비율 유지 크기 계산
+#
+# 사용 예:
+#   geometry = DocumentTableGeometry.from_document(doc)
+#   box = geometry.box_for(cell)          # 모르는 셀이면 None
+#   width, height = fit_to_box(px_width, px_height, box)
+
+from collections import namedtuple
+
+from docx.oxml.ns import qn
+
+from picture_sizing import SectionGeometry, TWIPS_PER_POINT, cell_width_twips, cell_margins_twips
+
+
+EMU_PER_TWIP = 635
+
+# 높이가 고정되지 않은 행의 기본 이미지 높이 (기존 규칙과 같은 6cm, 행 최소 높이가 더 크면 그 값)
+DEFAULT_BOX_HEIGHT_EMU = 2160000
+
+# 셀 너비 출처 (통계용)
+WIDTH_FROM_GRID = 'grid'
+WIDTH_FROM_TCW = 'tcW'
+WIDTH_ESTIMATED = 'estimated'
+
+CellBox = namedtuple('CellBox', 'width height fixed_height source')
+CellBox.__doc__ = "셀 안에 이미지가 들어갈 상자 (EMU) - fixed_height: 행 높이가 고정(exact)이면 True"
+
+
+def _int_attr(element, path, attr='w:val', default=None):
+    """하위 요소 속성을 정수로 (없거나 잘못되면 default)"""
+    node = element.find(path) if path else element
+    if node is None:
+        return default
+    try:
+        return int(float(node.get(qn(attr))))
+    except (TypeError, ValueError):
+        return default
+
+
+# ===================================================================
+# TABLE GEOMETRY
+# ===================================================================
+
+class TableGeometry:
+    """
+    표 하나의 셀별 이미지 상자
+
+    Args:
+        tbl: w:tbl 요소
+        section: 표가 속한 구역 (SectionGeometry)
+    """
+
+    def __init__(self, tbl, section):
+        self.boxes = {}  # w:tc → CellBox
+        content_width = int(section.content_width * TWIPS_PER_POINT)
+        content_height_emu = int(section.content_height * TWIPS_PER_POINT * EMU_PER_TWIP)
+
+        grid = [_int_attr(col, None, 'w:w', 0) for col in tbl.iterfind(f"{qn('w:tblGrid')}/{qn('w:gridCol')}")]
+
+        cells = []        # [tc, 너비(EMU), 위아래 여백(twip), 출처]
+        heights = {}      # 병합 시작 tc → [(행 높이 규칙, 높이 twip)]
+        vmerge_owner = {} # 그리드 열 → 세로 병합 시작 tc
+
+        for tr in tbl.iterfind(qn('w:tr')):
+            tr_height = tr.find(f"{qn('w:trPr')}/{qn('w:trHeight')}")
+            height = _int_attr(tr_height, None, 'w:val') if tr_height is not None else None
+            rule = tr_height.get(qn('w:hRule'), 'atLeast') if height else 'auto'
+
+            tcs = list(tr.iterfind(qn('w:tc')))
+            index = _int_attr(tr, f"{qn('w:trPr')}/{qn('w:gridBefore')}", default=0)
+            for tc in tcs:
+                tc_pr = tc.find(qn('w:tcPr'))
+                span = _int_attr(tc_pr, qn('w:gridSpan'), default=1) if tc_pr is not None else 1
+                v_merge = tc_pr.find(qn('w:vMerge')) if tc_pr is not None else None
+
+                # 세로 병합 이어지는 칸: 시작 셀 높이에 이 행 높이를 더함
+                if v_merge is not None and v_merge.get(qn('w:val'), 'continue') == 'continue':
+                    owner = vmerge_owner.get(index)
+                    if owner is not None:
+                        heights[owner].append((rule, height))
+                    index += span
+                    continue
+
+                width, source = cell_width_twips(tc, tbl, grid, index)
+                if not width:
+                    width, source = content_width // max(len(tcs), 1), WIDTH_ESTIMATED
+                width = min(width, content_width)
+
+                left, right, top, bottom = cell_margins_twips(tc, tbl)
+                cells.append((tc, max(width - left - right, 0) * EMU_PER_TWIP, top + bottom, source))
+                heights[tc] = [(rule, height)]
+                if v_merge is not None:
+                    vmerge_owner[index] = tc
+                else:
+                    vmerge_owner.pop(index, None)
+                index += span
+
+        for tc, width, vertical, source in cells:
+            rows = heights[tc]
+            fixed = all(rule == 'exact' for rule, _ in rows)
+            total = sum(h or 0 for _, h in rows)
+            if fixed:
+                height = max(total - vertical, 0) * EMU_PER_TWIP
+            else:
+                # 자동/최소 높이 행은 내용에 맞춰 늘어남 - 최소 높이가 기본 상한보다 크면 그만큼 허용
+                height = max(max(total - vertical, 0) * EMU_PER_TWIP, DEFAULT_BOX_HEIGHT_EMU)
+            self.boxes[tc] = CellBox(width, min(height, content_height_emu), fixed, source)
+
+
+class DocumentTableGeometry:
+    """
+    문서의 최상위 표(Document.tables) 전체 기하 모델 - 문서를 열고 한 번만 계산
+
+    구역은 단락의 w:pPr/w:sectPr로 끝나고, 마지막 구역은 body의 w:sectPr입니다.
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+        self._boxes = {}
+        for table in tables:
+            self._boxes.update(table.boxes)
+
+    @classmethod
+    def from_document(cls, document):
+        body = document.element.body
+        tables = []
+        pending = []  # 구역이 아직 정해지지 않은 표
+        for child in body.iterchildren():
+            if child.tag == qn('w:tbl'):
+                pending.append(child)
+            elif child.tag == qn('w:p'):
+                sect_pr = child.find(f"{qn('w:pPr')}/{qn('w:sectPr')}")
+                if sect_pr is not None:
+                    section = SectionGeometry(sect_pr)
+                    tables.extend(TableGeometry(tbl, section) for tbl in pending)
+                    pending = []
+        section = SectionGeometry(body.find(qn('w:sectPr')))
+        tables.extend(TableGeometry(tbl, section) for tbl in pending)
+        return cls(tables)
+
+    def box_for(self, cell):
+        """셀(python-docx _Cell)의 이미지 상자 (모델에 없는 셀이면 None)"""
+        return self._boxes.get(cell._tc)
+
+    def stats(self):
+        """셀 너비 출처별 개수"""
+        sources = {WIDTH_FROM_GRID: 0, WIDTH_FROM_TCW: 0, WIDTH_ESTIMATED: 0}
+        fixed = 0
+        for box in self._boxes.values():
+            sources[box.source] += 1
+            fixed += box.fixed_height
+        return {'tables': len(self.tables), 'cells': len(self._boxes), 'width_sources': sources,
+                'fixed_height_cells': fixed}
+
+
+def fit_to_box(px_width, px_height, box):
+    """
+    상자 안에 꼭 맞는 이미지 크기 (가로세로 비율 유지, EMU 정수)
+
+    가로 기준으로 맞춰 높이가 넘치면 세로 기준으로 맞춥니다 (기존 셀 크기 규칙과 같음).
+    """
+    aspect_ratio = px_height / px_width
+    if box.width * aspect_ratio <= box.height:
+        return box.width, int(box.width * aspect_ratio)
+    return int(box.height / aspect_ratio), box.height
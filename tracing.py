@@ -0,0 +1,259 @@
+# tracing.py
+# 단계별 구간 측정 (Chrome trace 형식 내보내기)
+# - 작업 스레드마다 현재 추적기를 지정 (꺼져 있으면 span()은 아무것도 하지 않음)
+# - 구간: scan, index, open_document, image_preflight, table_geometry, cell_match, image_probe, prefetch_wait,
+#         insert, range_copy, marker_paste, save, com_startup, com_teardown 등
+# - 결과: chrome://tracing / Perfetto에서 여는 JSON + 단계별 합계/횟수/p50/p95 요약
+#
+# 사용 예:
+#   tracer = Tracer()
+#   set_tracer(tracer)
+#   with span('save', file=path):
+#       doc.save(path)
+#   set_tracer(None)
+#   tracer.export_chrome_trace('trace.json')
+
+import os
+import json
+import math
+import time
+import threading
+import functools
+from datetime import datetime
+
+
+# perf_counter(정밀) 값을 벽시계 기준으로 맞추는 오프셋 - 작업자 프로세스 구간과 시간축을 맞추기 위함
+_CLOCK_OFFSET = time.time() - time.perf_counter()
+
+_local = threading.local()
+
+
+def _now_us():
+    """현재 시각 (마이크로초, 벽시계 기준)"""
+    return (time.perf_counter() + _CLOCK_OFFSET) * 1_000_000
+
+
+def set_tracer(tracer):
+    """현재 스레드의 추적기 지정 (None이면 해제)"""
+    _local.tracer = tracer
+
+
+def current_tracer():
+    """현재 스레드의 추적기 (없으면 None)"""
+    return getattr(_local, 'tracer', None)
+
+
+class _NullSpan:
+    """추적 꺼짐 - 아무것도 하지 않는 구간"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """측정 구간 하나 (with 블록)"""
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.add(self.name, self.start, _now_us() - self.start, self.args)
+        return False
+
+    def set(self, **args):
+        """구간 종료 전에 인자 추가 (예: 매칭 결과)"""
+        self.args.update(args)
+
+
+def span(name, **args):
+    """현재 스레드 추적기에 구간 기록 (추적기가 없으면 비용 없음)"""
+    tracer = current_tracer()
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, args)
+
+
+def traced(name):
+    """함수 전체를 구간으로 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _percentile(sorted_values, fraction):
+    """정렬된 값의 백분위수 (최근접 순위)"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class Tracer:
+    """
+    구간 기록기 (여러 스레드에서 공유 가능)
+
+    Args:
+        name: 추적 이름 (Chrome trace의 프로세스 이름)
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+        self._lock = threading.Lock()
+        self._events = []
+        self._thread_names = {}
+
+    def add(self, name, start_us, duration_us, args=None):
+        """완료된 구간 추가"""
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': name.split('.')[0],
+            'ph': 'X',
+            'ts': round(start_us, 1),
+            'dur': round(duration_us, 1),
+            'pid': os.getpid(),
+            'tid': thread.ident,
+        }
+        if args:
+            event['args'] = {key: _jsonable(value) for key, value in args.items()}
+        with self._lock:
+            self._events.append(event)
+            self._thread_names.setdefault((event['pid'], event['tid']), thread.name)
+
+    @property
+    def events(self):
+        """기록된 구간 목록 (복사본)"""
+        with self._lock:
+            return list(self._events)
+
+    def merge(self, events, process_name=None):
+        """다른 프로세스(병렬 작업자)에서 기록한 구간 합치기"""
+        if not events:
+            return
+        with self._lock:
+            self._events.extend(events)
+            if process_name:
+                self._thread_names[(events[0]['pid'], None)] = process_name
+
+    def _metadata_events(self):
+        """프로세스/스레드 이름 (Chrome trace 'M' 이벤트)"""
+        metadata = []
+        pid = os.getpid()
+        if self.name:
+            metadata.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                             'args': {'name': self.name}})
+        for (event_pid, tid), name in self._thread_names.items():
+            if tid is None:
+                metadata.append({'name': 'process_name', 'ph': 'M', 'pid': event_pid, 'tid': 0,
+                                 'args': {'name': name}})
+            else:
+                metadata.append({'name': 'thread_name', 'ph': 'M', 'pid': event_pid, 'tid': tid,
+                                 'args': {'name': name}})
+        return metadata
+
+    def export_chrome_trace(self, path):
+        """Chrome trace JSON 저장 (chrome://tracing, ui.perfetto.dev에서 열기)"""
+        with self._lock:
+            data = {
+                'traceEvents': self._metadata_events() + list(self._events),
+                'displayTimeUnit': 'ms',
+                'otherData': {'summary': self._summary_locked()},
+            }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        return path
+
+    def summary(self):
+        """
+        단계별 요약
+
+        Returns:
+            {단계: {'count', 'total_ms', 'mean_ms', 'p50_ms', 'p95_ms', 'max_ms'}} - 합계 내림차순
+        """
+        with self._lock:
+            return self._summary_locked()
+
+    def _summary_locked(self):
+        durations = {}
+        for event in self._events:
+            durations.setdefault(event['name'], []).append(event['dur'] / 1000)
+
+        summary = {}
+        for name, values in durations.items():
+            values.sort()
+            total = sum(values)
+            summary[name] = {
+                'count': len(values),
+                'total_ms': round(total, 3),
+                'mean_ms': round(total / len(values), 3),
+                'p50_ms': round(_percentile(values, 0.50), 3),
+                'p95_ms': round(_percentile(values, 0.95), 3),
+                'max_ms': round(values[-1], 3),
+            }
+        return dict(sorted(summary.items(), key=lambda item: -item[1]['total_ms']))
+
+    def summary_lines(self):
+        """요약 표 (로그 출력용 줄 목록)"""
+        summary = self.summary()
+        if not summary:
+            return []
+        lines = [f"{'단계':16s} {'횟수':>7s} {'합계(ms)':>11s} {'p50(ms)':>9s} {'p95(ms)':>9s} {'최대(ms)':>9s}"]
+        for name, item in summary.items():
+            lines.append(
+                f"{name:16s} {item['count']:7d} {item['total_ms']:11.1f} "
+                f"{item['p50_ms']:9.2f} {item['p95_ms']:9.2f} {item['max_ms']:9.2f}"
+            )
+        return lines
+
+
+def default_trace_path(name, trace_dir=None):
+    """작업별 trace 파일 경로 (기본: 로그 폴더의 trace_<name>_<시각>.json)"""
+    if trace_dir is None:
+        from log_channel import LOG_DIR
+        trace_dir = LOG_DIR
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(trace_dir, f"trace_{name}_{timestamp}.json")
+
+
+def write_trace(tracer, path, log_callback):
+    """trace 파일 저장 후 요약 표를 로그로 출력 (저장 실패는 작업 결과에 영향 없음)"""
+    try:
+        tracer.export_chrome_trace(path)
+    except OSError as e:
+        log_callback(f"⚠️ trace 저장 실패: {str(e)}")
+        path = None
+    log_callback("\n단계별 소요 시간" + (f" (trace: {path})" if path else ""))
+    for line in tracer.summary_lines():
+        log_callback(f"  {line}")
+    return path
+
+
+def _jsonable(value):
+    """구간 인자를 JSON으로 저장 가능한 값으로 변환"""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)